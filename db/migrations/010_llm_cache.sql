@@ -0,0 +1,56 @@
+-- ============================================================
+-- Migration 010: LLM Completion Cache
+-- ============================================================
+-- Created: 2026-10-16
+-- Purpose: Shared content-addressed cache for LLM completions
+--          (src/shared/llm_cache.py, LLM_CACHE_BACKEND=supabase)
+-- Tables: llm_cache
+-- ============================================================
+
+-- ============================================================
+-- Table: llm_cache
+-- Purpose: Completions keyed on sha256(model, temperature, messages,
+--          tools, response_format) so re-runs skip paid-for calls
+-- ============================================================
+CREATE TABLE IF NOT EXISTS llm_cache (
+    cache_key TEXT PRIMARY KEY,  -- Hex SHA-256 content address
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,  -- Encoded completion ({"type", "value"} JSON)
+
+    -- Timestamps
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    expires_at TIMESTAMPTZ NOT NULL DEFAULT (NOW() + INTERVAL '7 days')
+);
+
+-- Indexes for llm_cache
+CREATE INDEX IF NOT EXISTS idx_llm_cache_expires ON llm_cache(expires_at);
+
+-- Add Row Level Security (RLS)
+ALTER TABLE llm_cache ENABLE ROW LEVEL SECURITY;
+
+-- Service role bypass (for Modal backend operations using service_role key)
+CREATE POLICY "Service role has full access on llm_cache"
+    ON llm_cache FOR ALL
+    USING (auth.role() = 'service_role')
+    WITH CHECK (auth.role() = 'service_role');
+
+-- ============================================================
+-- Function: prune expired cache entries
+-- ============================================================
+CREATE OR REPLACE FUNCTION prune_llm_cache()
+RETURNS INTEGER AS $$
+DECLARE
+    deleted_count INTEGER;
+BEGIN
+    DELETE FROM llm_cache WHERE expires_at <= NOW();
+    GET DIAGNOSTICS deleted_count = ROW_COUNT;
+    RETURN deleted_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================
+-- Comments
+-- ============================================================
+COMMENT ON TABLE llm_cache IS 'Content-addressed LLM completion cache shared across crews and runs';
+COMMENT ON COLUMN llm_cache.cache_key IS 'sha256 of model, temperature, messages, tools, response_format';
+COMMENT ON COLUMN llm_cache.expires_at IS 'Entries past this time are ignored on read and pruned by prune_llm_cache()';
@@ -0,0 +1,207 @@
+-- ============================================================
+-- Migration 011: Delta State Checkpoints
+-- ============================================================
+-- Created: 2026-10-16
+-- Purpose: Per-key phase_state patches so checkpoints stop rewriting
+--          the whole JSON blob (STATE_CHECKPOINT_MODE=delta in
+--          src/state/persistence.py)
+-- Tables: validation_state_patches
+-- Columns: validation_runs.state_version, validation_runs.state_base_version
+-- ============================================================
+
+-- ============================================================
+-- Columns: validation_runs versioning
+-- state_version      - version of the newest patch for the run
+-- state_base_version - version already folded into phase_state
+-- Materialized state = phase_state + patches (state_base_version, state_version]
+-- ============================================================
+ALTER TABLE validation_runs
+    ADD COLUMN IF NOT EXISTS state_version INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS state_base_version INTEGER NOT NULL DEFAULT 0;
+
+-- ============================================================
+-- Table: validation_state_patches
+-- Purpose: Append-only per-key patches to validation_runs.phase_state
+-- ============================================================
+CREATE TABLE IF NOT EXISTS validation_state_patches (
+    id BIGSERIAL PRIMARY KEY,
+    run_id UUID NOT NULL REFERENCES validation_runs(id) ON DELETE CASCADE,
+    version INTEGER NOT NULL,
+
+    -- Patch contents (top-level phase_state keys)
+    set_values JSONB NOT NULL DEFAULT '{}',  -- {key: new_value}
+    unset_keys TEXT[] NOT NULL DEFAULT '{}',  -- keys removed from state
+
+    -- Timestamps
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    UNIQUE (run_id, version)
+);
+
+-- Add Row Level Security (RLS)
+ALTER TABLE validation_state_patches ENABLE ROW LEVEL SECURITY;
+
+-- Service role bypass (for Modal backend operations using service_role key)
+CREATE POLICY "Service role has full access on validation_state_patches"
+    ON validation_state_patches FOR ALL
+    USING (auth.role() = 'service_role')
+    WITH CHECK (auth.role() = 'service_role');
+
+-- ============================================================
+-- Function: check the run columns a checkpoint writes with its state
+-- p_run_fields holds validation_runs columns (current_phase, status,
+-- hitl_state, ...) that must change in the same UPDATE as the state,
+-- so a crash between writes cannot leave new state with old markers.
+-- Unknown keys raise instead of being dropped.
+-- ============================================================
+CREATE OR REPLACE FUNCTION checked_run_fields(p_run_fields JSONB)
+RETURNS JSONB AS $$
+DECLARE
+    v_key TEXT;
+BEGIN
+    FOR v_key IN SELECT jsonb_object_keys(COALESCE(p_run_fields, '{}')) LOOP
+        IF v_key NOT IN (
+            'current_phase', 'status', 'hitl_state', 'hitl_checkpoint_at',
+            'completed_at', 'updated_at'
+        ) THEN
+            RAISE EXCEPTION 'unsupported run field in state checkpoint: %', v_key;
+        END IF;
+    END LOOP;
+    RETURN COALESCE(p_run_fields, '{}');
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+-- ============================================================
+-- Function: append a patch and bump the run's state version
+-- The UPDATE row lock serializes concurrent writers for a run, and
+-- p_run_fields is applied in the same UPDATE (see checked_run_fields).
+-- ============================================================
+CREATE OR REPLACE FUNCTION append_state_patch(
+    p_run_id UUID,
+    p_set_values JSONB,
+    p_unset_keys TEXT[] DEFAULT '{}',
+    p_run_fields JSONB DEFAULT '{}'
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_fields JSONB := checked_run_fields(p_run_fields);
+    v_version INTEGER;
+    v_base_version INTEGER;
+BEGIN
+    UPDATE validation_runs
+    SET state_version = state_version + 1,
+        current_phase = CASE WHEN v_fields ? 'current_phase'
+            THEN (v_fields->>'current_phase')::INTEGER ELSE current_phase END,
+        status = CASE WHEN v_fields ? 'status' THEN v_fields->>'status' ELSE status END,
+        hitl_state = CASE WHEN v_fields ? 'hitl_state' THEN v_fields->>'hitl_state' ELSE hitl_state END,
+        hitl_checkpoint_at = CASE WHEN v_fields ? 'hitl_checkpoint_at'
+            THEN (v_fields->>'hitl_checkpoint_at')::TIMESTAMPTZ ELSE hitl_checkpoint_at END,
+        completed_at = CASE WHEN v_fields ? 'completed_at'
+            THEN (v_fields->>'completed_at')::TIMESTAMPTZ ELSE completed_at END,
+        updated_at = COALESCE((v_fields->>'updated_at')::TIMESTAMPTZ, NOW())
+    WHERE id = p_run_id
+    RETURNING state_version, state_base_version INTO v_version, v_base_version;
+
+    IF v_version IS NULL THEN
+        RAISE EXCEPTION 'validation run % not found', p_run_id;
+    END IF;
+
+    INSERT INTO validation_state_patches (run_id, version, set_values, unset_keys)
+    VALUES (p_run_id, v_version, COALESCE(p_set_values, '{}'), COALESCE(p_unset_keys, '{}'));
+
+    RETURN jsonb_build_object(
+        'version', v_version,
+        'pending_patches', v_version - v_base_version
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================
+-- Function: fold pending patches into phase_state
+-- ============================================================
+CREATE OR REPLACE FUNCTION compact_state_patches(p_run_id UUID)
+RETURNS INTEGER AS $$
+DECLARE
+    v_state JSONB;
+    v_version INTEGER;
+    v_base_version INTEGER;
+    v_patch RECORD;
+    v_folded INTEGER := 0;
+BEGIN
+    SELECT phase_state, state_version, state_base_version
+    INTO v_state, v_version, v_base_version
+    FROM validation_runs
+    WHERE id = p_run_id
+    FOR UPDATE;
+
+    IF NOT FOUND OR v_version = v_base_version THEN
+        RETURN 0;
+    END IF;
+
+    FOR v_patch IN
+        SELECT set_values, unset_keys
+        FROM validation_state_patches
+        WHERE run_id = p_run_id
+          AND version > v_base_version
+          AND version <= v_version
+        ORDER BY version
+    LOOP
+        v_state := (COALESCE(v_state, '{}') || v_patch.set_values) - v_patch.unset_keys;
+        v_folded := v_folded + 1;
+    END LOOP;
+
+    UPDATE validation_runs
+    SET phase_state = v_state,
+        state_base_version = v_version
+    WHERE id = p_run_id;
+
+    DELETE FROM validation_state_patches
+    WHERE run_id = p_run_id AND version <= v_version;
+
+    RETURN v_folded;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================
+-- Function: replace phase_state wholesale, discarding pending patches
+-- Used when every section changed, so a patch would save nothing.
+-- p_run_fields is applied in the same UPDATE (see checked_run_fields).
+-- ============================================================
+CREATE OR REPLACE FUNCTION replace_phase_state(
+    p_run_id UUID,
+    p_state JSONB,
+    p_run_fields JSONB DEFAULT '{}'
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_fields JSONB := checked_run_fields(p_run_fields);
+    v_version INTEGER;
+BEGIN
+    UPDATE validation_runs
+    SET phase_state = p_state,
+        state_base_version = state_version,
+        current_phase = CASE WHEN v_fields ? 'current_phase'
+            THEN (v_fields->>'current_phase')::INTEGER ELSE current_phase END,
+        status = CASE WHEN v_fields ? 'status' THEN v_fields->>'status' ELSE status END,
+        hitl_state = CASE WHEN v_fields ? 'hitl_state' THEN v_fields->>'hitl_state' ELSE hitl_state END,
+        hitl_checkpoint_at = CASE WHEN v_fields ? 'hitl_checkpoint_at'
+            THEN (v_fields->>'hitl_checkpoint_at')::TIMESTAMPTZ ELSE hitl_checkpoint_at END,
+        completed_at = CASE WHEN v_fields ? 'completed_at'
+            THEN (v_fields->>'completed_at')::TIMESTAMPTZ ELSE completed_at END,
+        updated_at = COALESCE((v_fields->>'updated_at')::TIMESTAMPTZ, NOW())
+    WHERE id = p_run_id
+    RETURNING state_version INTO v_version;
+
+    DELETE FROM validation_state_patches
+    WHERE run_id = p_run_id AND version <= v_version;
+
+    RETURN v_version;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================
+-- Comments
+-- ============================================================
+COMMENT ON TABLE validation_state_patches IS 'Per-key phase_state patches appended by delta checkpoints, folded back by compact_state_patches()';
+COMMENT ON COLUMN validation_runs.state_version IS 'Version of the newest phase_state patch';
+COMMENT ON COLUMN validation_runs.state_base_version IS 'Patch version already folded into phase_state';
@@ -0,0 +1,221 @@
+-- ============================================================
+-- Migration 012: Materialized Run Status Summary
+-- ============================================================
+-- Created: 2026-10-16
+-- Purpose: Serve GET /status/{run_id} from one round trip. Triggers keep a
+--          per-run summary (run status, latest progress, pending HITL, version)
+--          up to date on write; get_run_status() returns it plus one page of
+--          progress after a cursor (src/state/run_status.py)
+-- Tables: validation_run_status
+-- ============================================================
+
+-- ============================================================
+-- Table: validation_run_status
+-- Purpose: One row per run, maintained by triggers
+-- version is bumped on every change and backs the endpoint's ETag
+-- ============================================================
+CREATE TABLE IF NOT EXISTS validation_run_status (
+    run_id UUID PRIMARY KEY REFERENCES validation_runs(id) ON DELETE CASCADE,
+    version BIGINT NOT NULL DEFAULT 1,
+
+    -- Copied from validation_runs
+    status TEXT NOT NULL DEFAULT 'pending',
+    current_phase INTEGER NOT NULL DEFAULT 0,
+    hitl_state TEXT,
+    error_message TEXT,
+    started_at TIMESTAMPTZ,
+    run_updated_at TIMESTAMPTZ,
+
+    -- Progress rollup
+    progress_count INTEGER NOT NULL DEFAULT 0,
+    latest_progress JSONB,
+
+    -- Newest pending hitl_requests row (NULL when none)
+    hitl_pending JSONB,
+
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Add Row Level Security (RLS)
+ALTER TABLE validation_run_status ENABLE ROW LEVEL SECURITY;
+
+-- Service role bypass (for Modal backend operations using service_role key)
+CREATE POLICY "Service role has full access on validation_run_status"
+    ON validation_run_status FOR ALL
+    USING (auth.role() = 'service_role')
+    WITH CHECK (auth.role() = 'service_role');
+
+-- Users can view their own run status
+CREATE POLICY "Users can view own run status"
+    ON validation_run_status FOR SELECT
+    USING (
+        run_id IN (
+            SELECT id FROM validation_runs WHERE user_id = auth.uid()
+        )
+    );
+
+-- Keyset pagination over progress: (created_at, id)
+CREATE INDEX IF NOT EXISTS idx_validation_progress_run_cursor
+    ON validation_progress(run_id, created_at, id);
+
+-- ============================================================
+-- Triggers: keep validation_run_status in sync
+-- SECURITY DEFINER so user-initiated writes allowed by migration 008
+-- (run kickoff, HITL updates) can maintain the service-role-only summary.
+-- ============================================================
+CREATE OR REPLACE FUNCTION sync_run_status_from_run()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO validation_run_status (
+        run_id, status, current_phase, hitl_state, error_message,
+        started_at, run_updated_at
+    )
+    VALUES (
+        NEW.id, NEW.status, NEW.current_phase, NEW.hitl_state, NEW.error_message,
+        NEW.started_at, NEW.updated_at
+    )
+    ON CONFLICT (run_id) DO UPDATE SET
+        status = EXCLUDED.status,
+        current_phase = EXCLUDED.current_phase,
+        hitl_state = EXCLUDED.hitl_state,
+        error_message = EXCLUDED.error_message,
+        started_at = EXCLUDED.started_at,
+        run_updated_at = EXCLUDED.run_updated_at,
+        version = validation_run_status.version + 1,
+        updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS sync_run_status_on_run ON validation_runs;
+CREATE TRIGGER sync_run_status_on_run
+    AFTER INSERT OR UPDATE OF status, current_phase, hitl_state, error_message, started_at
+    ON validation_runs
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_run_status_from_run();
+
+CREATE OR REPLACE FUNCTION sync_run_status_from_progress()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE validation_run_status
+    SET progress_count = progress_count + 1,
+        latest_progress = to_jsonb(NEW),
+        version = version + 1,
+        updated_at = NOW()
+    WHERE run_id = NEW.run_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS sync_run_status_on_progress ON validation_progress;
+CREATE TRIGGER sync_run_status_on_progress
+    AFTER INSERT ON validation_progress
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_run_status_from_progress();
+
+CREATE OR REPLACE FUNCTION sync_run_status_from_hitl()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE validation_run_status
+    SET hitl_pending = (
+            SELECT to_jsonb(h)
+            FROM hitl_requests h
+            WHERE h.run_id = NEW.run_id AND h.status = 'pending'
+            ORDER BY h.created_at DESC
+            LIMIT 1
+        ),
+        version = version + 1,
+        updated_at = NOW()
+    WHERE run_id = NEW.run_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS sync_run_status_on_hitl ON hitl_requests;
+CREATE TRIGGER sync_run_status_on_hitl
+    AFTER INSERT OR UPDATE ON hitl_requests
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_run_status_from_hitl();
+
+-- ============================================================
+-- Backfill existing runs
+-- ============================================================
+INSERT INTO validation_run_status (
+    run_id, status, current_phase, hitl_state, error_message,
+    started_at, run_updated_at, progress_count, latest_progress, hitl_pending
+)
+SELECT
+    r.id, r.status, r.current_phase, r.hitl_state, r.error_message,
+    r.started_at, r.updated_at,
+    (SELECT COUNT(*) FROM validation_progress p WHERE p.run_id = r.id),
+    (SELECT to_jsonb(p) FROM validation_progress p WHERE p.run_id = r.id
+        ORDER BY p.created_at DESC, p.id DESC LIMIT 1),
+    (SELECT to_jsonb(h) FROM hitl_requests h WHERE h.run_id = r.id AND h.status = 'pending'
+        ORDER BY h.created_at DESC LIMIT 1)
+FROM validation_runs r
+ON CONFLICT (run_id) DO NOTHING;
+
+-- ============================================================
+-- Function: status summary + one page of progress
+-- p_since: progress id or ISO timestamp; rows strictly after it are returned
+-- p_known_version: when equal to the current version only
+--                  {version, not_modified} is returned (ETag short-circuit)
+-- ============================================================
+CREATE OR REPLACE FUNCTION get_run_status(
+    p_run_id UUID,
+    p_since TEXT DEFAULT NULL,
+    p_limit INTEGER DEFAULT 500,
+    p_known_version BIGINT DEFAULT NULL
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_summary validation_run_status%ROWTYPE;
+    v_cursor_at TIMESTAMPTZ;
+    v_cursor_id UUID;
+    v_progress JSONB;
+BEGIN
+    SELECT * INTO v_summary FROM validation_run_status WHERE run_id = p_run_id;
+
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    IF p_known_version IS NOT NULL AND p_known_version = v_summary.version THEN
+        RETURN jsonb_build_object('version', v_summary.version, 'not_modified', true);
+    END IF;
+
+    IF p_since IS NOT NULL THEN
+        IF p_since ~* '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$' THEN
+            SELECT created_at, id INTO v_cursor_at, v_cursor_id
+            FROM validation_progress
+            WHERE id = p_since::UUID AND run_id = p_run_id;
+        ELSE
+            v_cursor_at := p_since::TIMESTAMPTZ;
+            v_cursor_id := 'ffffffff-ffff-ffff-ffff-ffffffffffff';
+        END IF;
+    END IF;
+
+    SELECT COALESCE(jsonb_agg(to_jsonb(p) ORDER BY p.created_at, p.id), '[]')
+    INTO v_progress
+    FROM (
+        SELECT *
+        FROM validation_progress
+        WHERE run_id = p_run_id
+          AND (v_cursor_at IS NULL OR (created_at, id) > (v_cursor_at, v_cursor_id))
+        ORDER BY created_at, id
+        LIMIT p_limit + 1
+    ) p;
+
+    RETURN to_jsonb(v_summary) || jsonb_build_object(
+        'progress', v_progress,
+        'not_modified', false
+    );
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================================
+-- Comments
+-- ============================================================
+COMMENT ON TABLE validation_run_status IS 'Per-run status summary maintained by triggers; read by get_run_status()';
+COMMENT ON COLUMN validation_run_status.version IS 'Bumped on every run/progress/HITL change; backs the /status ETag';
+COMMENT ON FUNCTION get_run_status IS 'Run summary plus progress page after a cursor, in one round trip';
@@ -0,0 +1,72 @@
+-- ============================================================
+-- Migration 013: Run Event Log
+-- ============================================================
+-- Created: 2026-10-16
+-- Purpose: Ordered per-run event log behind GET /status/{run_id}/stream
+--          (Server-Sent Events). The bigserial id is the SSE event id, so
+--          clients resume with Last-Event-ID (src/state/run_events.py)
+-- Tables: run_events
+-- ============================================================
+
+-- ============================================================
+-- Table: run_events
+-- Purpose: Append-only progress / HITL / completion events per run
+-- ============================================================
+CREATE TABLE IF NOT EXISTS run_events (
+    id BIGSERIAL PRIMARY KEY,
+    run_id UUID NOT NULL REFERENCES validation_runs(id) ON DELETE CASCADE,
+
+    -- Event details
+    event_type TEXT NOT NULL,  -- progress, hitl_required, validation_complete, validation_failed
+    payload JSONB NOT NULL DEFAULT '{}',
+
+    -- Timestamps
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Indexes for run_events
+CREATE INDEX IF NOT EXISTS idx_run_events_run_id ON run_events(run_id, id);
+CREATE INDEX IF NOT EXISTS idx_run_events_created ON run_events(created_at);
+
+-- Add Row Level Security (RLS)
+ALTER TABLE run_events ENABLE ROW LEVEL SECURITY;
+
+-- Service role bypass (for Modal backend operations using service_role key)
+CREATE POLICY "Service role has full access on run_events"
+    ON run_events FOR ALL
+    USING (auth.role() = 'service_role')
+    WITH CHECK (auth.role() = 'service_role');
+
+-- Users can view their own run events
+CREATE POLICY "Users can view own run events"
+    ON run_events FOR SELECT
+    USING (
+        run_id IN (
+            SELECT id FROM validation_runs WHERE user_id = auth.uid()
+        )
+    );
+
+-- ============================================================
+-- Trigger: mirror validation_progress rows into run_events
+-- HITL and completion events are recorded by the webhook senders.
+-- ============================================================
+CREATE OR REPLACE FUNCTION record_progress_run_event()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO run_events (run_id, event_type, payload, created_at)
+    VALUES (NEW.run_id, 'progress', to_jsonb(NEW), NEW.created_at);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS record_progress_run_event ON validation_progress;
+CREATE TRIGGER record_progress_run_event
+    AFTER INSERT ON validation_progress
+    FOR EACH ROW
+    EXECUTE FUNCTION record_progress_run_event();
+
+-- ============================================================
+-- Comments
+-- ============================================================
+COMMENT ON TABLE run_events IS 'Ordered per-run event log for the SSE status stream';
+COMMENT ON COLUMN run_events.id IS 'Monotonic SSE event id (Last-Event-ID)';
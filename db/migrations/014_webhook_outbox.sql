@@ -0,0 +1,158 @@
+-- ============================================================
+-- Migration 014: Webhook Outbox
+-- ============================================================
+-- Created: 2026-10-16
+-- Purpose: Durable outbound webhooks to the product app. Orchestrator code
+--          enqueues events here instead of POSTing inline; the
+--          deliver_webhooks Modal function drains the table with
+--          exponential backoff (src/state/webhook_outbox.py)
+-- Tables: webhook_outbox
+-- ============================================================
+
+-- ============================================================
+-- Table: webhook_outbox
+-- Purpose: Pending / delivered / dead webhook events
+-- ============================================================
+CREATE TABLE IF NOT EXISTS webhook_outbox (
+    id BIGSERIAL PRIMARY KEY,
+    run_id UUID REFERENCES validation_runs(id) ON DELETE SET NULL,
+
+    -- Delivery target and body
+    endpoint TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    body JSONB NOT NULL,
+
+    -- Delivery state
+    status TEXT NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'delivering', 'delivered', 'dead')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    locked_until TIMESTAMPTZ,
+    claim_token UUID,
+    last_error TEXT,
+
+    -- Timestamps
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    delivered_at TIMESTAMPTZ
+);
+
+-- Indexes for webhook_outbox
+CREATE INDEX IF NOT EXISTS idx_webhook_outbox_due
+    ON webhook_outbox(next_attempt_at, id) WHERE status IN ('pending', 'delivering');
+CREATE INDEX IF NOT EXISTS idx_webhook_outbox_run ON webhook_outbox(run_id);
+
+-- Add Row Level Security (RLS)
+ALTER TABLE webhook_outbox ENABLE ROW LEVEL SECURITY;
+
+-- Service role bypass (for Modal backend operations using service_role key)
+CREATE POLICY "Service role has full access on webhook_outbox"
+    ON webhook_outbox FOR ALL
+    USING (auth.role() = 'service_role')
+    WITH CHECK (auth.role() = 'service_role');
+
+-- ============================================================
+-- Function: claim due events for delivery
+-- SKIP LOCKED lets several workers drain concurrently; the lease
+-- returns events to the queue if a worker dies mid-delivery. Each
+-- claim gets a fresh claim_token, so a worker whose lease expired
+-- cannot complete or fail rows another worker has re-claimed.
+-- ============================================================
+CREATE OR REPLACE FUNCTION claim_webhook_events(
+    p_limit INTEGER DEFAULT 10,
+    p_lease_seconds INTEGER DEFAULT 300
+)
+RETURNS SETOF webhook_outbox AS $$
+DECLARE
+    v_token UUID := gen_random_uuid();
+BEGIN
+    RETURN QUERY
+    UPDATE webhook_outbox o
+    SET status = 'delivering',
+        locked_until = NOW() + make_interval(secs => p_lease_seconds),
+        claim_token = v_token
+    WHERE o.id IN (
+        SELECT id
+        FROM webhook_outbox
+        WHERE next_attempt_at <= NOW()
+          AND (status = 'pending'
+               OR (status = 'delivering' AND locked_until < NOW()))
+        ORDER BY id
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING o.*;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================
+-- Function: mark events delivered
+-- Only rows still held by p_claim_token are updated; returns the count
+-- ============================================================
+CREATE OR REPLACE FUNCTION complete_webhook_events(
+    p_ids BIGINT[],
+    p_claim_token UUID
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_count INTEGER;
+BEGIN
+    UPDATE webhook_outbox
+    SET status = 'delivered',
+        attempts = attempts + 1,
+        delivered_at = NOW(),
+        locked_until = NULL,
+        claim_token = NULL,
+        last_error = NULL
+    WHERE id = ANY(p_ids)
+      AND status = 'delivering'
+      AND claim_token = p_claim_token;
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RETURN v_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================
+-- Function: reschedule failed events with exponential backoff
+-- delay = min(p_base_seconds * 2^attempts, p_max_seconds) with +/-20% jitter;
+-- events reaching p_max_attempts become 'dead'. Only rows still held by
+-- p_claim_token are updated; returns the count
+-- ============================================================
+CREATE OR REPLACE FUNCTION fail_webhook_events(
+    p_ids BIGINT[],
+    p_claim_token UUID,
+    p_error TEXT,
+    p_max_attempts INTEGER DEFAULT 10,
+    p_base_seconds INTEGER DEFAULT 10,
+    p_max_seconds INTEGER DEFAULT 3600
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_count INTEGER;
+BEGIN
+    UPDATE webhook_outbox
+    SET attempts = attempts + 1,
+        status = CASE WHEN attempts + 1 >= p_max_attempts THEN 'dead' ELSE 'pending' END,
+        next_attempt_at = NOW() + make_interval(secs =>
+            LEAST(p_base_seconds * POWER(2, attempts), p_max_seconds) * (0.8 + random() * 0.4)
+        ),
+        locked_until = NULL,
+        claim_token = NULL,
+        last_error = LEFT(p_error, 1000)
+    WHERE id = ANY(p_ids)
+      AND status = 'delivering'
+      AND claim_token = p_claim_token;
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RETURN v_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================
+-- Comments
+-- ============================================================
+COMMENT ON TABLE webhook_outbox IS 'Durable outbound webhook queue drained by the deliver_webhooks Modal function';
+COMMENT ON COLUMN webhook_outbox.locked_until IS 'Delivery lease; expired leases are re-claimed';
+COMMENT ON COLUMN webhook_outbox.claim_token IS 'Token of the current claim; complete/fail only touch rows still holding it';
+COMMENT ON COLUMN webhook_outbox.endpoint IS 'Target URL; delivery only POSTs to endpoints on the configured allow-list';
+COMMENT ON COLUMN webhook_outbox.status IS 'pending -> delivering -> delivered, or dead after max attempts';
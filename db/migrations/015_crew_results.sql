@@ -0,0 +1,49 @@
+-- ============================================================
+-- Migration 015: Crew Result Memoization
+-- ============================================================
+-- Created: 2026-10-16
+-- Purpose: Persist each completed crew's result under an idempotency key
+--          (run_id, phase, crew, input_hash) so a retried phase skips crews
+--          that already finished (src/state/crew_results.py)
+-- Tables: crew_results
+-- ============================================================
+
+-- ============================================================
+-- Table: crew_results
+-- Purpose: Completed crew outputs keyed by their inputs
+-- ============================================================
+CREATE TABLE IF NOT EXISTS crew_results (
+    id BIGSERIAL PRIMARY KEY,
+    run_id UUID NOT NULL REFERENCES validation_runs(id) ON DELETE CASCADE,
+
+    -- Idempotency key
+    phase INTEGER NOT NULL CHECK (phase >= 0 AND phase <= 4),
+    crew TEXT NOT NULL,
+    input_hash TEXT NOT NULL,  -- SHA-256 of phase inputs + dependency results
+
+    -- Result
+    result JSONB,
+
+    -- Timestamps
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    UNIQUE (run_id, phase, crew, input_hash)
+);
+
+-- Indexes for crew_results
+CREATE INDEX IF NOT EXISTS idx_crew_results_run_phase ON crew_results(run_id, phase);
+
+-- Add Row Level Security (RLS)
+ALTER TABLE crew_results ENABLE ROW LEVEL SECURITY;
+
+-- Service role bypass (for Modal backend operations using service_role key)
+CREATE POLICY "Service role has full access on crew_results"
+    ON crew_results FOR ALL
+    USING (auth.role() = 'service_role')
+    WITH CHECK (auth.role() = 'service_role');
+
+-- ============================================================
+-- Comments
+-- ============================================================
+COMMENT ON TABLE crew_results IS 'Memoized crew outputs reused when a phase is retried';
+COMMENT ON COLUMN crew_results.input_hash IS 'Hash of the phase inputs and the results of the crews this crew depends on';
@@ -0,0 +1,153 @@
+-- ============================================================
+-- Migration 016: LLM Token and Cost Ledger
+-- ============================================================
+-- Created: 2026-10-16
+-- Purpose: Record prompt/completion tokens and USD cost of every LLM call,
+--          aggregated per (run, phase, crew, model), and keep a per-run
+--          rollup on validation_run_status so GET /status can report it
+--          (src/shared/metering.py)
+-- Tables: llm_usage, validation_run_status (llm_usage column)
+-- ============================================================
+
+-- ============================================================
+-- Table: llm_usage
+-- Purpose: Running totals per run, phase, crew and model
+-- crew is '_phase' for calls made outside any crew
+-- ============================================================
+CREATE TABLE IF NOT EXISTS llm_usage (
+    id BIGSERIAL PRIMARY KEY,
+    run_id UUID NOT NULL REFERENCES validation_runs(id) ON DELETE CASCADE,
+
+    -- Aggregation key
+    phase INTEGER NOT NULL CHECK (phase >= 0 AND phase <= 4),
+    crew TEXT NOT NULL,
+    model TEXT NOT NULL,
+
+    -- Totals
+    calls INTEGER NOT NULL DEFAULT 0,
+    cache_hits INTEGER NOT NULL DEFAULT 0,  -- served by the completion cache (no tokens, no cost)
+    prompt_tokens BIGINT NOT NULL DEFAULT 0,
+    completion_tokens BIGINT NOT NULL DEFAULT 0,
+    cost_usd NUMERIC(12, 6) NOT NULL DEFAULT 0,
+
+    -- Timestamps
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    UNIQUE (run_id, phase, crew, model)
+);
+
+-- Indexes for llm_usage
+CREATE INDEX IF NOT EXISTS idx_llm_usage_crew_cost ON llm_usage(crew, cost_usd DESC);
+
+-- Add Row Level Security (RLS)
+ALTER TABLE llm_usage ENABLE ROW LEVEL SECURITY;
+
+-- Service role bypass (for Modal backend operations using service_role key)
+CREATE POLICY "Service role has full access on llm_usage"
+    ON llm_usage FOR ALL
+    USING (auth.role() = 'service_role')
+    WITH CHECK (auth.role() = 'service_role');
+
+-- Per-run rollup served by get_run_status() (to_jsonb of the summary row)
+ALTER TABLE validation_run_status ADD COLUMN IF NOT EXISTS llm_usage JSONB;
+
+-- ============================================================
+-- Function: per-run usage rollup
+-- Same shape as summarize_usage() in src/shared/metering.py
+-- ============================================================
+CREATE OR REPLACE FUNCTION summarize_llm_usage(p_run_id UUID)
+RETURNS JSONB AS $$
+    WITH crews AS (
+        SELECT
+            phase,
+            crew,
+            SUM(calls)::INTEGER AS calls,
+            SUM(cache_hits)::INTEGER AS cache_hits,
+            SUM(prompt_tokens) AS prompt_tokens,
+            SUM(completion_tokens) AS completion_tokens,
+            SUM(prompt_tokens + completion_tokens) AS total_tokens,
+            SUM(cost_usd) AS cost_usd
+        FROM llm_usage
+        WHERE run_id = p_run_id
+        GROUP BY phase, crew
+    ),
+    phases AS (
+        SELECT
+            phase,
+            jsonb_build_object(
+                'calls', SUM(calls),
+                'cache_hits', SUM(cache_hits),
+                'prompt_tokens', SUM(prompt_tokens),
+                'completion_tokens', SUM(completion_tokens),
+                'total_tokens', SUM(total_tokens),
+                'cost_usd', SUM(cost_usd)
+            ) AS totals
+        FROM crews
+        GROUP BY phase
+    )
+    SELECT jsonb_build_object(
+        'calls', COALESCE(SUM(calls), 0),
+        'cache_hits', COALESCE(SUM(cache_hits), 0),
+        'prompt_tokens', COALESCE(SUM(prompt_tokens), 0),
+        'completion_tokens', COALESCE(SUM(completion_tokens), 0),
+        'total_tokens', COALESCE(SUM(total_tokens), 0),
+        'cost_usd', COALESCE(SUM(cost_usd), 0),
+        'by_phase', COALESCE((SELECT jsonb_object_agg(phase::TEXT, totals) FROM phases), '{}'),
+        'by_crew', COALESCE(jsonb_agg(to_jsonb(crews) ORDER BY cost_usd DESC), '[]')
+    )
+    FROM crews;
+$$ LANGUAGE sql STABLE;
+
+-- ============================================================
+-- Function: add usage deltas and refresh the run rollups
+-- p_rows: [{run_id, phase, crew, model, calls, cache_hits,
+--           prompt_tokens, completion_tokens, cost_usd}, ...]
+-- ============================================================
+CREATE OR REPLACE FUNCTION record_llm_usage(p_rows JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    v_count INTEGER;
+BEGIN
+    INSERT INTO llm_usage (
+        run_id, phase, crew, model,
+        calls, cache_hits, prompt_tokens, completion_tokens, cost_usd
+    )
+    SELECT
+        (r->>'run_id')::UUID,
+        (r->>'phase')::INTEGER,
+        COALESCE(r->>'crew', '_phase'),
+        r->>'model',
+        COALESCE((r->>'calls')::INTEGER, 0),
+        COALESCE((r->>'cache_hits')::INTEGER, 0),
+        COALESCE((r->>'prompt_tokens')::BIGINT, 0),
+        COALESCE((r->>'completion_tokens')::BIGINT, 0),
+        COALESCE((r->>'cost_usd')::NUMERIC, 0)
+    FROM jsonb_array_elements(p_rows) r
+    ON CONFLICT (run_id, phase, crew, model) DO UPDATE SET
+        calls = llm_usage.calls + EXCLUDED.calls,
+        cache_hits = llm_usage.cache_hits + EXCLUDED.cache_hits,
+        prompt_tokens = llm_usage.prompt_tokens + EXCLUDED.prompt_tokens,
+        completion_tokens = llm_usage.completion_tokens + EXCLUDED.completion_tokens,
+        cost_usd = llm_usage.cost_usd + EXCLUDED.cost_usd,
+        updated_at = NOW();
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+
+    UPDATE validation_run_status s
+    SET llm_usage = summarize_llm_usage(s.run_id),
+        version = s.version + 1,
+        updated_at = NOW()
+    WHERE s.run_id IN (SELECT DISTINCT (r->>'run_id')::UUID FROM jsonb_array_elements(p_rows) r);
+
+    RETURN v_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================
+-- Comments
+-- ============================================================
+COMMENT ON TABLE llm_usage IS 'LLM tokens and USD cost per run, phase, crew and model';
+COMMENT ON COLUMN llm_usage.cost_usd IS 'Computed from src/shared/metering.py MODEL_PRICES at call time';
+COMMENT ON COLUMN validation_run_status.llm_usage IS 'Run usage rollup (totals, by_phase, by_crew); refreshed by record_llm_usage()';
+COMMENT ON FUNCTION record_llm_usage IS 'Add usage deltas from one phase container and refresh run rollups';
@@ -0,0 +1,264 @@
+-- ============================================================
+-- Migration 017: Transactional HITL Decisions
+-- ============================================================
+-- Created: 2026-10-16
+-- Purpose: Apply a HITL decision in one RPC. /hitl/approve used to
+--          update hitl_requests, read validation_runs (and the request
+--          context for segment pivots) and update validation_runs in
+--          separate round trips, so two approvals of one checkpoint could
+--          both resume the run. hitl_apply_decision() locks the run,
+--          claims the checkpoint, records the decision and moves the run
+--          in one transaction (src/state/hitl.py)
+-- Functions: phase_state_value, hitl_apply_decision
+-- ============================================================
+
+-- ============================================================
+-- Function: one top-level key of the materialized phase_state
+-- Materialized state = phase_state + patches (state_base_version,
+-- state_version] (migration 011). Returns JSON null for removed keys and
+-- SQL NULL for keys never set. Keys stored only inside a Storage
+-- snapshot (STATE_CHECKPOINT_MODE=snapshot) are not visible.
+-- ============================================================
+CREATE OR REPLACE FUNCTION phase_state_value(p_run_id UUID, p_key TEXT)
+RETURNS JSONB AS $$
+    SELECT COALESCE(
+        (
+            SELECT CASE WHEN p_key = ANY(p.unset_keys) THEN 'null'::jsonb
+                        ELSE p.set_values -> p_key END
+            FROM validation_state_patches p
+            JOIN validation_runs r ON r.id = p.run_id
+            WHERE p.run_id = p_run_id
+              AND p.version > r.state_base_version
+              AND p.version <= r.state_version
+              AND (p.set_values ? p_key OR p_key = ANY(p.unset_keys))
+            ORDER BY p.version DESC
+            LIMIT 1
+        ),
+        (SELECT phase_state -> p_key FROM validation_runs WHERE id = p_run_id)
+    );
+$$ LANGUAGE sql STABLE;
+
+-- ============================================================
+-- Function: apply a HITL decision atomically
+-- Decisions: approved, rejected, override_proceed, iterate,
+--            segment_<n>, custom_segment (same transitions as the
+--            original /hitl/approve handler)
+-- The run row lock serializes decisions for a run; a decision is only
+-- accepted while validation_runs.hitl_state is the checkpoint (or its
+-- rejected_ state), so a second approval gets {"error": "conflict"}.
+--
+-- p_state_updates: extra top-level phase_state keys computed by the
+-- caller (segment pivot envelope, snapshot-mode iteration count); they
+-- are applied last.
+--
+-- Returns: {outcome, next_phase, pivot_type, resume, segment_name,
+--           previous_phase} or {error: not_found|conflict|invalid, detail}
+-- ============================================================
+CREATE OR REPLACE FUNCTION hitl_apply_decision(
+    p_run_id UUID,
+    p_checkpoint TEXT,
+    p_decision TEXT,
+    p_feedback TEXT DEFAULT NULL,
+    p_custom_segment JSONB DEFAULT NULL,
+    p_state_updates JSONB DEFAULT '{}'
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_run RECORD;
+    v_request RECORD;
+    v_feedback TEXT := NULLIF(p_feedback, '');
+    v_updates JSONB := '{}';
+    v_outcome TEXT;
+    v_request_status TEXT := 'approved';
+    v_run_status TEXT := 'running';
+    v_hitl_state TEXT := NULL;
+    v_next_phase INTEGER;
+    v_pivot_type TEXT;
+    v_segment JSONB;
+    v_index INTEGER;
+    v_iterations JSONB;
+    v_current_segment JSONB;
+BEGIN
+    SELECT id, current_phase, hitl_state, state_version, state_base_version
+    INTO v_run
+    FROM validation_runs
+    WHERE id = p_run_id
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('error', 'not_found', 'detail', 'Validation run not found');
+    END IF;
+
+    IF v_run.hitl_state IS DISTINCT FROM p_checkpoint
+       AND v_run.hitl_state IS DISTINCT FROM 'rejected_' || p_checkpoint THEN
+        RETURN jsonb_build_object(
+            'error', 'conflict',
+            'detail', format('Checkpoint ''%s'' is not awaiting a decision (hitl_state: %s)',
+                             p_checkpoint, COALESCE(v_run.hitl_state, 'none'))
+        );
+    END IF;
+
+    SELECT id, context
+    INTO v_request
+    FROM hitl_requests
+    WHERE run_id = p_run_id
+      AND checkpoint_name = p_checkpoint
+      AND status IN ('pending', 'rejected')
+    ORDER BY created_at DESC
+    LIMIT 1
+    FOR UPDATE;
+
+    -- -------------------------------------------------------------
+    -- Segment selection (segment_<n>, custom_segment)
+    -- -------------------------------------------------------------
+    IF p_decision LIKE 'segment\_%' OR p_decision = 'custom_segment' THEN
+        IF p_checkpoint <> 'approve_segment_pivot' THEN
+            RETURN jsonb_build_object(
+                'error', 'invalid',
+                'detail', 'Segment selection is only valid for approve_segment_pivot checkpoint'
+            );
+        END IF;
+
+        IF p_decision = 'custom_segment' THEN
+            v_segment := jsonb_build_object(
+                'segment_name', CASE WHEN p_custom_segment IS NOT NULL
+                                     THEN p_custom_segment -> 'segment_name'
+                                     ELSE to_jsonb(p_feedback) END,
+                'segment_description', COALESCE(p_custom_segment -> 'segment_description', '""'::jsonb),
+                'confidence', 0.5,
+                'is_custom', true
+            );
+        ELSE
+            v_index := split_part(p_decision, '_', 2)::INTEGER - 1;
+            v_segment := COALESCE(v_request.context, '{}') -> 'segment_alternatives' -> v_index;
+            IF v_segment IS NULL OR jsonb_typeof(v_segment) <> 'object' THEN
+                RETURN jsonb_build_object('error', 'invalid', 'detail', 'Invalid segment selection: ' || p_decision);
+            END IF;
+            v_segment := v_segment || '{"is_custom": false}'::jsonb;
+        END IF;
+
+        v_outcome := 'pivot';
+        v_pivot_type := 'segment_pivot';
+        v_next_phase := 1;
+        v_updates := jsonb_build_object(
+            'pivot_type', v_pivot_type,
+            'pivot_reason', COALESCE(v_feedback, 'Segment pivot to: ' || COALESCE(v_segment ->> 'segment_name', 'None')),
+            'pivot_from_phase', v_run.current_phase,
+            'target_segment_hypothesis', v_segment,
+            'failed_segment', COALESCE(v_request.context, '{}') -> 'failed_segment'
+        );
+
+    -- -------------------------------------------------------------
+    -- Approved
+    -- -------------------------------------------------------------
+    ELSIF p_decision = 'approved' THEN
+        IF p_checkpoint IN ('approve_segment_pivot', 'approve_value_pivot') THEN
+            v_outcome := 'pivot';
+            v_pivot_type := CASE WHEN p_checkpoint = 'approve_segment_pivot'
+                                 THEN 'segment_pivot' ELSE 'value_pivot' END;
+            v_next_phase := 1;
+            v_updates := jsonb_build_object(
+                'pivot_type', v_pivot_type,
+                'pivot_reason', COALESCE(v_feedback, 'Pivot approved from Phase 2: ' || v_pivot_type),
+                'pivot_from_phase', v_run.current_phase
+            );
+        ELSIF p_checkpoint = 'approve_brief' THEN
+            -- Stay in Phase 1: Stage B (VPC Discovery) runs next
+            v_outcome := 'resumed';
+            v_next_phase := v_run.current_phase;
+        ELSE
+            v_outcome := 'resumed';
+            v_next_phase := v_run.current_phase + 1;
+        END IF;
+
+    -- -------------------------------------------------------------
+    -- Override: ignore the pivot signal and proceed
+    -- -------------------------------------------------------------
+    ELSIF p_decision = 'override_proceed' THEN
+        v_outcome := 'resumed';
+        v_next_phase := v_run.current_phase + 1;
+        v_updates := jsonb_build_object(
+            'override_applied', true,
+            'override_reason', COALESCE(v_feedback, 'Human override: proceeding despite pivot signal'),
+            'override_checkpoint', p_checkpoint
+        );
+
+    -- -------------------------------------------------------------
+    -- Iterate: re-run the current phase (request stays pending)
+    -- -------------------------------------------------------------
+    ELSIF p_decision = 'iterate' THEN
+        v_outcome := 'iterate';
+        v_request_status := 'pending';
+        v_next_phase := v_run.current_phase;
+        v_iterations := phase_state_value(p_run_id, 'iteration_count');
+        v_updates := jsonb_build_object(
+            'iteration_count', CASE WHEN jsonb_typeof(v_iterations) = 'number'
+                                    THEN (v_iterations #>> '{}')::INTEGER ELSE 0 END + 1,
+            'iteration_reason', COALESCE(v_feedback, 'Additional experiments requested')
+        );
+        IF COALESCE(p_state_updates, '{}') ? 'pivot_type' THEN
+            v_updates := v_updates || jsonb_build_object('pivot_from_phase', v_run.current_phase);
+            v_current_segment := phase_state_value(p_run_id, 'customer_profile') -> 'segment_name';
+            IF v_current_segment IS NOT NULL
+               AND v_current_segment NOT IN ('null'::jsonb, '""'::jsonb) THEN
+                v_updates := v_updates || jsonb_build_object('failed_segment', v_current_segment);
+            END IF;
+        END IF;
+
+    -- -------------------------------------------------------------
+    -- Rejected: pause for review
+    -- -------------------------------------------------------------
+    ELSE
+        v_outcome := 'rejected';
+        v_request_status := 'rejected';
+        v_run_status := 'paused';
+        v_hitl_state := 'rejected_' || p_checkpoint;
+    END IF;
+
+    v_updates := v_updates || COALESCE(p_state_updates, '{}');
+
+    -- Record the decision
+    IF v_request.id IS NOT NULL THEN
+        UPDATE hitl_requests
+        SET status = v_request_status,
+            decision = p_decision,
+            feedback = p_feedback,
+            decision_at = NOW()
+        WHERE id = v_request.id;
+    END IF;
+
+    -- Move the run (state keys go in a patch while patches are pending)
+    IF v_updates <> '{}'::jsonb THEN
+        IF v_run.state_version > v_run.state_base_version THEN
+            PERFORM append_state_patch(p_run_id, v_updates, '{}');
+        ELSE
+            UPDATE validation_runs
+            SET phase_state = COALESCE(phase_state, '{}') || v_updates
+            WHERE id = p_run_id;
+        END IF;
+    END IF;
+
+    UPDATE validation_runs
+    SET hitl_state = v_hitl_state,
+        status = v_run_status,
+        current_phase = COALESCE(v_next_phase, current_phase),
+        updated_at = NOW()
+    WHERE id = p_run_id;
+
+    RETURN jsonb_build_object(
+        'outcome', v_outcome,
+        'next_phase', v_next_phase,
+        'pivot_type', COALESCE(v_pivot_type, v_updates ->> 'pivot_type'),
+        'resume', v_outcome <> 'rejected',
+        'segment_name', v_segment -> 'segment_name',
+        'confidence', v_segment -> 'confidence',
+        'previous_phase', v_run.current_phase
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================
+-- Comments
+-- ============================================================
+COMMENT ON FUNCTION phase_state_value IS 'One top-level key of the materialized phase_state (base + pending patches)';
+COMMENT ON FUNCTION hitl_apply_decision IS 'Record a HITL decision and move the run in one transaction; conflict if the checkpoint was already decided';
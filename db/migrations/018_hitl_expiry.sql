@@ -0,0 +1,129 @@
+-- ============================================================
+-- Migration 018: HITL Expiry Sweep
+-- ============================================================
+-- Created: 2026-10-16
+-- Purpose: Expire stale HITL requests in one statement. The 6-hourly
+--          cron used to UPDATE every stale request through PostgREST and
+--          read back full rows (context, options) just to count them;
+--          paused runs were never moved and the product app was never
+--          told. expire_hitl_requests() expires a bounded batch via the
+--          idx_hitl_requests_expires partial index, fails the runs still
+--          waiting on those checkpoints, records their run events and
+--          queues their failure webhooks, returning only ids
+--          (src/state/hitl.py)
+-- Functions: expire_hitl_requests
+-- ============================================================
+
+-- ============================================================
+-- Function: expire stale HITL requests
+-- Only pending requests past expires_at are touched (partial index
+-- idx_hitl_requests_expires, migration 007). The request and its run are
+-- locked together with SKIP LOCKED: a run being decided by
+-- hitl_apply_decision() (which locks run, then request) is left to that
+-- transaction and picked up by the next sweep if still pending.
+--
+-- A run is failed only while its hitl_state is still the expired
+-- checkpoint, so a later decision gets {"error": "conflict"} instead of
+-- resuming it.
+--
+-- Each failed run gets the existing validation_failed webhook, which the
+-- product app already handles.
+--
+-- p_endpoint: webhook endpoint for the notifications (NULL skips them)
+-- p_batch_notification: also queue one batched hitl_expired event for the
+--             whole batch. Off by default: the product app routes on
+--             flow_type and does not handle 'hitl_expired' yet
+--             (docs/features/integration-contracts.md)
+--
+-- Returns: {expired, runs_failed, request_ids, notifications}
+-- ============================================================
+CREATE OR REPLACE FUNCTION expire_hitl_requests(
+    p_limit INTEGER DEFAULT 500,
+    p_endpoint TEXT DEFAULT NULL,
+    p_batch_notification BOOLEAN DEFAULT FALSE
+)
+RETURNS JSONB AS $$
+    WITH expired AS (
+        UPDATE hitl_requests h
+        SET status = 'expired',
+            updated_at = NOW()
+        WHERE h.id IN (
+            SELECT p.id
+            FROM hitl_requests p
+            JOIN validation_runs r ON r.id = p.run_id
+            WHERE p.status = 'pending'
+              AND p.expires_at < NOW()
+            ORDER BY p.expires_at
+            LIMIT p_limit
+            FOR UPDATE OF p, r SKIP LOCKED
+        )
+        RETURNING h.id, h.run_id, h.checkpoint_name, h.expires_at
+    ),
+    failed_runs AS (
+        UPDATE validation_runs r
+        SET status = 'failed',
+            hitl_state = 'expired_' || e.checkpoint_name,
+            error_message = format('HITL checkpoint ''%s'' expired without a decision', e.checkpoint_name),
+            updated_at = NOW()
+        FROM expired e
+        WHERE r.id = e.run_id
+          AND r.hitl_state = e.checkpoint_name
+        RETURNING r.id, e.id AS request_id, e.checkpoint_name, r.error_message
+    ),
+    run_events_added AS (
+        INSERT INTO run_events (run_id, event_type, payload)
+        SELECT id, 'validation_failed', jsonb_build_object(
+            'error_message', error_message,
+            'reason', 'hitl_expired',
+            'checkpoint', checkpoint_name
+        )
+        FROM failed_runs
+        RETURNING id
+    ),
+    failure_outbox AS (
+        INSERT INTO webhook_outbox (run_id, endpoint, event_type, body)
+        SELECT id, p_endpoint, 'validation_failed', jsonb_build_object(
+            'flow_type', 'validation_failed',
+            'run_id', id,
+            'error_message', LEFT(error_message, 200),
+            'timestamp', NOW()
+        )
+        FROM failed_runs
+        WHERE p_endpoint IS NOT NULL
+        RETURNING id
+    ),
+    batch_outbox AS (
+        INSERT INTO webhook_outbox (endpoint, event_type, body)
+        SELECT p_endpoint, 'hitl_expired', jsonb_build_object(
+            'flow_type', 'hitl_expired',
+            'count', count(*),
+            'expired', jsonb_agg(jsonb_build_object(
+                'request_id', e.id,
+                'run_id', e.run_id,
+                'project_id', r.project_id,
+                'user_id', r.user_id,
+                'checkpoint', e.checkpoint_name,
+                'expires_at', e.expires_at,
+                'run_failed', f.id IS NOT NULL
+            ) ORDER BY e.expires_at),
+            'timestamp', NOW()
+        )
+        FROM expired e
+        JOIN validation_runs r ON r.id = e.run_id
+        LEFT JOIN failed_runs f ON f.request_id = e.id
+        WHERE p_endpoint IS NOT NULL AND p_batch_notification
+        HAVING count(*) > 0
+        RETURNING id
+    )
+    SELECT jsonb_build_object(
+        'expired', (SELECT count(*) FROM expired),
+        'runs_failed', (SELECT count(*) FROM failed_runs),
+        'request_ids', COALESCE((SELECT jsonb_agg(id) FROM expired), '[]'::jsonb),
+        'notifications', (SELECT count(*) FROM failure_outbox) + (SELECT count(*) FROM batch_outbox)
+    );
+$$ LANGUAGE sql;
+
+-- ============================================================
+-- Comments
+-- ============================================================
+COMMENT ON FUNCTION expire_hitl_requests IS 'Expire a batch of stale HITL requests, fail their paused runs and queue their validation_failed webhooks';
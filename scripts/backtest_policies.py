@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Backtest gate policies against recorded decisions and experiment outcomes.
+
+Replays every gate decision in decision_log under the current default
+policies and any candidate configs, and reports pass, divergence,
+false-pass and false-block rates with bootstrap confidence intervals
+(see src/shared/policy_backtest.py).
+
+Usage:
+    python scripts/backtest_policies.py --what-if DESIRABILITY.fit_score=75
+    python scripts/backtest_policies.py --policies candidates.json --since 2026-01-01
+    python scripts/backtest_policies.py --decisions decision_log.parquet \\
+        --outcomes experiment_outcomes.parquet --target conversion_rate=0.05 --json
+
+Candidate files (JSON or YAML) map a config name to per-gate overrides of
+the default policies:
+    {"strict": {"DESIRABILITY": {"thresholds": {"fit_score": 75}, "min_experiments": 4}}}
+
+Without Parquet files the tables are streamed from Supabase
+(SUPABASE_URL / SUPABASE_KEY).
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.shared.policy_backtest import (  # noqa: E402
+    DEFAULT_SUCCESS_TARGETS,
+    METRICS,
+    backtest_policies,
+    configs_from_spec,
+    load_parquet_decisions,
+    load_parquet_outcomes,
+    stream_decisions,
+    stream_outcomes,
+)
+
+
+def _parse_value(text: str):
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def parse_what_if(expression: str) -> dict:
+    """'DESIRABILITY.fit_score=75' -> {"DESIRABILITY": {"thresholds": {"fit_score": 75}}}."""
+    target, _, value = expression.partition("=")
+    gate, _, field = target.partition(".")
+    if not value or not field:
+        raise SystemExit(f"--what-if expects GATE.field=value, got '{expression}'")
+    if field.startswith("min_") or field in ("required_fit_types", "requires_approval"):
+        return {gate.upper(): {field: _parse_value(value)}}
+    return {gate.upper(): {"thresholds": {field: float(value)}}}
+
+
+def load_spec(path: Path) -> dict:
+    text = path.read_text()
+    if path.suffix in (".yaml", ".yml"):
+        import yaml
+        return yaml.safe_load(text) or {}
+    return json.loads(text)
+
+
+def format_metric(entry: dict) -> str:
+    value = entry.get("value")
+    if value is None:
+        return "      n/a"
+    ci = entry.get("ci")
+    text = f"{value:6.1%}"
+    if ci and None not in ci:
+        text += f" [{ci[0]:.1%}, {ci[1]:.1%}]"
+    return text
+
+
+def print_report(report: dict) -> None:
+    print("\n" + "=" * 60)
+    print("GATE POLICY BACKTEST")
+    print("=" * 60)
+    print(f"Decisions: {report['decisions']} ({report['labeled_decisions']} labeled by outcomes)")
+    print(f"Outcomes:  {report['outcomes']}")
+    confidence = report["bootstrap"]["confidence"]
+    print(f"Intervals: {confidence:.0%} bootstrap, {report['bootstrap']['resamples']} resamples")
+
+    for name, result in report["policies"].items():
+        overall = result["overall"]
+        print(f"\n--- {name} ---")
+        for metric in METRICS:
+            print(f"  {metric:<18} {format_metric(overall[metric])}")
+        for gate, scores in result["by_gate"].items():
+            print(f"  {gate:<14} n={scores['decisions']:<7} pass {format_metric(scores['pass_rate'])}"
+                  f"  diverge {format_metric(scores['divergence_rate'])}")
+    print("\n" + "=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtest gate policies on recorded decisions")
+    parser.add_argument("--decisions", type=Path, help="Parquet export of decision_log")
+    parser.add_argument("--outcomes", type=Path, help="Parquet export of experiment_outcomes")
+    parser.add_argument("--policies", type=Path, help="Candidate configs (JSON or YAML)")
+    parser.add_argument("--what-if", action="append", default=[],
+                        metavar="GATE.FIELD=VALUE", help="Quick single-change candidate (repeatable)")
+    parser.add_argument("--target", action="append", default=[], metavar="METRIC=VALUE",
+                        help="Outcome success target per primary_metric (default: ctr=0.02)")
+    parser.add_argument("--since", help="Only rows created at or after this ISO date (Supabase)")
+    parser.add_argument("--page-size", type=int, default=1000, help="Rows per Supabase request")
+    parser.add_argument("--bootstrap", type=int, default=1000, help="Bootstrap resamples (0 disables)")
+    parser.add_argument("--confidence", type=float, default=0.95, help="Confidence level")
+    parser.add_argument("--min-success-share", type=float, default=0.5,
+                        help="Share of later outcomes that must succeed for a decision to be good")
+    parser.add_argument("--seed", type=int, default=0, help="Bootstrap seed")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    targets = dict(DEFAULT_SUCCESS_TARGETS)
+    for item in args.target:
+        metric, _, value = item.partition("=")
+        targets[metric] = float(value)
+
+    spec = {"current": {}}
+    if args.policies:
+        spec.update(load_spec(args.policies))
+    for expression in args.what_if:
+        spec[expression] = parse_what_if(expression)
+    configs = configs_from_spec(spec)
+
+    started = time.perf_counter()
+    if args.decisions and args.outcomes:
+        decisions = load_parquet_decisions(args.decisions)
+        outcomes = load_parquet_outcomes(args.outcomes, targets)
+    elif args.decisions or args.outcomes:
+        parser.error("--decisions and --outcomes must be given together")
+    else:
+        from src.state.persistence import get_supabase
+        client = get_supabase()
+        decisions = stream_decisions(client, since=args.since, page_size=args.page_size)
+        outcomes = stream_outcomes(client, targets, since=args.since, page_size=args.page_size)
+    loaded = time.perf_counter()
+
+    report = backtest_policies(
+        decisions,
+        outcomes,
+        configs,
+        n_bootstrap=args.bootstrap,
+        confidence=args.confidence,
+        min_success_share=args.min_success_share,
+        seed=args.seed,
+    )
+    report["timing_s"] = {
+        "load": round(loaded - started, 3),
+        "backtest": round(time.perf_counter() - loaded, 3),
+    }
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Report saved to: {args.output}", file=sys.stderr)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Measure import time for every deployable entry point and enforce budgets.
+
+Each entry point is imported in a fresh interpreter with `python -X importtime`,
+so the numbers are what a cold container pays before it can do any work.
+Per-module self/cumulative costs are parsed from the importtime output; the
+median over --repeat runs is compared with the entry's budget in
+metrics/import_budgets.json.
+
+Entry points:
+    fastapi_app            - src.modal_app.app on the API image
+    run_validation         - the orchestrator (src.modal_app.app)
+    run_phase_0..4         - src.modal_app.app + that phase's module
+    run_*_crew             - each crew runner in src.crews.*
+    intake_crew.main:run   - the CrewAI project entry point
+
+Usage:
+    python scripts/benchmark_imports.py                       # check all budgets
+    python scripts/benchmark_imports.py --entry fastapi_app --top 20
+    python scripts/benchmark_imports.py --repeat 5 --save     # append to history
+    python scripts/benchmark_imports.py --update-budgets      # re-baseline
+
+Exit code is 1 when any entry point exceeds budget_ms * (1 + tolerance),
+cannot be imported, or has no budget; --allow-missing reports the last two
+as skipped instead. The Modal entry points need modal installed (dev extra:
+uv sync --extra dev).
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+METRICS_DIR = Path(__file__).parent / "metrics"
+BUDGET_FILE = METRICS_DIR / "import_budgets.json"
+HISTORY_FILE = METRICS_DIR / "import_history.json"
+
+DEFAULT_TOLERANCE = 0.15
+BUDGET_HEADROOM = 1.15  # --update-budgets sets budget = measured * headroom
+
+# Entry point -> import targets ("module" or "module:attribute")
+ENTRY_POINTS = {
+    "fastapi_app": ["src.modal_app.app:fastapi_app"],
+    "run_validation": ["src.modal_app.app:run_validation"],
+    # Phase functions import their phase module on first call
+    **{
+        f"run_phase_{n}": ["src.modal_app.app", f"src.modal_app.phases.phase_{n}"]
+        for n in range(5)
+    },
+    # Phase 1
+    "run_brief_generation_crew": ["src.crews.discovery:run_brief_generation_crew"],
+    "run_discovery_crew": ["src.crews.discovery:run_discovery_crew"],
+    "run_customer_research_crew": ["src.crews.discovery:run_customer_research_crew"],
+    "run_customer_profile_crew": ["src.crews.discovery:run_customer_profile_crew"],
+    "run_value_design_crew": ["src.crews.discovery:run_value_design_crew"],
+    "run_wtp_crew": ["src.crews.discovery:run_wtp_crew"],
+    "run_fit_assessment_crew": ["src.crews.discovery:run_fit_assessment_crew"],
+    # Phase 2
+    "run_build_crew": ["src.crews.desirability:run_build_crew"],
+    "run_growth_crew": ["src.crews.desirability:run_growth_crew"],
+    "run_governance_crew": ["src.crews.desirability:run_governance_crew"],
+    # Phase 3
+    "run_feasibility_build_crew": ["src.crews.feasibility:run_feasibility_build_crew"],
+    "run_feasibility_governance_crew": ["src.crews.feasibility:run_feasibility_governance_crew"],
+    # Phase 4
+    "run_finance_crew": ["src.crews.viability:run_finance_crew"],
+    "run_synthesis_crew": ["src.crews.viability:run_synthesis_crew"],
+    "run_viability_governance_crew": ["src.crews.viability:run_viability_governance_crew"],
+    "run_narrative_synthesis_crew": ["src.crews.viability:run_narrative_synthesis_crew"],
+    # CrewAI project
+    "intake_crew.main:run": ["intake_crew.main:run"],
+}
+
+# "import time: self [us] | cumulative | imported package"
+IMPORTTIME_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def parse_importtime(output: str) -> dict[str, dict[str, float]]:
+    """
+    Parse -X importtime output into per-module costs.
+
+    Returns:
+        {module: {"self_ms": float, "cumulative_ms": float, "top_level": bool}}
+    """
+    modules = {}
+    for line in output.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules[name] = {
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+            # importtime indents nested imports by two spaces per level
+            "top_level": len(indent) <= 1,
+        }
+    return modules
+
+
+def _import_code(targets: list[str]) -> str:
+    lines = ["import importlib"]
+    for target in targets:
+        module, _, attribute = target.partition(":")
+        lines.append(f"_module = importlib.import_module({module!r})")
+        if attribute:
+            lines.append(f"getattr(_module, {attribute!r})")
+    return "\n".join(lines)
+
+
+def measure_entry(targets: list[str]) -> dict:
+    """
+    Import targets in a fresh interpreter once.
+
+    Returns:
+        {"ok": bool, "total_ms": float, "modules": {...}, "error": str | None}
+    """
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(REPO_ROOT), str(REPO_ROOT / "src")]),
+        # Keep litellm from fetching its cost map over the network at import
+        "LITELLM_LOCAL_MODEL_COST_MAP": "True",
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _import_code(targets)],
+        capture_output=True, text=True, cwd=REPO_ROOT, env=env,
+    )
+    modules = parse_importtime(result.stderr)
+
+    if result.returncode != 0:
+        error_lines = [
+            line for line in result.stderr.splitlines()
+            if line.strip() and not line.startswith("import time:")
+        ]
+        return {
+            "ok": False,
+            "total_ms": None,
+            "modules": modules,
+            "error": error_lines[-1] if error_lines else f"exit code {result.returncode}",
+        }
+
+    total_ms = sum(m["cumulative_ms"] for m in modules.values() if m["top_level"])
+    return {"ok": True, "total_ms": total_ms, "modules": modules, "error": None}
+
+
+def benchmark_entry(targets: list[str], repeat: int) -> dict:
+    """Median of repeat runs, per entry total and per module."""
+    runs = [measure_entry(targets) for _ in range(repeat)]
+    failed = next((run for run in runs if not run["ok"]), None)
+    if failed:
+        return failed
+
+    names = set().union(*(run["modules"] for run in runs))
+    modules = {}
+    for name in names:
+        samples = [run["modules"][name] for run in runs if name in run["modules"]]
+        modules[name] = {
+            "self_ms": statistics.median(s["self_ms"] for s in samples),
+            "cumulative_ms": statistics.median(s["cumulative_ms"] for s in samples),
+        }
+
+    return {
+        "ok": True,
+        "total_ms": statistics.median(run["total_ms"] for run in runs),
+        "modules": modules,
+        "error": None,
+    }
+
+
+def load_budgets() -> dict[str, float]:
+    """Load per-entry budgets in milliseconds."""
+    if BUDGET_FILE.exists():
+        return json.loads(BUDGET_FILE.read_text())
+    return {}
+
+
+def save_budgets(budgets: dict[str, float]) -> None:
+    """Save per-entry budgets."""
+    METRICS_DIR.mkdir(exist_ok=True)
+    BUDGET_FILE.write_text(json.dumps(budgets, indent=2) + "\n")
+
+
+def load_history() -> list[dict]:
+    """Load existing import-time history."""
+    if HISTORY_FILE.exists():
+        return json.loads(HISTORY_FILE.read_text())
+    return []
+
+
+def save_history(history: list[dict]) -> None:
+    """Save import-time history to file."""
+    METRICS_DIR.mkdir(exist_ok=True)
+    HISTORY_FILE.write_text(json.dumps(history, indent=2))
+
+
+def check_budget(total_ms: float, budget_ms: float | None, tolerance: float) -> bool:
+    """True when total_ms is within budget_ms * (1 + tolerance); False without a budget."""
+    return budget_ms is not None and total_ms <= budget_ms * (1 + tolerance)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark entry point import times")
+    parser.add_argument("--entry", action="append", choices=sorted(ENTRY_POINTS),
+                        help="Entry point to measure (repeatable, default: all)")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Fresh-interpreter runs per entry")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules (self time) to print")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"Allowed regression over budget as a fraction (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument("--allow-missing", action="store_true",
+                        help="Skip (instead of failing on) entry points that cannot be imported or have no budget")
+    parser.add_argument("--save", action="store_true", help=f"Append results to {HISTORY_FILE.name}")
+    parser.add_argument("--update-budgets", action="store_true",
+                        help=f"Write measured totals x{BUDGET_HEADROOM} to {BUDGET_FILE.name}")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    entries = args.entry or list(ENTRY_POINTS)
+    budgets = load_budgets()
+    results = {}
+    failures = []
+    skipped = []
+
+    for entry in entries:
+        result = benchmark_entry(ENTRY_POINTS[entry], max(args.repeat, 1))
+        budget_ms = budgets.get(entry)
+        slowest = sorted(result["modules"].items(), key=lambda item: item[1]["self_ms"], reverse=True)
+
+        results[entry] = {
+            "ok": result["ok"],
+            "total_ms": round(result["total_ms"], 1) if result["ok"] else None,
+            "budget_ms": budget_ms,
+            "error": result["error"],
+            "slowest": [
+                {"module": name, "self_ms": round(cost["self_ms"], 1),
+                 "cumulative_ms": round(cost["cumulative_ms"], 1)}
+                for name, cost in slowest[:args.top]
+            ],
+        }
+
+        if not result["ok"]:
+            problem = f"{entry}: import failed ({result['error']})"
+            (skipped if args.allow_missing else failures).append(problem)
+        elif budget_ms is None:
+            problem = f"{entry}: no budget in {BUDGET_FILE.name} (run --update-budgets)"
+            (skipped if args.allow_missing else failures).append(problem)
+        elif not check_budget(result["total_ms"], budget_ms, args.tolerance):
+            failures.append(
+                f"{entry}: {result['total_ms']:.0f}ms exceeds budget {budget_ms:.0f}ms "
+                f"(+{args.tolerance:.0%} tolerance)"
+            )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for entry, result in results.items():
+            if not result["ok"]:
+                print(f"{entry:<34} skipped  {result['error']}")
+                continue
+            budget = f"{result['budget_ms']:.0f}ms" if result["budget_ms"] is not None else "-"
+            print(f"{entry:<34} {result['total_ms']:>8.1f}ms  budget {budget}")
+            for module in result["slowest"]:
+                print(f"    {module['self_ms']:>8.1f}ms self  {module['cumulative_ms']:>8.1f}ms cum  {module['module']}")
+
+    if args.save:
+        history = load_history()
+        history.append({
+            "timestamp": datetime.utcnow().isoformat(),
+            "python": sys.version.split()[0],
+            "repeat": args.repeat,
+            "totals_ms": {entry: result["total_ms"] for entry, result in results.items()},
+        })
+        save_history(history)
+        print(f"\nResults saved to {HISTORY_FILE}")
+
+    if args.update_budgets:
+        for entry, result in results.items():
+            if result["ok"]:
+                budgets[entry] = round(result["total_ms"] * BUDGET_HEADROOM, -1)
+        save_budgets(budgets)
+        print(f"\nBudgets written to {BUDGET_FILE}")
+        return 0
+
+    if skipped:
+        print("\nSkipped:")
+        for problem in skipped:
+            print(f"  {problem}")
+
+    if failures:
+        print("\nFailed:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+
+    checked = len(results) - len(skipped)
+    print(f"\nPassed: {checked} of {len(results)} entry points are within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
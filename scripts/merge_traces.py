@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Merge a run's per-container Chrome traces into one timeline.
+
+The orchestrator and every phase function write their own trace file when
+TRACE_EXPORT includes "chrome" (see src/shared/tracing.py). This script puts
+them side by side (one process row per file) so the whole run can be opened
+in https://ui.perfetto.dev or chrome://tracing.
+
+Usage:
+    modal volume get startupai-traces <run_id> traces/
+    python scripts/merge_traces.py traces/<run_id>
+    python scripts/merge_traces.py traces/<run_id> -o run.trace.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.shared.tracing import merge_chrome_traces  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge Chrome traces of a validation run")
+    parser.add_argument("paths", nargs="+", type=Path, help="Trace files or run directories")
+    parser.add_argument("-o", "--output", type=Path, default=None,
+                        help="Output file (default: <first run directory>/merged.trace.json)")
+    args = parser.parse_args()
+
+    files = []
+    for path in args.paths:
+        if path.is_dir():
+            files.extend(p for p in path.glob("*.trace.json") if p.name != "merged.trace.json")
+        else:
+            files.append(path)
+
+    if not files:
+        print("No trace files found")
+        return 1
+
+    output = args.output or files[0].parent / "merged.trace.json"
+    output.write_text(json.dumps(merge_chrome_traces(files)))
+    print(f"Merged {len(files)} trace(s) into {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Replay a recorded validation run offline from its phase cassettes.
+
+Cassettes are recorded by the Modal phase functions with CASSETTE_MODE=record
+(see src/shared/replay.py). A replay needs no network or API keys and runs in
+seconds, so it doubles as a performance regression check: replay time is the
+orchestrator and crew overhead without model latency.
+
+Usage:
+    modal volume get startupai-cassettes <run_id> cassettes/
+    python scripts/replay_run.py cassettes/<run_id>
+    python scripts/replay_run.py cassettes/<run_id> --strict --json
+    python scripts/replay_run.py cassettes/<run_id> --max-replay-ms 5000
+
+Exit code is 1 when a phase does not reproduce its recorded result, a call
+has no recorded interaction, or the replay exceeds --max-replay-ms.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.shared.replay import DEFAULT_TIME_COMPRESSION, offline_environment  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded validation run offline")
+    parser.add_argument("paths", nargs="+", type=Path, help="Cassette files or run directories")
+    parser.add_argument("--time-compression", type=float, default=DEFAULT_TIME_COMPRESSION,
+                        help="Divide sleeps by this factor (inf skips sleeps)")
+    parser.add_argument("--strict", action="store_true", help="Require exact key matches")
+    parser.add_argument("--max-replay-ms", type=float, default=None,
+                        help="Fail if the whole replay takes longer than this")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    # Before crewai/litellm are imported by the phases
+    offline_environment()
+    from src.shared.replay import replay_run
+
+    report = replay_run(args.paths, time_compression=args.time_compression, strict=args.strict)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for phase in report["phases"]:
+            status = "ok" if phase["matched"] else "MISMATCH"
+            print(
+                f"phase {phase['phase']}  {status:<8} replay {phase['replay_ms']:>9.1f}ms  "
+                f"recorded {phase['recorded_ms']:>10.1f}ms (io {phase['recorded_io_ms']:.1f}ms)  "
+                f"fallbacks {phase['fallbacks']}  misses {phase['misses']}"
+            )
+            if phase["error"]:
+                print(f"    error: {phase['error']}")
+        print(f"\nTotal replay {report['replay_ms']:.1f}ms vs recorded {report['recorded_ms']:.1f}ms")
+
+    failed = not report["phases"] or not report["matched"]
+    failed = failed or any(phase["misses"] for phase in report["phases"])
+    if args.max_replay_ms is not None and report["replay_ms"] > args.max_replay_ms:
+        print(f"\nFailed: replay took {report['replay_ms']:.0f}ms (max {args.max_replay_ms:.0f}ms)")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
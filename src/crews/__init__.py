@@ -11,24 +11,39 @@ Crew definitions for StartupAI validation engine.
 Total: 14 crews, 43 agents
 """
 
-# Phase 1: VPC Discovery (includes BriefGenerationCrew for Stage A)
-from src.crews.discovery import (
-    BriefGenerationCrew,
-    DiscoveryCrew,
-    CustomerProfileCrew,
-    ValueDesignCrew,
-    WTPCrew,
-    FitAssessmentCrew,
-)
-
-# Phase 2: Desirability
-from src.crews.desirability import BuildCrew, GrowthCrew, GovernanceCrew
-
-# Phase 3: Feasibility
-from src.crews.feasibility import FeasibilityBuildCrew, FeasibilityGovernanceCrew
-
-# Phase 4: Viability
-from src.crews.viability import FinanceCrew, SynthesisCrew, ViabilityGovernanceCrew
+# Crews are imported on first access: importing one phase's crews (e.g.
+# src.crews.discovery) must not load every other phase's agents and tools.
+_CREW_MODULES = {
+    # Phase 1: VPC Discovery (includes BriefGenerationCrew for Stage A)
+    "BriefGenerationCrew": "src.crews.discovery",
+    "DiscoveryCrew": "src.crews.discovery",
+    "CustomerProfileCrew": "src.crews.discovery",
+    "ValueDesignCrew": "src.crews.discovery",
+    "WTPCrew": "src.crews.discovery",
+    "FitAssessmentCrew": "src.crews.discovery",
+    # Phase 2: Desirability
+    "BuildCrew": "src.crews.desirability",
+    "GrowthCrew": "src.crews.desirability",
+    "GovernanceCrew": "src.crews.desirability",
+    # Phase 3: Feasibility
+    "FeasibilityBuildCrew": "src.crews.feasibility",
+    "FeasibilityGovernanceCrew": "src.crews.feasibility",
+    # Phase 4: Viability
+    "FinanceCrew": "src.crews.viability",
+    "SynthesisCrew": "src.crews.viability",
+    "ViabilityGovernanceCrew": "src.crews.viability",
+}
+
+
+def __getattr__(name: str):
+    """Lazy import crews so each phase only loads its own crew modules."""
+    if name in _CREW_MODULES:
+        import importlib
+        module = importlib.import_module(_CREW_MODULES[name])
+        return getattr(module, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Phase 1 (includes Stage A: BriefGenerationCrew)
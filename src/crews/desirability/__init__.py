@@ -6,6 +6,7 @@ from typing import Any
 from src.crews.desirability.build_crew import BuildCrew
 from src.crews.desirability.growth_crew import GrowthCrew
 from src.crews.desirability.governance_crew import GovernanceCrew
+from src.shared.llm_budget import apply_degradation
 from src.state.models import DesirabilityEvidence
 
 logger = logging.getLogger(__name__)
@@ -26,7 +27,7 @@ def run_build_crew(
         Build results with landing page URLs and designs
     """
     crew = BuildCrew()
-    result = crew.crew().kickoff(
+    result = apply_degradation(crew.crew()).kickoff(
         inputs={
             "value_proposition": value_proposition,
             "customer_profile": customer_profile,
@@ -55,7 +56,7 @@ def run_growth_crew(
     """
     try:
         crew = GrowthCrew()
-        result = crew.crew().kickoff(
+        result = apply_degradation(crew.crew()).kickoff(
             inputs={
                 "ad_concepts": ad_concepts,
                 "landing_pages": landing_pages,
@@ -132,7 +133,7 @@ def run_governance_crew(
         Governance results with compliance reports
     """
     crew = GovernanceCrew()
-    result = crew.crew().kickoff(
+    result = apply_degradation(crew.crew()).kickoff(
         inputs={
             "activities": activities,
             "creative_assets": creative_assets,
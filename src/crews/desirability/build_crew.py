@@ -12,10 +12,11 @@ Agents:
 @story US-ADB01
 """
 
-from crewai import Agent, Crew, LLM, Process, Task
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
-from shared.tools import (
+from src.shared.model_registry import get_llm
+from src.shared.tools import (
     CanvasBuilderTool,
     TestCardTool,
     LandingPageDeploymentTool,
@@ -49,7 +50,7 @@ class BuildCrew:
             reasoning=False,  # Creative design work
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.8),  # Creative design
+            llm=get_llm("f1_ux_designer", temperature=0.8),  # Creative design
             verbose=True,
             allow_delegation=False,
         )
@@ -63,7 +64,7 @@ class BuildCrew:
             reasoning=False,  # Code generation
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.2),  # Code generation
+            llm=get_llm("f2_frontend_developer", temperature=0.2),  # Code generation
             verbose=True,
             allow_delegation=False,
         )
@@ -77,7 +78,7 @@ class BuildCrew:
             reasoning=False,  # Code generation
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.2),  # Code generation
+            llm=get_llm("f3_backend_developer", temperature=0.2),  # Code generation
             verbose=True,
             allow_delegation=False,
         )
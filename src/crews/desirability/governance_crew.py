@@ -14,10 +14,11 @@ Guardian's role is oversight (board-level), not execution.
 @story US-ADB05
 """
 
-from crewai import Agent, Crew, LLM, Process, Task
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
-from shared.tools import MethodologyCheckTool, AnonymizerTool, LearningCardTool
+from src.shared.model_registry import get_llm
+from src.shared.tools import MethodologyCheckTool, AnonymizerTool, LearningCardTool
 
 
 @CrewBase
@@ -47,7 +48,7 @@ class GovernanceCrew:
             reasoning=True,
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.1),  # Strict QA
+            llm=get_llm("g1_qa_agent", temperature=0.1),  # Strict QA
             verbose=True,
             allow_delegation=False,
         )
@@ -61,7 +62,7 @@ class GovernanceCrew:
             reasoning=True,  # PII detection and anonymization
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.1),  # Strict QA
+            llm=get_llm("g2_security_agent", temperature=0.1),  # Strict QA
             verbose=True,
             allow_delegation=False,
         )
@@ -75,7 +76,7 @@ class GovernanceCrew:
             reasoning=False,  # Straightforward logging
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.1),  # Strict QA
+            llm=get_llm("g3_audit_agent", temperature=0.1),  # Strict QA
             verbose=True,
             allow_delegation=False,
         )
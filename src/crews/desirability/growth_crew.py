@@ -15,10 +15,11 @@ HITL Checkpoints:
 @story US-ADB03
 """
 
-from crewai import Agent, Crew, LLM, Process, Task
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
-from shared.tools import ABTestTool, AnalyticsTool, AdPlatformTool
+from src.shared.model_registry import get_llm
+from src.shared.tools import ABTestTool, AnalyticsTool, AdPlatformTool
 from src.state.models import DesirabilityEvidence
 
 
@@ -53,7 +54,7 @@ class GrowthCrew:
             reasoning=False,  # Creative work
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.8),  # Creative
+            llm=get_llm("p1_ad_creative", temperature=0.8),  # Creative
             verbose=True,
             allow_delegation=False,
         )
@@ -70,7 +71,7 @@ class GrowthCrew:
             reasoning=False,  # Copywriting
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.8),  # Creative
+            llm=get_llm("p2_communications", temperature=0.8),  # Creative
             verbose=True,
             allow_delegation=False,
         )
@@ -87,7 +88,7 @@ class GrowthCrew:
             reasoning=True,  # Analyzes experiment data
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.2),  # Analytical
+            llm=get_llm("p3_analytics", temperature=0.2),  # Analytical
             verbose=True,
             allow_delegation=False,
         )
@@ -16,6 +16,7 @@ from src.crews.discovery.customer_profile_crew import CustomerProfileCrew
 from src.crews.discovery.value_design_crew import ValueDesignCrew
 from src.crews.discovery.wtp_crew import WTPCrew
 from src.crews.discovery.fit_assessment_crew import FitAssessmentCrew
+from src.shared.llm_budget import apply_degradation
 from src.state.models import CustomerProfile, ValueMap, FitAssessment, FoundersBrief
 
 
@@ -39,7 +40,7 @@ def run_brief_generation_crew(
         raise ValueError(f"raw_idea is empty or too short: '{raw_idea}'. Cannot generate brief.")
 
     crew = BriefGenerationCrew()
-    result = crew.crew().kickoff(
+    result = apply_degradation(crew.crew()).kickoff(
         inputs={
             "raw_idea": raw_idea,
             "hints": hints or "",
@@ -75,13 +76,36 @@ def run_discovery_crew(founders_brief: dict[str, Any]) -> dict[str, Any]:
         Discovery results with assumptions map and evidence
     """
     crew = DiscoveryCrew()
-    result = crew.crew().kickoff(inputs={"founders_brief": founders_brief})
+    result = apply_degradation(crew.crew()).kickoff(inputs={"founders_brief": founders_brief})
     return result.raw if hasattr(result, "raw") else str(result)
 
 
+def run_customer_research_crew(founders_brief: dict[str, Any]) -> dict[str, Any]:
+    """
+    Execute CustomerProfileCrew's research pass (needs only the brief).
+
+    Args:
+        founders_brief: The Founder's Brief
+
+    Returns:
+        Ranked jobs, pains and gains from the brief alone
+    """
+    crew = CustomerProfileCrew()
+    result = apply_degradation(crew.research_crew()).kickoff(
+        inputs={"founders_brief": founders_brief}
+    )
+    outputs = {output.name: output.raw for output in result.tasks_output}
+    return {
+        "jobs": outputs.get("rank_jobs"),
+        "pains": outputs.get("rank_pains"),
+        "gains": outputs.get("rank_gains"),
+    }
+
+
 def run_customer_profile_crew(
     founders_brief: dict[str, Any],
     discovery_results: dict[str, Any],
+    customer_research: Optional[dict[str, Any]] = None,
 ) -> CustomerProfile:
     """
     Execute CustomerProfileCrew to extract Jobs, Pains, Gains.
@@ -89,15 +113,20 @@ def run_customer_profile_crew(
     Args:
         founders_brief: The Founder's Brief
         discovery_results: Results from DiscoveryCrew
+        customer_research: Output of run_customer_research_crew (run here if None)
 
     Returns:
         CustomerProfile with jobs, pains, gains
     """
+    if customer_research is None:
+        customer_research = run_customer_research_crew(founders_brief)
+
     crew = CustomerProfileCrew()
-    result = crew.crew().kickoff(
+    result = apply_degradation(crew.profile_crew()).kickoff(
         inputs={
             "founders_brief": founders_brief,
             "discovery_results": discovery_results,
+            "customer_research": customer_research,
         }
     )
     return result.pydantic if hasattr(result, "pydantic") else result
@@ -118,7 +147,7 @@ def run_value_design_crew(
         ValueMap with pain relievers and gain creators
     """
     crew = ValueDesignCrew()
-    result = crew.crew().kickoff(
+    result = apply_degradation(crew.crew()).kickoff(
         inputs={
             "founders_brief": founders_brief,
             "customer_profile": customer_profile,
@@ -142,7 +171,7 @@ def run_wtp_crew(
         WTP analysis results
     """
     crew = WTPCrew()
-    result = crew.crew().kickoff(
+    result = apply_degradation(crew.crew()).kickoff(
         inputs={
             "customer_profile": customer_profile,
             "value_map": value_map,
@@ -168,7 +197,7 @@ def run_fit_assessment_crew(
         FitAssessment with fit score
     """
     crew = FitAssessmentCrew()
-    result = crew.crew().kickoff(
+    result = apply_degradation(crew.crew()).kickoff(
         inputs={
             "customer_profile": customer_profile,
             "value_map": value_map,
@@ -187,6 +216,7 @@ __all__ = [
     "FitAssessmentCrew",
     "run_brief_generation_crew",
     "run_discovery_crew",
+    "run_customer_research_crew",
     "run_customer_profile_crew",
     "run_value_design_crew",
     "run_wtp_crew",
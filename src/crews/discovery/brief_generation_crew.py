@@ -16,10 +16,11 @@ Data Flow:
 @story US-AB01
 """
 
-from crewai import Agent, Crew, LLM, Process, Task
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
-from shared.tools import TavilySearchTool
+from src.shared.model_registry import get_llm
+from src.shared.tools import TavilySearchTool
 from src.state.models import FoundersBrief
 
 
@@ -51,7 +52,7 @@ class BriefGenerationCrew:
             reasoning=True,  # Uses extended thinking for thorough analysis
             inject_date=True,
             max_iter=15,
-            llm=LLM(model="openai/gpt-4o", temperature=0.3),
+            llm=get_llm("gv1_concept_validator", temperature=0.3),
             verbose=True,
             allow_delegation=False,
         )
@@ -65,7 +66,7 @@ class BriefGenerationCrew:
             reasoning=True,  # Synthesizes research into structured brief
             inject_date=True,
             max_iter=25,  # More iterations for research + compilation
-            llm=LLM(model="openai/gpt-4o", temperature=0.3),
+            llm=get_llm("s1_brief_compiler", temperature=0.3),
             verbose=True,
             allow_delegation=False,
         )
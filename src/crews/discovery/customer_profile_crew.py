@@ -4,6 +4,12 @@ CustomerProfileCrew - Phase 1: VPC Discovery - Jobs, Pains, Gains Discovery
 This crew researches and ranks customer Jobs, Pains, and Gains to build
 the Customer Profile (right side of Value Proposition Canvas).
 
+It runs in two passes so Phase 1 can overlap it with DiscoveryCrew:
+- research_crew(): discover and rank Jobs, Pains, Gains from the Founder's
+  Brief alone
+- profile_crew(): compile the ranked research and DiscoveryCrew's evidence
+  into the CustomerProfile
+
 Agents:
 - J1: JTBD Researcher (Sage) - Discover jobs (functional, emotional, social)
 - J2: Job Ranking Agent (Sage) - Rank jobs by importance
@@ -15,12 +21,14 @@ Agents:
 @story US-AD06
 """
 
-from crewai import Agent, Crew, LLM, Process, Task
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
+from src.shared.model_registry import get_llm
 from src.state.models import CustomerProfile
-from shared.tools import (
+from src.shared.tools import (
     TavilySearchTool,
+    BatchSearchTool,
     ForumSearchTool,
     ReviewAnalysisTool,
 )
@@ -51,13 +59,14 @@ class CustomerProfileCrew:
             config=self.agents_config["j1_jtbd_researcher"],
             tools=[
                 TavilySearchTool(),
+                BatchSearchTool(),
                 ForumSearchTool(),
                 ReviewAnalysisTool(),
             ],
             reasoning=True,
             inject_date=True,
             max_iter=30,
-            llm=LLM(model="openai/gpt-4o", temperature=0.3),
+            llm=get_llm("j1_jtbd_researcher", temperature=0.3),
             verbose=True,
             allow_delegation=False,
         )
@@ -71,7 +80,7 @@ class CustomerProfileCrew:
             reasoning=False,  # Simple ranking
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.3),
+            llm=get_llm("j2_job_ranking", temperature=0.3),
             verbose=True,
             allow_delegation=False,
         )
@@ -83,13 +92,14 @@ class CustomerProfileCrew:
             config=self.agents_config["pain_researcher"],
             tools=[
                 TavilySearchTool(),
+                BatchSearchTool(),
                 ForumSearchTool(),
                 ReviewAnalysisTool(),
             ],
             reasoning=True,
             inject_date=True,
             max_iter=30,
-            llm=LLM(model="openai/gpt-4o", temperature=0.3),
+            llm=get_llm("pain_researcher", temperature=0.3),
             verbose=True,
             allow_delegation=False,
         )
@@ -103,7 +113,7 @@ class CustomerProfileCrew:
             reasoning=False,  # Simple ranking
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.3),
+            llm=get_llm("pain_ranking", temperature=0.3),
             verbose=True,
             allow_delegation=False,
         )
@@ -115,13 +125,14 @@ class CustomerProfileCrew:
             config=self.agents_config["gain_researcher"],
             tools=[
                 TavilySearchTool(),
+                BatchSearchTool(),
                 ForumSearchTool(),
                 ReviewAnalysisTool(),
             ],
             reasoning=True,
             inject_date=True,
             max_iter=30,
-            llm=LLM(model="openai/gpt-4o", temperature=0.3),
+            llm=get_llm("gain_researcher", temperature=0.3),
             verbose=True,
             allow_delegation=False,
         )
@@ -135,7 +146,7 @@ class CustomerProfileCrew:
             reasoning=False,  # Simple ranking
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.3),
+            llm=get_llm("gain_ranking", temperature=0.3),
             verbose=True,
             allow_delegation=False,
         )
@@ -187,19 +198,40 @@ class CustomerProfileCrew:
     # =========================================================================
 
     @crew
-    def crew(self) -> Crew:
+    def research_crew(self) -> Crew:
         """
-        Creates the CustomerProfileCrew with sequential process.
+        Creates the brief-only research pass with sequential process.
 
         Task Flow:
         1. J1 discovers jobs -> J2 ranks jobs
         2. PAIN_RES discovers pains -> PAIN_RANK ranks pains
         3. GAIN_RES discovers gains -> GAIN_RANK ranks gains
-        4. Compile into CustomerProfile
         """
         return Crew(
             agents=self.agents,
-            tasks=self.tasks,
+            tasks=[
+                self.discover_jobs(),
+                self.rank_jobs(),
+                self.discover_pains(),
+                self.rank_pains(),
+                self.discover_gains(),
+                self.rank_gains(),
+            ],
+            process=Process.sequential,
+            verbose=True,
+        )
+
+    @crew
+    def profile_crew(self) -> Crew:
+        """
+        Creates the refinement pass that compiles the CustomerProfile.
+
+        Task Flow:
+        1. J1 reconciles ranked research with DiscoveryCrew evidence
+        """
+        return Crew(
+            agents=[self.j1_jtbd_researcher()],
+            tasks=[self.compile_customer_profile()],
             process=Process.sequential,
             verbose=True,
         )
@@ -13,11 +13,13 @@ Agents:
 @story US-AD01
 """
 
-from crewai import Agent, Crew, LLM, Process, Task
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
-from shared.tools import (
+from src.shared.model_registry import get_llm
+from src.shared.tools import (
     TavilySearchTool,
+    BatchSearchTool,
     ForumSearchTool,
     ReviewAnalysisTool,
     SocialListeningTool,
@@ -64,7 +66,7 @@ class DiscoveryCrew:
             reasoning=True,  # Designs experiments and captures learnings
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.7),
+            llm=get_llm("e1_experiment_designer", temperature=0.7),
             verbose=True,
             allow_delegation=False,
         )
@@ -82,7 +84,7 @@ class DiscoveryCrew:
             reasoning=True,  # Synthesizes interview insights
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.5),
+            llm=get_llm("d1_customer_interview", temperature=0.5),
             verbose=True,
             allow_delegation=False,
         )
@@ -94,6 +96,7 @@ class DiscoveryCrew:
             config=self.agents_config["d2_observation_agent"],
             tools=[
                 TavilySearchTool(),
+                BatchSearchTool(),
                 ForumSearchTool(),
                 ReviewAnalysisTool(),
                 SocialListeningTool(),
@@ -103,7 +106,7 @@ class DiscoveryCrew:
             reasoning=True,  # Synthesizes research from multiple sources
             inject_date=True,
             max_iter=30,  # More iterations for thorough research
-            llm=LLM(model="openai/gpt-4o", temperature=0.3),
+            llm=get_llm("d2_observation_agent", temperature=0.3),
             verbose=True,
             allow_delegation=False,
         )
@@ -122,7 +125,7 @@ class DiscoveryCrew:
             reasoning=True,  # Analyzes test patterns
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.5),
+            llm=get_llm("d3_cta_test_agent", temperature=0.5),
             verbose=True,
             allow_delegation=False,
         )
@@ -140,7 +143,7 @@ class DiscoveryCrew:
             reasoning=True,  # Synthesizes SAY vs DO evidence
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.5),
+            llm=get_llm("d4_evidence_triangulation", temperature=0.5),
             verbose=True,
             allow_delegation=False,
         )
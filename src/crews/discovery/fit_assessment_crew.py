@@ -12,11 +12,12 @@ HITL Checkpoint: approve_discovery_output (when fit >= 70)
 @story US-AD09
 """
 
-from crewai import Agent, Crew, LLM, Process, Task
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
+from src.shared.model_registry import get_llm
 from src.state.models import FitAssessment
-from shared.tools import MethodologyCheckTool
+from src.shared.tools import MethodologyCheckTool
 
 
 @CrewBase
@@ -46,7 +47,7 @@ class FitAssessmentCrew:
             reasoning=True,
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.2),  # Analytical
+            llm=get_llm("fit_score_analyst", temperature=0.2),  # Analytical
             verbose=True,
             allow_delegation=False,
         )
@@ -60,7 +61,7 @@ class FitAssessmentCrew:
             reasoning=False,  # Simple routing decision
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.3),
+            llm=get_llm("fit_route_agent", temperature=0.3),
             verbose=True,
             allow_delegation=False,
         )
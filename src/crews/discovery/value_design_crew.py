@@ -12,10 +12,11 @@ Agents:
 @story US-AD07
 """
 
-from crewai import Agent, Crew, LLM, Process, Task
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
-from shared.tools import CanvasBuilderTool
+from src.shared.model_registry import get_llm
+from src.shared.tools import CanvasBuilderTool
 from src.state.models import ValueMap
 
 
@@ -46,7 +47,7 @@ class ValueDesignCrew:
             reasoning=False,  # Creative design work
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.8),
+            llm=get_llm("v1_solution_designer", temperature=0.8),
             verbose=True,
             allow_delegation=False,
         )
@@ -60,7 +61,7 @@ class ValueDesignCrew:
             reasoning=False,  # Creative design work
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.8),
+            llm=get_llm("v2_pain_reliever_designer", temperature=0.8),
             verbose=True,
             allow_delegation=False,
         )
@@ -74,7 +75,7 @@ class ValueDesignCrew:
             reasoning=False,  # Creative design work
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.8),
+            llm=get_llm("v3_gain_creator_designer", temperature=0.8),
             verbose=True,
             allow_delegation=False,
         )
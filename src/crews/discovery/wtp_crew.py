@@ -12,10 +12,11 @@ HITL Checkpoint: approve_pricing_test (before any real money is involved)
 @story US-AD08
 """
 
-from crewai import Agent, Crew, LLM, Process, Task
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
-from shared.tools import ABTestTool, AnalyticsTool
+from src.shared.model_registry import get_llm
+from src.shared.tools import ABTestTool, AnalyticsTool
 
 
 @CrewBase
@@ -48,7 +49,7 @@ class WTPCrew:
             reasoning=True,  # Analyzes pricing experiment results
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.5),
+            llm=get_llm("w1_pricing_experiment", temperature=0.5),
             verbose=True,
             allow_delegation=False,
         )
@@ -64,7 +65,7 @@ class WTPCrew:
             reasoning=True,  # Analyzes payment test results
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.3),
+            llm=get_llm("w2_payment_test", temperature=0.3),
             verbose=True,
             allow_delegation=False,
         )
@@ -3,6 +3,7 @@ from typing import Any
 
 from src.crews.feasibility.build_crew import FeasibilityBuildCrew
 from src.crews.feasibility.governance_crew import FeasibilityGovernanceCrew
+from src.shared.llm_budget import apply_degradation
 from src.state.models import FeasibilityEvidence
 
 
@@ -21,7 +22,7 @@ def run_feasibility_build_crew(
         FeasibilityEvidence with signal and cost estimates
     """
     crew = FeasibilityBuildCrew()
-    result = crew.crew().kickoff(
+    result = apply_degradation(crew.crew()).kickoff(
         inputs={
             "value_map": value_map,
             "customer_profile": customer_profile,
@@ -45,7 +46,7 @@ def run_feasibility_governance_crew(
         Governance results with gate readiness
     """
     crew = FeasibilityGovernanceCrew()
-    result = crew.crew().kickoff(
+    result = apply_degradation(crew.crew()).kickoff(
         inputs={
             "feasibility_assessment": feasibility_assessment,
             "technical_architecture": technical_architecture,
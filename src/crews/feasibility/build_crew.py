@@ -12,9 +12,10 @@ Agents:
 @story US-AFB02
 """
 
-from crewai import Agent, Crew, LLM, Process, Task
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
+from src.shared.model_registry import get_llm
 from src.state.models import FeasibilityEvidence
 
 
@@ -46,7 +47,7 @@ class FeasibilityBuildCrew:
             reasoning=False,  # Straightforward mapping
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.3),  # Analytical
+            llm=get_llm("f1_requirements_analyst", temperature=0.3),  # Analytical
             verbose=True,
             allow_delegation=False,
         )
@@ -60,7 +61,7 @@ class FeasibilityBuildCrew:
             reasoning=False,  # Technical assessment
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.2),  # Technical
+            llm=get_llm("f2_frontend_assessor", temperature=0.2),  # Technical
             verbose=True,
             allow_delegation=False,
         )
@@ -74,7 +75,7 @@ class FeasibilityBuildCrew:
             reasoning=False,  # Technical assessment
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.2),  # Technical
+            llm=get_llm("f3_backend_assessor", temperature=0.2),  # Technical
             verbose=True,
             allow_delegation=False,
         )
@@ -11,10 +11,11 @@ Agents:
 @story US-AFB03
 """
 
-from crewai import Agent, Crew, LLM, Process, Task
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
-from shared.tools import MethodologyCheckTool, AnonymizerTool
+from src.shared.model_registry import get_llm
+from src.shared.tools import MethodologyCheckTool, AnonymizerTool
 
 
 @CrewBase
@@ -44,7 +45,7 @@ class FeasibilityGovernanceCrew:
             reasoning=True,
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.1),  # Strict QA
+            llm=get_llm("g1_qa_agent", temperature=0.1),  # Strict QA
             verbose=True,
             allow_delegation=False,
         )
@@ -58,7 +59,7 @@ class FeasibilityGovernanceCrew:
             reasoning=True,  # PII detection and security review
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.1),  # Strict QA
+            llm=get_llm("g2_security_agent", temperature=0.1),  # Strict QA
             verbose=True,
             allow_delegation=False,
         )
@@ -5,6 +5,7 @@ from src.crews.viability.finance_crew import FinanceCrew
 from src.crews.viability.synthesis_crew import SynthesisCrew
 from src.crews.viability.governance_crew import ViabilityGovernanceCrew
 from src.crews.viability.narrative_crew import NarrativeSynthesisCrew
+from src.shared.llm_budget import apply_degradation
 from src.state.models import ViabilityEvidence
 
 
@@ -27,7 +28,7 @@ def run_finance_crew(
         ViabilityEvidence with CAC, LTV, signals
     """
     crew = FinanceCrew()
-    result = crew.crew().kickoff(
+    result = apply_degradation(crew.crew()).kickoff(
         inputs={
             "experiment_data": experiment_data,
             "desirability_evidence": desirability_evidence,
@@ -59,7 +60,7 @@ def run_synthesis_crew(
         Synthesis results with decision options
     """
     crew = SynthesisCrew()
-    result = crew.crew().kickoff(
+    result = apply_degradation(crew.crew()).kickoff(
         inputs={
             "founders_brief": founders_brief,
             "vpc_evidence": vpc_evidence,
@@ -88,7 +89,7 @@ def run_viability_governance_crew(
         Governance results with audit trail and flywheel entry
     """
     crew = ViabilityGovernanceCrew()
-    result = crew.crew().kickoff(
+    result = apply_degradation(crew.crew()).kickoff(
         inputs={
             "validation_record": validation_record,
             "all_outputs": all_outputs,
@@ -132,7 +133,7 @@ def run_narrative_synthesis_crew(
     @story US-NL01
     """
     crew = NarrativeSynthesisCrew()
-    result = crew.crew().kickoff(
+    result = apply_degradation(crew.crew()).kickoff(
         inputs={
             "founders_brief": founders_brief,
             "customer_profile": customer_profile,
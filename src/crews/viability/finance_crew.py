@@ -11,10 +11,11 @@ Agents:
 @story US-AVB01
 """
 
-from crewai import Agent, Crew, LLM, Process, Task
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
-from shared.tools import AnalyticsTool
+from src.shared.model_registry import get_llm
+from src.shared.tools import AnalyticsTool
 from src.state.models import ViabilityEvidence
 
 
@@ -48,7 +49,7 @@ class FinanceCrew:
             reasoning=True,  # Analyzes financial data from experiments
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.2),  # Financial precision
+            llm=get_llm("l1_financial_controller", temperature=0.2),  # Financial precision
             verbose=True,
             allow_delegation=False,
         )
@@ -62,7 +63,7 @@ class FinanceCrew:
             reasoning=False,  # Compliance check
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.1),  # Strict compliance
+            llm=get_llm("l2_legal_compliance", temperature=0.1),  # Strict compliance
             verbose=True,
             allow_delegation=False,
         )
@@ -76,7 +77,7 @@ class FinanceCrew:
             reasoning=False,  # Assumption validation
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.2),  # Analytical
+            llm=get_llm("l3_economics_reviewer", temperature=0.2),  # Analytical
             verbose=True,
             allow_delegation=False,
         )
@@ -11,10 +11,11 @@ Agents:
 @story US-AVB05
 """
 
-from crewai import Agent, Crew, LLM, Process, Task
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
-from shared.tools import MethodologyCheckTool, AnonymizerTool
+from src.shared.model_registry import get_llm
+from src.shared.tools import MethodologyCheckTool, AnonymizerTool
 
 
 @CrewBase
@@ -45,7 +46,7 @@ class ViabilityGovernanceCrew:
             reasoning=True,
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.1),  # Strict QA
+            llm=get_llm("g1_qa_agent", temperature=0.1),  # Strict QA
             verbose=True,
             allow_delegation=False,
         )
@@ -59,7 +60,7 @@ class ViabilityGovernanceCrew:
             reasoning=True,  # PII detection and anonymization
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.1),  # Strict QA
+            llm=get_llm("g2_security_agent", temperature=0.1),  # Strict QA
             verbose=True,
             allow_delegation=False,
         )
@@ -73,7 +74,7 @@ class ViabilityGovernanceCrew:
             reasoning=False,  # Persistence/logging
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.1),  # Strict QA
+            llm=get_llm("viability_g3_audit_agent", temperature=0.1),  # Strict QA
             verbose=True,
             allow_delegation=False,
         )
@@ -12,9 +12,10 @@ Agents:
 @story US-NL01
 """
 
-from crewai import Agent, Crew, LLM, Process, Task
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
+from src.shared.model_registry import get_llm
 from src.shared.schemas.narrative import PitchNarrativeContent
 
 
@@ -47,7 +48,7 @@ class NarrativeSynthesisCrew:
             reasoning=False,  # Narrative composition
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.7),  # Creative writing
+            llm=get_llm("n1_narrative_architect", temperature=0.7),  # Creative writing
             verbose=True,
             allow_delegation=False,
         )
@@ -61,7 +62,7 @@ class NarrativeSynthesisCrew:
             reasoning=False,  # Evidence classification
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.3),  # Precise mapping
+            llm=get_llm("n2_evidence_mapper", temperature=0.3),  # Precise mapping
             verbose=True,
             allow_delegation=False,
         )
@@ -75,7 +76,7 @@ class NarrativeSynthesisCrew:
             reasoning=True,  # Reasoning for claim validation
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.1),  # Strict validation
+            llm=get_llm("n3_claim_guardian", temperature=0.1),  # Strict validation
             verbose=True,
             allow_delegation=False,
         )
@@ -11,9 +11,11 @@ Agents:
 @story US-AVB04
 """
 
-from crewai import Agent, Crew, LLM, Process, Task
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
+from src.shared.model_registry import get_llm
+
 
 @CrewBase
 class SynthesisCrew:
@@ -44,7 +46,7 @@ class SynthesisCrew:
             reasoning=False,  # Synthesis without tools
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.7),  # Synthesis/strategy
+            llm=get_llm("c1_product_pm", temperature=0.7),  # Synthesis/strategy
             verbose=True,
             allow_delegation=False,
         )
@@ -58,7 +60,7 @@ class SynthesisCrew:
             reasoning=False,  # HITL presentation
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.5),
+            llm=get_llm("c2_human_approval", temperature=0.5),
             verbose=True,
             allow_delegation=False,
         )
@@ -72,7 +74,7 @@ class SynthesisCrew:
             reasoning=False,  # Documentation
             inject_date=True,
             max_iter=25,
-            llm=LLM(model="openai/gpt-4o", temperature=0.7),  # Synthesis
+            llm=get_llm("c3_roadmap_writer", temperature=0.7),  # Synthesis
             verbose=True,
             allow_delegation=False,
         )
@@ -6,7 +6,8 @@ Implements the Serverless Agentic Loop architecture per ADR-002.
 
 Endpoints:
     POST /kickoff        - Start validation run (returns 202 + run_id)
-    GET  /status/{run_id} - Check progress (reads from Supabase)
+    GET  /status/{run_id} - Check progress (reads from Supabase, ?since= cursor, ETag)
+    GET  /status/{run_id}/stream - Server-Sent Events for progress, HITL and completion
     POST /hitl/approve   - Resume after human approval
 
 Usage:
@@ -19,10 +20,14 @@ import sys
 import json
 import hmac
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
+# Start of the cold-start measurement (see API_IMPORT_BUDGET_MS)
+_IMPORT_STARTED = time.perf_counter()
+
 # Add src directory to Python path for Modal container
 if "/root/src" not in sys.path:
     sys.path.insert(0, "/root/src")
@@ -30,10 +35,35 @@ if "/root" not in sys.path:
     sys.path.insert(0, "/root")
 
 import modal
-from fastapi import FastAPI, HTTPException, Header, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Header, BackgroundTasks, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from src.modal_app.config import (
+    PHASE_RESOURCES,
+    ORCHESTRATOR_RESOURCES,
+    API_MIN_CONTAINERS,
+    ORCHESTRATOR_MIN_CONTAINERS,
+    API_IMPORT_BUDGET_MS,
+    HITL_EXPIRY_SWEEP_MINUTES,
+)
+from src.shared import tracing
+from src.shared.gate_policies import with_gate_policies
+from src.shared.llm_budget import (
+    BudgetExceededError,
+    budget_scope,
+    check_run_budget,
+    run_phase_within_budget,
+)
+from src.shared.metering import flush_usage, metering_scope
+from src.state.hitl import HITLDecisionError, apply_hitl_decision, decision_message, expire_hitl_requests
+from src.state.persistence import load_phase_state, save_phase_state
+from src.state.progress_sink import flush_progress
+from src.state.run_status import get_run_status, parse_etag_version, status_etag, clamp_progress_limit
+from src.state.run_events import record_run_event, stream_run_events, parse_last_event_id
+from src.state.webhook_outbox import enqueue_webhook
+
 # Configure logging
 logging.basicConfig(
     format='{"timestamp":"%(asctime)s","level":"%(levelname)s","message":"%(message)s"}',
@@ -58,15 +88,60 @@ image = (
         "supabase>=2.0.0",
         "openai>=1.0.0",
         "tavily-python>=0.3.0",
-        "httpx>=0.27.0",
+        "httpx[http2]>=0.27.0",
         # MCP integration for tool framework
         "mcp>=1.0.0",
         "fastmcp>=0.1.0",
         "mcp-use>=0.1.0",
+        # Compressed state snapshots (STATE_CHECKPOINT_MODE=snapshot)
+        "zstandard>=0.22.0",
+        "orjson>=3.9.0",
     )
     .add_local_dir("src", remote_path="/root/src")
 )
 
+# Lightweight image for the ASGI API (/kickoff, /status, /hitl/approve).
+# The API only reads and writes Supabase and spawns functions, so it ships
+# without crewai, litellm or the ad SDKs; every module app.py imports at top
+# level must be installable here. Phase code is imported inside the phase
+# functions, which run on the full image. The per-minute deliver_webhooks and
+# HITL expiry crons run here too.
+api_image = (
+    modal.Image.debian_slim(python_version="3.11")
+    .pip_install(
+        "fastapi>=0.115.0",
+        "pydantic>=2.0.0",
+        "pydantic-settings>=2.0.0",
+        "supabase>=2.0.0",
+        "httpx[http2]>=0.27.0",
+        "zstandard>=0.22.0",
+        "orjson>=3.9.0",
+    )
+    .add_local_dir("src", remote_path="/root/src")
+)
+
+# Cassettes recorded by phase functions when CASSETTE_MODE=record
+# (see src/shared/replay.py; fetch with `modal volume get startupai-cassettes <run_id>`)
+CASSETTE_DIR = "/cassettes"
+cassette_volume = modal.Volume.from_name("startupai-cassettes", create_if_missing=True)
+
+# Chrome traces written when TRACE_EXPORT includes "chrome"
+# (see src/shared/tracing.py; fetch with `modal volume get startupai-traces <run_id>`)
+TRACE_DIR = "/traces"
+trace_volume = modal.Volume.from_name("startupai-traces", create_if_missing=True)
+
+
+def _commit_traces(run_id: str) -> None:
+    """Persist written traces; a commit failure never replaces the run's result."""
+    try:
+        trace_volume.commit()
+    except Exception as e:
+        logger.warning(json.dumps({
+            "event": "trace_commit_failed",
+            "run_id": run_id,
+            "error": str(e),
+        }))
+
 # Create the Modal App
 app = modal.App(
     name="startupai-validation",
@@ -139,6 +214,13 @@ class StatusResponse(BaseModel):
     started_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     error_message: Optional[str] = None
+    # Progress pagination: pass next_cursor back as ?since= to get newer rows
+    progress_count: Optional[int] = None
+    latest_progress: Optional[dict] = None
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    # Tokens and USD cost so far: totals, by_phase and by_crew (most expensive first)
+    llm_usage: Optional[dict] = None
 
 
 class HITLApproveRequest(BaseModel):
@@ -267,40 +349,42 @@ async def kickoff(
 @web_app.get("/status/{run_id}", response_model=StatusResponse)
 async def get_status(
     run_id: UUID,
+    response: Response,
+    since: Optional[str] = Query(None, description="Progress id or ISO timestamp; only newer progress is returned"),
+    limit: Optional[int] = Query(None, description="Maximum progress rows (default 500, max 1000)"),
     authorization: str = Header(...),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     Get current status of a validation run.
 
-    Reads from Supabase for instant response (no Modal container needed).
+    Reads the materialized run summary from Supabase in one round trip (no
+    Modal container needed). Returns 304 when If-None-Match matches the
+    current ETag.
     """
     verify_bearer_token(authorization)
 
-    supabase = get_supabase()
-
-    # Get run record
-    result = supabase.table("validation_runs").select("*").eq(
-        "id", str(run_id)
-    ).single().execute()
+    limit = clamp_progress_limit(limit)
+    known_version = parse_etag_version(if_none_match, str(run_id))
+    if known_version is not None and if_none_match != status_etag(str(run_id), known_version, since, limit):
+        known_version = None
+
+    status = get_run_status(
+        str(run_id),
+        since=since,
+        limit=limit,
+        known_version=known_version,
+        supabase=get_supabase(),
+    )
 
-    if not result.data:
+    if not status:
         raise HTTPException(status_code=404, detail="Validation run not found")
 
-    run = result.data
-
-    # Get progress records
-    progress_result = supabase.table("validation_progress").select("*").eq(
-        "run_id", str(run_id)
-    ).order("created_at", desc=False).execute()
-
-    progress = progress_result.data or []
-
-    # Check for pending HITL request
-    hitl_result = supabase.table("hitl_requests").select("*").eq(
-        "run_id", str(run_id)
-    ).eq("status", "pending").execute()
-
-    hitl_pending = hitl_result.data[0] if hitl_result.data else None
+    if status["version"] is not None:
+        etag = status_etag(str(run_id), status["version"], since, limit)
+        if status["not_modified"]:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
 
     # Get phase name from config
     phase_names = {
@@ -310,18 +394,55 @@ async def get_status(
         3: "Feasibility",
         4: "Viability",
     }
-    phase_name = phase_names.get(run["current_phase"], f"Phase {run['current_phase']}")
+    phase_name = phase_names.get(status["current_phase"], f"Phase {status['current_phase']}")
 
     return StatusResponse(
         run_id=run_id,
-        status=run["status"],
-        current_phase=run["current_phase"],
+        status=status["status"],
+        current_phase=status["current_phase"],
         phase_name=phase_name,
-        progress=progress,
-        hitl_pending=hitl_pending,
-        started_at=run.get("started_at"),
-        updated_at=run.get("updated_at"),
-        error_message=run.get("error_message"),
+        progress=status["progress"],
+        hitl_pending=status["hitl_pending"],
+        started_at=status.get("started_at"),
+        updated_at=status.get("updated_at"),
+        error_message=status.get("error_message"),
+        progress_count=status.get("progress_count"),
+        latest_progress=status.get("latest_progress"),
+        next_cursor=status.get("next_cursor"),
+        has_more=status.get("has_more", False),
+        llm_usage=status.get("llm_usage"),
+    )
+
+
+@web_app.get("/status/{run_id}/stream")
+async def stream_status(
+    run_id: UUID,
+    last_event_id: Optional[str] = Query(None, description="Resume after this event id (for clients that cannot set headers)"),
+    authorization: str = Header(...),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Stream progress, HITL and completion events as Server-Sent Events.
+
+    Resumes after Last-Event-ID when the client reconnects.
+    """
+    verify_bearer_token(authorization)
+
+    supabase = get_supabase()
+    result = supabase.table("validation_runs").select("id").eq(
+        "id", str(run_id)
+    ).execute()
+    if not result.data:
+        raise HTTPException(status_code=404, detail="Validation run not found")
+
+    return StreamingResponse(
+        stream_run_events(
+            str(run_id),
+            last_event_id=parse_last_event_id(last_event_id_header or last_event_id),
+            supabase=supabase,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -339,6 +460,9 @@ async def hitl_approve(
     - rejected: Pause workflow for review
     - override_proceed: Override pivot recommendation and force proceed
     - iterate: Re-run current phase with same hypothesis
+    - segment_<n> / custom_segment: Segment pivot to a chosen segment
+
+    Returns 409 if the checkpoint was already decided.
     """
     verify_bearer_token(authorization)
 
@@ -351,316 +475,180 @@ async def hitl_approve(
         "decision": request.decision,
     }))
 
-    # Update HITL request status
-    # Normalize status to valid enum: pending|approved|rejected|expired
-    # Store actual decision value in 'decision' column
-    if request.decision in ("rejected", "reject"):
-        normalized_status = "rejected"
-    elif request.decision == "iterate":
-        # Iterate keeps it pending for another round
-        normalized_status = "pending"
-    else:
-        # segment_1, segment_2, custom_segment, override_proceed, approved -> approved
-        normalized_status = "approved"
-
-    supabase.table("hitl_requests").update({
-        "status": normalized_status,
-        "decision": request.decision,
-        "feedback": request.feedback,
-        "decision_at": datetime.now(timezone.utc).isoformat(),
-    }).eq("run_id", str(request.run_id)).eq(
-        "checkpoint_name", request.checkpoint
-    ).eq("status", "pending").execute()
-
-    # Get current run state
-    run_result = supabase.table("validation_runs").select("*").eq(
-        "id", str(request.run_id)
-    ).single().execute()
-
-    if not run_result.data:
-        raise HTTPException(status_code=404, detail="Validation run not found")
-
-    run = run_result.data
-    current_phase = run["current_phase"]
-    phase_state = run.get("phase_state", {})
+    # One transactional RPC: claim the checkpoint, record the decision and
+    # move the run (a second decision for the same checkpoint gets a 409)
+    try:
+        outcome = apply_hitl_decision(
+            str(request.run_id),
+            request.checkpoint,
+            request.decision,
+            feedback=request.feedback,
+            custom_segment_data=request.custom_segment_data,
+            supabase=supabase,
+        )
+    except HITLDecisionError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
 
-    # -------------------------------------------------------------------------
-    # Handle: SEGMENT SELECTION (segment_1, segment_2, segment_3, custom_segment)
-    # -------------------------------------------------------------------------
     if request.decision.startswith("segment_") or request.decision == "custom_segment":
-        # This is a segment pivot with a specific segment selected
-        if request.checkpoint != "approve_segment_pivot":
-            raise HTTPException(
-                status_code=400,
-                detail="Segment selection is only valid for approve_segment_pivot checkpoint"
-            )
-
-        # Get segment alternatives from HITL request context
-        hitl_result = supabase.table("hitl_requests").select("context").eq(
-            "run_id", str(request.run_id)
-        ).eq("checkpoint_name", request.checkpoint).single().execute()
-
-        hitl_context = hitl_result.data.get("context", {}) if hitl_result.data else {}
-        segment_alternatives = hitl_context.get("segment_alternatives", [])
-
-        # Determine selected segment
-        if request.decision == "custom_segment":
-            # Custom segment from founder
-            selected_segment = {
-                "segment_name": request.custom_segment_data.get("segment_name") if request.custom_segment_data else request.feedback,
-                "segment_description": request.custom_segment_data.get("segment_description", "") if request.custom_segment_data else "",
-                "confidence": 0.5,  # Unknown confidence for custom
-                "is_custom": True,
-            }
-        else:
-            # Selected from alternatives (segment_1, segment_2, etc.)
-            segment_index = int(request.decision.split("_")[1]) - 1
-            if segment_index < len(segment_alternatives):
-                selected_segment = segment_alternatives[segment_index]
-                selected_segment["is_custom"] = False
-            else:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid segment selection: {request.decision}"
-                )
-
         logger.info(json.dumps({
             "event": "segment_pivot_selected",
             "run_id": str(request.run_id),
-            "selected_segment": selected_segment.get("segment_name"),
-            "confidence": selected_segment.get("confidence"),
+            "selected_segment": outcome.get("segment_name"),
+            "confidence": outcome.get("confidence"),
         }))
 
-        # Store pivot context with selected segment for Phase 1 to use
-        updated_state = {
-            **phase_state,
-            "pivot_type": "segment_pivot",
-            "pivot_reason": request.feedback or f"Segment pivot to: {selected_segment.get('segment_name')}",
-            "pivot_from_phase": current_phase,
-            "target_segment_hypothesis": selected_segment,  # NEW: Phase 1 will use this
-            "failed_segment": hitl_context.get("failed_segment"),
-        }
-
-        supabase.table("validation_runs").update({
-            "hitl_state": None,
-            "status": "running",
-            "current_phase": 1,  # Loop back to Phase 1
-            "phase_state": updated_state,
-        }).eq("id", str(request.run_id)).execute()
-
-        # Spawn resume function to continue from Phase 1
+    # Spawn resume function (rejected runs stay paused for review)
+    if outcome.get("resume"):
         resume_from_checkpoint.spawn(str(request.run_id), request.checkpoint)
 
-        return HITLApproveResponse(
-            status="pivot",
-            next_phase=1,
-            pivot_type="segment_pivot",
-            message=f"Segment pivot approved. Targeting '{selected_segment.get('segment_name')}' in Phase 1.",
-        )
+    return HITLApproveResponse(
+        status=outcome["outcome"],
+        next_phase=outcome.get("next_phase"),
+        pivot_type=outcome.get("pivot_type") if outcome["outcome"] == "pivot" else None,
+        message=decision_message(outcome, request.checkpoint, request.decision),
+    )
 
-    # -------------------------------------------------------------------------
-    # Handle: APPROVED
-    # -------------------------------------------------------------------------
-    if request.decision == "approved":
-        # Check if this is a pivot checkpoint (approved = loop back to Phase 1)
-        # Note: segment_pivot now uses segment_* decisions above, but keep fallback
-        if request.checkpoint in ("approve_segment_pivot", "approve_value_pivot"):
-            # Pivot approved: Loop back to Phase 1
-            pivot_type = (
-                "segment_pivot" if request.checkpoint == "approve_segment_pivot"
-                else "value_pivot"
-            )
 
-            # Store pivot context for Phase 1 to use
-            updated_state = {
-                **phase_state,
-                "pivot_type": pivot_type,
-                "pivot_reason": request.feedback or f"Pivot approved from Phase 2: {pivot_type}",
-                "pivot_from_phase": current_phase,
-            }
+# Set when the ASGI app is first served in this container
+_cold_start_ms: Optional[float] = None
 
-            supabase.table("validation_runs").update({
-                "hitl_state": None,
-                "status": "running",
-                "current_phase": 1,  # Loop back to Phase 1
-                "phase_state": updated_state,
-            }).eq("id", str(request.run_id)).execute()
-
-            # Spawn resume function to continue from Phase 1
-            resume_from_checkpoint.spawn(str(request.run_id), request.checkpoint)
-
-            return HITLApproveResponse(
-                status="pivot",
-                next_phase=1,
-                pivot_type=pivot_type,
-                message=f"Pivot approved. Returning to Phase 1 for {pivot_type.replace('_', ' ')}.",
-            )
-        elif request.checkpoint == "approve_brief":
-            # Brief approved: Stay in Phase 1, continue to Stage B (VPC Discovery)
-            # The founders_brief is already in phase_state from Stage A
 
-            supabase.table("validation_runs").update({
-                "hitl_state": None,
-                "status": "running",
-                # Keep current_phase at 1 - Stage B will run next
-            }).eq("id", str(request.run_id)).execute()
-
-            # Spawn resume function to continue Phase 1 Stage B
-            resume_from_checkpoint.spawn(str(request.run_id), request.checkpoint)
-
-            return HITLApproveResponse(
-                status="resumed",
-                next_phase=1,
-                message="Brief approved. Proceeding to VPC Discovery (Stage B).",
-            )
-        else:
-            # Standard approval: Advance to next phase
-            next_phase = current_phase + 1
+# @story US-A05
+@web_app.get("/health")
+async def health_check():
+    """Health check endpoint (includes this container's cold-start import time)."""
+    return {
+        "status": "healthy",
+        "service": "startupai-validation",
+        "cold_start_ms": _cold_start_ms,
+    }
 
-            supabase.table("validation_runs").update({
-                "hitl_state": None,
-                "status": "running",
-                "current_phase": next_phase,
-            }).eq("id", str(request.run_id)).execute()
-
-            # Spawn resume function to continue from next phase
-            resume_from_checkpoint.spawn(str(request.run_id), request.checkpoint)
-
-            return HITLApproveResponse(
-                status="resumed",
-                next_phase=next_phase,
-                message=f"Validation resumed from checkpoint '{request.checkpoint}'. Advancing to Phase {next_phase}.",
+
+# -----------------------------------------------------------------------------
+# Modal Functions
+# -----------------------------------------------------------------------------
+
+def _phase_function_options(phase_num: int) -> dict:
+    """Modal resources for one phase function (see PHASE_RESOURCES)."""
+    resources = PHASE_RESOURCES[phase_num]
+    return {
+        "timeout": resources["timeout_seconds"],
+        "cpu": resources["cpu"],
+        "memory": resources["memory"],
+        "volumes": {CASSETTE_DIR: cassette_volume, TRACE_DIR: trace_volume},
+        "retries": modal.Retries(
+            max_retries=resources["retries"],
+            initial_delay=1.0,
+            backoff_coefficient=2.0,
+        ),
+    }
+
+
+def _execute_phase(phase_num: int, run_id: str, phase_state: dict) -> dict:
+    """Run one phase in this container and write its buffered progress."""
+    from src.shared.replay import recording_enabled, record_phase
+    from src.modal_app.phases import (
+        phase_0_onboarding,
+        phase_1_vpc_discovery,
+        phase_2_desirability,
+        phase_3_feasibility,
+        phase_4_viability,
+    )
+
+    phase_modules = [
+        phase_0_onboarding,
+        phase_1_vpc_discovery,
+        phase_2_desirability,
+        phase_3_feasibility,
+        phase_4_viability,
+    ]
+
+    execute = phase_modules[phase_num].execute
+
+    tracer = None
+    try:
+        with metering_scope(run_id=run_id, phase=phase_num), \
+                budget_scope(run_id, phase_state) as budget, \
+                tracing.trace_phase(run_id, phase_num, TRACE_DIR) as tracer:
+            if recording_enabled():
+                try:
+                    return run_phase_within_budget(
+                        budget,
+                        phase_state,
+                        lambda: record_phase(run_id, phase_num, phase_state, execute, CASSETTE_DIR),
+                    )
+                finally:
+                    cassette_volume.commit()
+            # Carries the budget level reached in this phase back in its state
+            return run_phase_within_budget(
+                budget, phase_state, lambda: execute(run_id, phase_state)
             )
+    finally:
+        if tracer is not None:
+            _commit_traces(run_id)
+        flush_usage()
+        flush_progress()
 
-    # -------------------------------------------------------------------------
-    # Handle: OVERRIDE_PROCEED (ignore pivot signal, force proceed)
-    # -------------------------------------------------------------------------
-    elif request.decision == "override_proceed":
-        next_phase = current_phase + 1
-
-        # Store override context
-        updated_state = {
-            **phase_state,
-            "override_applied": True,
-            "override_reason": request.feedback or "Human override: proceeding despite pivot signal",
-            "override_checkpoint": request.checkpoint,
-        }
-
-        supabase.table("validation_runs").update({
-            "hitl_state": None,
-            "status": "running",
-            "current_phase": next_phase,
-            "phase_state": updated_state,
-        }).eq("id", str(request.run_id)).execute()
-
-        # Spawn resume function to continue from next phase
-        resume_from_checkpoint.spawn(str(request.run_id), request.checkpoint)
 
-        return HITLApproveResponse(
-            status="resumed",
-            next_phase=next_phase,
-            message=f"Override applied. Proceeding to Phase {next_phase} despite pivot recommendation.",
-        )
+@app.function(**_phase_function_options(0))
+def run_phase_0(run_id: str, phase_state: dict) -> dict:
+    """Phase 0: Onboarding (passthrough)."""
+    return _execute_phase(0, run_id, phase_state)
 
-    # -------------------------------------------------------------------------
-    # Handle: ITERATE (re-run current phase)
-    # -------------------------------------------------------------------------
-    elif request.decision == "iterate":
-        # Mark for iteration and re-run current phase
-        updated_state = {
-            **phase_state,
-            "iteration_count": phase_state.get("iteration_count", 0) + 1,
-            "iteration_reason": request.feedback or "Additional experiments requested",
-        }
-
-        # Parse segment pivot envelope from feedback if present
-        feedback_str = request.feedback or ""
-        if feedback_str.startswith("SEGMENT_PIVOT|"):
-            try:
-                pivot_json = json.loads(feedback_str[len("SEGMENT_PIVOT|"):])
-                target_segment = pivot_json.get("target_segment", "").strip()
-                rationale = pivot_json.get("rationale", "").strip()
-                if target_segment:
-                    updated_state["pivot_type"] = "segment_pivot"
-                    updated_state["pivot_reason"] = rationale or "Segment pivot requested by user"
-                    updated_state["pivot_from_phase"] = current_phase
-                    updated_state["target_segment_hypothesis"] = {
-                        "segment_name": target_segment,
-                        "segment_description": rationale or target_segment,
-                        "why_better_fit": rationale or "User-specified pivot",
-                    }
-                    # Track the failed segment from the current state
-                    current_segment = phase_state.get("customer_profile", {}).get("segment_name")
-                    if current_segment:
-                        updated_state["failed_segment"] = current_segment
-                    logger.info(json.dumps({
-                        "event": "segment_pivot_from_envelope",
-                        "run_id": str(request.run_id),
-                        "target_segment": target_segment,
-                    }))
-            except (json.JSONDecodeError, TypeError) as parse_err:
-                logger.warning(json.dumps({
-                    "event": "segment_pivot_envelope_parse_failed",
-                    "run_id": str(request.run_id),
-                    "error": str(parse_err),
-                }))
 
-        supabase.table("validation_runs").update({
-            "hitl_state": None,
-            "status": "running",
-            "phase_state": updated_state,
-        }).eq("id", str(request.run_id)).execute()
+@app.function(**_phase_function_options(1))
+def run_phase_1(run_id: str, phase_state: dict) -> dict:
+    """Phase 1: VPC Discovery."""
+    return _execute_phase(1, run_id, phase_state)
 
-        # Spawn resume function to re-run current phase
-        resume_from_checkpoint.spawn(str(request.run_id), request.checkpoint)
 
-        return HITLApproveResponse(
-            status="iterate",
-            next_phase=current_phase,
-            message=f"Iteration requested. Re-running Phase {current_phase} with additional experiments.",
-        )
+@app.function(**_phase_function_options(2))
+def run_phase_2(run_id: str, phase_state: dict) -> dict:
+    """Phase 2: Desirability."""
+    return _execute_phase(2, run_id, phase_state)
 
-    # -------------------------------------------------------------------------
-    # Handle: REJECTED
-    # -------------------------------------------------------------------------
-    else:
-        # Record rejection, workflow pauses
-        supabase.table("validation_runs").update({
-            "hitl_state": f"rejected_{request.checkpoint}",
-            "status": "paused",
-        }).eq("id", str(request.run_id)).execute()
-
-        return HITLApproveResponse(
-            status="rejected",
-            next_phase=None,
-            message=f"Checkpoint '{request.checkpoint}' rejected. Review required.",
-        )
 
+@app.function(**_phase_function_options(3))
+def run_phase_3(run_id: str, phase_state: dict) -> dict:
+    """Phase 3: Feasibility."""
+    return _execute_phase(3, run_id, phase_state)
 
-# @story US-A05
-@web_app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "service": "startupai-validation"}
 
+@app.function(**_phase_function_options(4))
+def run_phase_4(run_id: str, phase_state: dict) -> dict:
+    """Phase 4: Viability."""
+    return _execute_phase(4, run_id, phase_state)
+
+
+PHASE_FUNCTIONS = [run_phase_0, run_phase_1, run_phase_2, run_phase_3, run_phase_4]
 
-# -----------------------------------------------------------------------------
-# Modal Functions
-# -----------------------------------------------------------------------------
 
 @app.function(
-    timeout=7200,  # 2 hours - Phase 2-4 can take 40+ minutes
-    cpu=2.0,
-    memory=4096,
-    retries=modal.Retries(max_retries=2, initial_delay=1.0),
+    timeout=ORCHESTRATOR_RESOURCES["timeout_seconds"],
+    cpu=ORCHESTRATOR_RESOURCES["cpu"],
+    memory=ORCHESTRATOR_RESOURCES["memory"],
+    min_containers=ORCHESTRATOR_MIN_CONTAINERS,
+    volumes={TRACE_DIR: trace_volume},
 )
 def run_validation(run_id: str):
     """
     Main validation orchestrator.
 
-    Executes phases sequentially, checkpointing to Supabase at HITL points.
-    Container terminates during HITL waits ($0 cost while waiting).
+    Runs each phase as its own Modal function (right-sized resources and
+    per-phase retries), checkpointing to Supabase after every phase and at
+    HITL points. Container terminates during HITL waits ($0 cost while waiting).
     """
+    tracer = None
+    try:
+        with tracing.trace_run(run_id, TRACE_DIR) as tracer:
+            return _run_validation(run_id)
+    finally:
+        if tracer is not None:
+            _commit_traces(run_id)
+
+
+def _run_validation(run_id: str):
+    """Orchestrator body (see run_validation)."""
     logger.info(json.dumps({
         "event": "validation_start",
         "run_id": run_id,
@@ -681,25 +669,13 @@ def run_validation(run_id: str):
         run = run_result.data
 
         current_phase = run["current_phase"]
-        phase_state = run.get("phase_state", {})
-
-        # Execute phases sequentially
-        from src.modal_app.phases import (
-            phase_0_onboarding,
-            phase_1_vpc_discovery,
-            phase_2_desirability,
-            phase_3_feasibility,
-            phase_4_viability,
-        )
+        phase_state = load_phase_state(run_id, run, supabase)
+        persisted_state = phase_state
 
-        phase_functions = [
-            phase_0_onboarding.execute,
-            phase_1_vpc_discovery.execute,
-            phase_2_desirability.execute,
-            phase_3_feasibility.execute,
-            phase_4_viability.execute,
-        ]
+        # One gate_policies read per invocation; phases evaluate gates from state
+        phase_state = with_gate_policies(phase_state, str(run["user_id"]), supabase)
 
+        # Execute phases sequentially, each in its own container
         for phase_num in range(current_phase, 5):
             logger.info(json.dumps({
                 "event": "phase_start",
@@ -712,8 +688,28 @@ def run_validation(run_id: str):
                 "current_phase": phase_num,
             }).eq("id", run_id).execute()
 
-            # Execute phase
-            phase_result = phase_functions[phase_num](run_id, phase_state)
+            # Refresh LLM spend; degrades this phase's crews near the limit
+            # and stops the run (BudgetExceededError) once it is spent
+            try:
+                phase_state = check_run_budget(run_id, phase_num, phase_state, supabase)
+            except BudgetExceededError as e:
+                save_phase_state(run_id, e.phase_state, previous_state=persisted_state, supabase=supabase)
+                raise
+
+            # Execute phase (retried on its own container on failure)
+            with tracing.span(f"run_phase_{phase_num}", tracing.PHASE, phase=phase_num):
+                phase_result = PHASE_FUNCTIONS[phase_num].remote(run_id, phase_state)
+
+            # Budget ran out inside the phase: keep its recorded degradations
+            # and stop the run
+            if phase_result.get("budget_exhausted"):
+                save_phase_state(
+                    run_id,
+                    phase_result["state"],
+                    previous_state=persisted_state,
+                    supabase=supabase,
+                )
+                raise BudgetExceededError(phase_result["budget_exhausted"], phase_result["state"])
 
             # Check if HITL checkpoint was triggered
             if phase_result.get("hitl_checkpoint"):
@@ -726,11 +722,14 @@ def run_validation(run_id: str):
                 }))
 
                 # Save state and create HITL request
-                supabase.table("validation_runs").update({
-                    "hitl_state": checkpoint,
-                    "status": "paused",
-                    "phase_state": phase_result.get("state", phase_state),
-                }).eq("id", run_id).execute()
+                save_phase_state(
+                    run_id,
+                    phase_result.get("state", phase_state),
+                    previous_state=persisted_state,
+                    supabase=supabase,
+                    hitl_state=checkpoint,
+                    status="paused",
+                )
 
                 hitl_title = phase_result.get("hitl_title", f"Approval Required: {checkpoint}")
                 hitl_description = phase_result.get("hitl_description", "")
@@ -772,6 +771,17 @@ def run_validation(run_id: str):
             # Update state for next phase
             phase_state = phase_result.get("state", phase_state)
 
+            # Checkpoint the phase boundary so a rerun resumes from here
+            if phase_num < 4:
+                save_phase_state(
+                    run_id,
+                    phase_state,
+                    previous_state=persisted_state,
+                    supabase=supabase,
+                    current_phase=phase_num + 1,
+                )
+                persisted_state = phase_state
+
             logger.info(json.dumps({
                 "event": "phase_complete",
                 "run_id": run_id,
@@ -779,11 +789,14 @@ def run_validation(run_id: str):
             }))
 
         # All phases complete
-        supabase.table("validation_runs").update({
-            "status": "completed",
-            "phase_state": phase_state,
-            "completed_at": datetime.now(timezone.utc).isoformat(),
-        }).eq("id", run_id).execute()
+        save_phase_state(
+            run_id,
+            phase_state,
+            previous_state=persisted_state,
+            supabase=supabase,
+            status="completed",
+            completed_at=datetime.now(timezone.utc).isoformat(),
+        )
 
         logger.info(json.dumps({
             "event": "validation_complete",
@@ -796,6 +809,7 @@ def run_validation(run_id: str):
         return {"status": "completed"}
 
     except Exception as e:
+        flush_progress()
         logger.error(json.dumps({
             "event": "validation_error",
             "run_id": run_id,
@@ -831,16 +845,17 @@ def run_validation(run_id: str):
 
 
 @app.function(
-    timeout=7200,  # 2 hours - resumed phases can run long
-    cpu=2.0,
-    memory=4096,
-    retries=modal.Retries(max_retries=2, initial_delay=1.0),
+    timeout=ORCHESTRATOR_RESOURCES["timeout_seconds"],
+    cpu=ORCHESTRATOR_RESOURCES["cpu"],
+    memory=ORCHESTRATOR_RESOURCES["memory"],
+    volumes={TRACE_DIR: trace_volume},
 )
 def resume_from_checkpoint(run_id: str, checkpoint: str):
     """
     Resume validation from a HITL checkpoint after approval.
 
-    Loads state from Supabase and continues execution.
+    Loads state from Supabase and continues execution. Runs the orchestrator
+    in this container, so it mounts the same trace volume as run_validation.
     """
     logger.info(json.dumps({
         "event": "resume_from_checkpoint",
@@ -863,168 +878,135 @@ def _send_hitl_webhook(
     recommended: str,
     context: dict,
 ):
-    """Send HITL checkpoint webhook to product app to create approval_requests entry."""
-    import httpx
+    """Queue HITL checkpoint webhook to product app to create approval_requests entry."""
     from datetime import timedelta
 
-    product_app_url = os.environ.get("PRODUCT_APP_URL", "https://app.startupai.site")
-    webhook_url = f"{product_app_url}/api/crewai/webhook"
-    bearer_token = os.environ.get("WEBHOOK_BEARER_TOKEN", "startupai-modal-secret-2026")
-
     # Calculate expiration (7 days from now)
     expires_at = (datetime.now(timezone.utc) + timedelta(days=7)).isoformat()
 
-    try:
-        response = httpx.post(
-            webhook_url,
-            json={
-                "flow_type": "hitl_checkpoint",
-                "run_id": run_id,
-                "project_id": project_id,
-                "user_id": user_id,
-                "checkpoint": checkpoint,
-                "title": title,
-                "description": description,
-                "options": options,
-                "recommended": recommended,
-                "context": context,
-                "expires_at": expires_at,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            },
-            headers={
-                "Authorization": f"Bearer {bearer_token}",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        logger.info(json.dumps({
-            "event": "hitl_webhook_sent",
-            "run_id": run_id,
-            "checkpoint": checkpoint,
-            "status_code": response.status_code,
-        }))
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "hitl_webhook_failed",
-            "run_id": run_id,
-            "checkpoint": checkpoint,
-            "error": str(e),
-        }))
+    record_run_event(run_id, "hitl_required", {
+        "checkpoint": checkpoint,
+        "title": title,
+        "options": options,
+        "recommended": recommended,
+        "expires_at": expires_at,
+    })
+
+    enqueue_webhook(run_id, "hitl_checkpoint", {
+        "flow_type": "hitl_checkpoint",
+        "run_id": run_id,
+        "project_id": project_id,
+        "user_id": user_id,
+        "checkpoint": checkpoint,
+        "title": title,
+        "description": description,
+        "options": options,
+        "recommended": recommended,
+        "context": context,
+        "expires_at": expires_at,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    })
 
 
 def _send_failure_webhook(run_id: str, error_message: str):
-    """Notify frontend that validation run has failed."""
-    import httpx
-
-    product_app_url = os.environ.get("PRODUCT_APP_URL", "https://app.startupai.site")
-    webhook_url = f"{product_app_url}/api/crewai/webhook"
-    bearer_token = os.environ.get("WEBHOOK_BEARER_TOKEN", "startupai-modal-secret-2026")
+    """Queue webhook notifying frontend that validation run has failed."""
+    record_run_event(run_id, "validation_failed", {"error_message": error_message[:200]})
 
-    try:
-        response = httpx.post(
-            webhook_url,
-            json={
-                "flow_type": "validation_failed",
-                "run_id": run_id,
-                "error_message": error_message[:200],
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            },
-            headers={
-                "Authorization": f"Bearer {bearer_token}",
-                "Content-Type": "application/json",
-            },
-            timeout=10.0,
-        )
-        response.raise_for_status()
-        logger.info(json.dumps({
-            "event": "failure_webhook_sent",
-            "run_id": run_id,
-            "status_code": response.status_code,
-        }))
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "failure_webhook_failed",
-            "run_id": run_id,
-            "error": str(e),
-        }))
+    enqueue_webhook(run_id, "validation_failed", {
+        "flow_type": "validation_failed",
+        "run_id": run_id,
+        "error_message": error_message[:200],
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    })
 
 
 def _send_completion_webhook(run_id: str, final_state: dict):
-    """Send completion webhook to product app."""
-    import httpx
+    """Queue completion webhook to product app."""
+    record_run_event(run_id, "validation_complete", {"status": "completed"})
 
-    product_app_url = os.environ.get("PRODUCT_APP_URL", "https://app.startupai.site")
-    webhook_url = f"{product_app_url}/api/crewai/webhook"
-    bearer_token = os.environ.get("WEBHOOK_BEARER_TOKEN", "startupai-modal-secret-2026")
+    enqueue_webhook(run_id, "validation_complete", {
+        "flow_type": "founder_validation",
+        "run_id": run_id,
+        "status": "completed",
+        "result": final_state,
+    })
 
-    try:
-        response = httpx.post(
-            webhook_url,
-            json={
-                "flow_type": "founder_validation",
-                "run_id": run_id,
-                "status": "completed",
-                "result": final_state,
-            },
-            headers={
-                "Authorization": f"Bearer {bearer_token}",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
-        )
-        response.raise_for_status()
+
+# -----------------------------------------------------------------------------
+# Webhook Outbox Delivery
+# -----------------------------------------------------------------------------
+
+@app.function(image=api_image, schedule=modal.Period(minutes=1), timeout=300)
+def deliver_webhooks():
+    """
+    Drain the webhook outbox.
+
+    Picks up events whose in-process delivery did not finish (container
+    exit, product app outage) and retries them with backoff.
+    """
+    from src.state.webhook_outbox import deliver_pending
+
+    totals = {"claimed": 0, "delivered": 0, "failed": 0}
+    while True:
+        stats = deliver_pending()
+        for key in totals:
+            totals[key] += stats[key]
+        if not stats["claimed"]:
+            break
+
+    if totals["claimed"]:
         logger.info(json.dumps({
-            "event": "webhook_sent",
-            "run_id": run_id,
-            "status_code": response.status_code,
-        }))
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "webhook_failed",
-            "run_id": run_id,
-            "error": str(e),
+            "event": "webhook_outbox_drained",
+            **totals,
         }))
 
+    return totals
+
 
 # -----------------------------------------------------------------------------
-# HITL Expiration Cron
+# HITL Expiration Sweep
 # -----------------------------------------------------------------------------
 
-@app.function(schedule=modal.Cron("0 */6 * * *"))  # Every 6 hours
+@app.function(image=api_image, schedule=modal.Period(minutes=HITL_EXPIRY_SWEEP_MINUTES), timeout=300)
 def expire_stale_hitl_requests():
     """
-    Expire HITL requests older than 7 days.
+    Expire HITL requests past expires_at.
 
-    Runs every 6 hours to clean up abandoned approvals.
+    One RPC per batch expires the requests, fails the runs still paused on
+    them and queues their validation_failed webhooks; a sweep with
+    nothing due is one index probe. Queued notifications are delivered
+    before returning (deliver_webhooks retries failures).
     """
-    supabase = get_supabase()
+    from src.state.webhook_outbox import deliver_pending
 
-    result = supabase.table("hitl_requests").update({
-        "status": "expired",
-    }).eq("status", "pending").lt(
-        "expires_at", datetime.now(timezone.utc).isoformat()
-    ).execute()
+    result = expire_hitl_requests()
 
-    expired_count = len(result.data) if result.data else 0
+    if result["notifications"]:
+        deliver_pending()
 
-    if expired_count > 0:
-        logger.info(json.dumps({
-            "event": "hitl_expired",
-            "count": expired_count,
-        }))
-
-    return {"expired": expired_count}
+    return {
+        "expired": result["expired"],
+        "runs_failed": result["runs_failed"],
+        "notifications": result["notifications"],
+    }
 
 
 # -----------------------------------------------------------------------------
 # Mount FastAPI to Modal
 # -----------------------------------------------------------------------------
 
-@app.function()
+@app.function(image=api_image, min_containers=API_MIN_CONTAINERS)
 @modal.asgi_app()
 def fastapi_app():
-    """Serve FastAPI app via Modal ASGI."""
+    """Serve FastAPI app via Modal ASGI (slim image, warm pool)."""
+    global _cold_start_ms
+    _cold_start_ms = round((time.perf_counter() - _IMPORT_STARTED) * 1000, 1)
+    logger.info(json.dumps({
+        "event": "api_cold_start",
+        "import_ms": _cold_start_ms,
+        "budget_ms": API_IMPORT_BUDGET_MS,
+        "over_budget": _cold_start_ms > API_IMPORT_BUDGET_MS,
+    }))
     return web_app
 
 
@@ -1041,7 +1023,7 @@ def test_netlify_deploy():
     """
     import httpx
     from datetime import datetime
-    from shared.tools.landing_page_deploy import LandingPageDeploymentTool
+    from src.shared.tools.landing_page_deploy import LandingPageDeploymentTool
 
     logger.info("Starting LandingPageDeploymentTool test...")
 
@@ -119,3 +119,40 @@ TOTAL_FLOWS = 5
 TOTAL_CREWS = 14
 TOTAL_AGENTS = 45
 TOTAL_HITL_CHECKPOINTS = 10
+
+# Modal function resources per phase (see run_phase_* in app.py)
+# timeout_seconds is the hard container limit, with headroom over the
+# expected durations in PHASE_CONFIG; retries apply to that phase only.
+PHASE_RESOURCES = {
+    0: {"cpu": 0.25, "memory": 512, "timeout_seconds": 300, "retries": 1},  # Passthrough
+    1: {"cpu": 1.0, "memory": 2048, "timeout_seconds": 3600, "retries": 2},  # LLM-bound crews
+    2: {"cpu": 2.0, "memory": 4096, "timeout_seconds": 3600, "retries": 2},  # Landing pages + ads
+    3: {"cpu": 1.0, "memory": 2048, "timeout_seconds": 2400, "retries": 2},
+    4: {"cpu": 1.0, "memory": 3072, "timeout_seconds": 3600, "retries": 2},  # Narrative synthesis context
+}
+
+# Orchestrator only sequences phases and writes checkpoints. It waits on
+# each phase through all of its attempts, so its limit covers every phase
+# timing out on every retry (about 11.3 h, under Modal's 24 h maximum)
+# plus 10 minutes for checkpoints and retry backoff.
+ORCHESTRATOR_RESOURCES = {
+    "cpu": 0.25,
+    "memory": 512,
+    "timeout_seconds": sum(
+        (r["retries"] + 1) * r["timeout_seconds"] for r in PHASE_RESOURCES.values()
+    ) + 600,
+}
+
+# Warm pools, read when the app is deployed. One warm API container keeps
+# /kickoff off the cold-start path; the orchestrator pool is opt-in because
+# idle containers are billed.
+API_MIN_CONTAINERS = int(os.environ.get("API_MIN_CONTAINERS", "1"))
+ORCHESTRATOR_MIN_CONTAINERS = int(os.environ.get("ORCHESTRATOR_MIN_CONTAINERS", "0"))
+
+# Cold-start budget for the API container: importing app.py on api_image
+# (logged as api_cold_start and reported by /health)
+API_IMPORT_BUDGET_MS = 800
+
+# HITL expiry sweep cadence, read when the app is deployed. A sweep with
+# nothing due is a single partial-index probe, so it can run often.
+HITL_EXPIRY_SWEEP_MINUTES = int(os.environ.get("HITL_EXPIRY_SWEEP_MINUTES", "1"))
@@ -14,6 +14,8 @@ from typing import Any
 
 from openai import OpenAI
 
+from src.shared.llm_cache import cached_chat_completion
+
 logger = logging.getLogger(__name__)
 
 
@@ -121,7 +123,8 @@ Example format:
 IMPORTANT: The alternatives should be meaningfully DIFFERENT from the failed segment, not just variations."""
 
     try:
-        response = client.chat.completions.create(
+        content = cached_chat_completion(
+            client,
             model="gpt-4o",
             messages=[
                 {"role": "system", "content": "You are a startup strategy expert specializing in customer segmentation and market validation."},
@@ -131,7 +134,6 @@ IMPORTANT: The alternatives should be meaningfully DIFFERENT from the failed seg
             temperature=0.7,
         )
 
-        content = response.choices[0].message.content
         result = json.loads(content)
 
         # Handle both direct array and wrapped object
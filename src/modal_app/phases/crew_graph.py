@@ -0,0 +1,327 @@
+"""
+Crew dependency graph executor.
+
+Each phase declares its crews as a small DAG of CrewNode entries. Crews whose
+inputs are already available run concurrently in a thread pool; everything
+else waits for its dependencies. Progress rows are streamed through the
+phase's own update_progress callable, so the UI sees the same
+started/in_progress/completed/failed sequence per crew as before.
+
+Example:
+    nodes = [
+        CrewNode(name="FinanceCrew", run=run_finance, end_pct=40),
+        CrewNode(name="SynthesisCrew", run=run_synthesis, depends_on=("FinanceCrew",)),
+        CrewNode(name="NarrativeCrew", run=run_narrative, depends_on=("FinanceCrew",), optional=True),
+    ]
+    results = execute_crew_graph(run_id, phase=4, nodes=nodes, progress=update_progress)
+
+When a phase passes idempotency_inputs, each completed crew's result is
+stored under (run_id, phase, crew, input hash) and a retried phase reuses it
+instead of re-running the crew (see src/state/crew_results.py).
+
+Configuration:
+    CREW_GRAPH_MAX_WORKERS: Max crews running at once (default 4, 1 = sequential)
+    CREW_RESULT_MEMO: Set to 0 to disable crew result reuse (default: enabled)
+"""
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from src.shared import llm_budget, metering, tracing
+from src.state.crew_results import CrewResultMemo, memo_enabled
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass
+class CrewNode:
+    """
+    A single crew in a phase's dependency graph.
+
+    Attributes:
+        name: Crew name used for progress rows (e.g. "DiscoveryCrew")
+        run: Callable receiving the results of completed crews, keyed by name
+        depends_on: Names of crews whose results this crew needs
+        start_pct: Start of the crew's share of phase progress (reported
+            when it starts in a sequential graph; see _GraphProgress)
+        end_pct: End of the crew's share of phase progress
+        agent: Agent reported on the in_progress row (optional)
+        task: Task reported on the in_progress row (optional)
+        in_progress_pct: Progress percentage for the in_progress row
+        optional: If True, failures are logged and the result is None
+        error_event: Log event name on failure (default phase_<n>_<name>_error)
+    """
+
+    name: str
+    run: Callable[[dict[str, Any]], Any]
+    depends_on: tuple[str, ...] = ()
+    start_pct: int = 0
+    end_pct: int = 100
+    agent: Optional[str] = None
+    task: Optional[str] = None
+    in_progress_pct: Optional[int] = None
+    optional: bool = False
+    error_event: Optional[str] = None
+
+
+def _get_max_workers() -> int:
+    """Read the crew concurrency limit from the environment."""
+    try:
+        return max(1, int(os.environ.get("CREW_GRAPH_MAX_WORKERS", DEFAULT_MAX_WORKERS)))
+    except ValueError:
+        return DEFAULT_MAX_WORKERS
+
+
+def validate_crew_graph(nodes: list[CrewNode]) -> None:
+    """
+    Check that a crew graph has unique names, known dependencies and no cycles.
+
+    Raises:
+        ValueError: If the graph is malformed
+    """
+    names = [node.name for node in nodes]
+    if len(names) != len(set(names)):
+        raise ValueError(f"Duplicate crew names in graph: {names}")
+
+    known = set(names)
+    for node in nodes:
+        unknown = [dep for dep in node.depends_on if dep not in known]
+        if unknown:
+            raise ValueError(f"Crew '{node.name}' depends on unknown crews: {unknown}")
+
+    # Kahn's algorithm - anything left unvisited sits on a cycle
+    remaining = {node.name: set(node.depends_on) for node in nodes}
+    ready = [name for name, deps in remaining.items() if not deps]
+    visited = 0
+    while ready:
+        name = ready.pop()
+        visited += 1
+        for other, deps in remaining.items():
+            if name in deps:
+                deps.discard(name)
+                if not deps:
+                    ready.append(other)
+    if visited != len(nodes):
+        cyclic = sorted(name for name, deps in remaining.items() if deps)
+        raise ValueError(f"Crew graph has a dependency cycle involving: {cyclic}")
+
+
+class _GraphProgress:
+    """
+    Progress rows for a crew graph, with phase-wide percentages.
+
+    Crews that run in parallel finish in any order, so a crew's own
+    start_pct/end_pct can report less than a sibling already did. Each row's
+    progress_pct is instead the graph's start plus the share (end_pct -
+    start_pct) of every crew already finished, never going down. For a
+    sequential graph this is exactly each crew's own percentages.
+    """
+
+    def __init__(self, run_id: str, phase: int, nodes: list[CrewNode], progress: Callable[..., Any]):
+        self.run_id = run_id
+        self.phase = phase
+        self.progress = progress
+        self.finished_pct = min((node.start_pct for node in nodes), default=0)
+        self.reported_pct = self.finished_pct
+        self.lock = threading.Lock()
+
+    def __call__(self, node: CrewNode, status: str, **fields: Any) -> None:
+        with self.lock:
+            if status in ("completed", "skipped", "failed"):
+                self.finished_pct += node.end_pct - node.start_pct
+            if status != "failed":
+                pct = self.finished_pct
+                if status == "in_progress" and node.in_progress_pct is not None:
+                    pct += node.in_progress_pct - node.start_pct
+                self.reported_pct = max(self.reported_pct, pct)
+                fields["progress_pct"] = self.reported_pct
+            self.progress(
+                run_id=self.run_id,
+                phase=self.phase,
+                crew=node.name,
+                status=status,
+                **fields,
+            )
+
+
+def _run_node(
+    run_id: str,
+    phase: int,
+    node: CrewNode,
+    results: dict[str, Any],
+    progress: _GraphProgress,
+    memo: Optional[CrewResultMemo] = None,
+    cancelled: Optional[threading.Event] = None,
+) -> Any:
+    """Run one crew (or reuse its stored result), emitting progress rows around it."""
+    # The phase already failed while this crew was queued
+    if cancelled is not None and cancelled.is_set():
+        return None
+
+    if memo is not None:
+        memo_key = memo.key(node.name, {dep: results[dep] for dep in node.depends_on})
+        found, stored = memo.get(node.name, memo_key)
+        if found:
+            logger.info(json.dumps({
+                "event": "crew_result_reused",
+                "run_id": run_id,
+                "phase": phase,
+                "crew": node.name,
+            }))
+            progress(node, "completed")
+            return stored
+
+    # Stops the phase (BudgetExceededError) once the run's budget is spent
+    llm_budget.ensure_budget_available()
+
+    if llm_budget.should_skip_crew(node.name, node.optional):
+        logger.warning(json.dumps({
+            "event": "crew_skipped_for_budget",
+            "run_id": run_id,
+            "phase": phase,
+            "crew": node.name,
+        }))
+        progress(node, "skipped")
+        return None
+
+    progress(node, "started")
+
+    try:
+        if node.agent or node.task:
+            progress(node, "in_progress", agent=node.agent, task=node.task)
+
+        started = time.perf_counter()
+        with metering.metering_scope(crew=node.name), tracing.span(node.name, tracing.CREW, phase=phase):
+            result = node.run(results)
+
+        if memo is not None:
+            memo.save(node.name, memo_key, result)
+
+        progress(
+            node,
+            "completed",
+            duration_ms=int((time.perf_counter() - started) * 1000),
+        )
+        return result
+
+    except Exception as e:
+        log = logger.warning if node.optional else logger.error
+        log(json.dumps({
+            "event": node.error_event or f"phase_{phase}_{node.name}_error",
+            "run_id": run_id,
+            "error": str(e),
+        }))
+        progress(node, "failed", error_message=str(e))
+        raise
+
+
+def execute_crew_graph(
+    run_id: str,
+    phase: int,
+    nodes: list[CrewNode],
+    progress: Callable[..., Any],
+    max_workers: Optional[int] = None,
+    idempotency_inputs: Any = None,
+) -> dict[str, Any]:
+    """
+    Execute a phase's crews, running independent crews concurrently.
+
+    A crew starts as soon as all of its dependencies have finished. If a
+    required crew fails, crews that have not started yet are cancelled, crews
+    already running are waited for (so none outlives the failed phase into
+    its retry) and the original exception is re-raised. Optional crews that fail record
+    None as their result and do not block their dependents. Once the run's
+    LLM budget is exhausted no further crew starts and BudgetExceededError
+    is raised, even from an optional crew.
+
+    Args:
+        run_id: Validation run ID
+        phase: Phase number for progress rows
+        nodes: Crew graph for the phase
+        progress: Progress callable (the phase module's update_progress)
+        max_workers: Concurrency limit (defaults to CREW_GRAPH_MAX_WORKERS)
+        idempotency_inputs: Phase inputs that determine crew results; when
+            given, completed crews are stored and reused on retry
+
+    Returns:
+        Dict of crew name -> result
+    """
+    validate_crew_graph(nodes)
+
+    workers = max_workers or _get_max_workers()
+    memo = (
+        CrewResultMemo.load(run_id, phase, idempotency_inputs)
+        if idempotency_inputs is not None and memo_enabled()
+        else None
+    )
+    results: dict[str, Any] = {}
+    pending = list(nodes)
+    running: dict[Future, CrewNode] = {}
+    graph_progress = _GraphProgress(run_id, phase, nodes, progress)
+    cancelled = threading.Event()
+
+    logger.info(json.dumps({
+        "event": "crew_graph_start",
+        "run_id": run_id,
+        "phase": phase,
+        "crews": [node.name for node in nodes],
+        "max_workers": workers,
+    }))
+
+    executor = ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix=f"phase{phase}-crew",
+    )
+    try:
+        while pending or running:
+            # Launch every crew whose dependencies are satisfied
+            for node in [n for n in pending if all(d in results for d in n.depends_on)]:
+                pending.remove(node)
+                # Snapshot so a crew sees exactly the results it was scheduled with
+                inputs = dict(results)
+                ctx = contextvars.copy_context()
+                future = executor.submit(
+                    ctx.run, _run_node, run_id, phase, node, inputs, graph_progress, memo, cancelled
+                )
+                running[future] = node
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                error = future.exception()
+                if error is None:
+                    results[node.name] = future.result()
+                elif node.optional and not isinstance(error, llm_budget.BudgetExceededError):
+                    results[node.name] = None
+                else:
+                    if running:
+                        logger.warning(json.dumps({
+                            "event": "crew_graph_cancelled",
+                            "run_id": run_id,
+                            "phase": phase,
+                            "failed_crew": node.name,
+                            "waiting_for": [n.name for n in running.values()],
+                        }))
+                    raise error
+    finally:
+        # Crews can't be interrupted mid-run: stop queued ones from starting
+        # and wait for the rest before the phase returns or raises
+        cancelled.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    logger.info(json.dumps({
+        "event": "crew_graph_complete",
+        "run_id": run_id,
+        "phase": phase,
+    }))
+
+    return results
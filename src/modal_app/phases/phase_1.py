@@ -9,7 +9,8 @@ Stage A - Brief Generation:
 
 Stage B - VPC Discovery:
     - DiscoveryCrew: Segment discovery and research
-    - CustomerProfileCrew: Jobs, Pains, Gains extraction
+    - CustomerProfileCrew: Jobs, Pains, Gains extraction (brief-only research
+      pass alongside DiscoveryCrew, then refinement with its evidence)
     - ValueDesignCrew: Pain Relievers, Gain Creators design
     - WTPCrew: Willingness-to-pay analysis
     - FitAssessmentCrew: VPC fit scoring
@@ -20,8 +21,8 @@ Agents: 20 total (2 Stage A + 18 Stage B)
 
 Flow:
     raw_idea + hints → BriefGenerationCrew → approve_brief
-        → DiscoveryCrew → CustomerProfileCrew → ValueDesignCrew
-        → WTPCrew → FitAssessmentCrew → approve_discovery_output
+        → DiscoveryCrew ∥ CustomerProfileResearch → CustomerProfileCrew
+        → ValueDesignCrew → WTPCrew → FitAssessmentCrew → approve_discovery_output
 """
 
 # @story US-F06, US-H01, US-H02, US-AD01, US-AH02, US-AB01, US-AD10
@@ -32,6 +33,7 @@ from typing import Any
 
 from src.state import update_progress
 from src.shared.gate_policies import evaluate_gate_for_user, DEFAULT_POLICIES
+from src.modal_app.phases.crew_graph import CrewNode, execute_crew_graph
 
 logger = logging.getLogger(__name__)
 
@@ -267,255 +269,126 @@ def _execute_stage_b(
         }))
 
     # ==========================================================================
-    # Crew 1: DiscoveryCrew - Segment validation and evidence collection
+    # Crew graph: (Discovery ∥ CustomerProfileResearch) → CustomerProfile
+    #             → ValueDesign → WTP → FitAssessment
     # ==========================================================================
-
-    update_progress(
-        run_id=run_id,
-        phase=1,
-        crew="DiscoveryCrew",
-        status="started",
-        progress_pct=0,
-    )
+    #
+    # DiscoveryCrew and CustomerProfileCrew's research pass both need only the
+    # Founder's Brief, so they run concurrently; the CustomerProfileCrew node
+    # then reconciles that research with DiscoveryCrew's evidence. The rest of
+    # Stage B consumes the previous crew's output and stays a chain.
 
     # Import here to avoid circular imports during Modal image build
     from src.crews.discovery import (
         run_discovery_crew,
+        run_customer_research_crew,
         run_customer_profile_crew,
         run_value_design_crew,
         run_wtp_crew,
         run_fit_assessment_crew,
     )
 
-    try:
-        # Task: Map assumptions and collect evidence
-        update_progress(
-            run_id=run_id,
-            phase=1,
-            crew="DiscoveryCrew",
-            agent="E1",
-            task="map_assumptions",
-            status="in_progress",
-            progress_pct=5,
-        )
-
-        discovery_results = run_discovery_crew(founders_brief)
-
-        update_progress(
-            run_id=run_id,
-            phase=1,
-            crew="DiscoveryCrew",
-            status="completed",
-            progress_pct=20,
-        )
-
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "phase_1_discovery_error",
-            "run_id": run_id,
-            "error": str(e),
-        }))
-        update_progress(
-            run_id=run_id,
-            phase=1,
-            crew="DiscoveryCrew",
-            status="failed",
-            error_message=str(e),
-        )
-        raise
-
-    # ==========================================================================
-    # Crew 2: CustomerProfileCrew - Jobs, Pains, Gains extraction
-    # ==========================================================================
+    def _discovery(results: dict[str, Any]) -> Any:
+        return run_discovery_crew(founders_brief)
 
-    update_progress(
-        run_id=run_id,
-        phase=1,
-        crew="CustomerProfileCrew",
-        status="started",
-        progress_pct=20,
-    )
+    def _customer_research(results: dict[str, Any]) -> dict[str, Any]:
+        return run_customer_research_crew(founders_brief)
 
-    try:
+    def _customer_profile(results: dict[str, Any]) -> dict[str, Any]:
         customer_profile = run_customer_profile_crew(
             founders_brief=founders_brief,
-            discovery_results=discovery_results,
-        )
-
-        # Convert to dict if it's a Pydantic model
-        customer_profile_dict = (
-            customer_profile.model_dump(mode="json")
-            if hasattr(customer_profile, "model_dump")
-            else customer_profile
+            discovery_results=results["DiscoveryCrew"],
+            customer_research=results["CustomerProfileResearch"],
         )
+        return _to_dict(customer_profile)
 
-        update_progress(
-            run_id=run_id,
-            phase=1,
-            crew="CustomerProfileCrew",
-            status="completed",
-            progress_pct=40,
-        )
-
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "phase_1_customer_profile_error",
-            "run_id": run_id,
-            "error": str(e),
-        }))
-        update_progress(
-            run_id=run_id,
-            phase=1,
-            crew="CustomerProfileCrew",
-            status="failed",
-            error_message=str(e),
-        )
-        raise
-
-    # ==========================================================================
-    # Crew 3: ValueDesignCrew - Pain Relievers, Gain Creators
-    # ==========================================================================
-
-    update_progress(
-        run_id=run_id,
-        phase=1,
-        crew="ValueDesignCrew",
-        status="started",
-        progress_pct=40,
-    )
-
-    try:
+    def _value_design(results: dict[str, Any]) -> dict[str, Any]:
         value_map = run_value_design_crew(
             founders_brief=founders_brief,
-            customer_profile=customer_profile_dict,
-        )
-
-        # Convert to dict if it's a Pydantic model
-        value_map_dict = (
-            value_map.model_dump(mode="json")
-            if hasattr(value_map, "model_dump")
-            else value_map
+            customer_profile=results["CustomerProfileCrew"],
         )
+        return _to_dict(value_map)
 
-        update_progress(
-            run_id=run_id,
-            phase=1,
-            crew="ValueDesignCrew",
-            status="completed",
-            progress_pct=60,
-        )
-
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "phase_1_value_design_error",
-            "run_id": run_id,
-            "error": str(e),
-        }))
-        update_progress(
-            run_id=run_id,
-            phase=1,
-            crew="ValueDesignCrew",
-            status="failed",
-            error_message=str(e),
-        )
-        raise
-
-    # ==========================================================================
-    # Crew 4: WTPCrew - Willingness-to-pay analysis
-    # ==========================================================================
-
-    update_progress(
-        run_id=run_id,
-        phase=1,
-        crew="WTPCrew",
-        status="started",
-        progress_pct=60,
-    )
-
-    try:
+    def _wtp(results: dict[str, Any]) -> dict[str, Any]:
         wtp_results = run_wtp_crew(
-            customer_profile=customer_profile_dict,
-            value_map=value_map_dict,
-        )
-
-        # Convert to dict if needed
-        wtp_results_dict = (
-            wtp_results.model_dump(mode="json")
-            if hasattr(wtp_results, "model_dump")
-            else wtp_results
-        )
-
-        update_progress(
-            run_id=run_id,
-            phase=1,
-            crew="WTPCrew",
-            status="completed",
-            progress_pct=80,
+            customer_profile=results["CustomerProfileCrew"],
+            value_map=results["ValueDesignCrew"],
         )
+        return _to_dict(wtp_results)
 
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "phase_1_wtp_error",
-            "run_id": run_id,
-            "error": str(e),
-        }))
-        update_progress(
-            run_id=run_id,
-            phase=1,
-            crew="WTPCrew",
-            status="failed",
-            error_message=str(e),
+    def _fit_assessment(results: dict[str, Any]) -> dict[str, Any]:
+        fit_assessment = run_fit_assessment_crew(
+            customer_profile=results["CustomerProfileCrew"],
+            value_map=results["ValueDesignCrew"],
+            wtp_results=results["WTPCrew"],
         )
-        raise
-
-    # ==========================================================================
-    # Crew 5: FitAssessmentCrew - VPC fit scoring
-    # ==========================================================================
+        return _to_dict(fit_assessment)
 
-    update_progress(
+    crew_results = execute_crew_graph(
         run_id=run_id,
         phase=1,
-        crew="FitAssessmentCrew",
-        status="started",
-        progress_pct=80,
+        nodes=[
+            CrewNode(
+                name="DiscoveryCrew",
+                run=_discovery,
+                start_pct=0,
+                end_pct=20,
+                agent="E1",
+                task="map_assumptions",
+                in_progress_pct=5,
+                error_event="phase_1_discovery_error",
+            ),
+            CrewNode(
+                name="CustomerProfileResearch",
+                run=_customer_research,
+                start_pct=20,
+                end_pct=30,
+                agent="J1",
+                task="discover_jobs",
+                error_event="phase_1_customer_research_error",
+            ),
+            CrewNode(
+                name="CustomerProfileCrew",
+                run=_customer_profile,
+                depends_on=("DiscoveryCrew", "CustomerProfileResearch"),
+                start_pct=30,
+                end_pct=40,
+                error_event="phase_1_customer_profile_error",
+            ),
+            CrewNode(
+                name="ValueDesignCrew",
+                run=_value_design,
+                depends_on=("CustomerProfileCrew",),
+                start_pct=40,
+                end_pct=60,
+                error_event="phase_1_value_design_error",
+            ),
+            CrewNode(
+                name="WTPCrew",
+                run=_wtp,
+                depends_on=("CustomerProfileCrew", "ValueDesignCrew"),
+                start_pct=60,
+                end_pct=80,
+                error_event="phase_1_wtp_error",
+            ),
+            CrewNode(
+                name="FitAssessmentCrew",
+                run=_fit_assessment,
+                depends_on=("CustomerProfileCrew", "ValueDesignCrew", "WTPCrew"),
+                start_pct=80,
+                end_pct=100,
+                error_event="phase_1_fit_assessment_error",
+            ),
+        ],
+        progress=update_progress,
+        # Reuse crews already completed by an earlier attempt of this phase
+        idempotency_inputs={"state": state, "founders_brief": founders_brief},
     )
 
-    try:
-        fit_assessment = run_fit_assessment_crew(
-            customer_profile=customer_profile_dict,
-            value_map=value_map_dict,
-            wtp_results=wtp_results_dict,
-        )
-
-        # Convert to dict if needed
-        fit_assessment_dict = (
-            fit_assessment.model_dump(mode="json")
-            if hasattr(fit_assessment, "model_dump")
-            else fit_assessment
-        )
-
-        update_progress(
-            run_id=run_id,
-            phase=1,
-            crew="FitAssessmentCrew",
-            status="completed",
-            progress_pct=100,
-        )
-
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "phase_1_fit_assessment_error",
-            "run_id": run_id,
-            "error": str(e),
-        }))
-        update_progress(
-            run_id=run_id,
-            phase=1,
-            crew="FitAssessmentCrew",
-            status="failed",
-            error_message=str(e),
-        )
-        raise
+    customer_profile_dict = crew_results["CustomerProfileCrew"]
+    value_map_dict = crew_results["ValueDesignCrew"]
+    wtp_results_dict = crew_results["WTPCrew"]
+    fit_assessment_dict = crew_results["FitAssessmentCrew"]
 
     # ==========================================================================
     # Prepare HITL Checkpoint: approve_discovery_output
@@ -568,6 +441,7 @@ def _execute_stage_b(
             user_id=user_id,
             gate="DESIRABILITY",
             evidence_summary=evidence_summary,
+            policies=state.get("gate_policies"),
         )
         gate_ready = gate_result.gate_ready
         gate_blockers = gate_result.blockers
@@ -623,3 +497,8 @@ def _execute_stage_b(
         ],
         "hitl_recommended": "approved" if gate_ready else "iterate",
     }
+
+
+def _to_dict(value: Any) -> Any:
+    """Convert a Pydantic crew output to a dict, passing other values through."""
+    return value.model_dump(mode="json") if hasattr(value, "model_dump") else value
@@ -24,6 +24,7 @@ from typing import Any
 
 from src.state import update_progress
 from src.shared.gate_policies import evaluate_gate_for_user, DEFAULT_POLICIES
+from src.modal_app.phases.crew_graph import CrewNode, execute_crew_graph
 from src.modal_app.helpers.segment_alternatives import (
     generate_alternative_segments,
     format_segment_options,
@@ -54,17 +55,9 @@ def execute(run_id: str, state: dict[str, Any]) -> dict[str, Any]:
     founders_brief = state.get("founders_brief", {})
 
     # ==========================================================================
-    # Crew 1: BuildCrew - Landing pages and testable artifacts
+    # Crew graph: BuildCrew → GrowthCrew → GovernanceCrew
     # ==========================================================================
 
-    update_progress(
-        run_id=run_id,
-        phase=2,
-        crew="BuildCrew",
-        status="started",
-        progress_pct=0,
-    )
-
     # Import here to avoid circular imports during Modal image build
     from src.crews.desirability import (
         run_build_crew,
@@ -72,87 +65,32 @@ def execute(run_id: str, state: dict[str, Any]) -> dict[str, Any]:
         run_governance_crew,
     )
 
-    try:
-        # Extract value proposition from value map
-        value_proposition = {
-            "products_services": value_map.get("products_services", []),
-            "pain_relievers": value_map.get("pain_relievers", []),
-            "gain_creators": value_map.get("gain_creators", []),
-            "one_liner": founders_brief.get("the_idea", {}).get("one_liner", ""),
-        }
-
-        update_progress(
-            run_id=run_id,
-            phase=2,
-            crew="BuildCrew",
-            agent="F1",
-            task="design_landing_page",
-            status="in_progress",
-            progress_pct=5,
-        )
+    # Extract value proposition from value map
+    value_proposition = {
+        "products_services": value_map.get("products_services", []),
+        "pain_relievers": value_map.get("pain_relievers", []),
+        "gain_creators": value_map.get("gain_creators", []),
+        "one_liner": founders_brief.get("the_idea", {}).get("one_liner", ""),
+    }
 
+    def _build(results: dict[str, Any]) -> dict[str, Any]:
         build_results = run_build_crew(
             value_proposition=value_proposition,
             customer_profile=customer_profile,
         )
 
         # Convert to dict if needed
-        build_results_dict = (
-            build_results if isinstance(build_results, dict) else {"raw": str(build_results)}
-        )
+        return build_results if isinstance(build_results, dict) else {"raw": str(build_results)}
 
-        update_progress(
-            run_id=run_id,
-            phase=2,
-            crew="BuildCrew",
-            status="completed",
-            progress_pct=30,
-        )
-
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "phase_2_build_error",
-            "run_id": run_id,
-            "error": str(e),
-        }))
-        update_progress(
-            run_id=run_id,
-            phase=2,
-            crew="BuildCrew",
-            status="failed",
-            error_message=str(e),
-        )
-        raise
-
-    # ==========================================================================
-    # Crew 2: GrowthCrew - Ad campaigns and evidence collection
-    # ==========================================================================
-
-    update_progress(
-        run_id=run_id,
-        phase=2,
-        crew="GrowthCrew",
-        status="started",
-        progress_pct=30,
-    )
+    def _growth(results: dict[str, Any]) -> dict[str, Any]:
+        build_results_dict = results["BuildCrew"]
 
-    try:
         # Extract customer pains for ad copy
         customer_pains = [
             pain.get("pain_statement", "")
             for pain in customer_profile.get("pains", [])
         ]
 
-        update_progress(
-            run_id=run_id,
-            phase=2,
-            crew="GrowthCrew",
-            agent="P1",
-            task="create_ad_variants",
-            status="in_progress",
-            progress_pct=35,
-        )
-
         desirability_evidence = run_growth_crew(
             ad_concepts=build_results_dict,
             landing_pages=build_results_dict.get("landing_pages", {}),
@@ -161,76 +99,60 @@ def execute(run_id: str, state: dict[str, Any]) -> dict[str, Any]:
         )
 
         # Convert to dict if it's a Pydantic model
-        desirability_dict = (
+        return (
             desirability_evidence.model_dump(mode="json")
             if hasattr(desirability_evidence, "model_dump")
             else desirability_evidence
         )
 
-        update_progress(
-            run_id=run_id,
-            phase=2,
-            crew="GrowthCrew",
-            status="completed",
-            progress_pct=70,
-        )
-
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "phase_2_growth_error",
-            "run_id": run_id,
-            "error": str(e),
-        }))
-        update_progress(
-            run_id=run_id,
-            phase=2,
-            crew="GrowthCrew",
-            status="failed",
-            error_message=str(e),
+    def _governance(results: dict[str, Any]) -> Any:
+        return run_governance_crew(
+            activities={"phase": 2, "crews_completed": ["BuildCrew", "GrowthCrew"]},
+            creative_assets=results["BuildCrew"],
+            experiment_data=results["GrowthCrew"],
         )
-        raise
-
-    # ==========================================================================
-    # Crew 3: GovernanceCrew - QA, security, and audit
-    # ==========================================================================
 
-    update_progress(
+    crew_results = execute_crew_graph(
         run_id=run_id,
         phase=2,
-        crew="GovernanceCrew",
-        status="started",
-        progress_pct=70,
+        nodes=[
+            CrewNode(
+                name="BuildCrew",
+                run=_build,
+                start_pct=0,
+                end_pct=30,
+                agent="F1",
+                task="design_landing_page",
+                in_progress_pct=5,
+                error_event="phase_2_build_error",
+            ),
+            CrewNode(
+                name="GrowthCrew",
+                run=_growth,
+                depends_on=("BuildCrew",),
+                start_pct=30,
+                end_pct=70,
+                agent="P1",
+                task="create_ad_variants",
+                in_progress_pct=35,
+                error_event="phase_2_growth_error",
+            ),
+            CrewNode(
+                name="GovernanceCrew",
+                run=_governance,
+                depends_on=("BuildCrew", "GrowthCrew"),
+                start_pct=70,
+                end_pct=100,
+                error_event="phase_2_governance_error",
+            ),
+        ],
+        progress=update_progress,
+        # Reuse crews already completed by an earlier attempt of this phase
+        idempotency_inputs=state,
     )
 
-    try:
-        governance_results = run_governance_crew(
-            activities={"phase": 2, "crews_completed": ["BuildCrew", "GrowthCrew"]},
-            creative_assets=build_results_dict,
-            experiment_data=desirability_dict,
-        )
-
-        update_progress(
-            run_id=run_id,
-            phase=2,
-            crew="GovernanceCrew",
-            status="completed",
-            progress_pct=100,
-        )
-
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "phase_2_governance_error",
-            "run_id": run_id,
-            "error": str(e),
-        }))
-        update_progress(
-            run_id=run_id,
-            phase=2,
-            crew="GovernanceCrew",
-            status="failed",
-            error_message=str(e),
-        )
-        raise
+    build_results_dict = crew_results["BuildCrew"]
+    desirability_dict = crew_results["GrowthCrew"]
 
     # ==========================================================================
     # Determine Desirability Signal with Configurable Gate Policy
@@ -271,6 +193,7 @@ def execute(run_id: str, state: dict[str, Any]) -> dict[str, Any]:
             gate="DESIRABILITY",
             evidence_summary=evidence_summary,
             signal=signal,
+            policies=state.get("gate_policies"),
         )
         gate_blockers = gate_result.blockers
     else:
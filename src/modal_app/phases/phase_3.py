@@ -21,6 +21,7 @@ from typing import Any
 
 from src.state import update_progress
 from src.shared.gate_policies import evaluate_gate_for_user, DEFAULT_POLICIES
+from src.modal_app.phases.crew_graph import CrewNode, execute_crew_graph
 
 logger = logging.getLogger(__name__)
 
@@ -46,82 +47,31 @@ def execute(run_id: str, state: dict[str, Any]) -> dict[str, Any]:
     value_map = state.get("value_map", {})
 
     # ==========================================================================
-    # Crew 1: FeasibilityBuildCrew - Technical assessment
+    # Crew graph: FeasibilityBuildCrew → FeasibilityGovernanceCrew
     # ==========================================================================
 
-    update_progress(
-        run_id=run_id,
-        phase=3,
-        crew="FeasibilityBuildCrew",
-        status="started",
-        progress_pct=0,
-    )
-
     # Import here to avoid circular imports during Modal image build
     from src.crews.feasibility import (
         run_feasibility_build_crew,
         run_feasibility_governance_crew,
     )
 
-    try:
-        update_progress(
-            run_id=run_id,
-            phase=3,
-            crew="FeasibilityBuildCrew",
-            agent="F1",
-            task="extract_feature_requirements",
-            status="in_progress",
-            progress_pct=10,
-        )
-
+    def _build(results: dict[str, Any]) -> dict[str, Any]:
         feasibility_evidence = run_feasibility_build_crew(
             value_map=value_map,
             customer_profile=customer_profile,
         )
 
         # Convert to dict if it's a Pydantic model
-        feasibility_dict = (
+        return (
             feasibility_evidence.model_dump(mode="json")
             if hasattr(feasibility_evidence, "model_dump")
             else feasibility_evidence
         )
 
-        update_progress(
-            run_id=run_id,
-            phase=3,
-            crew="FeasibilityBuildCrew",
-            status="completed",
-            progress_pct=60,
-        )
-
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "phase_3_build_error",
-            "run_id": run_id,
-            "error": str(e),
-        }))
-        update_progress(
-            run_id=run_id,
-            phase=3,
-            crew="FeasibilityBuildCrew",
-            status="failed",
-            error_message=str(e),
-        )
-        raise
-
-    # ==========================================================================
-    # Crew 2: FeasibilityGovernanceCrew - Gate validation
-    # ==========================================================================
-
-    update_progress(
-        run_id=run_id,
-        phase=3,
-        crew="FeasibilityGovernanceCrew",
-        status="started",
-        progress_pct=60,
-    )
+    def _governance(results: dict[str, Any]) -> Any:
+        feasibility_dict = results["FeasibilityBuildCrew"]
 
-    try:
         # Prepare technical architecture from assessment
         technical_architecture = {
             "constraints": feasibility_dict.get("constraints", []),
@@ -129,33 +79,40 @@ def execute(run_id: str, state: dict[str, Any]) -> dict[str, Any]:
             "infra_costs": feasibility_dict.get("infra_costs_monthly", 0),
         }
 
-        governance_results = run_feasibility_governance_crew(
+        return run_feasibility_governance_crew(
             feasibility_assessment=feasibility_dict,
             technical_architecture=technical_architecture,
         )
 
-        update_progress(
-            run_id=run_id,
-            phase=3,
-            crew="FeasibilityGovernanceCrew",
-            status="completed",
-            progress_pct=100,
-        )
+    crew_results = execute_crew_graph(
+        run_id=run_id,
+        phase=3,
+        nodes=[
+            CrewNode(
+                name="FeasibilityBuildCrew",
+                run=_build,
+                start_pct=0,
+                end_pct=60,
+                agent="F1",
+                task="extract_feature_requirements",
+                in_progress_pct=10,
+                error_event="phase_3_build_error",
+            ),
+            CrewNode(
+                name="FeasibilityGovernanceCrew",
+                run=_governance,
+                depends_on=("FeasibilityBuildCrew",),
+                start_pct=60,
+                end_pct=100,
+                error_event="phase_3_governance_error",
+            ),
+        ],
+        progress=update_progress,
+        # Reuse crews already completed by an earlier attempt of this phase
+        idempotency_inputs=state,
+    )
 
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "phase_3_governance_error",
-            "run_id": run_id,
-            "error": str(e),
-        }))
-        update_progress(
-            run_id=run_id,
-            phase=3,
-            crew="FeasibilityGovernanceCrew",
-            status="failed",
-            error_message=str(e),
-        )
-        raise
+    feasibility_dict = crew_results["FeasibilityBuildCrew"]
 
     # ==========================================================================
     # Determine Feasibility Signal with Configurable Gate Policy
@@ -202,6 +159,7 @@ def execute(run_id: str, state: dict[str, Any]) -> dict[str, Any]:
             gate="FEASIBILITY",
             evidence_summary=evidence_summary,
             signal=signal,
+            policies=state.get("gate_policies"),
         )
         gate_blockers = gate_result.blockers
     else:
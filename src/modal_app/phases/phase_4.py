@@ -7,7 +7,8 @@ Crews (4):
     - FinanceCrew: CAC/LTV, pricing, market sizing
     - SynthesisCrew: Evidence synthesis, decision recommendation
     - ViabilityGovernanceCrew: Final gate, decision approval
-    - NarrativeSynthesisCrew: Pitch narrative generation (optional)
+    - NarrativeSynthesisCrew: Pitch narrative generation (optional, runs
+      concurrently with SynthesisCrew once FinanceCrew completes)
 
 Agents: 12 total
 
@@ -26,6 +27,7 @@ from typing import Any
 
 from src.state import update_progress
 from src.shared.gate_policies import evaluate_gate_for_user, DEFAULT_POLICIES
+from src.modal_app.phases.crew_graph import CrewNode, execute_crew_graph
 
 logger = logging.getLogger(__name__)
 
@@ -55,17 +57,11 @@ def execute(run_id: str, state: dict[str, Any]) -> dict[str, Any]:
     feasibility_evidence = state.get("feasibility_evidence", {})
 
     # ==========================================================================
-    # Crew 1: FinanceCrew - Unit economics calculation
+    # Crew graph:
+    #   FinanceCrew → SynthesisCrew → ViabilityGovernanceCrew
+    #              ↘ NarrativeSynthesisCrew (optional, runs alongside synthesis)
     # ==========================================================================
 
-    update_progress(
-        run_id=run_id,
-        phase=4,
-        crew="FinanceCrew",
-        status="started",
-        progress_pct=0,
-    )
-
     # Import here to avoid circular imports during Modal image build
     from src.crews.viability import (
         run_finance_crew,
@@ -74,7 +70,14 @@ def execute(run_id: str, state: dict[str, Any]) -> dict[str, Any]:
         run_narrative_synthesis_crew,
     )
 
-    try:
+    # Prepare VPC evidence summary
+    vpc_evidence = {
+        "customer_profile": customer_profile,
+        "value_map": value_map,
+        "fit_score": state.get("fit_assessment", {}).get("fit_score", 0),
+    }
+
+    def _finance(results: dict[str, Any]) -> dict[str, Any]:
         # Prepare pricing data from WTP results
         pricing_data = {
             "target_price": wtp_results.get("target_price", 0),
@@ -86,16 +89,6 @@ def execute(run_id: str, state: dict[str, Any]) -> dict[str, Any]:
         solution = founders_brief.get("solution_hypothesis", {})
         business_model = solution.get("business_model", "saas_b2b_smb")
 
-        update_progress(
-            run_id=run_id,
-            phase=4,
-            crew="FinanceCrew",
-            agent="L1",
-            task="calculate_cac",
-            status="in_progress",
-            progress_pct=10,
-        )
-
         viability_evidence = run_finance_crew(
             experiment_data=desirability_evidence,
             desirability_evidence=desirability_evidence,
@@ -104,105 +97,30 @@ def execute(run_id: str, state: dict[str, Any]) -> dict[str, Any]:
         )
 
         # Convert to dict if it's a Pydantic model
-        viability_dict = (
+        return (
             viability_evidence.model_dump(mode="json")
             if hasattr(viability_evidence, "model_dump")
             else viability_evidence
         )
 
-        update_progress(
-            run_id=run_id,
-            phase=4,
-            crew="FinanceCrew",
-            status="completed",
-            progress_pct=40,
-        )
-
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "phase_4_finance_error",
-            "run_id": run_id,
-            "error": str(e),
-        }))
-        update_progress(
-            run_id=run_id,
-            phase=4,
-            crew="FinanceCrew",
-            status="failed",
-            error_message=str(e),
-        )
-        raise
-
-    # ==========================================================================
-    # Crew 2: SynthesisCrew - Evidence synthesis and decision options
-    # ==========================================================================
-
-    update_progress(
-        run_id=run_id,
-        phase=4,
-        crew="SynthesisCrew",
-        status="started",
-        progress_pct=40,
-    )
-
-    try:
-        # Prepare VPC evidence summary
-        vpc_evidence = {
-            "customer_profile": customer_profile,
-            "value_map": value_map,
-            "fit_score": state.get("fit_assessment", {}).get("fit_score", 0),
-        }
-
+    def _synthesis(results: dict[str, Any]) -> dict[str, Any]:
         synthesis_results = run_synthesis_crew(
             founders_brief=founders_brief,
             vpc_evidence=vpc_evidence,
             desirability_evidence=desirability_evidence,
             feasibility_evidence=feasibility_evidence,
-            viability_evidence=viability_dict,
+            viability_evidence=results["FinanceCrew"],
         )
 
         # Convert to dict if needed
-        synthesis_dict = (
+        return (
             synthesis_results if isinstance(synthesis_results, dict)
             else {"raw": str(synthesis_results)}
         )
 
-        update_progress(
-            run_id=run_id,
-            phase=4,
-            crew="SynthesisCrew",
-            status="completed",
-            progress_pct=70,
-        )
+    def _governance(results: dict[str, Any]) -> Any:
+        viability_dict = results["FinanceCrew"]
 
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "phase_4_synthesis_error",
-            "run_id": run_id,
-            "error": str(e),
-        }))
-        update_progress(
-            run_id=run_id,
-            phase=4,
-            crew="SynthesisCrew",
-            status="failed",
-            error_message=str(e),
-        )
-        raise
-
-    # ==========================================================================
-    # Crew 3: ViabilityGovernanceCrew - Final audit and flywheel
-    # ==========================================================================
-
-    update_progress(
-        run_id=run_id,
-        phase=4,
-        crew="ViabilityGovernanceCrew",
-        status="started",
-        progress_pct=70,
-    )
-
-    try:
         # Compile complete validation record
         validation_record = {
             "run_id": run_id,
@@ -222,53 +140,18 @@ def execute(run_id: str, state: dict[str, Any]) -> dict[str, Any]:
             "phase_4": viability_dict,
         }
 
-        learnings = synthesis_dict.get("learnings", {})
+        learnings = results["SynthesisCrew"].get("learnings", {})
 
-        governance_results = run_viability_governance_crew(
+        return run_viability_governance_crew(
             validation_record=validation_record,
             all_outputs=all_outputs,
             learnings=learnings,
         )
 
-        update_progress(
-            run_id=run_id,
-            phase=4,
-            crew="ViabilityGovernanceCrew",
-            status="completed",
-            progress_pct=80,
-        )
-
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "phase_4_governance_error",
-            "run_id": run_id,
-            "error": str(e),
-        }))
-        update_progress(
-            run_id=run_id,
-            phase=4,
-            crew="ViabilityGovernanceCrew",
-            status="failed",
-            error_message=str(e),
-        )
-        raise
-
-    # ==========================================================================
-    # Crew 4: NarrativeSynthesisCrew - Pitch narrative generation
     # @story US-NL01
-    # ==========================================================================
-
-    narrative_result = None
-
-    update_progress(
-        run_id=run_id,
-        phase=4,
-        crew="NarrativeSynthesisCrew",
-        status="started",
-        progress_pct=80,
-    )
+    def _narrative(results: dict[str, Any]) -> Any:
+        viability_dict = results["FinanceCrew"]
 
-    try:
         # Gather experiment results from all phases
         all_experiments = []
         for phase_evidence in [desirability_evidence, feasibility_evidence, viability_dict]:
@@ -276,13 +159,7 @@ def execute(run_id: str, state: dict[str, Any]) -> dict[str, Any]:
             if isinstance(exps, list):
                 all_experiments.extend(exps)
 
-        # Prepare competitor map from state
-        competitor_map = state.get("competitor_map", {})
-
-        # Prepare founder profile from state
-        founder_profile = state.get("founder_profile", {})
-
-        narrative_result = run_narrative_synthesis_crew(
+        narrative = run_narrative_synthesis_crew(
             founders_brief=founders_brief,
             customer_profile=customer_profile,
             value_map=value_map,
@@ -290,40 +167,68 @@ def execute(run_id: str, state: dict[str, Any]) -> dict[str, Any]:
             feasibility_evidence=feasibility_evidence,
             viability_evidence=viability_dict,
             fit_assessment=state.get("fit_assessment", {}),
-            competitor_map=competitor_map,
+            competitor_map=state.get("competitor_map", {}),
             experiment_results=all_experiments,
-            founder_profile=founder_profile,
-        )
-
-        update_progress(
-            run_id=run_id,
-            phase=4,
-            crew="NarrativeSynthesisCrew",
-            status="completed",
-            progress_pct=95,
+            founder_profile=state.get("founder_profile", {}),
         )
 
         logger.info(json.dumps({
             "event": "phase_4_narrative_complete",
             "run_id": run_id,
-            "has_content": "pitch_narrative_content" in narrative_result if isinstance(narrative_result, dict) else False,
+            "has_content": "pitch_narrative_content" in narrative if isinstance(narrative, dict) else False,
         }))
+        return narrative
 
-    except Exception as e:
-        # Narrative generation is non-blocking — log and continue
-        logger.warning(json.dumps({
-            "event": "phase_4_narrative_error",
-            "run_id": run_id,
-            "error": str(e),
-        }))
-        update_progress(
-            run_id=run_id,
-            phase=4,
-            crew="NarrativeSynthesisCrew",
-            status="failed",
-            error_message=str(e),
-        )
-        # Do NOT raise — narrative is optional, viability flow continues
+    crew_results = execute_crew_graph(
+        run_id=run_id,
+        phase=4,
+        nodes=[
+            CrewNode(
+                name="FinanceCrew",
+                run=_finance,
+                start_pct=0,
+                end_pct=40,
+                agent="L1",
+                task="calculate_cac",
+                in_progress_pct=10,
+                error_event="phase_4_finance_error",
+            ),
+            CrewNode(
+                name="SynthesisCrew",
+                run=_synthesis,
+                depends_on=("FinanceCrew",),
+                start_pct=40,
+                end_pct=70,
+                error_event="phase_4_synthesis_error",
+            ),
+            CrewNode(
+                name="ViabilityGovernanceCrew",
+                run=_governance,
+                depends_on=("FinanceCrew", "SynthesisCrew"),
+                start_pct=70,
+                end_pct=80,
+                error_event="phase_4_governance_error",
+            ),
+            # Narrative generation is non-blocking — a failure is logged and
+            # the viability flow continues without it
+            CrewNode(
+                name="NarrativeSynthesisCrew",
+                run=_narrative,
+                depends_on=("FinanceCrew",),
+                start_pct=80,
+                end_pct=95,
+                optional=True,
+                error_event="phase_4_narrative_error",
+            ),
+        ],
+        progress=update_progress,
+        # Reuse crews already completed by an earlier attempt of this phase
+        idempotency_inputs=state,
+    )
+
+    viability_dict = crew_results["FinanceCrew"]
+    synthesis_dict = crew_results["SynthesisCrew"]
+    narrative_result = crew_results["NarrativeSynthesisCrew"]
 
     # ==========================================================================
     # Determine Viability Signal and Final Decision with Configurable Gate Policy
@@ -370,6 +275,7 @@ def execute(run_id: str, state: dict[str, Any]) -> dict[str, Any]:
             gate="VIABILITY",
             evidence_summary=evidence_summary,
             signal=signal,
+            policies=state.get("gate_policies"),
         )
         gate_blockers = gate_result.blockers
     else:
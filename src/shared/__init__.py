@@ -11,6 +11,7 @@ from src.shared.gate_policies import (
     GateEvaluationResult,
     DEFAULT_POLICIES,
     get_gate_policy,
+    invalidate_gate_policies,
     evaluate_gate,
     evaluate_gate_for_user,
 )
@@ -20,6 +21,7 @@ __all__ = [
     "GateEvaluationResult",
     "DEFAULT_POLICIES",
     "get_gate_policy",
+    "invalidate_gate_policies",
     "evaluate_gate",
     "evaluate_gate_for_user",
 ]
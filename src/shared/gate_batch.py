@@ -0,0 +1,181 @@
+"""
+Vectorized bulk gate evaluation.
+
+evaluate_gate() checks one evidence summary against one policy. For
+portfolio dashboards and policy what-ifs ("what if fit_score had to be 75?")
+we need every historical summary against every candidate policy, so
+evaluate_gates_batch() turns the summaries into NumPy columns once and
+evaluates all (summary, policy) pairs in a single broadcast pass:
+
+    stricter = policy_variant(current, thresholds={"fit_score": 75.0})
+    result = evaluate_gates_batch(summaries, [current, stricter], signals)
+    result.passed             # (n_summaries, n_policies) bool
+    result.blocker_count      # (n_summaries, n_policies) int
+    result.pass_rate()        # (n_policies,) share of summaries passing
+    result.failed_checks(i, j)
+
+Semantics match evaluate_gate() check for check (missing or null evidence
+counts as 0, "<name>_max" thresholds are upper bounds, the signal check
+only applies where a signal is given).
+
+Requires numpy (the "analytics" extra).
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from src.shared.gate_policies import GatePolicy
+
+# Evidence-count checks: check name -> (evidence key, policy attribute)
+COUNT_CHECKS: dict[str, tuple[str, str]] = {
+    "experiments": ("experiments_run", "min_experiments"),
+    "weak_evidence": ("weak_evidence_count", "min_weak_evidence"),
+    "medium_evidence": ("medium_evidence_count", "min_medium_evidence"),
+    "strong_evidence": ("strong_evidence_count", "min_strong_evidence"),
+}
+
+# Signals that pass the signal check, per gate (same lists as evaluate_gate)
+PASSING_SIGNALS: dict[str, frozenset[str]] = {
+    "DESIRABILITY": frozenset({"strong_commitment", "green"}),
+    "FEASIBILITY": frozenset({"green", "green_feasible"}),
+    "VIABILITY": frozenset({"profitable", "green", "proceed"}),
+}
+
+SIGNAL_CHECK = "signal"
+
+
+def _threshold_check(key: str) -> str:
+    return f"threshold:{key}"
+
+
+def policy_variant(
+    policy: GatePolicy,
+    thresholds: Optional[dict[str, float]] = None,
+    **fields: Any,
+) -> GatePolicy:
+    """Copy of a policy with some thresholds/fields changed (thresholds are merged)."""
+    if thresholds:
+        fields["thresholds"] = {**policy.thresholds, **thresholds}
+    return replace(policy, **fields)
+
+
+def evidence_column(summaries: Sequence[dict[str, Any]], key: str) -> np.ndarray:
+    """One evidence field across summaries as float64 (missing/null -> 0)."""
+    return np.fromiter(
+        (float(s.get(key) or 0) for s in summaries),
+        dtype=np.float64,
+        count=len(summaries),
+    )
+
+
+@dataclass
+class BatchGateResult:
+    """
+    Gate outcomes for every (summary, policy) pair.
+
+    Attributes:
+        policies: The candidate policies (columns)
+        checks: {check name: (n_summaries, n_policies) bool, True = blocker}
+        passed: (n_summaries, n_policies) bool, True = gate ready
+        blocker_count: (n_summaries, n_policies) number of blockers
+    """
+
+    policies: list[GatePolicy]
+    checks: dict[str, np.ndarray]
+    passed: np.ndarray
+    blocker_count: np.ndarray
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.passed.shape
+
+    def pass_rate(self) -> np.ndarray:
+        """Share of summaries passing, per policy (NaN for an empty batch)."""
+        if self.passed.shape[0] == 0:
+            return np.full(len(self.policies), np.nan)
+        return self.passed.mean(axis=0)
+
+    def blocker_rates(self) -> dict[str, np.ndarray]:
+        """Share of summaries blocked by each check, per policy."""
+        n = max(self.passed.shape[0], 1)
+        return {name: mask.sum(axis=0) / n for name, mask in self.checks.items()}
+
+    def failed_checks(self, summary_index: int, policy_index: int) -> list[str]:
+        """Names of the checks blocking one (summary, policy) pair."""
+        return [
+            name for name, mask in self.checks.items()
+            if mask[summary_index, policy_index]
+        ]
+
+
+def evaluate_gates_batch(
+    evidence_summaries: Sequence[dict[str, Any]],
+    policies: Sequence[GatePolicy],
+    signals: Optional[Sequence[Optional[str]]] = None,
+) -> BatchGateResult:
+    """
+    Evaluate many evidence summaries against many gate policies at once.
+
+    Args:
+        evidence_summaries: One evidence summary per run/project (same keys
+            as evaluate_gate)
+        policies: Candidate policies to compare (may mix gates)
+        signals: Optional signal per summary (None entries skip the check)
+
+    Returns:
+        BatchGateResult with (n_summaries, n_policies) matrices
+
+    Raises:
+        ValueError: if signals and evidence_summaries differ in length
+    """
+    policies = list(policies)
+    n, p = len(evidence_summaries), len(policies)
+    if signals is not None and len(signals) != n:
+        raise ValueError(f"Got {len(signals)} signals for {n} evidence summaries")
+
+    checks: dict[str, np.ndarray] = {}
+
+    for name, (key, attr) in COUNT_CHECKS.items():
+        actual = evidence_column(evidence_summaries, key)
+        minimum = np.array([getattr(policy, attr) for policy in policies], dtype=np.float64)
+        checks[name] = actual[:, None] < minimum[None, :]
+
+    threshold_keys = sorted({key for policy in policies for key in policy.thresholds})
+    for key in threshold_keys:
+        limit = np.array(
+            [policy.thresholds.get(key, np.nan) for policy in policies], dtype=np.float64
+        )
+        applies = ~np.isnan(limit)
+        if key.endswith("_max"):
+            actual = evidence_column(evidence_summaries, key.replace("_max", ""))
+            blocked = actual[:, None] > limit[None, :]
+        else:
+            actual = evidence_column(evidence_summaries, key)
+            blocked = actual[:, None] < limit[None, :]
+        checks[_threshold_check(key)] = blocked & applies[None, :]
+
+    if signals is not None:
+        lowered = np.array([(s or "").lower() for s in signals], dtype=object)
+        given = np.array([bool(s) for s in signals], dtype=bool)
+        blocked = np.zeros((n, p), dtype=bool)
+        for gate in {policy.gate for policy in policies}:
+            allowed = PASSING_SIGNALS.get(gate)
+            if allowed is None:
+                continue
+            columns = [j for j, policy in enumerate(policies) if policy.gate == gate]
+            weak = given & ~np.isin(lowered, list(allowed))
+            blocked[:, columns] = weak[:, None]
+        checks[SIGNAL_CHECK] = blocked
+
+    blocker_count = np.zeros((n, p), dtype=np.int32)
+    for mask in checks.values():
+        blocker_count += mask
+
+    return BatchGateResult(
+        policies=policies,
+        checks=checks,
+        passed=blocker_count == 0,
+        blocker_count=blocker_count,
+    )
@@ -4,13 +4,30 @@ Gate Policy Evaluation Module
 Fetches user-configured gate policies from Supabase and evaluates
 gate readiness against configurable criteria.
 
+Validation runs load a user's three policies once per orchestrator
+invocation (with_gate_policies) and carry them in phase_state["gate_policies"],
+so phase containers evaluate gates without querying gate_policies. Edits made
+in the product app apply from the next run or HITL resume.
+
+Lookups without policies in state (older runs, other callers) go through an
+in-process per-user cache: the first lookup loads all three gates in one
+query, later lookups are served from memory until the TTL expires. The
+product app writes gate_policies directly, so the TTL is the only
+invalidation across containers; invalidate_gate_policies() clears this
+process's cache (tests, scripts).
+
+Configuration:
+    GATE_POLICY_CACHE_TTL_SECONDS: Cache lifetime (default: 300, 0 disables)
+
 @story US-AD10, US-ADB05, US-AFB03, US-AVB03
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Any, Optional
 import os
-from supabase import create_client, Client
+import threading
+import time
+from supabase import Client
 
 
 @dataclass
@@ -64,14 +81,148 @@ DEFAULT_POLICIES: dict[str, GatePolicy] = {
 
 
 def get_supabase_client() -> Client:
-    """Create Supabase client from environment variables."""
-    url = os.environ.get("SUPABASE_URL")
-    key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+    """Shared Supabase client (see src/state/persistence.py)."""
+    from src.state.persistence import get_supabase
+    return get_supabase()
+
+
+def _policy_from_row(gate: str, row: dict[str, Any]) -> GatePolicy:
+    """Build a GatePolicy from a gate_policies row, filling gaps from defaults."""
+    defaults = DEFAULT_POLICIES[gate]
+    return GatePolicy(
+        gate=gate,
+        min_experiments=row.get("min_experiments", defaults.min_experiments),
+        required_fit_types=row.get("required_fit_types", defaults.required_fit_types),
+        min_weak_evidence=row.get("min_weak_evidence") or defaults.min_weak_evidence,
+        min_medium_evidence=row.get("min_medium_evidence") or defaults.min_medium_evidence,
+        min_strong_evidence=row.get("min_strong_evidence") or defaults.min_strong_evidence,
+        thresholds=row.get("thresholds") or defaults.thresholds,
+        override_roles=row.get("override_roles") or defaults.override_roles,
+        requires_approval=row.get("requires_approval", defaults.requires_approval),
+    )
+
+
+def load_user_policies(user_id: str, supabase: Optional[Client] = None) -> dict[str, GatePolicy]:
+    """
+    Fetch all of a user's gate policies in one query.
+
+    Args:
+        user_id: The user's UUID
+        supabase: Optional Supabase client (default: the shared client)
+
+    Returns:
+        {gate: GatePolicy} for every gate (defaults where the user has none)
+
+    Raises:
+        Exception: Supabase errors are propagated (callers fall back to defaults)
+    """
+    client = supabase or get_supabase_client()
+    result = client.table("gate_policies").select("*").eq(
+        "user_id", user_id
+    ).in_(
+        "gate", list(DEFAULT_POLICIES)
+    ).execute()
+
+    policies = dict(DEFAULT_POLICIES)
+    for row in result.data or []:
+        gate = str(row.get("gate", "")).upper()
+        if gate in DEFAULT_POLICIES:
+            policies[gate] = _policy_from_row(gate, row)
+    return policies
+
+
+class GatePolicyCache:
+    """
+    Per-user gate policy cache with a TTL.
+
+    Args:
+        ttl_seconds: How long a user's policies are served from memory
+            (0 disables caching)
+        clock: Time source (monotonic seconds)
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, clock=time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, dict[str, GatePolicy]]] = {}
+
+    def get(self, user_id: str, supabase: Optional[Client] = None) -> dict[str, GatePolicy]:
+        """All of a user's policies, loading them on a miss or after expiry."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(user_id)
+        if entry is not None and now - entry[0] < self.ttl_seconds:
+            return entry[1]
+
+        policies = load_user_policies(user_id, supabase)
+        if self.ttl_seconds > 0:
+            with self._lock:
+                self._entries[user_id] = (now, policies)
+        return policies
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """Drop one user's policies (or all) so the next lookup reloads them."""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+
+_policy_cache: Optional[GatePolicyCache] = None
+_policy_cache_lock = threading.Lock()
+
+
+def get_policy_cache() -> GatePolicyCache:
+    """Get the process-wide gate policy cache."""
+    global _policy_cache
+    if _policy_cache is None:
+        with _policy_cache_lock:
+            if _policy_cache is None:
+                _policy_cache = GatePolicyCache(
+                    ttl_seconds=float(os.environ.get("GATE_POLICY_CACHE_TTL_SECONDS", "300")),
+                )
+    return _policy_cache
 
-    if not url or not key:
-        raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set")
 
-    return create_client(url, key)
+def invalidate_gate_policies(user_id: Optional[str] = None) -> None:
+    """Call after a user's gate policies change (all users if user_id is None)."""
+    get_policy_cache().invalidate(user_id)
+
+
+def with_gate_policies(
+    phase_state: dict,
+    user_id: Optional[str],
+    supabase: Optional[Client] = None,
+) -> dict:
+    """
+    Load the run user's gate policies into phase_state (orchestrator).
+
+    Always reads gate_policies (no cache), so each run or resume sees the
+    user's current policies. user_id comes from the validation_runs row:
+    kickoff does not put it in phase_state, so it is written there too for
+    the phases' gate evaluation.
+
+    Returns:
+        phase_state with "user_id" and "gate_policies" ({gate: policy
+        fields}) as a new dict; "gate_policies" is left out if the load
+        fails, and phase_state is unchanged if there is no user_id
+    """
+    if not user_id:
+        return phase_state
+
+    phase_state = {**phase_state, "user_id": user_id}
+    try:
+        policies = load_user_policies(user_id, supabase)
+    except Exception as e:
+        print(f"[gate_policies] Error loading policies for user {user_id}: {e}")
+        return phase_state
+
+    return {
+        **phase_state,
+        "gate_policies": {gate: asdict(policy) for gate, policy in policies.items()},
+    }
 
 
 def get_gate_policy(
@@ -80,12 +231,12 @@ def get_gate_policy(
     supabase: Optional[Client] = None,
 ) -> GatePolicy:
     """
-    Fetch user's gate policy from Supabase, falling back to defaults.
+    Fetch user's gate policy (cached), falling back to defaults.
 
     Args:
         user_id: The user's UUID
         gate: Gate type (DESIRABILITY, FEASIBILITY, VIABILITY)
-        supabase: Optional Supabase client (creates one if not provided)
+        supabase: Optional Supabase client (default: the shared client)
 
     Returns:
         GatePolicy with user's custom settings or defaults
@@ -95,37 +246,13 @@ def get_gate_policy(
     if gate_upper not in DEFAULT_POLICIES:
         raise ValueError(f"Invalid gate: {gate}. Must be one of: {list(DEFAULT_POLICIES.keys())}")
 
-    defaults = DEFAULT_POLICIES[gate_upper]
-
     try:
-        client = supabase or get_supabase_client()
-
-        result = client.table("gate_policies").select("*").eq(
-            "user_id", user_id
-        ).eq(
-            "gate", gate_upper
-        ).maybe_single().execute()
-
-        if not result.data:
-            return defaults
-
-        row = result.data
-        return GatePolicy(
-            gate=gate_upper,
-            min_experiments=row.get("min_experiments", defaults.min_experiments),
-            required_fit_types=row.get("required_fit_types", defaults.required_fit_types),
-            min_weak_evidence=row.get("min_weak_evidence") or defaults.min_weak_evidence,
-            min_medium_evidence=row.get("min_medium_evidence") or defaults.min_medium_evidence,
-            min_strong_evidence=row.get("min_strong_evidence") or defaults.min_strong_evidence,
-            thresholds=row.get("thresholds") or defaults.thresholds,
-            override_roles=row.get("override_roles") or defaults.override_roles,
-            requires_approval=row.get("requires_approval", defaults.requires_approval),
-        )
+        return get_policy_cache().get(user_id, supabase)[gate_upper]
 
     except Exception as e:
         # Log error but return defaults to avoid blocking validation
         print(f"[gate_policies] Error fetching policy for user {user_id}, gate {gate}: {e}")
-        return defaults
+        return DEFAULT_POLICIES[gate_upper]
 
 
 @dataclass
@@ -243,6 +370,7 @@ def evaluate_gate_for_user(
     evidence_summary: dict[str, Any],
     signal: Optional[str] = None,
     supabase: Optional[Client] = None,
+    policies: Optional[dict[str, dict[str, Any]]] = None,
 ) -> GateEvaluationResult:
     """
     Convenience function to fetch policy and evaluate gate in one call.
@@ -253,9 +381,15 @@ def evaluate_gate_for_user(
         evidence_summary: Evidence data for evaluation
         signal: Optional signal value
         supabase: Optional Supabase client
+        policies: phase_state["gate_policies"]; used instead of a lookup
+            when it has the gate
 
     Returns:
         GateEvaluationResult with complete evaluation
     """
-    policy = get_gate_policy(user_id, gate, supabase)
+    stored = (policies or {}).get(gate.upper())
+    if stored:
+        policy = GatePolicy(**stored)
+    else:
+        policy = get_gate_policy(user_id, gate, supabase)
     return evaluate_gate(policy, evidence_summary, signal)
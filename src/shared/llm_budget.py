@@ -0,0 +1,410 @@
+"""
+Per-run LLM budget with graceful degradation.
+
+A run gets a ceiling in USD and/or tokens (RUN_LLM_BUDGET_USD /
+RUN_LLM_BUDGET_TOKENS, or limit_usd / limit_tokens already stored in the
+run's phase_state["llm_budget"]). The orchestrator checks spend before every
+phase (check_run_budget, reading the llm_usage rollup from metering) and, as
+the run approaches its limit, degrades the crews of the remaining phases:
+
+    level      spend      effect on crews (apply_degradation / should_skip_crew)
+    normal     < 70%      none
+    economy    >= 70%     economy model, max_iter <= 10, reasoning=False
+    minimal    >= 90%     economy model, max_iter <= 5, reasoning=False,
+                          optional crews (NarrativeSynthesisCrew) skipped
+    exhausted  >= 100%    run stops with BudgetExceededError
+
+Inside a phase the level is re-evaluated with the spend recorded so far in
+that container, so a phase that crosses a threshold degrades its later crews
+too; at exhausted no further crew starts and the phase ends early
+(run_phase_within_budget), so the orchestrator stops the run without waiting
+for the next phase boundary. Levels only ever go up within a run. Every level
+change, before or during a phase, is recorded in
+phase_state["llm_budget"]["degradations"] (ValidationRunState.llm_budget).
+
+Configuration:
+    RUN_LLM_BUDGET_USD: Per-run cost ceiling (default: unlimited)
+    RUN_LLM_BUDGET_TOKENS: Per-run token ceiling (default: unlimited)
+    LLM_BUDGET_ECONOMY_MODEL: Model for degraded agents (default: the model
+        registry's fast tier)
+    LLM_BUDGET_PROTECTED_CREWS: Comma-separated crews that are never degraded
+"""
+
+import contextlib
+import contextvars
+import copy
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterator, Optional
+
+from src.shared import metering
+
+logger = logging.getLogger(__name__)
+
+LEVELS = ("normal", "economy", "minimal", "exhausted")
+
+# Fraction of the budget at which each level starts
+LEVEL_THRESHOLDS = {"economy": 0.7, "minimal": 0.9, "exhausted": 1.0}
+
+DEFAULT_ECONOMY_MODEL = "openai/gpt-4o-mini"
+
+
+class BudgetExceededError(RuntimeError):
+    """The run has spent its LLM budget (phase_state carries the final llm_budget)."""
+
+    def __init__(self, message: str, phase_state: dict):
+        super().__init__(message)
+        self.phase_state = phase_state
+
+
+@dataclass(frozen=True)
+class Degradation:
+    """Agent settings applied at a budget level (None = leave as configured)."""
+
+    level: str
+    model: Optional[str] = None
+    max_iter: Optional[int] = None
+    disable_reasoning: bool = False
+    skip_optional_crews: bool = False
+
+
+def economy_model() -> str:
+    """LLM_BUDGET_ECONOMY_MODEL, else the model registry's fast tier."""
+    override = os.environ.get("LLM_BUDGET_ECONOMY_MODEL")
+    if override:
+        return override
+    try:
+        from src.shared.model_registry import tier_model
+        return tier_model("fast")
+    except (ImportError, KeyError, OSError):
+        return DEFAULT_ECONOMY_MODEL
+
+
+def degradation_for(level: str) -> Degradation:
+    model = economy_model()
+    if level == "economy":
+        return Degradation(level, model=model, max_iter=10, disable_reasoning=True)
+    if level in ("minimal", "exhausted"):
+        return Degradation(level, model=model, max_iter=5, disable_reasoning=True, skip_optional_crews=True)
+    return Degradation("normal")
+
+
+def _env_number(name: str, cast):
+    value = os.environ.get(name, "").strip()
+    return cast(value) if value else None
+
+
+@dataclass
+class RunBudget:
+    """
+    A run's LLM limits, spend and degradation history (stored in phase_state).
+
+    Args:
+        limit_usd: Cost ceiling (None = no cost limit)
+        limit_tokens: Token ceiling (None = no token limit)
+        spent_usd: Spend recorded in llm_usage when last checked
+        spent_tokens: Tokens recorded in llm_usage when last checked
+        level: Highest level reached so far
+        degradations: Level changes ({level, phase, spent_usd, spent_tokens, at})
+    """
+
+    limit_usd: Optional[float] = None
+    limit_tokens: Optional[int] = None
+    spent_usd: float = 0.0
+    spent_tokens: int = 0
+    level: str = "normal"
+    degradations: list[dict] = field(default_factory=list)
+
+    @classmethod
+    def from_state(cls, phase_state: Optional[dict]) -> "RunBudget":
+        """Budget from phase_state["llm_budget"], with limits defaulting to the environment."""
+        stored = copy.deepcopy((phase_state or {}).get("llm_budget") or {})
+        budget = cls(**{k: v for k, v in stored.items() if k in cls.__dataclass_fields__})
+        if budget.limit_usd is None:
+            budget.limit_usd = _env_number("RUN_LLM_BUDGET_USD", float)
+        if budget.limit_tokens is None:
+            budget.limit_tokens = _env_number("RUN_LLM_BUDGET_TOKENS", int)
+        return budget
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit_usd is not None or self.limit_tokens is not None
+
+    def fraction(self, extra_usd: float = 0.0, extra_tokens: int = 0) -> float:
+        """Share of the budget spent (the larger of the cost and token shares)."""
+        shares = [0.0]
+        if self.limit_usd:
+            shares.append((self.spent_usd + extra_usd) / self.limit_usd)
+        if self.limit_tokens:
+            shares.append((self.spent_tokens + extra_tokens) / self.limit_tokens)
+        return max(shares)
+
+    def level_for(self, extra_usd: float = 0.0, extra_tokens: int = 0) -> str:
+        """Level for the current spend (never below the level already reached)."""
+        fraction = self.fraction(extra_usd, extra_tokens)
+        reached = "normal"
+        for level in LEVELS[1:]:
+            if fraction >= LEVEL_THRESHOLDS[level]:
+                reached = level
+        return max(reached, self.level, key=LEVELS.index)
+
+    def to_state(self) -> dict:
+        return asdict(self)
+
+
+def load_run_spend(run_id: str, supabase=None) -> Optional[tuple[float, int]]:
+    """
+    Read a run's recorded (cost_usd, total_tokens) from llm_usage.
+
+    Returns:
+        (usd, tokens), or None if the rollup could not be read
+    """
+    try:
+        if supabase is None:
+            from src.state.persistence import get_supabase
+            supabase = get_supabase()
+        result = supabase.rpc("summarize_llm_usage", {"p_run_id": run_id}).execute()
+        summary = result.data or {}
+        return float(summary.get("cost_usd") or 0), int(summary.get("total_tokens") or 0)
+    except Exception as e:
+        logger.warning(json.dumps({
+            "event": "llm_budget_spend_unavailable",
+            "run_id": run_id,
+            "error": str(e),
+        }))
+        return None
+
+
+def check_run_budget(run_id: str, phase_num: int, phase_state: dict, supabase=None) -> dict:
+    """
+    Refresh a run's spend and level before a phase (orchestrator loop).
+
+    Returns:
+        phase_state with an updated "llm_budget" (a new dict; unchanged if
+        no budget is configured)
+
+    Raises:
+        BudgetExceededError: if the run has spent its whole budget
+    """
+    budget = RunBudget.from_state(phase_state)
+    if not budget.enabled:
+        return phase_state
+
+    spend = load_run_spend(run_id, supabase)
+    if spend is not None:
+        budget.spent_usd, budget.spent_tokens = spend
+
+    level = budget.level_for()
+    if level != budget.level:
+        budget.level = level
+        budget.degradations.append({
+            "level": level,
+            "phase": phase_num,
+            "spent_usd": round(budget.spent_usd, 6),
+            "spent_tokens": budget.spent_tokens,
+            "at": datetime.now(timezone.utc).isoformat(),
+        })
+        logger.warning(json.dumps({
+            "event": "llm_budget_degraded",
+            "run_id": run_id,
+            "phase": phase_num,
+            "level": level,
+            "spent_usd": round(budget.spent_usd, 4),
+            "limit_usd": budget.limit_usd,
+            "spent_tokens": budget.spent_tokens,
+            "limit_tokens": budget.limit_tokens,
+        }))
+
+    phase_state = {**phase_state, "llm_budget": budget.to_state()}
+
+    if level == "exhausted":
+        raise BudgetExceededError(
+            f"LLM budget exhausted before phase {phase_num}: "
+            f"${budget.spent_usd:.2f} of ${budget.limit_usd or 0:.2f}, "
+            f"{budget.spent_tokens} of {budget.limit_tokens or 'unlimited'} tokens",
+            phase_state,
+        )
+    return phase_state
+
+
+# -----------------------------------------------------------------------------
+# Phase container side
+# -----------------------------------------------------------------------------
+
+_active_budget: contextvars.ContextVar[Optional[tuple]] = contextvars.ContextVar(
+    "startupai_llm_budget", default=None
+)
+_level_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def budget_scope(run_id: str, phase_state: Optional[dict]) -> Iterator[RunBudget]:
+    """Enforce the run's budget for crews started in this block (phase functions)."""
+    budget = RunBudget.from_state(phase_state)
+    baseline = metering.get_usage_ledger().totals(run_id)
+    token = _active_budget.set((run_id, budget, baseline))
+    try:
+        yield budget
+    finally:
+        _active_budget.reset(token)
+
+
+def _scope_level() -> str:
+    """
+    Level for the run in scope, including spend so far in this container.
+
+    A level above the scope budget's is recorded in its degradations (crews
+    on several threads may cross a threshold at once; one entry is kept).
+    """
+    active = _active_budget.get()
+    if active is None:
+        return "normal"
+
+    run_id, budget, baseline = active
+    if not budget.enabled:
+        return "normal"
+
+    totals = metering.get_usage_ledger().totals(run_id)
+    extra_usd = totals["cost_usd"] - baseline["cost_usd"]
+    extra_tokens = totals["total_tokens"] - baseline["total_tokens"]
+
+    with _level_lock:
+        level = budget.level_for(extra_usd=extra_usd, extra_tokens=extra_tokens)
+        if level == budget.level:
+            return level
+        budget.level = level
+        phase = metering.current_scope().get("phase")
+        budget.degradations.append({
+            "level": level,
+            "phase": phase,
+            "spent_usd": round(budget.spent_usd + extra_usd, 6),
+            "spent_tokens": budget.spent_tokens + extra_tokens,
+            "at": datetime.now(timezone.utc).isoformat(),
+        })
+
+    logger.warning(json.dumps({
+        "event": "llm_budget_degraded",
+        "run_id": run_id,
+        "phase": phase,
+        "level": level,
+        "in_phase": True,
+        "spent_usd": round(budget.spent_usd + extra_usd, 4),
+        "limit_usd": budget.limit_usd,
+        "spent_tokens": budget.spent_tokens + extra_tokens,
+        "limit_tokens": budget.limit_tokens,
+    }))
+    return level
+
+
+def current_degradation() -> Degradation:
+    """Degradation for the run in scope, including spend so far in this container."""
+    return degradation_for(_scope_level())
+
+
+def ensure_budget_available() -> None:
+    """
+    Stop before starting another crew once the run's budget is spent.
+
+    Raises:
+        BudgetExceededError: at the exhausted level (phase_state carries the
+            scope's llm_budget)
+    """
+    if _scope_level() != "exhausted":
+        return
+    _, budget, _ = _active_budget.get()
+    raise BudgetExceededError(
+        f"LLM budget exhausted during phase {metering.current_scope().get('phase')}: "
+        f"limit ${budget.limit_usd or 0:.2f} / {budget.limit_tokens or 'unlimited'} tokens",
+        {"llm_budget": budget.to_state()},
+    )
+
+
+def run_phase_within_budget(
+    budget: RunBudget,
+    phase_state: dict,
+    execute: Callable[[], dict],
+) -> dict:
+    """
+    Run a phase and carry the budget level it reached into its result.
+
+    A phase that exhausts the budget returns (rather than raises, so Modal
+    does not retry it) {"state": ..., "budget_exhausted": message}; the
+    orchestrator then stops the run.
+
+    Args:
+        budget: The phase's budget (yielded by budget_scope)
+        phase_state: State the phase was started with
+        execute: Runs the phase and returns its result dict
+
+    Returns:
+        The phase result, with state["llm_budget"] updated when a budget is set
+    """
+    try:
+        result = execute()
+    except BudgetExceededError as e:
+        logger.warning(json.dumps({
+            "event": "llm_budget_exhausted_in_phase",
+            "phase": metering.current_scope().get("phase"),
+            "error": str(e),
+        }))
+        result = {"state": phase_state, "budget_exhausted": str(e)}
+
+    if not budget.enabled:
+        return result
+    state = result.get("state", phase_state)
+    return {**result, "state": {**state, "llm_budget": budget.to_state()}}
+
+
+def _protected(crew_name: Optional[str]) -> bool:
+    protected = os.environ.get("LLM_BUDGET_PROTECTED_CREWS", "")
+    return bool(crew_name) and crew_name in {name.strip() for name in protected.split(",")}
+
+
+def should_skip_crew(crew_name: str, optional: bool) -> bool:
+    """True if an optional crew should be skipped to save budget."""
+    return optional and not _protected(crew_name) and current_degradation().skip_optional_crews
+
+
+def apply_degradation(crew: Any) -> Any:
+    """
+    Apply the current degradation to a crew's agents before kickoff.
+
+    Swaps each agent's LLM for the economy model (keeping its temperature),
+    caps max_iter and turns off reasoning. No-op at the normal level or for
+    protected crews (named by the crew graph's metering scope).
+
+    Returns:
+        The same crew
+
+    Raises:
+        BudgetExceededError: if the run's budget is already spent
+    """
+    ensure_budget_available()
+    degradation = current_degradation()
+    crew_name = metering.current_scope().get("crew")
+    if degradation.level == "normal" or _protected(crew_name):
+        return crew
+
+    from src.shared.llm_cache import cached_llm
+
+    for agent in crew.agents:
+        llm = getattr(agent, "llm", None)
+        if degradation.model and llm is not None and getattr(llm, "model", None) != degradation.model.split("/")[-1]:
+            agent.llm = cached_llm(model=degradation.model, temperature=getattr(llm, "temperature", None))
+        if degradation.max_iter is not None and (agent.max_iter or 0) > degradation.max_iter:
+            agent.max_iter = degradation.max_iter
+        if degradation.disable_reasoning:
+            agent.reasoning = False
+
+    logger.info(json.dumps({
+        "event": "crew_degraded",
+        "crew": crew_name,
+        "level": degradation.level,
+        "model": degradation.model,
+        "max_iter": degradation.max_iter,
+    }))
+    return crew
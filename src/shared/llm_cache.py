@@ -0,0 +1,569 @@
+"""
+Content-addressed LLM completion cache.
+
+Completions are keyed on a SHA-256 of (model, temperature, messages, tools,
+response_format), so a phase re-run with identical inputs (HITL iterate,
+replays, resumed runs) reuses completions that were already paid for.
+
+Two backends:
+    - sqlite: Local file cache with TTL and LRU eviction (single container / dev)
+    - supabase: Shared llm_cache table (see db/migrations/010_llm_cache.sql),
+      TTL via expires_at - shared across Modal containers and runs
+
+Usage:
+    from src.shared.llm_cache import cached_llm
+
+    @agent
+    def w1_pricing_experiment(self) -> Agent:
+        return Agent(
+            llm=cached_llm(model="openai/gpt-4o", temperature=0.5),
+            ...
+        )
+
+    # Direct OpenAI SDK calls
+    content = cached_chat_completion(client, model="gpt-4o-mini", messages=[...])
+    content = await acached_chat_completion(async_client, model="gpt-4o-mini", messages=[...])
+
+Configuration:
+    LLM_CACHE_BACKEND: none | sqlite | supabase (default: none)
+    LLM_CACHE_TTL_SECONDS: Entry lifetime (default: 604800 = 7 days)
+    LLM_CACHE_MAX_ENTRIES: SQLite LRU bound (default: 10000)
+    LLM_CACHE_PATH: SQLite file (default: ~/.cache/startupai/llm_cache.sqlite3)
+
+Calls that execute tools inside the LLM call (available_functions) are never
+cached, since replaying them would skip the tool's side effects.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_SQLITE_PATH = Path.home() / ".cache" / "startupai" / "llm_cache.sqlite3"
+
+
+# -----------------------------------------------------------------------------
+# Cache Key
+# -----------------------------------------------------------------------------
+
+def _normalize(value: Any) -> Any:
+    """Convert pydantic models/classes into JSON-friendly structures for hashing."""
+    if isinstance(value, type) and hasattr(value, "model_json_schema"):
+        return value.model_json_schema()
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    return value
+
+
+def make_cache_key(
+    model: str,
+    temperature: Optional[float],
+    messages: Any,
+    tools: Any = None,
+    response_format: Any = None,
+) -> str:
+    """
+    Build the content address for a completion request.
+
+    Args:
+        model: Model identifier (e.g. "gpt-4o")
+        temperature: Sampling temperature
+        messages: Chat messages (string or list of role/content dicts)
+        tools: Tool / function schemas offered to the model
+        response_format: Response format or pydantic response model
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+
+    payload = json.dumps(
+        {
+            "model": model,
+            "temperature": temperature,
+            "messages": _normalize(messages),
+            "tools": _normalize(tools),
+            "response_format": _normalize(response_format),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# -----------------------------------------------------------------------------
+# Backends
+# -----------------------------------------------------------------------------
+
+class LLMCacheBackend(ABC):
+    """Base class for completion cache backends with hit/miss counters."""
+
+    name = "base"
+
+    def __init__(self, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached completion for key, or None on miss/expiry."""
+        value = self._get(key)
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, model: str, value: str) -> None:
+        """Store a completion."""
+        self._set(key, model, value)
+        with self._stats_lock:
+            self.writes += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters for this process."""
+        total = self.hits + self.misses
+        return {
+            "backend": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[str]:
+        """Backend lookup; None on miss or expiry."""
+
+    @abstractmethod
+    def _set(self, key: str, model: str, value: str) -> None:
+        """Backend write."""
+
+
+class SQLiteLLMCache(LLMCacheBackend):
+    """Local SQLite cache with TTL expiry and LRU eviction."""
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_SQLITE_PATH,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        super().__init__(ttl_seconds=ttl_seconds)
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Crews run on a thread pool, so one connection is shared under a lock
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_lru ON llm_cache (last_accessed_at)"
+        )
+        self._conn.commit()
+
+    def _get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            response, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+                self._conn.commit()
+                self.evictions += 1
+                return None
+            self._conn.execute(
+                "UPDATE llm_cache SET last_accessed_at = ? WHERE cache_key = ?",
+                (now, key),
+            )
+            self._conn.commit()
+            return response
+
+    def _set(self, key: str, model: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache "
+                "(cache_key, model, response, created_at, last_accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, model, value, now, now),
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM llm_cache WHERE cache_key IN ("
+                    "SELECT cache_key FROM llm_cache ORDER BY last_accessed_at ASC LIMIT ?)",
+                    (overflow,),
+                )
+                self.evictions += overflow
+            self._conn.commit()
+
+
+class SupabaseLLMCache(LLMCacheBackend):
+    """
+    Shared cache in the Supabase llm_cache table.
+
+    Expired rows are ignored on read; they are overwritten on the next write
+    for the same key. Failures are logged and treated as misses.
+    """
+
+    name = "supabase"
+
+    def __init__(self, ttl_seconds: int = DEFAULT_TTL_SECONDS, supabase=None):
+        super().__init__(ttl_seconds=ttl_seconds)
+        self._supabase = supabase
+
+    def _client(self):
+        if self._supabase is None:
+            from src.state.persistence import get_supabase
+            self._supabase = get_supabase()
+        return self._supabase
+
+    def _get(self, key: str) -> Optional[str]:
+        try:
+            result = (
+                self._client().table("llm_cache")
+                .select("response")
+                .eq("cache_key", key)
+                .gt("expires_at", datetime.now(timezone.utc).isoformat())
+                .limit(1)
+                .execute()
+            )
+            if result.data:
+                return result.data[0]["response"]
+            return None
+        except Exception as e:
+            logger.warning(json.dumps({
+                "event": "llm_cache_read_error",
+                "backend": self.name,
+                "error": str(e),
+            }))
+            return None
+
+    def _set(self, key: str, model: str, value: str) -> None:
+        now = datetime.now(timezone.utc)
+        try:
+            self._client().table("llm_cache").upsert({
+                "cache_key": key,
+                "model": model,
+                "response": value,
+                "created_at": now.isoformat(),
+                "expires_at": (now + timedelta(seconds=self.ttl_seconds)).isoformat(),
+            }).execute()
+        except Exception as e:
+            logger.warning(json.dumps({
+                "event": "llm_cache_write_error",
+                "backend": self.name,
+                "error": str(e),
+            }))
+
+
+# -----------------------------------------------------------------------------
+# Process-wide Cache
+# -----------------------------------------------------------------------------
+
+_cache: Optional[LLMCacheBackend] = None
+_cache_loaded = False
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMCacheBackend]:
+    """Get the configured cache backend (None if caching is disabled)."""
+    global _cache, _cache_loaded
+    if _cache_loaded:
+        return _cache
+
+    with _cache_lock:
+        if _cache_loaded:
+            return _cache
+
+        backend = os.environ.get("LLM_CACHE_BACKEND", "none").lower()
+        ttl = int(os.environ.get("LLM_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS))
+
+        try:
+            if backend == "sqlite":
+                _cache = SQLiteLLMCache(
+                    path=Path(os.environ.get("LLM_CACHE_PATH", DEFAULT_SQLITE_PATH)),
+                    ttl_seconds=ttl,
+                    max_entries=int(os.environ.get("LLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+                )
+            elif backend == "supabase":
+                _cache = SupabaseLLMCache(ttl_seconds=ttl)
+            else:
+                _cache = None
+        except Exception as e:
+            logger.warning(json.dumps({
+                "event": "llm_cache_init_error",
+                "backend": backend,
+                "error": str(e),
+            }))
+            _cache = None
+
+        _cache_loaded = True
+        return _cache
+
+
+def set_llm_cache(cache: Optional[LLMCacheBackend]) -> None:
+    """Override the process-wide cache (tests, scripts)."""
+    global _cache, _cache_loaded
+    with _cache_lock:
+        _cache = cache
+        _cache_loaded = True
+
+
+def get_llm_cache_stats() -> dict[str, Any]:
+    """Return hit/miss counters for the process-wide cache."""
+    cache = get_llm_cache()
+    if cache is None:
+        return {"backend": "none", "hits": 0, "misses": 0, "writes": 0, "evictions": 0, "hit_rate": 0.0}
+    return cache.stats()
+
+
+# -----------------------------------------------------------------------------
+# CrewAI LLM Integration
+# -----------------------------------------------------------------------------
+
+def _encode_result(result: Any) -> Optional[str]:
+    """Serialize an LLM result for storage (None if it can't be cached)."""
+    if isinstance(result, str):
+        return json.dumps({"type": "text", "value": result})
+    if hasattr(result, "model_dump_json"):
+        return json.dumps({"type": "model", "value": result.model_dump_json()})
+    return None
+
+
+def _decode_result(stored: str, response_model: Any = None) -> Any:
+    """Rebuild an LLM result from storage."""
+    entry = json.loads(stored)
+    if entry["type"] == "model" and response_model is not None:
+        return response_model.model_validate_json(entry["value"])
+    return entry["value"]
+
+
+def wrap_llm(llm: Any, cache: Optional[LLMCacheBackend] = None) -> Any:
+    """
+    Route an LLM instance's call() through the completion cache.
+
+    crewai.LLM is a factory that returns provider-specific classes (e.g. the
+    native OpenAI completion), so caching wraps the instance rather than
+    subclassing LLM.
+
+    Args:
+        llm: A crewai LLM / BaseLLM instance
+        cache: Backend override (defaults to the process-wide cache)
+
+    Returns:
+        The same instance, with call() cached if a backend is configured
+    """
+    cache = cache or get_llm_cache()
+    if cache is None:
+        return llm
+
+    original_call = llm.call
+
+    def call(
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+        response_model=None,
+    ):
+        passthrough = dict(
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model,
+        )
+        if available_functions:
+            return original_call(messages, **passthrough)
+
+        key = make_cache_key(
+            model=llm.model,
+            temperature=llm.temperature,
+            messages=messages,
+            tools=tools,
+            response_format=response_model or getattr(llm, "response_format", None),
+        )
+
+        stored = cache.get(key)
+        if stored is not None:
+            try:
+                return _decode_result(stored, response_model)
+            except Exception as e:
+                logger.warning(json.dumps({
+                    "event": "llm_cache_decode_error",
+                    "model": llm.model,
+                    "error": str(e),
+                }))
+
+        result = original_call(messages, **passthrough)
+
+        encoded = _encode_result(result)
+        if encoded is not None:
+            cache.set(key, llm.model, encoded)
+        return result
+
+    llm.call = call
+    return llm
+
+
+def cached_llm(model: str, temperature: Optional[float] = None, **kwargs: Any) -> Any:
+    """
+    Drop-in replacement for crewai.LLM(...) with completion caching.
+
+    Args:
+        model: Model identifier (e.g. "openai/gpt-4o")
+        temperature: Sampling temperature
+        **kwargs: Passed through to crewai.LLM
+
+    Returns:
+        LLM instance whose call() is served from the cache when possible
+        (metered per run/phase/crew, recorded/replayed when a cassette is in
+        use, traced when tracing is on)
+    """
+    from crewai import LLM
+    from src.shared.metering import wrap_llm_for_metering
+    from src.shared.replay import wrap_llm_for_cassette
+    from src.shared.tracing import wrap_llm_for_tracing
+
+    llm = LLM(model=model, temperature=temperature, **kwargs)
+    return wrap_llm_for_tracing(wrap_llm_for_metering(wrap_llm_for_cassette(wrap_llm(llm))))
+
+
+# -----------------------------------------------------------------------------
+# Direct OpenAI SDK Integration
+# -----------------------------------------------------------------------------
+
+def _chat_cache_key(kwargs: dict) -> str:
+    return make_cache_key(
+        model=kwargs.get("model"),
+        temperature=kwargs.get("temperature"),
+        messages=kwargs.get("messages"),
+        tools=kwargs.get("tools"),
+        response_format=kwargs.get("response_format"),
+    )
+
+
+def cached_chat_completion(client: Any, **kwargs: Any) -> str:
+    """
+    Run client.chat.completions.create(**kwargs) through the cache.
+
+    Returns the first choice's message content. Used by tools/helpers that
+    call the OpenAI SDK directly instead of going through CrewAI.
+
+    Args:
+        client: openai.OpenAI client
+        **kwargs: chat.completions.create arguments (model, messages, ...)
+
+    Returns:
+        Message content string
+    """
+    from src.shared import metering, tracing
+    from src.shared.replay import play_chat_completion, record_chat_completion
+
+    replayed, content = play_chat_completion(kwargs)
+    if replayed:
+        metering.record_llm_call(kwargs.get("model", ""), cache_hit=True)
+        return content
+
+    cache = get_llm_cache()
+    key = None
+
+    if cache is not None:
+        key = _chat_cache_key(kwargs)
+        stored = cache.get(key)
+        if stored is not None:
+            metering.record_llm_call(kwargs.get("model", ""), cache_hit=True)
+            return _decode_result(stored)
+
+    started = time.perf_counter()
+    with tracing.span(kwargs.get("model", "chat"), tracing.LLM, llm_calls=1) as active:
+        response = client.chat.completions.create(**kwargs)
+        tracing.record_llm_usage(active, getattr(response, "usage", None))
+    metering.record_response_usage(kwargs.get("model", ""), getattr(response, "usage", None))
+    content = response.choices[0].message.content
+    record_chat_completion(kwargs, content, (time.perf_counter() - started) * 1000)
+
+    if cache is not None and isinstance(content, str):
+        cache.set(key, kwargs.get("model", ""), _encode_result(content))
+    return content
+
+
+async def acached_chat_completion(client: Any, **kwargs: Any) -> str:
+    """
+    Async variant of cached_chat_completion for openai.AsyncOpenAI clients.
+
+    Cache backends are blocking (SQLite file / Supabase HTTP), so lookups and
+    writes run in a worker thread to keep the event loop free.
+    """
+    from src.shared import metering, tracing
+    from src.shared.replay import play_chat_completion, record_chat_completion
+
+    replayed, content = play_chat_completion(kwargs)
+    if replayed:
+        metering.record_llm_call(kwargs.get("model", ""), cache_hit=True)
+        return content
+
+    cache = get_llm_cache()
+    key = None
+
+    if cache is not None:
+        key = _chat_cache_key(kwargs)
+        stored = await asyncio.to_thread(cache.get, key)
+        if stored is not None:
+            metering.record_llm_call(kwargs.get("model", ""), cache_hit=True)
+            return _decode_result(stored)
+
+    started = time.perf_counter()
+    with tracing.span(kwargs.get("model", "chat"), tracing.LLM, llm_calls=1) as active:
+        response = await client.chat.completions.create(**kwargs)
+        tracing.record_llm_usage(active, getattr(response, "usage", None))
+    metering.record_response_usage(kwargs.get("model", ""), getattr(response, "usage", None))
+    content = response.choices[0].message.content
+    record_chat_completion(kwargs, content, (time.perf_counter() - started) * 1000)
+
+    if cache is not None and isinstance(content, str):
+        await asyncio.to_thread(cache.set, key, kwargs.get("model", ""), _encode_result(content))
+    return content
@@ -0,0 +1,369 @@
+"""
+Token and cost metering for LLM calls, per run, phase, crew and model.
+
+Every LLM call made through cached_llm (CrewAI agents) or
+cached_chat_completion / acached_chat_completion (direct OpenAI SDK calls in
+advanced_analysis.py and segment_alternatives.py) is recorded here with its
+prompt/completion tokens and USD cost. Calls served from the completion
+cache or a cassette are counted as cache hits with no tokens.
+
+Attribution comes from metering_scope(): the phase functions open a scope
+with run_id/phase and the crew graph adds the crew name, so calls made deep
+inside a crew need no extra arguments (the scope is a contextvar and follows
+the crew graph's copied contexts into its worker threads).
+
+Usage is aggregated in memory per (run_id, phase, crew, model) and written
+with flush_usage() at phase boundaries through the record_llm_usage RPC,
+which adds the deltas to llm_usage and refreshes the run's llm_usage summary
+on validation_run_status (served by GET /status, see
+db/migrations/016_llm_usage.sql).
+
+Costs use MODEL_PRICES (USD per 1M tokens, matched on the longest model
+prefix, provider prefix ignored); unknown models fall back to litellm's cost
+map when it is installed and are otherwise counted at $0 and logged once.
+
+Usage:
+    from src.shared.metering import metering_scope, flush_usage
+
+    with metering_scope(run_id=run_id, phase=2):
+        with metering_scope(crew="GrowthCrew"):
+            crew.kickoff()
+    flush_usage()
+"""
+
+import contextlib
+import contextvars
+import json
+import logging
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# USD per 1M tokens: (prompt, completion)
+MODEL_PRICES: dict[str, tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-5-nano": (0.05, 0.40),
+    "gpt-5-mini": (0.25, 2.00),
+    "gpt-5": (1.25, 10.00),
+    "o3-mini": (1.10, 4.40),
+    "o4-mini": (1.10, 4.40),
+    "o3": (2.00, 8.00),
+}
+
+# Crew name for calls made outside any crew (e.g. phase-level helpers)
+PHASE_LEVEL = "_phase"
+
+_USAGE_KEYS = ("prompt_tokens", "completion_tokens")
+
+_scope: contextvars.ContextVar[dict] = contextvars.ContextVar("startupai_metering_scope", default={})
+_unpriced_models: set[str] = set()
+
+
+def _normalize_model(model: str) -> str:
+    return (model or "").split("/")[-1].lower()
+
+
+def model_price(model: str) -> Optional[tuple[float, float]]:
+    """(prompt, completion) USD per 1M tokens, or None if unknown."""
+    name = _normalize_model(model)
+    for prefix in sorted(MODEL_PRICES, key=len, reverse=True):
+        if name.startswith(prefix):
+            return MODEL_PRICES[prefix]
+
+    try:
+        import litellm
+        info = litellm.model_cost.get(name) or litellm.model_cost.get(model) or {}
+        if info.get("input_cost_per_token") is not None:
+            return (
+                info["input_cost_per_token"] * 1_000_000,
+                (info.get("output_cost_per_token") or 0) * 1_000_000,
+            )
+    except ImportError:
+        pass
+    return None
+
+
+def llm_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """USD cost of one call ($0 for unknown models)."""
+    price = model_price(model)
+    if price is None:
+        if model not in _unpriced_models:
+            _unpriced_models.add(model)
+            logger.warning(json.dumps({"event": "llm_model_unpriced", "model": model}))
+        return 0.0
+    return (prompt_tokens * price[0] + completion_tokens * price[1]) / 1_000_000
+
+
+@dataclass
+class UsageTotals:
+    """Aggregated usage for one (run, phase, crew, model)."""
+
+    calls: int = 0
+    cache_hits: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+
+    def add(self, other: "UsageTotals") -> None:
+        self.calls += other.calls
+        self.cache_hits += other.cache_hits
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.cost_usd += other.cost_usd
+
+
+class UsageLedger:
+    """
+    Thread-safe in-memory usage ledger with batched writes.
+
+    Keeps two views: totals for everything recorded in this process (for
+    budget checks) and pending deltas not yet written.
+
+    Args:
+        write: Callable taking a list of usage rows (deltas) and persisting them
+    """
+
+    def __init__(self, write: Callable[[list[dict]], None]):
+        self._write = write
+        self._lock = threading.Lock()
+        self._totals: dict[tuple, UsageTotals] = {}
+        self._pending: dict[tuple, UsageTotals] = {}
+
+    def record(
+        self,
+        run_id: str,
+        phase: Optional[int],
+        crew: Optional[str],
+        model: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cache_hit: bool = False,
+    ) -> float:
+        """
+        Record one LLM call.
+
+        Returns:
+            Cost of the call in USD
+        """
+        cost = 0.0 if cache_hit else llm_cost(model, prompt_tokens, completion_tokens)
+        call = UsageTotals(
+            calls=1,
+            cache_hits=1 if cache_hit else 0,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cost_usd=cost,
+        )
+        key = (str(run_id), phase, crew or PHASE_LEVEL, _normalize_model(model))
+        with self._lock:
+            for view in (self._totals, self._pending):
+                view.setdefault(key, UsageTotals()).add(call)
+        return cost
+
+    def rows(self, run_id: Optional[str] = None, pending: bool = False) -> list[dict]:
+        """Usage rows (optionally only one run's, or only unwritten deltas)."""
+        with self._lock:
+            view = dict(self._pending if pending else self._totals)
+        return [
+            {"run_id": key[0], "phase": key[1], "crew": key[2], "model": key[3], **asdict(totals)}
+            for key, totals in view.items()
+            if run_id is None or key[0] == str(run_id)
+        ]
+
+    def totals(self, run_id: Optional[str] = None) -> dict[str, Any]:
+        """Summary of everything recorded in this process (see summarize_usage)."""
+        return summarize_usage(self.rows(run_id))
+
+    def flush(self) -> bool:
+        """
+        Write pending deltas in one request.
+
+        Returns:
+            True if written (or nothing pending); failed deltas are kept
+        """
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return True
+
+        rows = [
+            {"run_id": key[0], "phase": key[1], "crew": key[2], "model": key[3], **asdict(totals)}
+            for key, totals in batch.items()
+        ]
+        try:
+            self._write(rows)
+            return True
+        except Exception as e:
+            with self._lock:
+                for key, totals in batch.items():
+                    self._pending.setdefault(key, UsageTotals()).add(totals)
+            logger.error(json.dumps({
+                "event": "llm_usage_flush_failed",
+                "rows": len(rows),
+                "error": str(e),
+            }))
+            return False
+
+
+def summarize_usage(rows: list[dict]) -> dict[str, Any]:
+    """
+    Roll usage rows up to run totals, per-phase totals and per-crew totals.
+
+    Same shape as the llm_usage summary on validation_run_status.
+    """
+    def empty() -> dict:
+        return {"calls": 0, "cache_hits": 0, "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0}
+
+    def add(target: dict, row: dict) -> None:
+        for key in ("calls", "cache_hits", "prompt_tokens", "completion_tokens"):
+            target[key] += int(row.get(key) or 0)
+        target["cost_usd"] += float(row.get("cost_usd") or 0)
+
+    total = empty()
+    by_phase: dict[str, dict] = {}
+    by_crew: dict[tuple, dict] = {}
+    for row in rows:
+        add(total, row)
+        add(by_phase.setdefault(str(row.get("phase")), empty()), row)
+        add(by_crew.setdefault((row.get("phase"), row.get("crew")), {
+            "phase": row.get("phase"), "crew": row.get("crew"), **empty(),
+        }), row)
+
+    for entry in [total, *by_phase.values(), *by_crew.values()]:
+        entry["total_tokens"] = entry["prompt_tokens"] + entry["completion_tokens"]
+        entry["cost_usd"] = round(entry["cost_usd"], 6)
+
+    return {
+        **total,
+        "by_phase": by_phase,
+        "by_crew": sorted(by_crew.values(), key=lambda c: c["cost_usd"], reverse=True),
+    }
+
+
+# -----------------------------------------------------------------------------
+# Process-wide ledger and scope
+# -----------------------------------------------------------------------------
+
+_ledger: Optional[UsageLedger] = None
+_ledger_lock = threading.Lock()
+
+
+def _write_usage(rows: list[dict]) -> None:
+    from src.state.persistence import get_supabase
+    get_supabase().rpc("record_llm_usage", {"p_rows": rows}).execute()
+
+
+def get_usage_ledger() -> UsageLedger:
+    """Get the process-wide usage ledger."""
+    global _ledger
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                _ledger = UsageLedger(_write_usage)
+    return _ledger
+
+
+def flush_usage() -> bool:
+    """Write pending usage now (phase boundaries, HITL)."""
+    if _ledger is None:
+        return True
+    return _ledger.flush()
+
+
+@contextlib.contextmanager
+def metering_scope(**fields: Any) -> Iterator[dict]:
+    """Attribute LLM calls in this block to run_id / phase / crew (nested scopes merge)."""
+    scope = {**_scope.get(), **{k: v for k, v in fields.items() if v is not None}}
+    token = _scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _scope.reset(token)
+
+
+def current_scope() -> dict:
+    """The run_id / phase / crew attribution in effect."""
+    return dict(_scope.get())
+
+
+def record_llm_call(
+    model: str,
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+    cache_hit: bool = False,
+) -> Optional[float]:
+    """
+    Record one LLM call against the current scope.
+
+    Returns:
+        Cost in USD, or None when no run is in scope (calls outside a run,
+        e.g. local scripts, are not metered)
+    """
+    scope = _scope.get()
+    if not scope.get("run_id"):
+        return None
+    return get_usage_ledger().record(
+        scope["run_id"],
+        scope.get("phase"),
+        scope.get("crew"),
+        model,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        cache_hit=cache_hit,
+    )
+
+
+def record_response_usage(model: str, usage: Any) -> Optional[float]:
+    """Record an OpenAI SDK response's usage (None usage counts as a cache hit)."""
+    tokens = {key: getattr(usage, key, None) for key in _USAGE_KEYS}
+    return record_llm_call(
+        model,
+        cache_hit=usage is None,
+        **{key: value if isinstance(value, int) else 0 for key, value in tokens.items()},
+    )
+
+
+def wrap_llm_for_metering(llm: Any) -> Any:
+    """
+    Record tokens and cost of each call() on a crewai LLM.
+
+    Tokens are the change in the LLM's own _token_usage counters across the
+    call, so calls answered by the completion cache or a cassette (no change)
+    are recorded as cache hits.
+    """
+    original_call = llm.call
+
+    def call(messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        passthrough = dict(
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model,
+        )
+        if not _scope.get().get("run_id"):
+            return original_call(messages, **passthrough)
+
+        before = getattr(llm, "_token_usage", None) or {}
+        before = {key: int(before.get(key, 0) or 0) for key in _USAGE_KEYS}
+        succeeded = False
+        try:
+            result = original_call(messages, **passthrough)
+            succeeded = True
+            return result
+        finally:
+            after = getattr(llm, "_token_usage", None) or {}
+            delta = {key: max(int(after.get(key, 0) or 0) - before[key], 0) for key in _USAGE_KEYS}
+            # A failed call is only recorded if the provider billed tokens for it
+            if any(delta.values()) or succeeded:
+                record_llm_call(llm.model, cache_hit=not any(delta.values()), **delta)
+
+    llm.call = call
+    return llm
@@ -0,0 +1,110 @@
+"""
+Central model registry for crew agents.
+
+Agents used to hardcode LLM(model="openai/gpt-4o", ...) in every crew file.
+Instead they ask for a model by role:
+
+    llm=get_llm("l2_legal_compliance", temperature=0.1)
+
+and model_registry.yaml maps the role to a tier (standard / fast) and the
+tier to a model. Simple classification, ranking and compliance roles run on
+the fast tier; everything else on standard.
+
+Overrides (later wins):
+    MODEL_REGISTRY_ENV: environments.<name> overlay in the YAML (default: production)
+    MODEL_REGISTRY_PATH: Alternative registry file
+    LLM_MODEL_<TIER>: Model for a tier (e.g. LLM_MODEL_FAST=openai/gpt-4.1-nano)
+    LLM_ROLE_<ROLE>: Tier for a single role (e.g. LLM_ROLE_G1_QA_AGENT=fast)
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+
+DEFAULT_REGISTRY_PATH = Path(__file__).with_name("model_registry.yaml")
+DEFAULT_ENVIRONMENT = "production"
+
+
+def _merge(base: dict, overlay: dict) -> dict:
+    merged = dict(base)
+    for key, value in (overlay or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+@lru_cache()
+def load_registry(path: Optional[str] = None, environment: Optional[str] = None) -> dict:
+    """
+    Load the registry with its environment overlay applied.
+
+    Returns:
+        {"tiers": {tier: model}, "default_tier": str, "roles": {role: tier}}
+    """
+    path = path or os.environ.get("MODEL_REGISTRY_PATH") or DEFAULT_REGISTRY_PATH
+    environment = environment or os.environ.get("MODEL_REGISTRY_ENV", DEFAULT_ENVIRONMENT)
+
+    data = yaml.safe_load(Path(path).read_text()) or {}
+    overlay = (data.pop("environments", None) or {}).get(environment) or {}
+    registry = _merge(data, overlay)
+    registry.setdefault("tiers", {})
+    registry.setdefault("roles", {})
+    registry.setdefault("default_tier", "standard")
+    return registry
+
+
+def _env_key(name: str) -> str:
+    return name.upper().replace("-", "_").replace(".", "_")
+
+
+def tier_for(role: str) -> str:
+    """Tier of an agent role (LLM_ROLE_<ROLE>, then the registry, then default_tier)."""
+    registry = load_registry()
+    return (
+        os.environ.get(f"LLM_ROLE_{_env_key(role)}")
+        or registry["roles"].get(role)
+        or registry["default_tier"]
+    )
+
+
+def tier_model(tier: str) -> str:
+    """
+    Model of a tier (LLM_MODEL_<TIER>, then the registry).
+
+    Raises:
+        KeyError: if the tier is not defined
+    """
+    override = os.environ.get(f"LLM_MODEL_{_env_key(tier)}")
+    if override:
+        return override
+    tiers = load_registry()["tiers"]
+    if tier not in tiers:
+        raise KeyError(f"Unknown model tier '{tier}' (known: {', '.join(sorted(tiers))})")
+    return tiers[tier]
+
+
+def model_for(role: str) -> str:
+    """Model an agent role runs on."""
+    return tier_model(tier_for(role))
+
+
+def get_llm(role: str, temperature: Optional[float] = None, **kwargs: Any) -> Any:
+    """
+    LLM for an agent role (drop-in for cached_llm(model=..., temperature=...)).
+
+    Args:
+        role: Agent key (e.g. "n3_claim_guardian")
+        temperature: Sampling temperature
+        **kwargs: Passed through to cached_llm / crewai.LLM
+
+    Returns:
+        Cached, metered LLM instance on the role's model
+    """
+    from .llm_cache import cached_llm
+
+    return cached_llm(model=model_for(role), temperature=temperature, **kwargs)
@@ -0,0 +1,484 @@
+"""
+Gate policy backtesting over decision_log and experiment_outcomes.
+
+Replays every recorded gate decision under alternative GatePolicy configs
+and scores each config against what actually happened to the project:
+
+    decisions   decision_log rows with decision_type = 'router_decision' and
+                decision_point '<gate>_gate' (decision 'passed'/'failed',
+                context_snapshot = the evidence summary the gate saw)
+    outcomes    completed experiment_outcomes rows; an outcome succeeded if
+                primary_value >= the target for its primary_metric
+    label       a decision is "good" if at least min_success_share of the
+                project's outcomes completed after the decision succeeded,
+                "bad" otherwise, and unlabeled if none completed after it
+
+For each config (plus "recorded", the decisions as logged):
+
+    pass_rate          share of decisions the config passes
+    divergence_rate    share where the config disagrees with the recorded decision
+    false_pass_rate    share of bad decisions the config passes
+    false_block_rate   share of good decisions the config blocks
+
+with percentile bootstrap confidence intervals. Decisions are resampled by
+drawing the 12 (recorded, replayed, label) cell counts from a multinomial,
+which is exactly a row bootstrap but costs O(n_bootstrap) instead of
+O(n_bootstrap * n_decisions).
+
+Data is streamed from Supabase in keyset-paginated pages (only the columns
+needed) or read from a local Parquet export, and held as NumPy columns;
+replay uses the vectorized evaluator in gate_batch.
+
+Requires numpy (and pyarrow for Parquet), the "analytics" extra.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterable, Iterator, Mapping, Optional
+
+import numpy as np
+
+from src.shared.gate_batch import evaluate_gates_batch, policy_variant
+from src.shared.gate_policies import DEFAULT_POLICIES, GatePolicy
+
+DECISION_COLUMNS = ("id", "project_id", "decision_point", "decision", "context_snapshot", "created_at")
+OUTCOME_COLUMNS = ("id", "project_id", "primary_metric", "primary_value", "completed_at", "created_at")
+
+PASSED_DECISIONS = frozenset({"passed", "approved", "proceed"})
+FAILED_DECISIONS = frozenset({"failed", "rejected", "blocked"})
+
+# Outcome success targets per primary_metric (metrics without one are ignored)
+DEFAULT_SUCCESS_TARGETS: dict[str, float] = {
+    "ctr": DEFAULT_POLICIES["DESIRABILITY"].thresholds["ctr"],
+}
+
+RECORDED = "recorded"
+METRICS = ("pass_rate", "divergence_rate", "false_pass_rate", "false_block_rate")
+
+# Label codes
+UNLABELED, BAD, GOOD = -1, 0, 1
+
+
+# -----------------------------------------------------------------------------
+# Loading
+# -----------------------------------------------------------------------------
+
+def _to_micros(value: Any) -> Optional[int]:
+    """ISO string / datetime -> UTC microseconds since epoch (None if missing)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1_000_000)
+
+
+def _gate_of(decision_point: Optional[str]) -> Optional[str]:
+    gate = (decision_point or "").removesuffix("_gate").upper()
+    return gate if gate in DEFAULT_POLICIES else None
+
+
+@dataclass
+class DecisionColumns:
+    """Recorded gate decisions as columns (one entry per decision)."""
+
+    project_id: np.ndarray      # object
+    created_at: np.ndarray      # int64 microseconds
+    gate: np.ndarray            # object (DESIRABILITY/FEASIBILITY/VIABILITY)
+    recorded_pass: np.ndarray   # bool
+    evidence: list[dict[str, Any]]
+    signal: list[Optional[str]]
+
+    def __len__(self) -> int:
+        return len(self.evidence)
+
+
+@dataclass
+class OutcomeColumns:
+    """Completed experiment outcomes with a success target, as columns."""
+
+    project_id: np.ndarray      # object
+    completed_at: np.ndarray    # int64 microseconds
+    success: np.ndarray         # bool
+
+    def __len__(self) -> int:
+        return len(self.success)
+
+
+def decisions_from_rows(rows: Iterable[dict[str, Any]]) -> DecisionColumns:
+    """Build decision columns, skipping non-gate and undecided rows."""
+    project_ids, created, gates, recorded, evidence, signals = [], [], [], [], [], []
+    for row in rows:
+        gate = _gate_of(row.get("decision_point"))
+        decision = str(row.get("decision") or "").lower()
+        if gate is None or decision not in PASSED_DECISIONS | FAILED_DECISIONS:
+            continue
+        snapshot = row.get("context_snapshot") or {}
+        if isinstance(snapshot, str):
+            snapshot = json.loads(snapshot)
+        at = _to_micros(row.get("created_at"))
+        if at is None:
+            continue
+
+        project_ids.append(row.get("project_id"))
+        created.append(at)
+        gates.append(gate)
+        recorded.append(decision in PASSED_DECISIONS)
+        evidence.append(snapshot)
+        signals.append(snapshot.get("signal"))
+
+    return DecisionColumns(
+        project_id=np.array(project_ids, dtype=object),
+        created_at=np.array(created, dtype=np.int64),
+        gate=np.array(gates, dtype=object),
+        recorded_pass=np.array(recorded, dtype=bool),
+        evidence=evidence,
+        signal=signals,
+    )
+
+
+def outcomes_from_rows(
+    rows: Iterable[dict[str, Any]],
+    targets: Optional[Mapping[str, float]] = None,
+) -> OutcomeColumns:
+    """Build outcome columns, skipping rows without a value, time or target."""
+    targets = DEFAULT_SUCCESS_TARGETS if targets is None else targets
+    project_ids, completed, success = [], [], []
+    for row in rows:
+        target = targets.get(row.get("primary_metric"))
+        value = row.get("primary_value")
+        at = _to_micros(row.get("completed_at") or row.get("created_at"))
+        if target is None or value is None or at is None:
+            continue
+        project_ids.append(row.get("project_id"))
+        completed.append(at)
+        success.append(float(value) >= target)
+
+    return OutcomeColumns(
+        project_id=np.array(project_ids, dtype=object),
+        completed_at=np.array(completed, dtype=np.int64),
+        success=np.array(success, dtype=bool),
+    )
+
+
+def iter_table_pages(
+    client,
+    table: str,
+    columns: Iterable[str],
+    filters: Optional[list[tuple[str, str, Any]]] = None,
+    page_size: int = 1000,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Stream a table in pages, keyset-paginated on the primary key.
+
+    Args:
+        client: Supabase client
+        table: Table name
+        columns: Columns to select (must include "id")
+        filters: (method, column, value) query filters, e.g. ("eq", "status", "completed")
+        page_size: Rows per request
+
+    Yields:
+        Lists of rows (the last page may be shorter)
+    """
+    last_id = None
+    select = ",".join(columns)
+    while True:
+        query = client.table(table).select(select)
+        for method, column, value in filters or []:
+            query = getattr(query, method)(column, value)
+        if last_id is not None:
+            query = query.gt("id", last_id)
+        rows = query.order("id").limit(page_size).execute().data or []
+        if rows:
+            yield rows
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1]["id"]
+
+
+def _flatten(pages: Iterable[list[dict[str, Any]]]) -> Iterator[dict[str, Any]]:
+    for page in pages:
+        yield from page
+
+
+def stream_decisions(client, since: Optional[str] = None, page_size: int = 1000) -> DecisionColumns:
+    """Load gate decisions from decision_log (created_at >= since)."""
+    filters = [
+        ("eq", "decision_type", "router_decision"),
+        ("in_", "decision_point", [f"{gate.lower()}_gate" for gate in DEFAULT_POLICIES]),
+    ]
+    if since:
+        filters.append(("gte", "created_at", since))
+    return decisions_from_rows(_flatten(
+        iter_table_pages(client, "decision_log", DECISION_COLUMNS, filters, page_size)
+    ))
+
+
+def stream_outcomes(
+    client,
+    targets: Optional[Mapping[str, float]] = None,
+    since: Optional[str] = None,
+    page_size: int = 1000,
+) -> OutcomeColumns:
+    """Load completed experiment_outcomes (created_at >= since)."""
+    targets = DEFAULT_SUCCESS_TARGETS if targets is None else targets
+    filters = [
+        ("eq", "status", "completed"),
+        ("in_", "primary_metric", list(targets)),
+    ]
+    if since:
+        filters.append(("gte", "created_at", since))
+    return outcomes_from_rows(
+        _flatten(iter_table_pages(client, "experiment_outcomes", OUTCOME_COLUMNS, filters, page_size)),
+        targets,
+    )
+
+
+def _parquet_rows(path, columns: Iterable[str], batch_size: int = 65536) -> Iterator[dict[str, Any]]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:  # pragma: no cover - depends on environment
+        raise ImportError("Reading Parquet exports requires pyarrow (pip install pyarrow)") from e
+
+    parquet = pq.ParquetFile(path)
+    available = set(parquet.schema_arrow.names)
+    for batch in parquet.iter_batches(batch_size=batch_size, columns=[c for c in columns if c in available]):
+        yield from batch.to_pylist()
+
+
+def load_parquet_decisions(path) -> DecisionColumns:
+    """Load gate decisions from a Parquet export of decision_log."""
+    rows = _parquet_rows(path, DECISION_COLUMNS + ("decision_type",))
+    return decisions_from_rows(r for r in rows if r.get("decision_type", "router_decision") == "router_decision")
+
+
+def load_parquet_outcomes(path, targets: Optional[Mapping[str, float]] = None) -> OutcomeColumns:
+    """Load outcomes from a Parquet export of experiment_outcomes."""
+    rows = _parquet_rows(path, OUTCOME_COLUMNS + ("status",))
+    return outcomes_from_rows((r for r in rows if r.get("status", "completed") == "completed"), targets)
+
+
+# -----------------------------------------------------------------------------
+# Replay and scoring
+# -----------------------------------------------------------------------------
+
+def label_decisions(
+    decisions: DecisionColumns,
+    outcomes: OutcomeColumns,
+    min_success_share: float = 0.5,
+) -> np.ndarray:
+    """
+    Label each decision by the project's outcomes completed after it.
+
+    Returns:
+        int8 array of GOOD / BAD / UNLABELED per decision
+    """
+    n = len(decisions)
+    labels = np.full(n, UNLABELED, dtype=np.int8)
+    if n == 0 or len(outcomes) == 0:
+        return labels
+
+    projects, codes = np.unique(
+        np.concatenate([decisions.project_id, outcomes.project_id]).astype(str), return_inverse=True
+    )
+    d_code, o_code = codes[:n], codes[n:]
+    times, ranks = np.unique(
+        np.concatenate([decisions.created_at, outcomes.completed_at]), return_inverse=True
+    )
+    d_rank, o_rank = ranks[:n], ranks[n:]
+
+    # Outcomes sorted by (project, time); key orders the same way
+    stride = len(times) + 1
+    o_key = o_code.astype(np.int64) * stride + o_rank
+    order = np.argsort(o_key, kind="stable")
+    o_key = o_key[order]
+    wins = np.concatenate([[0], np.cumsum(outcomes.success[order], dtype=np.int64)])
+
+    # Outcomes strictly after the decision, up to the end of the project's block
+    start = np.searchsorted(o_key, d_code.astype(np.int64) * stride + d_rank, side="right")
+    end = np.searchsorted(o_key, (d_code.astype(np.int64) + 1) * stride, side="left")
+    count = end - start
+    won = wins[end] - wins[start]
+
+    labeled = count > 0
+    share = np.divide(won, count, out=np.zeros(n), where=labeled)
+    labels[labeled] = np.where(share[labeled] >= min_success_share, GOOD, BAD)
+    return labels
+
+
+def configs_from_spec(spec: Mapping[str, Mapping[str, Mapping[str, Any]]]) -> dict[str, dict[str, GatePolicy]]:
+    """
+    Build policy configs from overrides of the default policies.
+
+    Args:
+        spec: {config name: {gate: {field: value}}}, e.g.
+            {"fit75": {"DESIRABILITY": {"thresholds": {"fit_score": 75}}}}
+            (thresholds are merged into the defaults, other fields replaced)
+
+    Returns:
+        {config name: {gate: GatePolicy}}
+
+    Raises:
+        ValueError: on an unknown gate
+    """
+    configs = {}
+    for name, gates in spec.items():
+        config = dict(DEFAULT_POLICIES)
+        for gate, overrides in (gates or {}).items():
+            gate_upper = gate.upper()
+            if gate_upper not in DEFAULT_POLICIES:
+                raise ValueError(f"Invalid gate in config '{name}': {gate}")
+            config[gate_upper] = policy_variant(DEFAULT_POLICIES[gate_upper], **overrides)
+        configs[name] = config
+    return configs
+
+
+def replay_decisions(
+    decisions: DecisionColumns,
+    configs: Mapping[str, Mapping[str, GatePolicy]],
+) -> np.ndarray:
+    """
+    Replay every decision under each config.
+
+    Args:
+        decisions: Recorded decisions
+        configs: {config name: {gate: GatePolicy}} (missing gates use defaults)
+
+    Returns:
+        (n_decisions, n_configs) bool, True = gate passes
+    """
+    names = list(configs)
+    passed = np.zeros((len(decisions), len(names)), dtype=bool)
+    for gate in DEFAULT_POLICIES:
+        rows = np.flatnonzero(decisions.gate == gate)
+        if len(rows) == 0:
+            continue
+        policies = [configs[name].get(gate, DEFAULT_POLICIES[gate]) for name in names]
+        result = evaluate_gates_batch(
+            [decisions.evidence[i] for i in rows],
+            policies,
+            [decisions.signal[i] for i in rows],
+        )
+        passed[rows] = result.passed
+    return passed
+
+
+def _cell_counts(recorded: np.ndarray, replayed: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """Counts of the 12 (recorded, replayed, label) cells."""
+    cells = recorded.astype(np.int64) * 6 + replayed.astype(np.int64) * 3 + (labels.astype(np.int64) + 1)
+    return np.bincount(cells, minlength=12)
+
+
+def _metrics(counts: np.ndarray) -> dict[str, np.ndarray]:
+    """Metric values from cell counts (shape (..., 12))."""
+    cube = counts.reshape(counts.shape[:-1] + (2, 2, 3)).astype(np.float64)
+    total = cube.sum(axis=(-3, -2, -1))
+    replay_pass = cube[..., :, 1, :].sum(axis=(-2, -1))
+    diverged = cube[..., 0, 1, :].sum(axis=-1) + cube[..., 1, 0, :].sum(axis=-1)
+    bad = cube[..., :, :, 1 + BAD].sum(axis=(-2, -1))
+    good = cube[..., :, :, 1 + GOOD].sum(axis=(-2, -1))
+    false_pass = cube[..., :, 1, 1 + BAD].sum(axis=-1)
+    false_block = cube[..., :, 0, 1 + GOOD].sum(axis=-1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            "pass_rate": replay_pass / total,
+            "divergence_rate": diverged / total,
+            "false_pass_rate": false_pass / bad,
+            "false_block_rate": false_block / good,
+        }
+
+
+def _round(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 4)
+
+
+def _score(
+    counts: np.ndarray,
+    rng: np.random.Generator,
+    n_bootstrap: int,
+    confidence: float,
+) -> dict[str, Any]:
+    point = _metrics(counts)
+    total = int(counts.sum())
+    scores: dict[str, Any] = {
+        "decisions": total,
+        "good": int(counts[1 + GOOD::3].sum()),
+        "bad": int(counts[1 + BAD::3].sum()),
+    }
+    if total and n_bootstrap:
+        samples = _metrics(rng.multinomial(total, counts / total, size=n_bootstrap))
+    else:
+        samples = None
+
+    tail = (1 - confidence) / 2 * 100
+    for name in METRICS:
+        entry = {"value": _round(point[name])}
+        if samples is not None:
+            values = samples[name][~np.isnan(samples[name])]
+            if len(values):
+                low, high = np.percentile(values, [tail, 100 - tail])
+                entry["ci"] = [_round(low), _round(high)]
+        scores[name] = entry
+    return scores
+
+
+def backtest_policies(
+    decisions: DecisionColumns,
+    outcomes: OutcomeColumns,
+    configs: Mapping[str, Mapping[str, GatePolicy]],
+    n_bootstrap: int = 1000,
+    confidence: float = 0.95,
+    min_success_share: float = 0.5,
+    seed: Optional[int] = 0,
+) -> dict[str, Any]:
+    """
+    Replay recorded gate decisions under alternative policy configs.
+
+    Args:
+        decisions: Recorded gate decisions (stream_decisions / load_parquet_decisions)
+        outcomes: Experiment outcomes (stream_outcomes / load_parquet_outcomes)
+        configs: {config name: {gate: GatePolicy}} to compare
+        n_bootstrap: Bootstrap resamples for confidence intervals (0 disables)
+        confidence: Confidence level of the intervals
+        min_success_share: Share of later outcomes that must succeed for a
+            decision to count as good
+        seed: Bootstrap RNG seed (None for a random seed)
+
+    Returns:
+        Report dict: counts, and per config (plus "recorded") the metrics
+        overall and by gate, each {"value": float, "ci": [low, high]}
+    """
+    rng = np.random.default_rng(seed)
+    labels = label_decisions(decisions, outcomes, min_success_share)
+    replayed = replay_decisions(decisions, configs)
+    recorded = decisions.recorded_pass
+
+    columns = {RECORDED: recorded}
+    columns.update({name: replayed[:, j] for j, name in enumerate(configs)})
+
+    gates = [gate for gate in DEFAULT_POLICIES if (decisions.gate == gate).any()]
+    results: dict[str, Any] = {}
+    for name, column in columns.items():
+        by_gate = {}
+        for gate in gates:
+            rows = decisions.gate == gate
+            by_gate[gate] = _score(
+                _cell_counts(recorded[rows], column[rows], labels[rows]), rng, n_bootstrap, confidence
+            )
+        results[name] = {
+            "overall": _score(_cell_counts(recorded, column, labels), rng, n_bootstrap, confidence),
+            "by_gate": by_gate,
+        }
+
+    return {
+        "decisions": len(decisions),
+        "labeled_decisions": int((labels != UNLABELED).sum()),
+        "outcomes": len(outcomes),
+        "bootstrap": {"resamples": n_bootstrap, "confidence": confidence, "seed": seed},
+        "min_success_share": min_success_share,
+        "policies": results,
+    }
@@ -0,0 +1,728 @@
+"""
+Record/replay cassettes for offline, deterministic validation runs.
+
+While recording, every LLM completion, direct OpenAI SDK completion, CrewAI
+tool invocation and Supabase query made by a phase is captured - request key,
+response and latency - into a cassette file, one per phase invocation. A
+replay feeds those responses back in the same order, so all five phases
+re-run offline in seconds with no API keys or network (sockets are blocked
+during replay). Sleeps are time-compressed.
+
+Replays measure orchestrator overhead apart from model latency: each phase
+reports its replay wall time next to the recorded wall time and the recorded
+time spent waiting on LLMs, tools and Supabase.
+
+Interactions are matched on a content key per kind (the same SHA-256 as the
+LLM cache for completions). Concurrent crews can interleave calls, so a key
+miss falls back to the next unplayed interaction of the same kind and name
+unless the cassette is strict.
+
+Usage:
+    # Record (Modal): set CASSETTE_MODE=record; each phase writes
+    # /cassettes/{run_id}/{started}_phase_{n}.json to the startupai-cassettes volume
+    modal volume get startupai-cassettes <run_id> cassettes/
+
+    # Replay locally
+    python scripts/replay_run.py cassettes/<run_id>
+
+Configuration:
+    CASSETTE_MODE: off | record (default: off)
+"""
+
+import asyncio
+import base64
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from src.shared.llm_cache import _decode_result, _encode_result, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+DEFAULT_TIME_COMPRESSION = 1000.0
+
+# Interaction kinds
+LLM = "llm"
+CHAT = "chat"
+TOOL = "tool"
+SUPABASE = "supabase"
+PHASE = "phase"
+
+IO_KINDS = (LLM, CHAT, TOOL, SUPABASE)
+
+
+class CassetteMissError(LookupError):
+    """A replayed call has no recorded interaction (or the network was used)."""
+
+
+def recording_enabled() -> bool:
+    """Check whether phases should record cassettes (CASSETTE_MODE=record)."""
+    return os.environ.get("CASSETTE_MODE", "off").strip().lower() == "record"
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _to_json(value: Any) -> Any:
+    """Round-trip through JSON so recorded values match what a replay returns."""
+    return json.loads(json.dumps(value, default=str))
+
+
+# -----------------------------------------------------------------------------
+# Cassette
+# -----------------------------------------------------------------------------
+
+class Cassette:
+    """
+    Recorded interactions for one phase invocation.
+
+    Args:
+        mode: "record" or "replay"
+        interactions: Recorded interactions (replay)
+        metadata: Run/phase details stored with the cassette
+        strict: Replay only on exact key matches (no in-order fallback)
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        interactions: Optional[list[dict]] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        strict: bool = False,
+    ):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.mode = mode
+        self.metadata = metadata or {}
+        self.strict = strict
+        self.misses: list[dict] = []
+        self.played = 0
+        self._interactions: list[dict] = list(interactions or [])
+        self._lock = threading.Lock()
+
+        # Replay queues: exact (kind, name, key) and in-order (kind, name)
+        self._by_key: dict[tuple, deque] = defaultdict(deque)
+        self._by_name: dict[tuple, deque] = defaultdict(deque)
+        self._used: set[int] = set()
+        for index, interaction in enumerate(self._interactions):
+            kind, name = interaction["kind"], interaction.get("name")
+            self._by_key[(kind, name, interaction["key"])].append(index)
+            self._by_name[(kind, name)].append(index)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @classmethod
+    def load(cls, path: Path, strict: bool = False) -> "Cassette":
+        """Load a recorded cassette for replay."""
+        data = json.loads(Path(path).read_text())
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {data.get('version')}")
+        return cls("replay", data["interactions"], data.get("metadata"), strict=strict)
+
+    def save(self, path: Path) -> Path:
+        """Write the cassette as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {
+                "version": CASSETTE_VERSION,
+                "metadata": self.metadata,
+                "interactions": self._interactions,
+            }
+        path.write_text(json.dumps(data, default=str))
+        return path
+
+    def interactions(self, kind: Optional[str] = None) -> list[dict]:
+        """Recorded interactions, optionally of one kind, in record order."""
+        return [i for i in self._interactions if kind is None or i["kind"] == kind]
+
+    def record(
+        self,
+        kind: str,
+        name: Optional[str],
+        key: str,
+        response: Any,
+        duration_ms: float,
+        request: Any = None,
+    ) -> None:
+        """Append an interaction (record mode)."""
+        interaction = {
+            "kind": kind,
+            "name": name,
+            "key": key,
+            "request": request,
+            "response": _to_json(response),
+            "duration_ms": round(duration_ms, 2),
+        }
+        with self._lock:
+            self._interactions.append(interaction)
+
+    def has(self, kind: str, name: Optional[str], key: str) -> bool:
+        """Check for an unplayed exact match without consuming it."""
+        with self._lock:
+            return any(i not in self._used for i in self._by_key.get((kind, name, key), ()))
+
+    def play(self, kind: str, name: Optional[str], key: str, required: bool = True) -> dict:
+        """
+        Consume the recorded interaction for a call (replay mode).
+
+        Args:
+            required: Count a failed lookup as a miss (False for optional calls)
+
+        Raises:
+            CassetteMissError: No unplayed interaction matches
+        """
+        with self._lock:
+            index = self._next(self._by_key.get((kind, name, key)))
+            if index is None and not self.strict:
+                index = self._next(self._by_name.get((kind, name)))
+                if index is not None:
+                    self.misses.append({"kind": kind, "name": name, "key": key, "fallback": True})
+            if index is None:
+                if required:
+                    self.misses.append({"kind": kind, "name": name, "key": key, "fallback": False})
+                raise CassetteMissError(f"No recorded {kind} interaction for {name} ({key[:12]})")
+            self._used.add(index)
+            self.played += 1
+            return self._interactions[index]
+
+    def _next(self, queue: Optional[deque]) -> Optional[int]:
+        while queue:
+            index = queue.popleft()
+            if index not in self._used:
+                return index
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        """Interaction counts and recorded latency per kind."""
+        counts: dict[str, int] = defaultdict(int)
+        recorded_ms: dict[str, float] = defaultdict(float)
+        for interaction in self._interactions:
+            counts[interaction["kind"]] += 1
+            recorded_ms[interaction["kind"]] += interaction.get("duration_ms") or 0.0
+        return {
+            "counts": dict(counts),
+            "recorded_ms": {kind: round(ms, 1) for kind, ms in recorded_ms.items()},
+            "played": self.played,
+            "fallbacks": sum(1 for miss in self.misses if miss["fallback"]),
+            "misses": sum(1 for miss in self.misses if not miss["fallback"]),
+        }
+
+
+# -----------------------------------------------------------------------------
+# Active cassette
+# -----------------------------------------------------------------------------
+
+_cassette: Optional[Cassette] = None
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """The cassette in use by this process (None outside record/replay)."""
+    return _cassette
+
+
+@contextlib.contextmanager
+def use_cassette(
+    cassette: Cassette,
+    time_compression: float = DEFAULT_TIME_COMPRESSION,
+    block_network: bool = True,
+) -> Iterator[Cassette]:
+    """
+    Route LLM, tool and Supabase calls through a cassette.
+
+    Replays also compress time.sleep/asyncio.sleep by time_compression
+    (inf skips sleeps) and, with block_network, fail any socket connect.
+    """
+    global _cassette
+    from src.state import persistence
+
+    with _cassette_lock:
+        if _cassette is not None:
+            raise RuntimeError("A cassette is already in use")
+        _cassette = cassette
+
+    _install_tool_hooks()
+    previous_client = persistence._supabase_client
+    restore: list[Callable[[], None]] = []
+
+    try:
+        if cassette.replaying:
+            persistence._supabase_client = ReplaySupabase(cassette)
+            restore.append(_compress_sleeps(time_compression))
+            if block_network:
+                restore.append(_block_network())
+        else:
+            client = previous_client or persistence.get_supabase
+            persistence._supabase_client = RecordingSupabase(client, cassette)
+
+        yield cassette
+
+    finally:
+        for undo in reversed(restore):
+            undo()
+        persistence._supabase_client = previous_client
+        with _cassette_lock:
+            _cassette = None
+
+
+def _compress_sleeps(factor: float) -> Callable[[], None]:
+    real_sleep, real_async_sleep = time.sleep, asyncio.sleep
+
+    def sleep(seconds: float) -> None:
+        if factor != float("inf") and seconds > 0:
+            real_sleep(seconds / factor)
+
+    async def async_sleep(seconds: float, result: Any = None) -> Any:
+        return await real_async_sleep(0 if factor == float("inf") else seconds / factor, result)
+
+    time.sleep, asyncio.sleep = sleep, async_sleep
+
+    def undo() -> None:
+        time.sleep, asyncio.sleep = real_sleep, real_async_sleep
+
+    return undo
+
+
+def _block_network() -> Callable[[], None]:
+    real_connect = socket.socket.connect
+
+    def connect(sock, address):
+        if sock.family == getattr(socket, "AF_UNIX", None):
+            return real_connect(sock, address)
+        raise CassetteMissError(f"Network access during replay: {address}")
+
+    socket.socket.connect = connect
+
+    def undo() -> None:
+        socket.socket.connect = real_connect
+
+    return undo
+
+
+def offline_environment() -> None:
+    """Placeholder credentials and telemetry opt-outs so clients build offline."""
+    for name in ("OPENAI_API_KEY", "TAVILY_API_KEY", "SUPABASE_KEY"):
+        os.environ.setdefault(name, "replay-offline")
+    os.environ.setdefault("SUPABASE_URL", "http://replay.invalid")
+    os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+    os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+    os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+    os.environ.setdefault("CREW_RESULT_MEMO", "0")
+
+
+# -----------------------------------------------------------------------------
+# LLM and OpenAI SDK hooks
+# -----------------------------------------------------------------------------
+
+def wrap_llm_for_cassette(llm: Any) -> Any:
+    """
+    Record/replay an LLM instance's call() when a cassette is in use.
+
+    Applied outermost (over the completion cache) by cached_llm, so replays
+    never reach the cache or the provider.
+    """
+    original_call = llm.call
+
+    def call(messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        cassette = get_cassette()
+        passthrough = dict(
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model,
+        )
+        if cassette is None:
+            return original_call(messages, **passthrough)
+
+        key = make_cache_key(
+            model=llm.model,
+            temperature=llm.temperature,
+            messages=messages,
+            tools=tools,
+            response_format=response_model or getattr(llm, "response_format", None),
+        )
+
+        if cassette.replaying:
+            stored = cassette.play(LLM, llm.model, key)["response"]
+            if stored is None:
+                raise CassetteMissError(f"Recorded {llm.model} result could not be stored")
+            return _decode_result(stored, response_model)
+
+        started = time.perf_counter()
+        result = original_call(messages, **passthrough)
+        cassette.record(LLM, llm.model, key, _encode_result(result),
+                        (time.perf_counter() - started) * 1000)
+        return result
+
+    llm.call = call
+    return llm
+
+
+def _chat_key(kwargs: dict) -> str:
+    return make_cache_key(
+        model=kwargs.get("model"),
+        temperature=kwargs.get("temperature"),
+        messages=kwargs.get("messages"),
+        tools=kwargs.get("tools"),
+        response_format=kwargs.get("response_format"),
+    )
+
+
+def play_chat_completion(kwargs: dict) -> tuple[bool, Any]:
+    """Replayed content for an OpenAI SDK completion: (replayed, content)."""
+    cassette = get_cassette()
+    if cassette is None or not cassette.replaying:
+        return False, None
+    return True, cassette.play(CHAT, kwargs.get("model"), _chat_key(kwargs))["response"]
+
+
+def record_chat_completion(kwargs: dict, content: Any, duration_ms: float) -> None:
+    """Record an OpenAI SDK completion's content while recording."""
+    cassette = get_cassette()
+    if cassette is not None and not cassette.replaying:
+        cassette.record(CHAT, kwargs.get("model"), _chat_key(kwargs), content, duration_ms)
+
+
+# -----------------------------------------------------------------------------
+# Tool hooks
+# -----------------------------------------------------------------------------
+
+_tool_hooks_installed = False
+_tool_context = threading.local()
+
+
+def _tool_call(name: str, arguments: Any, run: Callable[[], Any]) -> Any:
+    cassette = get_cassette()
+    # Tools call each other (and BaseTool.run backs CrewStructuredTool.invoke):
+    # only the outermost call is an interaction.
+    if cassette is None or getattr(_tool_context, "active", False):
+        return run()
+
+    key = _digest({"tool": name, "arguments": arguments})
+    if cassette.replaying:
+        return cassette.play(TOOL, name, key)["response"]
+
+    _tool_context.active = True
+    started = time.perf_counter()
+    try:
+        result = run()
+    finally:
+        _tool_context.active = False
+    cassette.record(TOOL, name, key, result, (time.perf_counter() - started) * 1000,
+                    request=_to_json(arguments))
+    return result
+
+
+def _install_tool_hooks() -> None:
+    """Patch CrewAI's tool entry points once; the hooks pass through with no cassette."""
+    global _tool_hooks_installed
+    if _tool_hooks_installed:
+        return
+
+    try:
+        from crewai.tools import BaseTool
+        from crewai.tools.structured_tool import CrewStructuredTool
+    except ImportError:
+        return
+
+    base_run = BaseTool.run
+    structured_invoke = CrewStructuredTool.invoke
+
+    def run(self, *args, **kwargs):
+        return _tool_call(self.name, {"args": args, "kwargs": kwargs},
+                          lambda: base_run(self, *args, **kwargs))
+
+    def invoke(self, input, config=None, **kwargs):
+        return _tool_call(self.name, {"input": input},
+                          lambda: structured_invoke(self, input, config, **kwargs))
+
+    BaseTool.run = run
+    CrewStructuredTool.invoke = invoke
+    _tool_hooks_installed = True
+
+
+# -----------------------------------------------------------------------------
+# Supabase hooks
+# -----------------------------------------------------------------------------
+
+class _Response:
+    """Stand-in for postgrest's APIResponse (data/count)."""
+
+    def __init__(self, data: Any = None, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+def _describe(path: list) -> str:
+    parts = []
+    for name, args, _ in path:
+        label = next((a for a in args if isinstance(a, str)), None)
+        parts.append(f"{name}({label})" if label and name in ("table", "rpc", "from_") else name)
+    return ".".join(parts)
+
+
+def _encode_terminal(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray)):
+        return {"bytes": base64.b64encode(bytes(value)).decode("ascii")}
+    return {"value": value}
+
+
+def _decode_terminal(stored: dict) -> Any:
+    if "bytes" in stored:
+        return base64.b64decode(stored["bytes"])
+    return stored.get("value")
+
+
+class RecordingSupabase:
+    """
+    Supabase client proxy that records every query result.
+
+    target may be a zero-argument factory so the real client is only
+    created if the phase actually queries Supabase.
+    """
+
+    def __init__(self, target: Any, cassette: Cassette, path: Optional[list] = None):
+        self._target = target
+        self._cassette = cassette
+        self._path = path or []
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if not self._path and callable(self._target) and not hasattr(self._target, "table"):
+            self._target = self._target()
+        value = getattr(self._target, name)
+        if not callable(value):
+            return RecordingSupabase(value, self._cassette, self._path + [(name, (), {})])
+
+        def call(*args, **kwargs):
+            path = self._path + [(name, args, kwargs)]
+            started = time.perf_counter()
+            result = value(*args, **kwargs)
+            duration_ms = (time.perf_counter() - started) * 1000
+
+            if name == "execute":
+                self._cassette.record(
+                    SUPABASE, _describe(path), _digest(path),
+                    {"data": result.data, "count": getattr(result, "count", None)},
+                    duration_ms,
+                )
+                return result
+            if result is None or isinstance(result, (bytes, bytearray, str, int, float, bool, dict, list)):
+                # Terminal calls outside postgrest (e.g. storage upload/download)
+                self._cassette.record(SUPABASE, _describe(path), _digest(path),
+                                      _encode_terminal(result), duration_ms)
+                return result
+            return RecordingSupabase(result, self._cassette, path)
+
+        return call
+
+
+class ReplaySupabase:
+    """
+    Offline Supabase client that answers queries from a cassette.
+
+    Attribute access and calls both extend the query path, so chains like
+    client.table(...).select(...).execute() and client.storage.from_(...)
+    produce the same path as when they were recorded.
+    """
+
+    def __init__(self, cassette: Cassette, path: Optional[list] = None):
+        self._cassette = cassette
+        self._path = path or []
+
+    def __getattr__(self, name: str) -> "ReplaySupabase":
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return ReplaySupabase(self._cassette, self._path + [(name, (), {})])
+
+    def __call__(self, *args, **kwargs) -> Any:
+        name = self._path[-1][0]
+        path = self._path[:-1] + [(name, args, kwargs)]
+        described, key = _describe(path), _digest(path)
+
+        if name == "execute":
+            try:
+                stored = self._cassette.play(SUPABASE, described, key, required=False)["response"]
+                return _Response(stored.get("data"), stored.get("count"))
+            except CassetteMissError:
+                # Unrecorded query (e.g. a write that did not happen live): succeed empty
+                single = any(step[0] in ("single", "maybe_single") for step in path)
+                return _Response(None if single else [])
+        if self._cassette.has(SUPABASE, described, key):
+            return _decode_terminal(self._cassette.play(SUPABASE, described, key)["response"])
+        return ReplaySupabase(self._cassette, path)
+
+
+# -----------------------------------------------------------------------------
+# Phase record / replay
+# -----------------------------------------------------------------------------
+
+def cassette_path(directory: Path, run_id: str, phase_num: int) -> Path:
+    """Cassette file for one phase invocation (sorted by start time)."""
+    started = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    return Path(directory) / run_id / f"{started}_phase_{phase_num}.json"
+
+
+def record_phase(
+    run_id: str,
+    phase_num: int,
+    phase_state: dict,
+    execute: Callable[[str, dict], dict],
+    directory: Path,
+) -> dict:
+    """
+    Run a phase while recording its cassette, then save it under directory.
+
+    The cassette is saved even if the phase fails, so the failure replays.
+    """
+    from src.state.progress_sink import flush_progress
+
+    cassette = Cassette("record", metadata={
+        "run_id": run_id,
+        "phase": phase_num,
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+    })
+    path = cassette_path(directory, run_id, phase_num)
+    started = time.perf_counter()
+    result = None
+
+    try:
+        with use_cassette(cassette):
+            try:
+                result = execute(run_id, phase_state)
+            finally:
+                flush_progress()
+        return result
+    finally:
+        cassette.record(
+            PHASE, f"phase_{phase_num}", _digest(phase_state), result,
+            (time.perf_counter() - started) * 1000,
+            request={"run_id": run_id, "phase": phase_num, "state": _to_json(phase_state)},
+        )
+        try:
+            cassette.save(path)
+            logger.info(json.dumps({
+                "event": "cassette_recorded",
+                "run_id": run_id,
+                "phase": phase_num,
+                "path": str(path),
+                **cassette.stats(),
+            }))
+        except Exception as e:
+            logger.warning(json.dumps({
+                "event": "cassette_save_failed",
+                "run_id": run_id,
+                "phase": phase_num,
+                "error": str(e),
+            }))
+
+
+def _phase_executor(phase_num: int) -> Callable[[str, dict], dict]:
+    from src.modal_app import phases
+    return getattr(phases, f"phase_{phase_num}").execute
+
+
+def replay_phase(
+    cassette: Cassette,
+    time_compression: float = DEFAULT_TIME_COMPRESSION,
+    execute: Optional[Callable[[str, dict], dict]] = None,
+) -> dict[str, Any]:
+    """
+    Re-run one recorded phase offline and compare it with the recording.
+
+    Returns:
+        Report: phase, matched, replay_ms, recorded_ms, recorded_io_ms
+        (time the recording spent waiting on LLMs, tools and Supabase),
+        counts, fallbacks, misses, error
+    """
+    from src.state.progress_sink import flush_progress
+
+    phases = cassette.interactions(PHASE)
+    if not phases:
+        raise ValueError("Cassette has no recorded phase")
+    recorded = phases[0]
+    request = recorded["request"]
+    phase_num = request["phase"]
+    execute = execute or _phase_executor(phase_num)
+
+    result, error = None, None
+    started = time.perf_counter()
+    with use_cassette(cassette, time_compression=time_compression):
+        try:
+            result = execute(request["run_id"], request["state"])
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            flush_progress()
+    replay_ms = (time.perf_counter() - started) * 1000
+
+    stats = cassette.stats()
+    recorded_io_ms = sum(stats["recorded_ms"].get(kind, 0.0) for kind in IO_KINDS)
+    return {
+        "phase": phase_num,
+        "run_id": request["run_id"],
+        "matched": error is None and _to_json(result) == recorded["response"],
+        "replay_ms": round(replay_ms, 1),
+        "recorded_ms": recorded["duration_ms"],
+        "recorded_io_ms": round(recorded_io_ms, 1),
+        "counts": stats["counts"],
+        "fallbacks": stats["fallbacks"],
+        "misses": stats["misses"],
+        "error": error,
+    }
+
+
+def replay_run(
+    paths: list[Path],
+    time_compression: float = DEFAULT_TIME_COMPRESSION,
+    strict: bool = False,
+) -> dict[str, Any]:
+    """
+    Replay a recorded run: every phase cassette under paths, in start order.
+
+    Args:
+        paths: Cassette files and/or directories of cassettes
+        time_compression: Sleep divisor during replay (inf skips sleeps)
+        strict: Fail on any key mismatch instead of replaying in order
+
+    Returns:
+        {"phases": [per-phase report], "replay_ms", "recorded_ms", "matched"}
+    """
+    offline_environment()
+
+    files: list[Path] = []
+    for path in map(Path, paths):
+        files.extend(sorted(path.rglob("*.json")) if path.is_dir() else [path])
+
+    reports = []
+    for file in sorted(files, key=lambda f: f.name):
+        report = replay_phase(Cassette.load(file, strict=strict), time_compression)
+        report["cassette"] = str(file)
+        reports.append(report)
+
+    return {
+        "phases": reports,
+        "replay_ms": round(sum(r["replay_ms"] for r in reports), 1),
+        "recorded_ms": round(sum(r["recorded_ms"] for r in reports), 1),
+        "matched": all(r["matched"] for r in reports),
+    }
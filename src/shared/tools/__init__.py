@@ -4,7 +4,7 @@ StartupAI Shared Tools.
 Tools available to agents across all crews in the validation engine.
 
 Tool Categories:
-- Research: TavilySearchTool, CustomerResearchTool
+- Research: TavilySearchTool, BatchSearchTool, CustomerResearchTool
 - Customer Research: ForumSearchTool, ReviewAnalysisTool, SocialListeningTool, TrendAnalysisTool
 - Advanced Analysis: TranscriptionTool, InsightExtractorTool, BehaviorPatternTool, ABTestTool
 - Analytics & Privacy: AnalyticsTool, AnonymizerTool, AdPlatformTool, CalendarTool
@@ -12,7 +12,7 @@ Tool Categories:
 - Governance: MethodologyCheckTool
 
 Usage:
-    from shared.tools import TavilySearchTool, ForumSearchTool, MethodologyCheckTool
+    from src.shared.tools import TavilySearchTool, ForumSearchTool, MethodologyCheckTool
 
     @agent
     def research_agent(self) -> Agent:
@@ -23,15 +23,18 @@ Usage:
         )
 """
 
-from shared.tools.web_search import (
+from src.shared.tools.web_search import (
     TavilySearchTool,
+    BatchSearchTool,
     CustomerResearchTool,
     web_search,
+    batch_web_search,
     research_customers,
     SearchResult,
     WebSearchOutput,
+    BatchSearchOutput,
 )
-from shared.tools.customer_research import (
+from src.shared.tools.customer_research import (
     ForumSearchTool,
     ReviewAnalysisTool,
     SocialListeningTool,
@@ -45,7 +48,7 @@ from shared.tools.customer_research import (
     SocialListeningOutput,
     TrendAnalysisOutput,
 )
-from shared.tools.methodology_check import (
+from src.shared.tools.methodology_check import (
     MethodologyCheckTool,
     check_vpc,
     MethodologyCheckResult,
@@ -53,7 +56,7 @@ from shared.tools.methodology_check import (
     CheckSeverity,
     MethodologyType,
 )
-from shared.tools.advanced_analysis import (
+from src.shared.tools.advanced_analysis import (
     TranscriptionTool,
     InsightExtractorTool,
     BehaviorPatternTool,
@@ -67,7 +70,7 @@ from shared.tools.advanced_analysis import (
     BehaviorPatternOutput,
     ABTestResult,
 )
-from shared.tools.analytics_privacy import (
+from src.shared.tools.analytics_privacy import (
     AnalyticsTool,
     AnonymizerTool,
     AdPlatformTool,
@@ -81,7 +84,7 @@ from shared.tools.analytics_privacy import (
     AdPlatformOutput,
     CalendarOutput,
 )
-from shared.tools.llm_tools import (
+from src.shared.tools.llm_tools import (
     CanvasBuilderTool,
     TestCardTool,
     LearningCardTool,
@@ -99,7 +102,7 @@ from shared.tools.llm_tools import (
     EvidenceType,
     SignalStrength,
 )
-from shared.tools.landing_page_deploy import (
+from src.shared.tools.landing_page_deploy import (
     LandingPageDeploymentTool,
     deploy_landing_page,
     DeploymentResult,
@@ -109,11 +112,14 @@ from shared.tools.landing_page_deploy import (
 __all__ = [
     # Web Search Tools
     "TavilySearchTool",
+    "BatchSearchTool",
     "CustomerResearchTool",
     "web_search",
+    "batch_web_search",
     "research_customers",
     "SearchResult",
     "WebSearchOutput",
+    "BatchSearchOutput",
     # Customer Research Tools (Phase A)
     "ForumSearchTool",
     "ReviewAnalysisTool",
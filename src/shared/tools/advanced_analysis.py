@@ -10,6 +10,7 @@ Provides:
 Target agents: D1, D2, D3, D4, P1, P2, W1
 """
 
+import asyncio
 import os
 import json
 import math
@@ -19,6 +20,14 @@ from datetime import datetime
 from crewai.tools import BaseTool
 from pydantic import Field, BaseModel
 
+from src.shared.llm_cache import acached_chat_completion, cached_chat_completion
+from src.shared.tools.http_clients import (
+    get_async_http_client,
+    get_async_openai_client,
+    get_openai_client,
+    run_async,
+)
+
 
 # =======================================================================================
 # OUTPUT MODELS
@@ -134,17 +143,12 @@ class TranscriptionTool(BaseTool):
     model: str = Field(default="whisper-1", description="OpenAI Whisper model to use")
 
     def _get_openai_client(self):
-        """Get OpenAI client for Whisper API."""
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable not set")
-
-        try:
-            from openai import OpenAI
+        """Get the shared OpenAI client for Whisper API."""
+        return get_openai_client()
 
-            return OpenAI(api_key=api_key)
-        except ImportError:
-            raise ImportError("openai package not installed. Run: pip install openai")
+    def _get_async_openai_client(self):
+        """Get the shared AsyncOpenAI client (IO loop only)."""
+        return get_async_openai_client()
 
     def _run(self, input_source: str) -> str:
         """
@@ -190,6 +194,30 @@ class TranscriptionTool(BaseTool):
                 response_format="verbose_json",
             )
 
+        return self._format_transcription(response)
+
+    async def _atranscribe_audio(self, filename: str, audio: bytes) -> str:
+        """Transcribe audio bytes using the async Whisper API (IO loop only)."""
+        client = self._get_async_openai_client()
+
+        response = await client.audio.transcriptions.create(
+            model=self.model,
+            file=(filename, audio),
+            response_format="verbose_json",
+        )
+
+        return self._format_transcription(response)
+
+    async def _atranscribe_url(self, url: str) -> str:
+        """Download audio over the pooled HTTP client and transcribe it (IO loop only)."""
+        response = await get_async_http_client().get(url, follow_redirects=True)
+        response.raise_for_status()
+
+        filename = os.path.basename(url.split("?", 1)[0]) or "audio.mp3"
+        return await self._atranscribe_audio(filename, response.content)
+
+    def _format_transcription(self, response: Any) -> str:
+        """Format a Whisper API response."""
         output = TranscriptionOutput(
             source_type="audio_file",
             transcript=response.text,
@@ -250,8 +278,29 @@ class TranscriptionTool(BaseTool):
         return "\n".join(lines)
 
     async def _arun(self, input_source: str) -> str:
-        """Async version - delegates to sync."""
-        return self._run(input_source)
+        """Async version - transcribes over the shared async clients."""
+        try:
+            if "\n" in input_source or len(input_source) > 500:
+                return self._format_text_input(input_source)
+
+            if os.path.isfile(input_source):
+                with open(input_source, "rb") as audio_file:
+                    audio = await asyncio.to_thread(audio_file.read)
+                return await run_async(
+                    self._atranscribe_audio(os.path.basename(input_source), audio)
+                )
+
+            if input_source.startswith(("http://", "https://")):
+                return await run_async(self._atranscribe_url(input_source))
+
+            return self._format_text_input(input_source)
+
+        except ValueError as e:
+            return f"Configuration error: {str(e)}"
+        except ImportError as e:
+            return f"Dependency error: {str(e)}"
+        except Exception as e:
+            return f"Transcription failed: {str(e)}"
 
 
 # =======================================================================================
@@ -289,17 +338,12 @@ class InsightExtractorTool(BaseTool):
     )
 
     def _get_openai_client(self):
-        """Get OpenAI client."""
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable not set")
+        """Get the shared OpenAI client."""
+        return get_openai_client()
 
-        try:
-            from openai import OpenAI
-
-            return OpenAI(api_key=api_key)
-        except ImportError:
-            raise ImportError("openai package not installed. Run: pip install openai")
+    def _get_async_openai_client(self):
+        """Get the shared AsyncOpenAI client (IO loop only)."""
+        return get_async_openai_client()
 
     def _run(self, text: str) -> str:
         """
@@ -313,8 +357,40 @@ class InsightExtractorTool(BaseTool):
         """
         try:
             client = self._get_openai_client()
+            content = cached_chat_completion(client, **self._completion_kwargs(text))
+            return self._build_output(text, content)
+
+        except ValueError as e:
+            return f"Configuration error: {str(e)}"
+        except ImportError as e:
+            return f"Dependency error: {str(e)}"
+        except json.JSONDecodeError as e:
+            return f"Failed to parse LLM response: {str(e)}"
+        except Exception as e:
+            return f"Insight extraction failed: {str(e)}"
+
+    async def _arun(self, text: str) -> str:
+        """Async version - calls the LLM over the shared AsyncOpenAI client."""
+        try:
+            content = await run_async(self._acomplete(text))
+            return self._build_output(text, content)
+
+        except ValueError as e:
+            return f"Configuration error: {str(e)}"
+        except ImportError as e:
+            return f"Dependency error: {str(e)}"
+        except json.JSONDecodeError as e:
+            return f"Failed to parse LLM response: {str(e)}"
+        except Exception as e:
+            return f"Insight extraction failed: {str(e)}"
+
+    async def _acomplete(self, text: str) -> str:
+        client = self._get_async_openai_client()
+        return await acached_chat_completion(client, **self._completion_kwargs(text))
 
-            prompt = f"""Analyze the following text and extract structured insights.
+    def _completion_kwargs(self, text: str) -> Dict[str, Any]:
+        """Build the chat completion request for insight extraction."""
+        prompt = f"""Analyze the following text and extract structured insights.
 
 TEXT TO ANALYZE:
 {text[:8000]}  # Limit to avoid token limits
@@ -335,40 +411,33 @@ Format your response as JSON:
     "behavioral_insights": ["behavior1", "behavior2", ...]
 }}"""
 
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert qualitative researcher skilled at extracting insights from customer interviews. Respond only with valid JSON.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"},
-            )
-
-            result = json.loads(response.choices[0].message.content)
-
-            output = InsightExtractionOutput(
-                source_text_preview=text[:200] + "..." if len(text) > 200 else text,
-                insights=[],
-                key_themes=result.get("key_themes", []),
-                pain_points=result.get("pain_points", []),
-                opportunities=result.get("opportunities", []),
-                notable_quotes=result.get("notable_quotes", []),
-            )
+        return dict(
+            model=self.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are an expert qualitative researcher skilled at extracting insights from customer interviews. Respond only with valid JSON.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.3,
+            response_format={"type": "json_object"},
+        )
 
-            return self._format_output(output)
+    def _build_output(self, text: str, content: str) -> str:
+        """Parse the LLM JSON response into formatted insights."""
+        result = json.loads(content)
+
+        output = InsightExtractionOutput(
+            source_text_preview=text[:200] + "..." if len(text) > 200 else text,
+            insights=[],
+            key_themes=result.get("key_themes", []),
+            pain_points=result.get("pain_points", []),
+            opportunities=result.get("opportunities", []),
+            notable_quotes=result.get("notable_quotes", []),
+        )
 
-        except ValueError as e:
-            return f"Configuration error: {str(e)}"
-        except ImportError as e:
-            return f"Dependency error: {str(e)}"
-        except json.JSONDecodeError as e:
-            return f"Failed to parse LLM response: {str(e)}"
-        except Exception as e:
-            return f"Insight extraction failed: {str(e)}"
+        return self._format_output(output)
 
     def _format_output(self, output: InsightExtractionOutput) -> str:
         """Format insights for agent consumption."""
@@ -407,10 +476,6 @@ Format your response as JSON:
 
         return "\n".join(lines)
 
-    async def _arun(self, text: str) -> str:
-        """Async version - delegates to sync."""
-        return self._run(text)
-
 
 # =======================================================================================
 # BEHAVIOR PATTERN TOOL
@@ -447,17 +512,12 @@ class BehaviorPatternTool(BaseTool):
     )
 
     def _get_openai_client(self):
-        """Get OpenAI client."""
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable not set")
-
-        try:
-            from openai import OpenAI
+        """Get the shared OpenAI client."""
+        return get_openai_client()
 
-            return OpenAI(api_key=api_key)
-        except ImportError:
-            raise ImportError("openai package not installed. Run: pip install openai")
+    def _get_async_openai_client(self):
+        """Get the shared AsyncOpenAI client (IO loop only)."""
+        return get_async_openai_client()
 
     def _run(self, evidence_text: str, topic: Optional[str] = None) -> str:
         """
@@ -472,16 +532,57 @@ class BehaviorPatternTool(BaseTool):
         """
         try:
             client = self._get_openai_client()
+            evidence_text, topic = self._split_topic(evidence_text, topic)
+
+            content = cached_chat_completion(
+                client, **self._completion_kwargs(evidence_text, topic)
+            )
+            return self._build_output(topic, content)
+
+        except ValueError as e:
+            return f"Configuration error: {str(e)}"
+        except ImportError as e:
+            return f"Dependency error: {str(e)}"
+        except json.JSONDecodeError as e:
+            return f"Failed to parse LLM response: {str(e)}"
+        except Exception as e:
+            return f"Pattern identification failed: {str(e)}"
+
+    async def _arun(self, evidence_text: str, topic: Optional[str] = None) -> str:
+        """Async version - calls the LLM over the shared AsyncOpenAI client."""
+        try:
+            evidence_text, topic = self._split_topic(evidence_text, topic)
 
-            # Handle case where topic is passed as part of evidence_text
-            if topic is None and "|" in evidence_text:
-                parts = evidence_text.split("|", 1)
-                topic = parts[0].strip()
-                evidence_text = parts[1].strip()
+            content = await run_async(self._acomplete(evidence_text, topic))
+            return self._build_output(topic, content)
 
-            topic = topic or "customer behavior"
+        except ValueError as e:
+            return f"Configuration error: {str(e)}"
+        except ImportError as e:
+            return f"Dependency error: {str(e)}"
+        except json.JSONDecodeError as e:
+            return f"Failed to parse LLM response: {str(e)}"
+        except Exception as e:
+            return f"Pattern identification failed: {str(e)}"
 
-            prompt = f"""Analyze the following evidence about "{topic}" and identify behavioral patterns.
+    async def _acomplete(self, evidence_text: str, topic: str) -> str:
+        client = self._get_async_openai_client()
+        return await acached_chat_completion(
+            client, **self._completion_kwargs(evidence_text, topic)
+        )
+
+    def _split_topic(self, evidence_text: str, topic: Optional[str]) -> tuple[str, str]:
+        """Handle case where topic is passed as part of evidence_text ("topic | evidence")."""
+        if topic is None and "|" in evidence_text:
+            parts = evidence_text.split("|", 1)
+            topic = parts[0].strip()
+            evidence_text = parts[1].strip()
+
+        return evidence_text, topic or "customer behavior"
+
+    def _completion_kwargs(self, evidence_text: str, topic: str) -> Dict[str, Any]:
+        """Build the chat completion request for pattern identification."""
+        prompt = f"""Analyze the following evidence about "{topic}" and identify behavioral patterns.
 
 EVIDENCE TO ANALYZE:
 {evidence_text[:8000]}
@@ -508,51 +609,44 @@ Format your response as JSON:
     "recommendations": ["recommendation1", "recommendation2"]
 }}"""
 
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert behavioral analyst skilled at identifying patterns in customer research. Respond only with valid JSON.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"},
-            )
+        return dict(
+            model=self.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are an expert behavioral analyst skilled at identifying patterns in customer research. Respond only with valid JSON.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.3,
+            response_format={"type": "json_object"},
+        )
 
-            result = json.loads(response.choices[0].message.content)
-
-            patterns = []
-            for p in result.get("patterns", []):
-                patterns.append(
-                    PatternOutput(
-                        pattern_name=p.get("pattern_name", "Unknown"),
-                        description=p.get("description", ""),
-                        frequency=p.get("frequency", "occasional"),
-                        evidence_sources=p.get("evidence", []),
-                        implications=p.get("implications", []),
-                    )
+    def _build_output(self, topic: str, content: str) -> str:
+        """Parse the LLM JSON response into a formatted pattern analysis."""
+        result = json.loads(content)
+
+        patterns = []
+        for p in result.get("patterns", []):
+            patterns.append(
+                PatternOutput(
+                    pattern_name=p.get("pattern_name", "Unknown"),
+                    description=p.get("description", ""),
+                    frequency=p.get("frequency", "occasional"),
+                    evidence_sources=p.get("evidence", []),
+                    implications=p.get("implications", []),
                 )
-
-            output = BehaviorPatternOutput(
-                topic=topic,
-                patterns=patterns,
-                say_vs_do_discrepancies=result.get("say_vs_do_discrepancies", []),
-                behavioral_signals=result.get("behavioral_signals", []),
-                recommendations=result.get("recommendations", []),
             )
 
-            return self._format_output(output)
+        output = BehaviorPatternOutput(
+            topic=topic,
+            patterns=patterns,
+            say_vs_do_discrepancies=result.get("say_vs_do_discrepancies", []),
+            behavioral_signals=result.get("behavioral_signals", []),
+            recommendations=result.get("recommendations", []),
+        )
 
-        except ValueError as e:
-            return f"Configuration error: {str(e)}"
-        except ImportError as e:
-            return f"Dependency error: {str(e)}"
-        except json.JSONDecodeError as e:
-            return f"Failed to parse LLM response: {str(e)}"
-        except Exception as e:
-            return f"Pattern identification failed: {str(e)}"
+        return self._format_output(output)
 
     def _format_output(self, output: BehaviorPatternOutput) -> str:
         """Format patterns for agent consumption."""
@@ -604,10 +698,6 @@ Format your response as JSON:
 
         return "\n".join(lines)
 
-    async def _arun(self, evidence_text: str, topic: Optional[str] = None) -> str:
-        """Async version - delegates to sync."""
-        return self._run(evidence_text, topic)
-
 
 # =======================================================================================
 # A/B TEST TOOL
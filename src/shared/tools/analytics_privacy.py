@@ -10,6 +10,7 @@ Provides:
 Target agents: P3, D3, L1, W1, W2, P1, P2, D1
 """
 
+import asyncio
 import os
 import re
 import json
@@ -19,6 +20,10 @@ from datetime import datetime, timedelta
 from crewai.tools import BaseTool
 from pydantic import Field, BaseModel
 
+from src.shared.tools.http_clients import get_async_http_client, run_async
+
+NETLIFY_API_URL = "https://api.netlify.com/api/v1"
+
 
 # =======================================================================================
 # INPUT SCHEMAS (for CrewAI tool args_schema)
@@ -223,48 +228,22 @@ class AnalyticsTool(BaseTool):
 
             # Get site info
             site_response = requests.get(
-                f"https://api.netlify.com/api/v1/sites/{site_id}",
+                f"{NETLIFY_API_URL}/sites/{site_id}",
                 headers=headers,
                 timeout=10,
             )
 
-            site_name = None
-            if site_response.status_code == 200:
-                site_data = site_response.json()
-                site_name = site_data.get("name", site_id)
-
             # Get analytics (Netlify Analytics API)
-            # Note: Netlify Analytics requires Pro plan
-            analytics_url = f"https://api.netlify.com/api/v1/sites/{site_id}/analytics"
-            params = {
-                "from": int(start_date.timestamp() * 1000),
-                "to": int(end_date.timestamp() * 1000),
-                "resolution": "day",
-            }
-
             analytics_response = requests.get(
-                analytics_url,
+                f"{NETLIFY_API_URL}/sites/{site_id}/analytics",
                 headers=headers,
-                params=params,
+                params=self._analytics_params(start_date, end_date),
                 timeout=10,
             )
 
-            if analytics_response.status_code == 200:
-                raw_data = analytics_response.json()
-                return self._parse_netlify_response(
-                    site_id, site_name, start_date, end_date, raw_data
-                )
-            elif analytics_response.status_code == 402:
-                # Analytics requires Pro plan - return simulated data with warning
-                return self._create_placeholder_analytics(
-                    site_id, site_name, start_date, end_date,
-                    note="Netlify Analytics requires Pro plan. Using placeholder data."
-                )
-            else:
-                return self._create_placeholder_analytics(
-                    site_id, site_name, start_date, end_date,
-                    note=f"API returned status {analytics_response.status_code}"
-                )
+            return self._analytics_from_responses(
+                site_id, start_date, end_date, site_response, analytics_response
+            )
 
         except ImportError:
             return self._create_placeholder_analytics(
@@ -277,6 +256,74 @@ class AnalyticsTool(BaseTool):
                 note=f"Request failed: {str(e)}"
             )
 
+    async def _afetch_netlify_analytics(
+        self, token: str, site_id: str, start_date: datetime, end_date: datetime
+    ) -> AnalyticsOutput:
+        """Fetch site info and analytics concurrently over the pooled client (IO loop only)."""
+        import httpx
+
+        client = get_async_http_client()
+        headers = {"Authorization": f"Bearer {token}"}
+
+        try:
+            site_response, analytics_response = await asyncio.gather(
+                client.get(f"{NETLIFY_API_URL}/sites/{site_id}", headers=headers, timeout=10),
+                client.get(
+                    f"{NETLIFY_API_URL}/sites/{site_id}/analytics",
+                    headers=headers,
+                    params=self._analytics_params(start_date, end_date),
+                    timeout=10,
+                ),
+            )
+        except httpx.HTTPError as e:
+            return self._create_placeholder_analytics(
+                site_id, None, start_date, end_date,
+                note=f"Request failed: {str(e)}"
+            )
+
+        return self._analytics_from_responses(
+            site_id, start_date, end_date, site_response, analytics_response
+        )
+
+    def _analytics_params(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+        """Query parameters for the Netlify Analytics API."""
+        return {
+            "from": int(start_date.timestamp() * 1000),
+            "to": int(end_date.timestamp() * 1000),
+            "resolution": "day",
+        }
+
+    def _analytics_from_responses(
+        self,
+        site_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        site_response: Any,
+        analytics_response: Any,
+    ) -> AnalyticsOutput:
+        """Build analytics output from the site and analytics API responses."""
+        site_name = None
+        if site_response.status_code == 200:
+            site_data = site_response.json()
+            site_name = site_data.get("name", site_id)
+
+        if analytics_response.status_code == 200:
+            raw_data = analytics_response.json()
+            return self._parse_netlify_response(
+                site_id, site_name, start_date, end_date, raw_data
+            )
+        elif analytics_response.status_code == 402:
+            # Netlify Analytics requires Pro plan - return simulated data with warning
+            return self._create_placeholder_analytics(
+                site_id, site_name, start_date, end_date,
+                note="Netlify Analytics requires Pro plan. Using placeholder data."
+            )
+        else:
+            return self._create_placeholder_analytics(
+                site_id, site_name, start_date, end_date,
+                note=f"API returned status {analytics_response.status_code}"
+            )
+
     def _parse_netlify_response(
         self,
         site_id: str,
@@ -391,8 +438,26 @@ class AnalyticsTool(BaseTool):
         return "\n".join(lines)
 
     async def _arun(self, site_id: str, days: int = 7) -> str:
-        """Async version - delegates to sync."""
-        return self._run(site_id, days)
+        """Async version - fetches over the pooled HTTP client on the IO loop."""
+        try:
+            if not site_id:
+                return "Error: site_id is required"
+
+            token = self._get_netlify_client()
+
+            end_date = datetime.now()
+            start_date = end_date - timedelta(days=days)
+
+            analytics = await run_async(
+                self._afetch_netlify_analytics(token, site_id, start_date, end_date)
+            )
+
+            return self._format_output(analytics)
+
+        except ValueError as e:
+            return f"Configuration error: {str(e)}"
+        except Exception as e:
+            return f"Analytics fetch failed: {str(e)}"
 
 
 # =======================================================================================
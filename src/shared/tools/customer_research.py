@@ -14,13 +14,14 @@ Tools:
 All tools leverage TavilySearchTool with domain-specific query construction.
 """
 
+import asyncio
 from typing import List, Optional
 from datetime import datetime
 
 from crewai.tools import BaseTool
 from pydantic import Field, BaseModel
 
-from shared.tools.web_search import TavilySearchTool
+from src.shared.tools.web_search import TavilySearchTool
 
 
 # =======================================================================================
@@ -163,60 +164,75 @@ class ForumSearchTool(BaseTool):
         """
         try:
             search = TavilySearchTool(max_results=self.max_results, search_depth="advanced")
-
-            # Use provided platforms or defaults
-            platform_list = (platforms or self.default_platforms).split(",")
-            platform_list = [p.strip() for p in platform_list]
-
-            # Build domain filter for the query
-            domain_filters = []
-            for platform in platform_list:
-                if platform.lower() == "reddit":
-                    domain_filters.append("site:reddit.com")
-                elif platform.lower() == "stackoverflow":
-                    domain_filters.append("site:stackoverflow.com")
-                elif platform.lower() == "quora":
-                    domain_filters.append("site:quora.com")
-                elif platform.lower() == "discourse":
-                    domain_filters.append("site:discourse.org")
-                elif platform.lower() == "hackernews":
-                    domain_filters.append("site:news.ycombinator.com")
-                else:
-                    domain_filters.append(f"site:{platform}.com")
-
-            # Construct forum-specific query
-            domain_filter = " OR ".join(domain_filters)
-            forum_query = f"{query} ({domain_filter})"
+            platform_list, forum_query = self._build_query(query, platforms)
 
             # Execute search
             results = search._run(forum_query)
 
-            # Format output
-            output_lines = [
-                f"# Forum Search: {query}",
-                f"**Platforms searched**: {', '.join(platform_list)}",
-                "",
-                "## Discussion Threads Found",
-                "",
-                results,
-                "",
-                "## Key Observations",
-                "",
-                "Look for recurring themes in the discussions above:",
-                "- What problems do people describe most often?",
-                "- What workarounds are they using?",
-                "- What language do they use to describe their pain?",
-                "- What solutions have they tried and rejected?",
-            ]
-
-            return "\n".join(output_lines)
+            return self._format_output(query, platform_list, results)
 
         except Exception as e:
             return f"Forum search failed: {str(e)}"
 
     async def _arun(self, query: str, platforms: Optional[str] = None) -> str:
-        """Async version - delegates to sync."""
-        return self._run(query, platforms)
+        """Async version - searches without blocking the event loop."""
+        try:
+            search = TavilySearchTool(max_results=self.max_results, search_depth="advanced")
+            platform_list, forum_query = self._build_query(query, platforms)
+
+            results = await search._arun(forum_query)
+
+            return self._format_output(query, platform_list, results)
+
+        except Exception as e:
+            return f"Forum search failed: {str(e)}"
+
+    def _build_query(self, query: str, platforms: Optional[str]) -> tuple[List[str], str]:
+        """Build the site-filtered forum query and the list of platforms searched."""
+        # Use provided platforms or defaults
+        platform_list = (platforms or self.default_platforms).split(",")
+        platform_list = [p.strip() for p in platform_list]
+
+        # Build domain filter for the query
+        domain_filters = []
+        for platform in platform_list:
+            if platform.lower() == "reddit":
+                domain_filters.append("site:reddit.com")
+            elif platform.lower() == "stackoverflow":
+                domain_filters.append("site:stackoverflow.com")
+            elif platform.lower() == "quora":
+                domain_filters.append("site:quora.com")
+            elif platform.lower() == "discourse":
+                domain_filters.append("site:discourse.org")
+            elif platform.lower() == "hackernews":
+                domain_filters.append("site:news.ycombinator.com")
+            else:
+                domain_filters.append(f"site:{platform}.com")
+
+        # Construct forum-specific query
+        domain_filter = " OR ".join(domain_filters)
+        return platform_list, f"{query} ({domain_filter})"
+
+    def _format_output(self, query: str, platform_list: List[str], results: str) -> str:
+        """Format forum search results for agent consumption."""
+        output_lines = [
+            f"# Forum Search: {query}",
+            f"**Platforms searched**: {', '.join(platform_list)}",
+            "",
+            "## Discussion Threads Found",
+            "",
+            results,
+            "",
+            "## Key Observations",
+            "",
+            "Look for recurring themes in the discussions above:",
+            "- What problems do people describe most often?",
+            "- What workarounds are they using?",
+            "- What language do they use to describe their pain?",
+            "- What solutions have they tried and rejected?",
+        ]
+
+        return "\n".join(output_lines)
 
 
 # =======================================================================================
@@ -272,68 +288,88 @@ class ReviewAnalysisTool(BaseTool):
         try:
             search = TavilySearchTool(max_results=self.max_results, search_depth="advanced")
 
+            results = [search._run(q) for q in self._build_queries(product_or_category)]
+
+            return self._format_output(product_or_category, *results)
+
+        except Exception as e:
+            return f"Review analysis failed: {str(e)}"
+
+    async def _arun(self, product_or_category: str) -> str:
+        """Async version - runs the review searches concurrently."""
+        try:
+            search = TavilySearchTool(max_results=self.max_results, search_depth="advanced")
+
+            results = await asyncio.gather(
+                *(search._arun(q) for q in self._build_queries(product_or_category))
+            )
+
+            return self._format_output(product_or_category, *results)
+
+        except Exception as e:
+            return f"Review analysis failed: {str(e)}"
+
+    def _build_queries(self, product_or_category: str) -> List[str]:
+        """Build the negative, feature-request and positive review queries."""
+        return [
             # Search for negative reviews (pain points)
-            negative_query = (
+            (
                 f"{product_or_category} reviews complaints problems issues "
                 "(site:g2.com OR site:capterra.com OR site:trustradius.com OR "
                 "site:amazon.com/review OR site:producthunt.com)"
-            )
-            negative_results = search._run(negative_query)
-
+            ),
             # Search for feature requests and wishes
-            feature_query = (
+            (
                 f"{product_or_category} reviews \"wish\" OR \"missing\" OR \"needs\" OR "
                 "\"feature request\" "
                 "(site:g2.com OR site:capterra.com OR site:trustradius.com)"
-            )
-            feature_results = search._run(feature_query)
-
+            ),
             # Search for positive feedback (to understand what works)
-            positive_query = (
+            (
                 f"{product_or_category} reviews best features love great "
                 "(site:g2.com OR site:capterra.com OR site:trustradius.com)"
-            )
-            positive_results = search._run(positive_query)
-
-            # Format output
-            output_lines = [
-                f"# Review Analysis: {product_or_category}",
-                "",
-                "## Common Complaints & Pain Points",
-                "",
-                negative_results,
-                "",
-                "---",
-                "",
-                "## Feature Requests & Wishes",
-                "",
-                feature_results,
-                "",
-                "---",
-                "",
-                "## What Customers Love (Competitive Table Stakes)",
-                "",
-                positive_results,
-                "",
-                "---",
-                "",
-                "## Analysis Framework",
-                "",
-                "When reading the reviews above, identify:",
-                "1. **Must-Have Features**: What do all positive reviews mention?",
-                "2. **Pain Points**: What frustrations appear repeatedly?",
-                "3. **Opportunities**: What gaps exist that no product fills?",
-                "4. **Pricing Signals**: Any mentions of value vs cost?",
-            ]
-
-            return "\n".join(output_lines)
-
-        except Exception as e:
-            return f"Review analysis failed: {str(e)}"
-
-    async def _arun(self, product_or_category: str) -> str:
-        """Async version - delegates to sync."""
-        return self._run(product_or_category)
+            ),
+        ]
+
+    def _format_output(
+        self,
+        product_or_category: str,
+        negative_results: str,
+        feature_results: str,
+        positive_results: str,
+    ) -> str:
+        """Format review search results for agent consumption."""
+        output_lines = [
+            f"# Review Analysis: {product_or_category}",
+            "",
+            "## Common Complaints & Pain Points",
+            "",
+            negative_results,
+            "",
+            "---",
+            "",
+            "## Feature Requests & Wishes",
+            "",
+            feature_results,
+            "",
+            "---",
+            "",
+            "## What Customers Love (Competitive Table Stakes)",
+            "",
+            positive_results,
+            "",
+            "---",
+            "",
+            "## Analysis Framework",
+            "",
+            "When reading the reviews above, identify:",
+            "1. **Must-Have Features**: What do all positive reviews mention?",
+            "2. **Pain Points**: What frustrations appear repeatedly?",
+            "3. **Opportunities**: What gaps exist that no product fills?",
+            "4. **Pricing Signals**: Any mentions of value vs cost?",
+        ]
+
+        return "\n".join(output_lines)
 
 
 # =======================================================================================
@@ -389,66 +425,86 @@ class SocialListeningTool(BaseTool):
         try:
             search = TavilySearchTool(max_results=self.max_results, search_depth="advanced")
 
+            results = [search._run(q) for q in self._build_queries(topic)]
+
+            return self._format_output(topic, *results)
+
+        except Exception as e:
+            return f"Social listening failed: {str(e)}"
+
+    async def _arun(self, topic: str) -> str:
+        """Async version - runs the platform searches concurrently."""
+        try:
+            search = TavilySearchTool(max_results=self.max_results, search_depth="advanced")
+
+            results = await asyncio.gather(
+                *(search._arun(q) for q in self._build_queries(topic))
+            )
+
+            return self._format_output(topic, *results)
+
+        except Exception as e:
+            return f"Social listening failed: {str(e)}"
+
+    def _build_queries(self, topic: str) -> List[str]:
+        """Build the Twitter/X, LinkedIn and blog/news queries."""
+        return [
             # Search Twitter/X discussions
-            twitter_query = (
+            (
                 f"{topic} (site:twitter.com OR site:x.com) "
                 "discussion opinion thoughts"
-            )
-            twitter_results = search._run(twitter_query)
-
+            ),
             # Search LinkedIn discussions
-            linkedin_query = (
+            (
                 f"{topic} site:linkedin.com "
                 "post article discussion"
-            )
-            linkedin_results = search._run(linkedin_query)
-
+            ),
             # Search for news and blog mentions
-            mentions_query = (
+            (
                 f"{topic} mention discussion trend "
                 "(site:medium.com OR site:substack.com OR site:techcrunch.com)"
-            )
-            mentions_results = search._run(mentions_query)
-
-            # Format output
-            output_lines = [
-                f"# Social Listening: {topic}",
-                "",
-                "## Twitter/X Discussions",
-                "",
-                twitter_results,
-                "",
-                "---",
-                "",
-                "## LinkedIn Conversations",
-                "",
-                linkedin_results,
-                "",
-                "---",
-                "",
-                "## Industry Mentions (Blogs, News)",
-                "",
-                mentions_results,
-                "",
-                "---",
-                "",
-                "## Sentiment Analysis Guide",
-                "",
-                "Review the social mentions above and assess:",
-                "- **Overall Sentiment**: Is discussion mostly positive, negative, or neutral?",
-                "- **Key Themes**: What topics come up repeatedly?",
-                "- **Influencers**: Who is driving the conversation?",
-                "- **Pain Points**: What frustrations are people expressing?",
-            ]
-
-            return "\n".join(output_lines)
-
-        except Exception as e:
-            return f"Social listening failed: {str(e)}"
-
-    async def _arun(self, topic: str) -> str:
-        """Async version - delegates to sync."""
-        return self._run(topic)
+            ),
+        ]
+
+    def _format_output(
+        self,
+        topic: str,
+        twitter_results: str,
+        linkedin_results: str,
+        mentions_results: str,
+    ) -> str:
+        """Format social search results for agent consumption."""
+        output_lines = [
+            f"# Social Listening: {topic}",
+            "",
+            "## Twitter/X Discussions",
+            "",
+            twitter_results,
+            "",
+            "---",
+            "",
+            "## LinkedIn Conversations",
+            "",
+            linkedin_results,
+            "",
+            "---",
+            "",
+            "## Industry Mentions (Blogs, News)",
+            "",
+            mentions_results,
+            "",
+            "---",
+            "",
+            "## Sentiment Analysis Guide",
+            "",
+            "Review the social mentions above and assess:",
+            "- **Overall Sentiment**: Is discussion mostly positive, negative, or neutral?",
+            "- **Key Themes**: What topics come up repeatedly?",
+            "- **Influencers**: Who is driving the conversation?",
+            "- **Pain Points**: What frustrations are people expressing?",
+        ]
+
+        return "\n".join(output_lines)
 
 
 # =======================================================================================
@@ -503,83 +559,102 @@ class TrendAnalysisTool(BaseTool):
         try:
             search = TavilySearchTool(max_results=self.max_results, search_depth="advanced")
 
-            # Get current year for time-relevant searches
-            current_year = datetime.now().year
+            results = [search._run(q) for q in self._build_queries(topic)]
+
+            return self._format_output(topic, *results)
 
+        except Exception as e:
+            return f"Trend analysis failed: {str(e)}"
+
+    async def _arun(self, topic: str) -> str:
+        """Async version - runs the trend searches concurrently."""
+        try:
+            search = TavilySearchTool(max_results=self.max_results, search_depth="advanced")
+
+            results = await asyncio.gather(
+                *(search._arun(q) for q in self._build_queries(topic))
+            )
+
+            return self._format_output(topic, *results)
+
+        except Exception as e:
+            return f"Trend analysis failed: {str(e)}"
+
+    def _build_queries(self, topic: str) -> List[str]:
+        """Build the trends, market size, innovation and challenges queries."""
+        # Get current year for time-relevant searches
+        current_year = datetime.now().year
+
+        return [
             # Search for market trends and forecasts
-            trends_query = (
+            (
                 f"{topic} market trends {current_year} forecast growth "
                 "industry report analysis"
-            )
-            trends_results = search._run(trends_query)
-
+            ),
             # Search for market size and opportunity
-            market_query = (
+            (
                 f"{topic} market size TAM SAM opportunity {current_year} "
                 "billion million revenue"
-            )
-            market_results = search._run(market_query)
-
+            ),
             # Search for emerging technologies and innovations
-            innovation_query = (
+            (
                 f"{topic} emerging innovation new technology {current_year} "
                 "startup disruption"
-            )
-            innovation_results = search._run(innovation_query)
-
+            ),
             # Search for challenges and headwinds
-            challenges_query = (
+            (
                 f"{topic} challenges obstacles barriers {current_year} "
                 "decline risk problem"
-            )
-            challenges_results = search._run(challenges_query)
-
-            # Format output
-            output_lines = [
-                f"# Trend Analysis: {topic}",
-                "",
-                "## Market Trends & Forecasts",
-                "",
-                trends_results,
-                "",
-                "---",
-                "",
-                "## Market Size & Opportunity",
-                "",
-                market_results,
-                "",
-                "---",
-                "",
-                "## Emerging Innovations & Disruption",
-                "",
-                innovation_results,
-                "",
-                "---",
-                "",
-                "## Challenges & Headwinds",
-                "",
-                challenges_results,
-                "",
-                "---",
-                "",
-                "## Trend Interpretation Guide",
-                "",
-                "From the data above, assess:",
-                "- **Market Direction**: Is this market growing, stable, or declining?",
-                "- **Timing**: Is now a good time to enter this market?",
-                "- **Opportunities**: What gaps exist that could be filled?",
-                "- **Risks**: What headwinds or challenges exist?",
-                "- **Competition**: How crowded is this space?",
-            ]
-
-            return "\n".join(output_lines)
-
-        except Exception as e:
-            return f"Trend analysis failed: {str(e)}"
-
-    async def _arun(self, topic: str) -> str:
-        """Async version - delegates to sync."""
-        return self._run(topic)
+            ),
+        ]
+
+    def _format_output(
+        self,
+        topic: str,
+        trends_results: str,
+        market_results: str,
+        innovation_results: str,
+        challenges_results: str,
+    ) -> str:
+        """Format trend search results for agent consumption."""
+        output_lines = [
+            f"# Trend Analysis: {topic}",
+            "",
+            "## Market Trends & Forecasts",
+            "",
+            trends_results,
+            "",
+            "---",
+            "",
+            "## Market Size & Opportunity",
+            "",
+            market_results,
+            "",
+            "---",
+            "",
+            "## Emerging Innovations & Disruption",
+            "",
+            innovation_results,
+            "",
+            "---",
+            "",
+            "## Challenges & Headwinds",
+            "",
+            challenges_results,
+            "",
+            "---",
+            "",
+            "## Trend Interpretation Guide",
+            "",
+            "From the data above, assess:",
+            "- **Market Direction**: Is this market growing, stable, or declining?",
+            "- **Timing**: Is now a good time to enter this market?",
+            "- **Opportunities**: What gaps exist that could be filled?",
+            "- **Risks**: What headwinds or challenges exist?",
+            "- **Competition**: How crowded is this space?",
+        ]
+
+        return "\n".join(output_lines)
 
 
 # =======================================================================================
@@ -0,0 +1,242 @@
+"""
+Shared HTTP Clients for Tools.
+
+Tools run inside CrewAI agents from worker threads (see the phase crew graph
+executor), so async HTTP work is executed on a single background event loop
+owned by this module. The process-wide httpx.AsyncClient lives on that loop,
+which lets every tool reuse pooled keep-alive connections (HTTP/2 via the
+h2 package from httpx[http2], installed on both Modal images) instead of
+paying a TLS handshake per call.
+
+The OpenAI SDK clients are shared the same way: one sync OpenAI client per
+API key (its own pooled httpx.Client) for tools running in worker threads, and
+one AsyncOpenAI client bound to the IO loop's AsyncClient.
+
+Helpers:
+    run_sync(coro)      - Run a coroutine on the IO loop from sync code
+    await run_async(coro) - Run a coroutine on the IO loop from another loop
+    get_async_http_client() - Pooled AsyncClient (only use on the IO loop)
+    get_openai_client() - Shared sync OpenAI client
+    get_async_openai_client() - Shared AsyncOpenAI client (only use on the IO loop)
+
+Usage:
+    async def _fetch(url):
+        client = get_async_http_client()
+        return (await client.get(url)).json()
+
+    data = run_sync(_fetch("https://api.example.com"))
+"""
+
+import asyncio
+import atexit
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Optional, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_async_client: Optional[httpx.AsyncClient] = None
+_openai_clients: dict[str, Any] = {}
+_async_openai_clients: dict[str, tuple[httpx.AsyncClient, Any]] = {}
+_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    """HTTP/2 requires h2 (httpx[http2]); fall back to HTTP/1.1 in bare environments."""
+    try:
+        import h2  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+# =======================================================================================
+# IO EVENT LOOP
+# =======================================================================================
+
+
+def get_io_loop() -> asyncio.AbstractEventLoop:
+    """Get (starting if needed) the background event loop used for tool IO."""
+    global _loop, _loop_thread
+    if _loop is not None and _loop.is_running():
+        return _loop
+
+    with _lock:
+        if _loop is None or not _loop.is_running():
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def _run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+
+            _loop_thread = threading.Thread(
+                target=_run, name="tools-io-loop", daemon=True
+            )
+            _loop_thread.start()
+            started.wait()
+            _loop = loop
+    return _loop
+
+
+def run_sync(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Run a coroutine on the IO loop and block until it finishes.
+
+    Safe to call from any thread except the IO loop itself.
+    """
+    loop = get_io_loop()
+    future: Future = asyncio.run_coroutine_threadsafe(coro, loop)
+    return future.result(timeout=timeout)
+
+
+async def run_async(coro: Awaitable[T]) -> T:
+    """
+    Await a coroutine that must run on the IO loop from a different loop.
+
+    The caller's loop stays free while the IO loop does the work.
+    """
+    loop = get_io_loop()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+# =======================================================================================
+# POOLED CLIENTS
+# =======================================================================================
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide AsyncClient.
+
+    Must only be used from coroutines running on the IO loop (run_sync/run_async).
+    """
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(
+            http2=_http2_available(),
+            timeout=DEFAULT_TIMEOUT,
+            limits=DEFAULT_LIMITS,
+        )
+    return _async_client
+
+
+def _openai_api_key(api_key: Optional[str]) -> str:
+    api_key = api_key or os.environ.get("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY environment variable not set")
+    return api_key
+
+
+def get_openai_client(api_key: Optional[str] = None) -> Any:
+    """
+    Get the process-wide sync OpenAI client for an API key.
+
+    Args:
+        api_key: OpenAI API key (default: OPENAI_API_KEY)
+
+    Raises:
+        ValueError: If no API key is configured
+        ImportError: If the openai package is not installed
+    """
+    api_key = _openai_api_key(api_key)
+    client = _openai_clients.get(api_key)
+    if client is not None:
+        return client
+
+    try:
+        from openai import OpenAI
+    except ImportError:
+        raise ImportError("openai package not installed. Run: pip install openai")
+
+    with _lock:
+        client = _openai_clients.get(api_key)
+        if client is None:
+            client = OpenAI(
+                api_key=api_key,
+                http_client=httpx.Client(timeout=DEFAULT_TIMEOUT, limits=DEFAULT_LIMITS),
+            )
+            _openai_clients[api_key] = client
+    return client
+
+
+def get_async_openai_client(api_key: Optional[str] = None) -> Any:
+    """
+    Get the process-wide AsyncOpenAI client for an API key.
+
+    Shares the pooled AsyncClient, so it must only be used from coroutines
+    running on the IO loop (run_sync/run_async).
+
+    Raises:
+        ValueError: If no API key is configured
+        ImportError: If the openai package is not installed
+    """
+    api_key = _openai_api_key(api_key)
+    http_client = get_async_http_client()
+    cached = _async_openai_clients.get(api_key)
+    if cached is not None and cached[0] is http_client:
+        return cached[1]
+
+    try:
+        from openai import AsyncOpenAI
+    except ImportError:
+        raise ImportError("openai package not installed. Run: pip install openai")
+
+    client = AsyncOpenAI(api_key=api_key, http_client=http_client)
+    _async_openai_clients[api_key] = (http_client, client)
+    return client
+
+
+async def _close_clients() -> None:
+    if _async_client is not None and not _async_client.is_closed:
+        await _async_client.aclose()
+
+
+def close_http_clients() -> None:
+    """Close pooled clients and stop the IO loop (registered at exit)."""
+    global _loop
+    for client in list(_openai_clients.values()):
+        try:
+            client.close()
+        except Exception:
+            pass
+    _openai_clients.clear()
+    _async_openai_clients.clear()
+
+    if _loop is None or not _loop.is_running():
+        return
+    try:
+        run_sync(_close_clients(), timeout=5)
+    except Exception:
+        pass
+    _loop.call_soon_threadsafe(_loop.stop)
+    _loop = None
+
+
+atexit.register(close_http_clients)
+
+
+def get_http_client_info() -> dict[str, Any]:
+    """Describe the pooled client configuration (for diagnostics)."""
+    return {
+        "http2": _http2_available(),
+        "max_connections": DEFAULT_LIMITS.max_connections,
+        "max_keepalive_connections": DEFAULT_LIMITS.max_keepalive_connections,
+        "io_loop_running": _loop is not None and _loop.is_running(),
+    }
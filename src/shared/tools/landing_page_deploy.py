@@ -15,6 +15,7 @@ Environment Variables Required:
 - SUPABASE_ANON_KEY: Supabase anon key (for client-side tracking)
 """
 
+import asyncio
 import os
 import hashlib
 import logging
@@ -216,7 +217,7 @@ class LandingPageDeploymentTool(BaseTool):
             start_time = datetime.now()
 
             # Get Supabase client
-            from state.persistence import get_supabase
+            from src.state.persistence import get_supabase
             supabase = get_supabase()
 
             # Sanitize project_id and variant_id for storage path
@@ -302,8 +303,8 @@ class LandingPageDeploymentTool(BaseTool):
         variant_id: str = "default",
         site_name: Optional[str] = None,
     ) -> str:
-        """Async version - delegates to sync."""
-        return self._run(html, project_id, variant_id, site_name)
+        """Async version - runs the blocking Supabase upload in a worker thread."""
+        return await asyncio.to_thread(self._run, html, project_id, variant_id, site_name)
 
     def _sanitize_path_segment(self, segment: str) -> str:
         """Sanitize a string for use in storage path."""
@@ -11,7 +11,7 @@ Tools:
 - LearningCardTool: Capture experiment learnings using Learning Card format
 
 Usage:
-    from shared.tools import CanvasBuilderTool, TestCardTool, LearningCardTool
+    from src.shared.tools import CanvasBuilderTool, TestCardTool, LearningCardTool
 
     @agent
     def value_designer(self) -> Agent:
@@ -0,0 +1,271 @@
+"""
+Search Result Cache for Tavily-backed Tools.
+
+Research agents (and the Forum/Review/Social/Trend tools, which each wrap
+their own TavilySearchTool) often issue the same or near-identical queries
+within a run. This module provides a process-wide cache in front of the
+Tavily API:
+
+- Query normalization: case, whitespace, and the order of site: filters
+  (both standalone and inside "(site:a OR site:b)" groups) do not affect the key
+- TTL expiry with an LRU bound on entry count
+- In-flight dedup: concurrent identical searches share one network request
+
+Configuration:
+    SEARCH_CACHE_TTL_SECONDS: Entry lifetime (default: 3600, 0 disables caching)
+    SEARCH_CACHE_MAX_ENTRIES: LRU bound (default: 1024)
+
+Usage:
+    from src.shared.tools.search_cache import get_search_cache, search_cache_key
+
+    key = search_cache_key(query, search_depth="advanced", max_results=5)
+    response = get_search_cache().get_or_fetch(key, lambda: client.search(...))
+"""
+
+import asyncio
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_ENTRIES = 1024
+
+_SITE_GROUP = re.compile(r"\(\s*(site:\S+(?:\s+or\s+site:\S+)*)\s*\)")
+_SITE_TERM = re.compile(r"(?<![\w(])site:[^\s()]+")
+
+
+# =======================================================================================
+# QUERY NORMALIZATION
+# =======================================================================================
+
+
+def normalize_query(query: str) -> str:
+    """
+    Canonicalize a search query for cache lookups.
+
+    Lowercases and collapses whitespace, then moves site: filters to the end
+    in a canonical order - members of "(site:a OR site:b)" groups are sorted,
+    and groups and standalone filters are each sorted.
+
+    Args:
+        query: Raw search query
+
+    Returns:
+        Normalized query string
+    """
+    text = " ".join(query.lower().split())
+
+    groups = sorted(
+        "(" + " or ".join(sorted(set(match.split(" or ")))) + ")"
+        for match in _SITE_GROUP.findall(text)
+    )
+    text = _SITE_GROUP.sub(" ", text)
+
+    standalone = sorted(set(_SITE_TERM.findall(text)))
+    text = _SITE_TERM.sub(" ", text)
+
+    return " ".join(text.split() + groups + standalone)
+
+
+def search_cache_key(query: str, **params: Any) -> str:
+    """
+    Build a cache key from a query plus the search parameters that affect results.
+
+    Args:
+        query: Raw search query
+        **params: Search parameters (search_depth, max_results, include_answer, ...)
+
+    Returns:
+        Cache key string
+    """
+    param_part = "&".join(f"{k}={params[k]}" for k in sorted(params))
+    return f"{normalize_query(query)}|{param_part}"
+
+
+# =======================================================================================
+# CACHE
+# =======================================================================================
+
+
+class SearchCache:
+    """
+    Thread-safe TTL/LRU cache with in-flight request deduplication.
+
+    Failed fetches are not cached; the exception is raised to every caller
+    waiting on that request.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.deduped = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a fresh cached value, or None."""
+        with self._lock:
+            return self._get_locked(key)
+
+    def _get_locked(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting least recently used entries past the bound."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, fetching it at most once concurrently.
+
+        Args:
+            key: Cache key (see search_cache_key)
+            fetch: Zero-arg callable performing the actual search
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        if not self.enabled:
+            return fetch()
+
+        with self._lock:
+            value = self._get_locked(key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.deduped += 1
+                owner = False
+            else:
+                self.misses += 1
+                future = Future()
+                self._in_flight[key] = future
+                owner = True
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    async def aget_or_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async variant of get_or_fetch.
+
+        Shares the same entries and in-flight table, so an async batch search
+        and a sync tool call for the same query still hit the network once.
+
+        Args:
+            key: Cache key (see search_cache_key)
+            fetch: Zero-arg coroutine function performing the actual search
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        if not self.enabled:
+            return await fetch()
+
+        with self._lock:
+            value = self._get_locked(key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.deduped += 1
+                owner = False
+            else:
+                self.misses += 1
+                future = Future()
+                self._in_flight[key] = future
+                owner = True
+
+        if not owner:
+            return await asyncio.wrap_future(future)
+
+        try:
+            value = await fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.deduped = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters for this process."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "deduped": self.deduped,
+            }
+
+
+_search_cache: Optional[SearchCache] = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> SearchCache:
+    """Get the process-wide search cache (configured from the environment)."""
+    global _search_cache
+    if _search_cache is None:
+        with _search_cache_lock:
+            if _search_cache is None:
+                _search_cache = SearchCache(
+                    ttl_seconds=int(os.environ.get("SEARCH_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+                    max_entries=int(os.environ.get("SEARCH_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+                )
+    return _search_cache
@@ -10,13 +10,19 @@ ideal for agent workloads.
 Migrated from: src/intake_crew/tools/web_search.py
 """
 
+import asyncio
+import json
 import os
-from typing import List, Optional
+import threading
+from typing import Dict, List, Optional
 from datetime import datetime
 
 from crewai.tools import BaseTool
 from pydantic import Field, BaseModel
 
+from src.shared.tools.http_clients import get_async_http_client, run_async, run_sync
+from src.shared.tools.search_cache import get_search_cache, search_cache_key
+
 
 # =======================================================================================
 # SEARCH RESULT MODELS
@@ -43,6 +49,64 @@ class WebSearchOutput(BaseModel):
     result_count: int = 0
 
 
+class BatchSearchOutput(BaseModel):
+    """Merged, URL-deduplicated output from a batch of searches."""
+
+    queries: List[str]
+    results: List[SearchResult]
+    answers: Dict[str, str] = Field(default_factory=dict)
+    errors: Dict[str, str] = Field(default_factory=dict)
+    response_time_ms: int = 0
+    result_count: int = 0
+
+
+def _to_search_result(item: dict) -> SearchResult:
+    """Convert one raw Tavily result into a SearchResult."""
+    return SearchResult(
+        title=item.get("title", ""),
+        url=item.get("url", ""),
+        content=item.get("content", ""),
+        score=item.get("score", 0.0),
+        published_date=item.get("published_date"),
+    )
+
+
+# =======================================================================================
+# SHARED TAVILY CLIENT
+# =======================================================================================
+
+_tavily_client = None
+_tavily_api_key: Optional[str] = None
+_tavily_lock = threading.Lock()
+
+
+def get_tavily_client():
+    """
+    Get the process-wide Tavily client (created once per API key).
+
+    Raises:
+        ValueError: If TAVILY_API_KEY is not set
+        ImportError: If tavily-python is not installed
+    """
+    global _tavily_client, _tavily_api_key
+
+    api_key = os.environ.get("TAVILY_API_KEY")
+    if not api_key:
+        raise ValueError("TAVILY_API_KEY environment variable not set")
+
+    with _tavily_lock:
+        if _tavily_client is None or _tavily_api_key != api_key:
+            try:
+                from tavily import TavilyClient
+            except ImportError:
+                raise ImportError(
+                    "tavily-python package not installed. Run: pip install tavily-python"
+                )
+            _tavily_client = TavilyClient(api_key=api_key)
+            _tavily_api_key = api_key
+        return _tavily_client
+
+
 # =======================================================================================
 # TAVILY SEARCH TOOL
 # =======================================================================================
@@ -58,6 +122,9 @@ class TavilySearchTool(BaseTool):
     - Optional synthesized answers
     - Fast response times (~1-2 seconds)
 
+    Results are served from the process-wide search cache when the same
+    (normalized) query was already run - see src.shared.tools.search_cache.
+
     Requires TAVILY_API_KEY environment variable.
     """
 
@@ -88,19 +155,49 @@ class TavilySearchTool(BaseTool):
     )
 
     def _get_client(self):
-        """Get Tavily client with API key from environment."""
-        api_key = os.environ.get("TAVILY_API_KEY")
-        if not api_key:
-            raise ValueError("TAVILY_API_KEY environment variable not set")
-
-        try:
-            from tavily import TavilyClient
-
-            return TavilyClient(api_key=api_key)
-        except ImportError:
-            raise ImportError(
-                "tavily-python package not installed. Run: pip install tavily-python"
-            )
+        """Get the shared Tavily client."""
+        return get_tavily_client()
+
+    def _cache_key(self, query: str) -> str:
+        return search_cache_key(
+            query,
+            search_depth=self.search_depth,
+            max_results=self.max_results,
+            include_answer=self.include_answer,
+        )
+
+    def _search(self, query: str) -> dict:
+        """Run a Tavily search through the cache (deduping in-flight requests)."""
+        client = self._get_client()
+        key = self._cache_key(query)
+        return get_search_cache().get_or_fetch(
+            key,
+            lambda: client.search(
+                query=query,
+                search_depth=self.search_depth,
+                max_results=self.max_results,
+                include_answer=self.include_answer,
+            ),
+        )
+
+    async def _asearch(self, query: str) -> dict:
+        """Async variant of _search over the pooled HTTP client (IO loop only)."""
+        return await get_search_cache().aget_or_fetch(
+            self._cache_key(query),
+            lambda: _tavily_search_async(
+                query, self.search_depth, self.max_results, self.include_answer
+            ),
+        )
+
+    def _build_output(self, query: str, response: dict, elapsed_ms: int) -> WebSearchOutput:
+        results = [_to_search_result(item) for item in response.get("results", [])]
+        return WebSearchOutput(
+            query=query,
+            results=results,
+            answer=response.get("answer"),
+            response_time_ms=elapsed_ms,
+            result_count=len(results),
+        )
 
     def _run(self, query: str) -> str:
         """
@@ -115,42 +212,13 @@ class TavilySearchTool(BaseTool):
         try:
             start_time = datetime.now()
 
-            # Get Tavily client
-            client = self._get_client()
-
-            # Execute search
-            response = client.search(
-                query=query,
-                search_depth=self.search_depth,
-                max_results=self.max_results,
-                include_answer=self.include_answer,
-            )
+            # Execute search (cached)
+            response = self._search(query)
 
             elapsed_ms = int((datetime.now() - start_time).total_seconds() * 1000)
 
-            # Parse results
-            results = []
-            for item in response.get("results", []):
-                results.append(
-                    SearchResult(
-                        title=item.get("title", ""),
-                        url=item.get("url", ""),
-                        content=item.get("content", ""),
-                        score=item.get("score", 0.0),
-                        published_date=item.get("published_date"),
-                    )
-                )
-
-            output = WebSearchOutput(
-                query=query,
-                results=results,
-                answer=response.get("answer"),
-                response_time_ms=elapsed_ms,
-                result_count=len(results),
-            )
-
             # Format output for agent consumption
-            return self._format_results(output)
+            return self._format_results(self._build_output(query, response, elapsed_ms))
 
         except ValueError as e:
             return f"Configuration error: {str(e)}"
@@ -160,8 +228,21 @@ class TavilySearchTool(BaseTool):
             return f"Search failed: {str(e)}"
 
     async def _arun(self, query: str) -> str:
-        """Async version - delegates to sync for now."""
-        return self._run(query)
+        """Async version - searches over the pooled HTTP client on the IO loop."""
+        try:
+            start_time = datetime.now()
+
+            # Execute search (cached, shares in-flight requests with _run)
+            response = await run_async(self._asearch(query))
+
+            elapsed_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+
+            return self._format_results(self._build_output(query, response, elapsed_ms))
+
+        except ValueError as e:
+            return f"Configuration error: {str(e)}"
+        except Exception as e:
+            return f"Search failed: {str(e)}"
 
     def _format_results(self, output: WebSearchOutput) -> str:
         """Format search results for agent consumption."""
@@ -201,6 +282,259 @@ class TavilySearchTool(BaseTool):
         return "\n".join(lines)
 
 
+# =======================================================================================
+# BATCH SEARCH
+# =======================================================================================
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+MAX_BATCH_QUERIES = 10
+DEFAULT_BATCH_CONCURRENCY = 5
+
+
+class BatchSearchInput(BaseModel):
+    """Input schema for BatchSearchTool."""
+
+    queries: List[str] = Field(
+        ...,
+        description=f"List of search queries to run together (max {MAX_BATCH_QUERIES})",
+    )
+
+
+async def _tavily_search_async(
+    query: str,
+    search_depth: str,
+    max_results: int,
+    include_answer: bool,
+) -> dict:
+    """Run one Tavily search over the pooled async HTTP client (IO loop only)."""
+    api_key = os.environ.get("TAVILY_API_KEY")
+    if not api_key:
+        raise ValueError("TAVILY_API_KEY environment variable not set")
+
+    client = get_async_http_client()
+    response = await client.post(
+        TAVILY_SEARCH_URL,
+        json={
+            "query": query,
+            "search_depth": search_depth,
+            "max_results": max_results,
+            "include_answer": include_answer,
+        },
+        headers={"Authorization": f"Bearer {api_key}"},
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def _url_key(url: str) -> str:
+    """Key used to deduplicate results across queries."""
+    return url.split("#", 1)[0].rstrip("/")
+
+
+async def batch_search_async(
+    queries: List[str],
+    search_depth: str = "advanced",
+    max_results: int = 5,
+    include_answer: bool = True,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> BatchSearchOutput:
+    """
+    Run several Tavily searches concurrently and merge the results.
+
+    Must run on the tools IO loop (use run_sync / run_async). Queries that
+    normalize to the same cache key are fetched once, and every query goes
+    through the shared search cache. Results are deduplicated by URL, keeping
+    the highest relevance score. A failed query is reported in ``errors``
+    without failing the batch.
+
+    Args:
+        queries: Search queries (at most MAX_BATCH_QUERIES are run)
+        search_depth: 'basic' or 'advanced'
+        max_results: Maximum results per query
+        include_answer: Whether to request a synthesized answer per query
+        max_concurrency: Maximum searches in flight at once
+
+    Returns:
+        BatchSearchOutput with merged results, per-query answers and errors
+    """
+    start_time = datetime.now()
+    cache = get_search_cache()
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    # Collapse queries that normalize to the same key
+    unique: dict[str, str] = {}
+    for query in queries[:MAX_BATCH_QUERIES]:
+        if query and query.strip():
+            key = search_cache_key(
+                query,
+                search_depth=search_depth,
+                max_results=max_results,
+                include_answer=include_answer,
+            )
+            unique.setdefault(key, query)
+
+    async def _one(key: str, query: str) -> dict:
+        async def _fetch() -> dict:
+            async with semaphore:
+                return await _tavily_search_async(
+                    query, search_depth, max_results, include_answer
+                )
+
+        return await cache.aget_or_fetch(key, _fetch)
+
+    responses = await asyncio.gather(
+        *(_one(key, query) for key, query in unique.items()),
+        return_exceptions=True,
+    )
+
+    merged: dict[str, SearchResult] = {}
+    answers: dict[str, str] = {}
+    errors: dict[str, str] = {}
+    for query, response in zip(unique.values(), responses):
+        if isinstance(response, BaseException):
+            errors[query] = str(response)
+            continue
+        if response.get("answer"):
+            answers[query] = response["answer"]
+        for item in response.get("results", []):
+            result = _to_search_result(item)
+            url_key = _url_key(result.url)
+            if url_key not in merged or result.score > merged[url_key].score:
+                merged[url_key] = result
+
+    results = sorted(merged.values(), key=lambda r: r.score, reverse=True)
+    elapsed_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+
+    return BatchSearchOutput(
+        queries=list(unique.values()),
+        results=results,
+        answers=answers,
+        errors=errors,
+        response_time_ms=elapsed_ms,
+        result_count=len(results),
+    )
+
+
+def _format_batch_results(output: BatchSearchOutput) -> str:
+    """Format merged batch results for agent consumption."""
+    lines = [
+        f"## Batch Web Search Results ({len(output.queries)} queries)",
+        f"Found {output.result_count} unique results in {output.response_time_ms}ms",
+        "",
+    ]
+
+    if output.answers:
+        lines.append("### Summaries")
+        for query, answer in output.answers.items():
+            lines.extend([f"**{query}**", answer, ""])
+
+    if output.errors:
+        lines.append("### Failed Queries")
+        for query, error in output.errors.items():
+            lines.append(f"- {query}: {error}")
+        lines.append("")
+
+    lines.append("### Sources")
+    for i, result in enumerate(output.results, 1):
+        lines.extend(
+            [
+                f"**{i}. {result.title}**",
+                f"URL: {result.url}",
+                f"Relevance: {result.score:.2f}",
+                (
+                    f"{result.content[:500]}..."
+                    if len(result.content) > 500
+                    else result.content
+                ),
+                "",
+            ]
+        )
+
+    return "\n".join(lines)
+
+
+def _coerce_queries(queries) -> List[str]:
+    """Accept a list, a JSON-encoded list, or newline-separated queries."""
+    if isinstance(queries, str):
+        try:
+            parsed = json.loads(queries)
+            if isinstance(parsed, list):
+                return [str(q) for q in parsed]
+        except json.JSONDecodeError:
+            pass
+        return [q.strip() for q in queries.splitlines() if q.strip()]
+    return [str(q) for q in queries]
+
+
+class BatchSearchTool(BaseTool):
+    """
+    Run several web searches at once and return merged, deduplicated results.
+
+    Queries fan out concurrently over a pooled HTTP client (bounded by
+    max_concurrency), so one agent step can gather 5-10 searches in roughly
+    the time of one. Shares the search cache with TavilySearchTool.
+
+    Requires TAVILY_API_KEY environment variable.
+    """
+
+    name: str = "batch_web_search"
+    description: str = f"""
+    Run multiple web searches in one step. Use this instead of calling web_search
+    repeatedly when you need several angles on a topic (e.g. pain points,
+    competitors, pricing, communities).
+
+    Input should be a list of up to {MAX_BATCH_QUERIES} clear search queries.
+    Returns merged results with duplicate URLs removed, plus a summary per query.
+    """
+    args_schema: type[BaseModel] = BatchSearchInput
+
+    search_depth: str = Field(
+        default="advanced",
+        description="Search depth: 'basic' for faster results, 'advanced' for more comprehensive",
+    )
+    max_results: int = Field(
+        default=5, description="Maximum number of search results per query"
+    )
+    include_answer: bool = Field(
+        default=True, description="Whether to include a synthesized answer per query"
+    )
+    max_concurrency: int = Field(
+        default=DEFAULT_BATCH_CONCURRENCY,
+        description="Maximum number of searches in flight at once",
+    )
+
+    def _batch(self, queries: List[str]):
+        return batch_search_async(
+            _coerce_queries(queries),
+            search_depth=self.search_depth,
+            max_results=self.max_results,
+            include_answer=self.include_answer,
+            max_concurrency=self.max_concurrency,
+        )
+
+    def _run(self, queries: List[str]) -> str:
+        """
+        Execute the batch search and return formatted merged results.
+
+        Args:
+            queries: Search queries
+
+        Returns:
+            Formatted string with merged search results
+        """
+        try:
+            return _format_batch_results(run_sync(self._batch(queries)))
+        except Exception as e:
+            return f"Batch search failed: {str(e)}"
+
+    async def _arun(self, queries: List[str]) -> str:
+        """Async version - runs on the shared IO loop without blocking the caller."""
+        try:
+            return _format_batch_results(await run_async(self._batch(queries)))
+        except Exception as e:
+            return f"Batch search failed: {str(e)}"
+
+
 # =======================================================================================
 # CUSTOMER RESEARCH TOOL
 # =======================================================================================
@@ -268,8 +602,33 @@ class CustomerResearchTool(BaseTool):
             return f"Customer research failed: {str(e)}"
 
     async def _arun(self, customer_segment: str) -> str:
-        """Async version - delegates to sync."""
-        return self._run(customer_segment)
+        """Async version - runs both searches concurrently."""
+        try:
+            search_tool = TavilySearchTool(max_results=8, search_depth="advanced")
+
+            pain_results, community_results = await asyncio.gather(
+                search_tool._arun(
+                    f"{customer_segment} challenges pain points problems struggles"
+                ),
+                search_tool._arun(
+                    f"{customer_segment} communities forums Reddit LinkedIn groups"
+                ),
+            )
+
+            output = [
+                f"# Customer Research: {customer_segment}",
+                "",
+                "## Pain Points & Challenges",
+                pain_results,
+                "",
+                "## Communities & Gathering Places",
+                community_results,
+            ]
+
+            return "\n".join(output)
+
+        except Exception as e:
+            return f"Customer research failed: {str(e)}"
 
 
 # =======================================================================================
@@ -304,3 +663,18 @@ def research_customers(customer_segment: str) -> str:
     """
     tool = CustomerResearchTool()
     return tool._run(customer_segment)
+
+
+def batch_web_search(queries: List[str], max_results: int = 5) -> str:
+    """
+    Convenience function for running several searches concurrently.
+
+    Args:
+        queries: Search queries
+        max_results: Maximum results per query
+
+    Returns:
+        Formatted merged search results
+    """
+    tool = BatchSearchTool(max_results=max_results)
+    return tool._run(queries)
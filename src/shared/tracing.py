@@ -0,0 +1,617 @@
+"""
+Latency tracing for validation runs: run -> phase -> crew -> task -> agent -> LLM/tool.
+
+Progress rows only say when a crew started and finished. A trace records
+nested spans with wall time, token counts and retry counts, so a phase can be
+broken down by crew, task, agent iteration, LLM call and tool call (e.g.
+whether one agent's 30 iterations or a whole crew dominates Phase 1).
+
+Where spans come from:
+    - run / phase: the Modal functions in app.py (trace_run / trace_phase)
+    - crew: crew_graph nodes (span(), propagated into the crew thread pool)
+    - LLM call: cached_llm / cached_chat_completion (timing + token usage);
+      each call is one agent iteration
+    - task / agent / tool: CrewAI event bus (TaskStarted/Completed,
+      AgentExecutionStarted/Completed, ToolUsageFinished/Error); CrewAI runs
+      these handlers on its own threads, so they are stitched to the crew
+      span through the task ids seen by the LLM calls
+
+Token and LLM call counts roll up to every ancestor span.
+
+Export (TRACE_EXPORT, comma-separated):
+    chrome - {TRACE_DIR}/{run_id}/{name}.trace.json, loadable in Perfetto or
+             chrome://tracing; merge a run's files with scripts/merge_traces.py
+    otel   - OpenTelemetry spans through the configured global tracer provider;
+             every container of a run shares one trace id derived from run_id
+
+Configuration:
+    TRACE_EXPORT: none | chrome | otel | chrome,otel (default: none - tracing off)
+    TRACE_DIR: Chrome trace directory (default: traces)
+"""
+
+import contextlib
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRACE_DIR = Path("traces")
+
+# Span kinds, outermost first
+RUN = "run"
+PHASE = "phase"
+CREW = "crew"
+TASK = "task"
+AGENT = "agent"
+LLM = "llm"
+TOOL = "tool"
+
+ROLLUP_ATTRIBUTES = ("prompt_tokens", "completion_tokens", "total_tokens", "llm_calls", "tool_calls")
+
+
+def trace_exporters() -> set[str]:
+    """Configured exporters (empty when tracing is off)."""
+    value = os.environ.get("TRACE_EXPORT", "none").strip().lower()
+    return {name.strip() for name in value.split(",") if name.strip() not in ("", "none")}
+
+
+def trace_id_for_run(run_id: str) -> str:
+    """Deterministic 32-hex trace id, shared by every container of a run."""
+    return hashlib.sha256(f"trace:{run_id}".encode("utf-8")).hexdigest()[:32]
+
+
+def _epoch_ns(value: Any) -> int:
+    """Event timestamp (datetime) to epoch nanoseconds."""
+    return int(value.timestamp() * 1_000_000_000)
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace."""
+
+    name: str
+    kind: str
+    trace_id: str
+    span_id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    parent_id: Optional[str] = None
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: Optional[int] = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+    thread: str = field(default_factory=lambda: threading.current_thread().name)
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1_000_000
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "thread": self.thread,
+            "attributes": self.attributes,
+        }
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "startupai_current_span", default=None
+)
+
+
+class Tracer:
+    """
+    Span collector for one traced unit of work (a phase or an orchestrator run).
+
+    Args:
+        run_id: Validation run ID (also determines the trace id)
+        name: File/trace name (e.g. "phase_1")
+    """
+
+    def __init__(self, run_id: str, name: str):
+        self.run_id = run_id
+        self.name = name
+        self.trace_id = trace_id_for_run(run_id)
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+        # Raw CrewAI events, stitched into spans by finish()
+        self._events: list[tuple[str, Any]] = []
+        self._task_parents: dict[str, str] = {}
+
+    # -- span creation ---------------------------------------------------------
+
+    def start_span(self, name: str, kind: str, parent: Optional[Span] = None, **attributes: Any) -> Span:
+        """Open a span under parent (default: the current span in this context)."""
+        parent = parent or _current_span.get()
+        span = Span(
+            name=name,
+            kind=kind,
+            trace_id=self.trace_id,
+            parent_id=parent.span_id if parent else None,
+            attributes={k: v for k, v in attributes.items() if v is not None},
+        )
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    @contextlib.contextmanager
+    def span(self, name: str, kind: str, **attributes: Any) -> Iterator[Span]:
+        """Time a block as a span and make it the current span."""
+        span = self.start_span(name, kind, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.attributes["error"] = str(e)[:500]
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            _current_span.reset(token)
+
+    def add_span(
+        self,
+        name: str,
+        kind: str,
+        start_ns: int,
+        end_ns: int,
+        parent_id: Optional[str],
+        status: str = "ok",
+        **attributes: Any,
+    ) -> Span:
+        """Add an already-finished span (from event timestamps)."""
+        span = Span(
+            name=name,
+            kind=kind,
+            trace_id=self.trace_id,
+            parent_id=parent_id,
+            start_ns=start_ns,
+            end_ns=end_ns,
+            status=status,
+            attributes={k: v for k, v in attributes.items() if v is not None},
+            thread="crewai-events",
+        )
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    # -- CrewAI integration ----------------------------------------------------
+
+    def link_task(self, task_id: Optional[str], parent: Optional[Span]) -> None:
+        """Remember which crew span a CrewAI task ran under."""
+        if task_id and parent is not None:
+            with self._lock:
+                self._task_parents.setdefault(task_id, parent.span_id)
+
+    def record_event(self, event_type: str, event: Any) -> None:
+        with self._lock:
+            self._events.append((event_type, event))
+
+    def _stitch_events(self) -> None:
+        """Turn CrewAI task/agent/tool events into spans under their crew spans."""
+        with self._lock:
+            events, self._events = self._events, []
+            task_parents = dict(self._task_parents)
+
+        open_tasks: dict[str, Any] = {}
+        open_agents: dict[tuple, Any] = {}
+        task_spans: dict[str, Span] = {}
+        agent_spans: dict[tuple, Span] = {}
+
+        for event_type, event in events:
+            task_id = getattr(event, "task_id", None)
+            agent_id = getattr(event, "agent_id", None)
+
+            if event_type == "task_started":
+                open_tasks[task_id] = event
+            elif event_type in ("task_completed", "task_failed") and task_id in open_tasks:
+                started = open_tasks.pop(task_id)
+                task_spans[task_id] = self.add_span(
+                    getattr(event, "task_name", None) or "task", TASK,
+                    _epoch_ns(started.timestamp), _epoch_ns(event.timestamp),
+                    task_parents.get(task_id),
+                    status="error" if event_type == "task_failed" else "ok",
+                    task_id=task_id,
+                )
+            elif event_type == "agent_started":
+                open_agents[(agent_id, task_id)] = event
+            elif event_type in ("agent_completed", "agent_failed") and (agent_id, task_id) in open_agents:
+                started = open_agents.pop((agent_id, task_id))
+                agent_spans[(agent_id, task_id)] = self.add_span(
+                    getattr(event, "agent_role", None) or "agent", AGENT,
+                    _epoch_ns(started.timestamp), _epoch_ns(event.timestamp),
+                    None,
+                    status="error" if event_type == "agent_failed" else "ok",
+                    agent_id=agent_id,
+                    task_id=task_id,
+                )
+
+        for span in agent_spans.values():
+            task = task_spans.get(span.attributes.get("task_id"))
+            span.parent_id = task.span_id if task else task_parents.get(span.attributes.get("task_id"))
+
+        def parent_for(task_id, agent_id) -> Optional[str]:
+            agent = agent_spans.get((agent_id, task_id))
+            task = task_spans.get(task_id)
+            return (agent or task).span_id if (agent or task) else task_parents.get(task_id)
+
+        for event_type, event in events:
+            if event_type not in ("tool_finished", "tool_failed"):
+                continue
+            task_id, agent_id = getattr(event, "task_id", None), getattr(event, "agent_id", None)
+            started_at = getattr(event, "started_at", None) or event.timestamp
+            finished_at = getattr(event, "finished_at", None) or event.timestamp
+            attempts = getattr(event, "run_attempts", None) or 1
+            self.add_span(
+                event.tool_name, TOOL,
+                _epoch_ns(started_at), _epoch_ns(finished_at),
+                parent_for(task_id, agent_id),
+                status="error" if event_type == "tool_failed" else "ok",
+                tool_calls=1,
+                retries=max(attempts - 1, 0),
+                from_cache=getattr(event, "from_cache", None),
+                task_id=task_id,
+            )
+
+        # LLM calls were opened under the crew span; move them under their agent
+        iterations: dict[Optional[str], int] = defaultdict(int)
+        for span in sorted(self.spans, key=lambda s: s.start_ns):
+            if span.kind != LLM or "task_id" not in span.attributes:
+                continue
+            task_id = span.attributes["task_id"]
+            parent = parent_for(task_id, span.attributes.get("agent_id"))
+            if parent:
+                span.parent_id = parent
+            iterations[(task_id, span.attributes.get("agent_id"))] += 1
+            span.attributes["iteration"] = iterations[(task_id, span.attributes.get("agent_id"))]
+
+    # -- finishing and export --------------------------------------------------
+
+    def _rollup(self) -> None:
+        """Sum token/LLM/tool counts from each span into all of its ancestors."""
+        by_id = {span.span_id: span for span in self.spans}
+        for span in self.spans:
+            values = {k: span.attributes[k] for k in ROLLUP_ATTRIBUTES if span.attributes.get(k)}
+            parent = by_id.get(span.parent_id)
+            seen = set()
+            while parent is not None and parent.span_id not in seen:
+                seen.add(parent.span_id)
+                for key, value in values.items():
+                    parent.attributes[f"sum_{key}"] = parent.attributes.get(f"sum_{key}", 0) + value
+                parent = by_id.get(parent.parent_id)
+
+    def finish(self) -> None:
+        """Stitch CrewAI events and roll up counts (call once, after the work ends)."""
+        self._stitch_events()
+        self._rollup()
+
+    def summary(self, top: int = 10) -> dict[str, Any]:
+        """Slowest spans per kind with their rolled-up counts."""
+        by_kind: dict[str, list[Span]] = defaultdict(list)
+        for span in self.spans:
+            by_kind[span.kind].append(span)
+        return {
+            kind: [
+                {
+                    "name": span.name,
+                    "duration_ms": round(span.duration_ms, 1),
+                    **{k: v for k, v in span.attributes.items()
+                       if k.startswith("sum_") or k in ("retries", "iteration")},
+                }
+                for span in sorted(spans, key=lambda s: s.duration_ms, reverse=True)[:top]
+            ]
+            for kind, spans in by_kind.items()
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Chrome trace event format (complete events, microseconds)."""
+        threads = {name: index for index, name in enumerate(sorted({s.thread for s in self.spans}), 1)}
+        events = [
+            {"ph": "M", "name": "thread_name", "pid": 1, "tid": tid, "args": {"name": name}}
+            for name, tid in threads.items()
+        ]
+        for span in sorted(self.spans, key=lambda s: s.start_ns):
+            events.append({
+                "name": span.name,
+                "cat": span.kind,
+                "ph": "X",
+                "ts": span.start_ns / 1000,
+                "dur": (span.end_ns or span.start_ns) / 1000 - span.start_ns / 1000,
+                "pid": 1,
+                "tid": threads[span.thread],
+                "args": {**span.attributes, "span_id": span.span_id,
+                         "parent_id": span.parent_id, "status": span.status},
+            })
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"run_id": self.run_id, "trace_id": self.trace_id, "name": self.name},
+        }
+
+    def write_chrome_trace(self, directory: Path) -> Path:
+        path = Path(directory) / self.run_id / f"{self.name}.trace.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace(), default=str))
+        return path
+
+    def export_otel(self) -> int:
+        """
+        Emit the spans through the global OpenTelemetry tracer provider.
+
+        Root spans are parented to a remote span context derived from the run
+        id, so spans from every container of a run land in one trace.
+
+        Returns:
+            Number of spans exported (0 if OpenTelemetry is not installed)
+        """
+        try:
+            from opentelemetry import trace
+            from opentelemetry.trace import NonRecordingSpan, SpanContext, Status, StatusCode, TraceFlags
+        except ImportError:
+            return 0
+
+        otel_tracer = trace.get_tracer("startupai.validation")
+        root = SpanContext(
+            trace_id=int(self.trace_id, 16),
+            span_id=int(hashlib.sha256(f"run:{self.run_id}".encode()).hexdigest()[:16], 16),
+            is_remote=True,
+            trace_flags=TraceFlags(TraceFlags.SAMPLED),
+        )
+        root_context = trace.set_span_in_context(NonRecordingSpan(root))
+
+        created: dict[str, Any] = {}
+        for span in sorted(self.spans, key=lambda s: s.start_ns):
+            parent = created.get(span.parent_id)
+            context = trace.set_span_in_context(parent) if parent is not None else root_context
+            attributes = {
+                f"startupai.{k}": v if isinstance(v, (str, bool, int, float)) else json.dumps(v, default=str)
+                for k, v in span.attributes.items()
+            }
+            otel_span = otel_tracer.start_span(
+                span.name,
+                context=context,
+                start_time=span.start_ns,
+                attributes={**attributes, "startupai.kind": span.kind, "startupai.run_id": self.run_id},
+            )
+            if span.status == "error":
+                otel_span.set_status(Status(StatusCode.ERROR))
+            created[span.span_id] = otel_span
+
+        for span in self.spans:
+            created[span.span_id].end(end_time=span.end_ns or span.start_ns)
+        return len(created)
+
+    def export(self, exporters: set[str], directory: Path) -> None:
+        """Export to each configured exporter; failures are logged, never raised."""
+        for exporter in exporters:
+            try:
+                if exporter == "chrome":
+                    path = self.write_chrome_trace(directory)
+                    logger.info(json.dumps({"event": "trace_written", "run_id": self.run_id, "path": str(path)}))
+                elif exporter == "otel":
+                    self.export_otel()
+            except Exception as e:
+                logger.warning(json.dumps({
+                    "event": "trace_export_failed",
+                    "run_id": self.run_id,
+                    "exporter": exporter,
+                    "error": str(e),
+                }))
+
+
+# -----------------------------------------------------------------------------
+# Process-wide tracer
+# -----------------------------------------------------------------------------
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    """The active tracer in this container (None when tracing is off)."""
+    return _tracer
+
+
+@contextlib.contextmanager
+def span(name: str, kind: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Time a block under the active tracer (no-op when tracing is off)."""
+    tracer = _tracer
+    if tracer is None:
+        yield None
+        return
+    with tracer.span(name, kind, **attributes) as active:
+        yield active
+
+
+@contextlib.contextmanager
+def _trace(run_id: str, name: str, kind: str, directory: Optional[Path], **attributes: Any) -> Iterator[Optional[Tracer]]:
+    global _tracer
+    exporters = trace_exporters()
+    if not exporters or _tracer is not None:
+        yield None
+        return
+
+    tracer = Tracer(run_id, name)
+    _install_crewai_listeners()
+    _tracer = tracer
+    try:
+        with tracer.span(name, kind, run_id=run_id, **attributes):
+            yield tracer
+    finally:
+        _tracer = None
+        tracer.finish()
+        logger.info(json.dumps({
+            "event": "trace_summary",
+            "run_id": run_id,
+            "trace": name,
+            "summary": tracer.summary(top=5),
+        }, default=str))
+        tracer.export(exporters, Path(directory or os.environ.get("TRACE_DIR", DEFAULT_TRACE_DIR)))
+
+
+def trace_phase(run_id: str, phase_num: int, directory: Optional[Path] = None):
+    """Trace one phase execution (context manager yielding the Tracer or None)."""
+    return _trace(run_id, f"phase_{phase_num}", PHASE, directory, phase=phase_num)
+
+
+def trace_run(run_id: str, directory: Optional[Path] = None):
+    """Trace one orchestrator invocation (context manager yielding the Tracer or None)."""
+    return _trace(run_id, f"run_{int(time.time())}", RUN, directory)
+
+
+# -----------------------------------------------------------------------------
+# LLM hooks
+# -----------------------------------------------------------------------------
+
+_USAGE_KEYS = ("prompt_tokens", "completion_tokens", "total_tokens")
+
+
+def _usage_snapshot(llm: Any) -> dict[str, int]:
+    usage = getattr(llm, "_token_usage", None) or {}
+    return {key: int(usage.get(key, 0) or 0) for key in _USAGE_KEYS}
+
+
+def wrap_llm_for_tracing(llm: Any) -> Any:
+    """Open an LLM span (one agent iteration) around each call() while tracing."""
+    original_call = llm.call
+
+    def call(messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None):
+        passthrough = dict(
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model,
+        )
+        tracer = _tracer
+        if tracer is None:
+            return original_call(messages, **passthrough)
+
+        task_id = str(from_task.id) if getattr(from_task, "id", None) else None
+        agent = from_agent or getattr(from_task, "agent", None)
+        tracer.link_task(task_id, _current_span.get())
+        before = _usage_snapshot(llm)
+
+        with tracer.span(
+            llm.model, LLM,
+            task_id=task_id,
+            agent_id=str(agent.id) if getattr(agent, "id", None) else None,
+            agent=getattr(agent, "role", None),
+            llm_calls=1,
+        ) as active:
+            try:
+                return original_call(messages, **passthrough)
+            finally:
+                after = _usage_snapshot(llm)
+                for key in _USAGE_KEYS:
+                    if after[key] > before[key]:
+                        active.attributes[key] = after[key] - before[key]
+
+    llm.call = call
+    return llm
+
+
+def record_llm_usage(active: Optional[Span], usage: Any) -> None:
+    """Copy an OpenAI SDK response's usage onto an LLM span."""
+    if active is None or usage is None:
+        return
+    for key in _USAGE_KEYS:
+        value = getattr(usage, key, None)
+        if isinstance(value, int):
+            active.attributes[key] = value
+
+
+# -----------------------------------------------------------------------------
+# CrewAI event bus listeners
+# -----------------------------------------------------------------------------
+
+_listeners_installed = False
+_listeners_lock = threading.Lock()
+
+
+def _install_crewai_listeners() -> None:
+    """Register event bus handlers once per process; they no-op when not tracing."""
+    global _listeners_installed
+    with _listeners_lock:
+        if _listeners_installed:
+            return
+        try:
+            from crewai.events import crewai_event_bus
+            from crewai.events.types.agent_events import (
+                AgentExecutionCompletedEvent,
+                AgentExecutionErrorEvent,
+                AgentExecutionStartedEvent,
+            )
+            from crewai.events.types.task_events import (
+                TaskCompletedEvent,
+                TaskFailedEvent,
+                TaskStartedEvent,
+            )
+            from crewai.events.types.tool_usage_events import (
+                ToolUsageErrorEvent,
+                ToolUsageFinishedEvent,
+            )
+        except ImportError:
+            return
+
+        def forward(event_type: str):
+            def handler(source, event):
+                tracer = _tracer
+                if tracer is None:
+                    return
+                if event_type.startswith("agent_"):
+                    # Agent events carry the objects rather than ids
+                    agent, task = getattr(event, "agent", None), getattr(event, "task", None)
+                    event.agent_id = str(agent.id) if getattr(agent, "id", None) else event.agent_id
+                    event.agent_role = getattr(agent, "role", None) or event.agent_role
+                    event.task_id = str(task.id) if getattr(task, "id", None) else event.task_id
+                task = getattr(event, "task", None)
+                if event_type.startswith("task_") and task is not None:
+                    event.task_id = event.task_id or str(task.id)
+                    event.task_name = event.task_name or task.name or task.description[:80]
+                tracer.record_event(event_type, event)
+            return handler
+
+        for event_class, event_type in (
+            (TaskStartedEvent, "task_started"),
+            (TaskCompletedEvent, "task_completed"),
+            (TaskFailedEvent, "task_failed"),
+            (AgentExecutionStartedEvent, "agent_started"),
+            (AgentExecutionCompletedEvent, "agent_completed"),
+            (AgentExecutionErrorEvent, "agent_failed"),
+            (ToolUsageFinishedEvent, "tool_finished"),
+            (ToolUsageErrorEvent, "tool_failed"),
+        ):
+            crewai_event_bus.on(event_class)(forward(event_type))
+
+        _listeners_installed = True
+
+
+def merge_chrome_traces(paths: list[Path]) -> dict[str, Any]:
+    """Combine per-container Chrome traces of a run into one timeline (one process each)."""
+    merged: list[dict] = []
+    for pid, path in enumerate(sorted(map(Path, paths)), 1):
+        data = json.loads(Path(path).read_text())
+        merged.append({"ph": "M", "name": "process_name", "pid": pid,
+                       "args": {"name": data.get("otherData", {}).get("name", path.stem)}})
+        merged.extend({**event, "pid": pid} for event in data.get("traceEvents", []))
+    return {"traceEvents": merged, "displayTimeUnit": "ms"}
@@ -39,6 +39,25 @@ from .persistence import (
     update_progress,
     create_hitl_request,
     get_hitl_decision,
+    load_phase_state,
+    save_phase_state,
+    compact_state,
+    save_state_snapshot,
+    load_state_snapshot,
+)
+from .progress_sink import (
+    ProgressSink,
+    get_progress_sink,
+    flush_progress,
+)
+from .run_status import get_run_status
+from .hitl import apply_hitl_decision, HITLDecisionError
+from .run_events import record_run_event, stream_run_events
+from .webhook_outbox import enqueue_webhook, deliver_pending
+from .codec import (
+    encode_snapshot,
+    decode_snapshot,
+    LazyStateSnapshot,
 )
 
 __all__ = [
@@ -75,4 +94,26 @@ __all__ = [
     "update_progress",
     "create_hitl_request",
     "get_hitl_decision",
+    "load_phase_state",
+    "save_phase_state",
+    "compact_state",
+    "save_state_snapshot",
+    "load_state_snapshot",
+    # Progress sink
+    "ProgressSink",
+    "get_progress_sink",
+    "flush_progress",
+    # Status reads
+    "get_run_status",
+    "apply_hitl_decision",
+    "HITLDecisionError",
+    "record_run_event",
+    "stream_run_events",
+    # Webhook outbox
+    "enqueue_webhook",
+    "deliver_pending",
+    # Snapshot codec
+    "encode_snapshot",
+    "decode_snapshot",
+    "LazyStateSnapshot",
 ]
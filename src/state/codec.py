@@ -0,0 +1,206 @@
+"""
+Compressed binary snapshot format for validation state.
+
+phase_state grows through the run (Founder's Brief, VPC, evidence, raw crew
+outputs such as discovery_results), and storing it verbatim as JSONB makes
+every resume download and parse the whole blob. A snapshot compresses each
+top-level section separately behind a small header, so readers only
+decompress the sections they touch.
+
+Layout:
+    b"SAIS"            magic
+    u8                 format version (FORMAT_VERSION)
+    u8                 compression (1 = zstd, 2 = zlib)
+    u32 (big endian)   header length
+    header             JSON: {"schema_version", "sections": [[name, offset, length], ...]}
+    section bytes      compressed JSON per section, offsets relative to the body
+
+zstd (zstandard) and orjson are optional; without them the codec falls back
+to zlib and the stdlib json module. Snapshots written with zstd need
+zstandard installed to read.
+
+Usage:
+    from src.state.codec import encode_snapshot, LazyStateSnapshot
+
+    blob = encode_snapshot(phase_state)
+    snapshot = LazyStateSnapshot(blob)
+    brief = snapshot["founders_brief"]  # only this section is decompressed
+"""
+
+import json
+import struct
+import zlib
+from collections.abc import Mapping
+from typing import Any, Iterator, Optional
+
+MAGIC = b"SAIS"
+FORMAT_VERSION = 1
+SNAPSHOT_SCHEMA_VERSION = 1
+
+COMPRESSION_ZSTD = 1
+COMPRESSION_ZLIB = 2
+
+_PREAMBLE = struct.Struct(">4sBBI")
+
+try:
+    import zstandard as _zstd
+except ImportError:  # pragma: no cover - depends on environment
+    _zstd = None
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+
+class SnapshotFormatError(ValueError):
+    """Raised when a blob is not a readable state snapshot."""
+
+
+# -----------------------------------------------------------------------------
+# Serialization / Compression
+# -----------------------------------------------------------------------------
+
+def _dumps(value: Any) -> bytes:
+    if _orjson is not None:
+        return _orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def default_compression() -> int:
+    """zstd when zstandard is installed, zlib otherwise."""
+    return COMPRESSION_ZSTD if _zstd is not None else COMPRESSION_ZLIB
+
+
+def _compress(data: bytes, compression: int) -> bytes:
+    if compression == COMPRESSION_ZSTD:
+        if _zstd is None:
+            raise SnapshotFormatError("zstd compression requires the zstandard package")
+        return _zstd.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(data: bytes, compression: int) -> bytes:
+    if compression == COMPRESSION_ZSTD:
+        if _zstd is None:
+            raise SnapshotFormatError("snapshot uses zstd; install zstandard to read it")
+        return _zstd.ZstdDecompressor().decompress(data)
+    if compression == COMPRESSION_ZLIB:
+        return zlib.decompress(data)
+    raise SnapshotFormatError(f"unknown compression id: {compression}")
+
+
+# -----------------------------------------------------------------------------
+# Encode / Decode
+# -----------------------------------------------------------------------------
+
+def encode_snapshot(state: Any, compression: Optional[int] = None) -> bytes:
+    """
+    Encode a state dict (or ValidationRunState) as a compressed snapshot.
+
+    Args:
+        state: phase_state dict or a pydantic model
+        compression: COMPRESSION_ZSTD or COMPRESSION_ZLIB (default: best available)
+
+    Returns:
+        Snapshot bytes
+    """
+    if hasattr(state, "model_dump"):
+        state = state.model_dump(mode="json")
+
+    compression = compression or default_compression()
+
+    sections = []
+    chunks = []
+    offset = 0
+    for name, value in state.items():
+        chunk = _compress(_dumps(value), compression)
+        sections.append([name, offset, len(chunk)])
+        chunks.append(chunk)
+        offset += len(chunk)
+
+    header = _dumps({
+        "schema_version": SNAPSHOT_SCHEMA_VERSION,
+        "sections": sections,
+    })
+
+    return b"".join([
+        _PREAMBLE.pack(MAGIC, FORMAT_VERSION, compression, len(header)),
+        header,
+        *chunks,
+    ])
+
+
+def is_snapshot(blob: bytes) -> bool:
+    """Check whether bytes start with the snapshot magic."""
+    return isinstance(blob, (bytes, bytearray, memoryview)) and bytes(blob[:4]) == MAGIC
+
+
+class LazyStateSnapshot(Mapping):
+    """
+    Read-only mapping over a snapshot that decodes sections on first access.
+
+    Iterating keys or checking membership never decompresses anything.
+    """
+
+    def __init__(self, blob: bytes):
+        blob = bytes(blob)
+        if len(blob) < _PREAMBLE.size:
+            raise SnapshotFormatError("snapshot is truncated")
+
+        magic, version, compression, header_len = _PREAMBLE.unpack_from(blob)
+        if magic != MAGIC:
+            raise SnapshotFormatError("not a state snapshot")
+        if version > FORMAT_VERSION:
+            raise SnapshotFormatError(f"unsupported snapshot format version: {version}")
+
+        header_end = _PREAMBLE.size + header_len
+        header = _loads(blob[_PREAMBLE.size:header_end])
+
+        self.format_version = version
+        self.compression = compression
+        self.schema_version = header.get("schema_version", SNAPSHOT_SCHEMA_VERSION)
+        self._body = memoryview(blob)[header_end:]
+        self._index = {name: (offset, length) for name, offset, length in header["sections"]}
+        self._decoded: dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._decoded:
+            return self._decoded[name]
+        offset, length = self._index[name]
+        value = _loads(_decompress(self._body[offset:offset + length], self.compression))
+        self._decoded[name] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    @property
+    def decoded_sections(self) -> list[str]:
+        """Sections decompressed so far."""
+        return list(self._decoded)
+
+    def section_size(self, name: str) -> int:
+        """Compressed size of a section in bytes."""
+        return self._index[name][1]
+
+    def to_dict(self) -> dict:
+        """Decode every section."""
+        return {name: self[name] for name in self._index}
+
+
+def decode_snapshot(blob: bytes) -> dict:
+    """Decode a full snapshot into a state dict."""
+    return LazyStateSnapshot(blob).to_dict()
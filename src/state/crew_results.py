@@ -0,0 +1,149 @@
+"""
+Crew result memoization for phase retries.
+
+A phase retried by Modal re-runs its crew graph from the start. Crews that
+already completed would repeat minutes of LLM work, so each completed crew's
+result is stored in crew_results (db/migrations/015_crew_results.sql) under
+the idempotency key (run_id, phase, crew, input_hash). The input hash covers
+the phase inputs (which include iteration_count and pivot context) and the
+results of the crews it depends on, so changed inputs never reuse a stale
+result.
+
+Only JSON-native results (dict/list/str/number/bool/None) are stored; other
+results are recomputed on retry. Storage failures never fail the phase.
+
+Configuration:
+    CREW_RESULT_MEMO: Set to 0 to disable memoization (default: enabled)
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Optional
+
+from .persistence import get_supabase
+
+logger = logging.getLogger(__name__)
+
+
+def memo_enabled() -> bool:
+    """Check whether crew result memoization is enabled."""
+    return os.environ.get("CREW_RESULT_MEMO", "1").strip().lower() not in ("0", "false", "no")
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _is_json_native(value: Any) -> bool:
+    try:
+        return json.loads(json.dumps(value)) == value
+    except (TypeError, ValueError):
+        return False
+
+
+class CrewResultMemo:
+    """
+    Stored crew results for one run phase.
+
+    Args:
+        run_id: Validation run ID
+        phase: Phase number
+        inputs: Phase inputs that determine crew outputs (e.g. phase state)
+        stored: {(crew, input_hash): result} already persisted
+        supabase: Supabase client used for saves
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        phase: int,
+        inputs: Any,
+        stored: Optional[dict[tuple[str, str], Any]] = None,
+        supabase=None,
+    ):
+        self.run_id = run_id
+        self.phase = phase
+        self.inputs_digest = _digest(inputs)
+        self._stored = stored or {}
+        self._supabase = supabase
+
+    @classmethod
+    def load(cls, run_id: str, phase: int, inputs: Any, supabase=None) -> "CrewResultMemo":
+        """Read every stored result for the run phase in one query."""
+        stored: dict[tuple[str, str], Any] = {}
+        try:
+            supabase = supabase or get_supabase()
+            result = supabase.table("crew_results").select(
+                "crew", "input_hash", "result"
+            ).eq("run_id", run_id).eq("phase", phase).execute()
+            for row in result.data or []:
+                stored[(row["crew"], row["input_hash"])] = row["result"]
+        except Exception as e:
+            logger.warning(json.dumps({
+                "event": "crew_results_load_failed",
+                "run_id": run_id,
+                "phase": phase,
+                "error": str(e),
+            }))
+        return cls(run_id, phase, inputs, stored, supabase)
+
+    def key(self, crew: str, dependency_results: dict[str, Any]) -> str:
+        """Input hash for a crew given the results of its dependencies."""
+        return _digest({
+            "inputs": self.inputs_digest,
+            "crew": crew,
+            "dependencies": dependency_results,
+        })
+
+    def get(self, crew: str, key: str) -> tuple[bool, Any]:
+        """
+        Look up a stored result.
+
+        Returns:
+            (found, result) - result may legitimately be None
+        """
+        if (crew, key) in self._stored:
+            return True, self._stored[(crew, key)]
+        return False, None
+
+    def save(self, crew: str, key: str, result: Any) -> bool:
+        """
+        Persist a completed crew's result.
+
+        Returns:
+            True if stored
+        """
+        if not _is_json_native(result):
+            logger.info(json.dumps({
+                "event": "crew_result_not_memoized",
+                "run_id": self.run_id,
+                "phase": self.phase,
+                "crew": crew,
+                "type": type(result).__name__,
+            }))
+            return False
+
+        try:
+            (self._supabase or get_supabase()).table("crew_results").upsert({
+                "run_id": self.run_id,
+                "phase": self.phase,
+                "crew": crew,
+                "input_hash": key,
+                "result": result,
+            }, on_conflict="run_id,phase,crew,input_hash").execute()
+        except Exception as e:
+            logger.warning(json.dumps({
+                "event": "crew_result_save_failed",
+                "run_id": self.run_id,
+                "phase": self.phase,
+                "crew": crew,
+                "error": str(e),
+            }))
+            return False
+
+        self._stored[(crew, key)] = result
+        return True
@@ -0,0 +1,249 @@
+"""
+HITL decisions applied in a single transactional RPC.
+
+/hitl/approve used to update hitl_requests, read validation_runs (plus the
+request context for segment pivots) and update validation_runs in separate
+round trips before spawning the resume, so two approvals of the same
+checkpoint could both resume the run. apply_hitl_decision() makes one call
+to hitl_apply_decision() (db/migrations/017_hitl_apply_decision.sql), which
+locks the run, checks the checkpoint is still awaiting a decision, records
+the decision, updates phase_state and moves the run in one transaction.
+
+Only the parts that need no database stay here: parsing the
+SEGMENT_PIVOT| envelope of iterate feedback, and (STATE_CHECKPOINT_MODE=
+snapshot only) reading the iteration count from the Storage snapshot,
+which SQL cannot see.
+
+expire_hitl_requests() runs the expiry sweep through the RPC of the same
+name (db/migrations/018_hitl_expiry.sql), which expires a bounded batch of
+stale requests, fails the runs still paused on them and queues a
+validation_failed webhook per failed run in a single statement, returning
+only ids.
+
+Configuration:
+    HITL_EXPIRY_BATCH: Requests expired per RPC call (default: 500)
+    HITL_EXPIRED_WEBHOOK: Set to "1" to also queue one batched hitl_expired
+        webhook per RPC call (default: off; the product app does not handle
+        that flow_type yet, see docs/features/integration-contracts.md)
+"""
+
+import json
+import logging
+import os
+from typing import Any, Optional
+
+from .persistence import get_checkpoint_mode, get_supabase, load_state_snapshot
+from .webhook_outbox import product_app_webhook_url
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_PIVOT_PREFIX = "SEGMENT_PIVOT|"
+
+# RPC error -> HTTP status
+ERROR_STATUS = {"not_found": 404, "conflict": 409, "invalid": 400}
+
+DEFAULT_EXPIRY_BATCH = 500
+
+
+class HITLDecisionError(Exception):
+    """A HITL decision was refused (status_code is the HTTP status to return)."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def parse_segment_pivot_envelope(run_id: str, feedback: Optional[str]) -> dict[str, Any]:
+    """
+    Pivot keys from a SEGMENT_PIVOT|{"target_segment", "rationale"} envelope.
+
+    pivot_from_phase and failed_segment are filled in by the RPC.
+
+    Returns:
+        phase_state keys to set ({} if there is no valid envelope)
+    """
+    if not (feedback or "").startswith(SEGMENT_PIVOT_PREFIX):
+        return {}
+
+    try:
+        pivot_json = json.loads(feedback[len(SEGMENT_PIVOT_PREFIX):])
+        target_segment = pivot_json.get("target_segment", "").strip()
+        rationale = pivot_json.get("rationale", "").strip()
+    except (json.JSONDecodeError, TypeError, AttributeError) as parse_err:
+        logger.warning(json.dumps({
+            "event": "segment_pivot_envelope_parse_failed",
+            "run_id": run_id,
+            "error": str(parse_err),
+        }))
+        return {}
+
+    if not target_segment:
+        return {}
+
+    logger.info(json.dumps({
+        "event": "segment_pivot_from_envelope",
+        "run_id": run_id,
+        "target_segment": target_segment,
+    }))
+    return {
+        "pivot_type": "segment_pivot",
+        "pivot_reason": rationale or "Segment pivot requested by user",
+        "target_segment_hypothesis": {
+            "segment_name": target_segment,
+            "segment_description": rationale or target_segment,
+            "why_better_fit": rationale or "User-specified pivot",
+        },
+    }
+
+
+def _snapshot_iteration_updates(run_id: str, envelope: dict, supabase) -> dict[str, Any]:
+    """
+    Iterate keys derived from a Storage snapshot (snapshot mode only).
+
+    Only the iteration_count and customer_profile sections are decompressed.
+    Keys stored next to the pointer (earlier decisions' state updates) take
+    precedence over the snapshot, as in load_phase_state.
+    """
+    run = supabase.table("validation_runs").select(
+        "phase_state"
+    ).eq("id", run_id).single().execute().data or {}
+    stored = run.get("phase_state") or {}
+    snapshot = load_state_snapshot(run_id, run, supabase) or {}
+
+    def read(key: str) -> Any:
+        return stored[key] if key in stored else snapshot.get(key)
+
+    updates: dict[str, Any] = {"iteration_count": (read("iteration_count") or 0) + 1}
+    current_segment = (read("customer_profile") or {}).get("segment_name")
+    if envelope and current_segment:
+        updates["failed_segment"] = current_segment
+    return updates
+
+
+def apply_hitl_decision(
+    run_id: str,
+    checkpoint: str,
+    decision: str,
+    feedback: Optional[str] = None,
+    custom_segment_data: Optional[dict] = None,
+    supabase=None,
+) -> dict[str, Any]:
+    """
+    Record a HITL decision and move the run in one transaction.
+
+    Args:
+        run_id: Validation run ID
+        checkpoint: Checkpoint name being decided
+        decision: approved | rejected | override_proceed | iterate |
+            segment_<n> | custom_segment
+        feedback: Optional reviewer feedback
+        custom_segment_data: Segment for custom_segment decisions
+        supabase: Supabase client (default: get_supabase())
+
+    Returns:
+        {outcome, next_phase, pivot_type, resume, segment_name, confidence,
+        previous_phase}; outcome is resumed | pivot | iterate | rejected
+
+    Raises:
+        HITLDecisionError: run not found (404), checkpoint already decided
+            or not awaiting a decision (409), invalid segment selection (400)
+    """
+    supabase = supabase or get_supabase()
+
+    state_updates: dict[str, Any] = {}
+    if decision == "iterate":
+        state_updates = parse_segment_pivot_envelope(run_id, feedback)
+        if get_checkpoint_mode() == "snapshot":
+            state_updates.update(_snapshot_iteration_updates(run_id, state_updates, supabase))
+
+    result = supabase.rpc("hitl_apply_decision", {
+        "p_run_id": run_id,
+        "p_checkpoint": checkpoint,
+        "p_decision": decision,
+        "p_feedback": feedback,
+        "p_custom_segment": custom_segment_data or None,
+        "p_state_updates": state_updates,
+    }).execute()
+
+    outcome = result.data or {}
+    error = outcome.get("error")
+    if error:
+        logger.warning(json.dumps({
+            "event": "hitl_decision_refused",
+            "run_id": run_id,
+            "checkpoint": checkpoint,
+            "decision": decision,
+            "error": error,
+        }))
+        raise HITLDecisionError(ERROR_STATUS.get(error, 400), outcome.get("detail") or error)
+
+    return outcome
+
+
+def decision_message(outcome: dict[str, Any], checkpoint: str, decision: str) -> str:
+    """Human-readable message for an applied decision (HITLApproveResponse.message)."""
+    kind = outcome.get("outcome")
+    next_phase = outcome.get("next_phase")
+
+    if kind == "pivot":
+        if decision.startswith("segment_") or decision == "custom_segment":
+            return f"Segment pivot approved. Targeting '{outcome.get('segment_name')}' in Phase 1."
+        pivot_type = outcome.get("pivot_type") or "pivot"
+        return f"Pivot approved. Returning to Phase 1 for {pivot_type.replace('_', ' ')}."
+    if kind == "iterate":
+        return f"Iteration requested. Re-running Phase {next_phase} with additional experiments."
+    if kind == "rejected":
+        return f"Checkpoint '{checkpoint}' rejected. Review required."
+    if decision == "override_proceed":
+        return f"Override applied. Proceeding to Phase {next_phase} despite pivot recommendation."
+    if checkpoint == "approve_brief":
+        return "Brief approved. Proceeding to VPC Discovery (Stage B)."
+    return f"Validation resumed from checkpoint '{checkpoint}'. Advancing to Phase {next_phase}."
+
+
+def expire_hitl_requests(supabase=None, limit: Optional[int] = None) -> dict[str, Any]:
+    """
+    Expire stale HITL requests, fail their runs and queue the notification.
+
+    Calls the expiry RPC until a batch comes back short, so a backlog is
+    cleared in one sweep.
+
+    Args:
+        supabase: Supabase client (default: get_supabase())
+        limit: Requests per RPC call (default: HITL_EXPIRY_BATCH)
+
+    Returns:
+        Counts: expired, runs_failed, notifications (queued webhooks); plus request_ids
+    """
+    supabase = supabase or get_supabase()
+    limit = max(limit or int(os.environ.get("HITL_EXPIRY_BATCH", DEFAULT_EXPIRY_BATCH)), 1)
+    endpoint = product_app_webhook_url()
+    batch_notification = os.environ.get("HITL_EXPIRED_WEBHOOK", "0").strip().lower() in ("1", "true", "yes")
+
+    totals: dict[str, Any] = {"expired": 0, "runs_failed": 0, "notifications": 0, "request_ids": []}
+    while True:
+        result = supabase.rpc("expire_hitl_requests", {
+            "p_limit": limit,
+            "p_endpoint": endpoint,
+            "p_batch_notification": batch_notification,
+        }).execute()
+        batch = result.data or {}
+
+        totals["expired"] += batch.get("expired", 0)
+        totals["runs_failed"] += batch.get("runs_failed", 0)
+        totals["request_ids"].extend(batch.get("request_ids") or [])
+        totals["notifications"] += batch.get("notifications", 0)
+
+        if batch.get("expired", 0) < limit:
+            break
+
+    if totals["expired"]:
+        logger.info(json.dumps({
+            "event": "hitl_expired",
+            "count": totals["expired"],
+            "runs_failed": totals["runs_failed"],
+            "notifications": totals["notifications"],
+        }))
+
+    return totals
@@ -656,3 +656,6 @@ class ValidationRunState(BaseModel):
     # Error tracking
     error_message: Optional[str] = None
     retry_count: int = 0
+
+    # LLM budget: limits, spend and degradation history (src/shared/llm_budget.py)
+    llm_budget: Optional[dict[str, Any]] = None
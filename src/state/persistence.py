@@ -3,16 +3,32 @@ Supabase persistence layer for validation state.
 
 Implements checkpoint/resume pattern for Modal serverless functions.
 $0 cost during HITL waits - containers terminate after checkpointing.
+
+State checkpoint modes (STATE_CHECKPOINT_MODE):
+    full  - Every save rewrites validation_runs.phase_state (default)
+    delta - Saves append a per-key patch to validation_state_patches with only
+            the changed top-level keys; patches are folded back into
+            phase_state every STATE_COMPACT_EVERY patches
+            (see db/migrations/011_state_patches.sql)
+    snapshot - Saves upload a compressed snapshot (src/state/codec.py) to the
+            STATE_SNAPSHOT_BUCKET Supabase Storage bucket and store only a
+            small pointer in phase_state; readers that need only a few
+            sections (HITL iterate decisions) decode just those
+
+Switching from delta back to full requires compacting runs with pending
+patches first (compact_state), otherwise they are re-applied on load.
 """
 
 import os
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Optional, Any
+from typing import Optional, Any, Iterable
 from uuid import UUID
 
+from .codec import LazyStateSnapshot, encode_snapshot
 from .models import ValidationRunState, HITLCheckpoint
+from .progress_sink import flush_progress, get_progress_sink
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +50,286 @@ def get_supabase():
     return _supabase_client
 
 
+# -----------------------------------------------------------------------------
+# Delta State Checkpoints
+# -----------------------------------------------------------------------------
+
+STATE_CHECKPOINT_MODES = ("full", "delta", "snapshot")
+DEFAULT_COMPACT_EVERY = 8
+
+
+def get_checkpoint_mode() -> str:
+    """Get the configured checkpoint mode (full | delta | snapshot)."""
+    mode = os.environ.get("STATE_CHECKPOINT_MODE", "full").strip().lower()
+    return mode if mode in STATE_CHECKPOINT_MODES else "full"
+
+
+def diff_state(previous: dict, current: dict) -> tuple[dict, list[str]]:
+    """
+    Compute a per-key patch between two phase_state dicts.
+
+    Keys are the top-level state sections (founders_brief, customer_profile,
+    desirability_evidence, ...), so unchanged sections are never rewritten.
+
+    Returns:
+        (set_values, unset_keys)
+    """
+    set_values = {
+        key: value for key, value in current.items()
+        if key not in previous or previous[key] != value
+    }
+    unset_keys = [key for key in previous if key not in current]
+    return set_values, unset_keys
+
+
+def apply_state_patches(base: dict, patches: Iterable[dict]) -> dict:
+    """Apply patches (ordered by version) on top of a base phase_state."""
+    state = dict(base or {})
+    for patch in patches:
+        state.update(patch.get("set_values") or {})
+        for key in patch.get("unset_keys") or []:
+            state.pop(key, None)
+    return state
+
+
+def load_phase_state(run_id: str, run: Optional[dict] = None, supabase=None) -> dict:
+    """
+    Load the materialized phase_state for a run (base + pending patches).
+
+    Works with any checkpoint mode; runs without the state_version columns
+    (pre-011 rows) just return phase_state. Snapshot pointers are resolved
+    and fully decoded.
+
+    Args:
+        run_id: Validation run ID
+        run: validation_runs row if already fetched
+        supabase: Supabase client (default: get_supabase())
+
+    Returns:
+        phase_state dict
+    """
+    supabase = supabase or get_supabase()
+
+    if run is None:
+        result = supabase.table("validation_runs").select(
+            "phase_state", "state_version", "state_base_version"
+        ).eq("id", run_id).single().execute()
+        run = result.data or {}
+
+    base = run.get("phase_state") or {}
+    if SNAPSHOT_STUB_KEY in base:
+        snapshot = load_state_snapshot(run_id, run, supabase)
+        base = _merge_snapshot(snapshot, base)
+
+    version = run.get("state_version") or 0
+    base_version = run.get("state_base_version") or 0
+    if version <= base_version:
+        return base
+
+    patches = supabase.table("validation_state_patches").select(
+        "version", "set_values", "unset_keys"
+    ).eq("run_id", run_id).gt("version", base_version).lte(
+        "version", version
+    ).order("version").execute()
+
+    return apply_state_patches(base, patches.data or [])
+
+
+def compact_state(run_id: str, supabase=None) -> int:
+    """
+    Fold pending patches into validation_runs.phase_state.
+
+    Returns:
+        Number of patches folded
+    """
+    supabase = supabase or get_supabase()
+    result = supabase.rpc("compact_state_patches", {"p_run_id": run_id}).execute()
+    folded = result.data or 0
+
+    logger.info(json.dumps({
+        "event": "state_patches_compacted",
+        "run_id": run_id,
+        "patches": folded,
+    }))
+
+    return folded
+
+
+def save_phase_state(
+    run_id: str,
+    state: dict,
+    previous_state: Optional[dict] = None,
+    supabase=None,
+    **run_fields: Any,
+) -> None:
+    """
+    Persist phase_state plus any other validation_runs columns.
+
+    In full mode this is a single UPDATE. In delta mode only the top-level
+    keys that differ from previous_state are written as a patch; the RPC
+    sets the remaining columns (status, hitl_state, ...) in the same
+    statement, so state and run markers never diverge. In snapshot mode the
+    state is uploaded to Storage and phase_state holds the pointer.
+
+    Args:
+        run_id: Validation run ID
+        state: New phase_state (JSON-serializable dict)
+        previous_state: phase_state as last loaded/saved by the caller
+            (delta mode reads it from Supabase when omitted)
+        supabase: Supabase client (default: get_supabase())
+        **run_fields: Other validation_runs columns to update
+
+    Raises:
+        Exception: Supabase errors are propagated to the caller
+    """
+    supabase = supabase or get_supabase()
+    mode = get_checkpoint_mode()
+
+    if mode == "snapshot":
+        supabase.table("validation_runs").update({
+            **run_fields,
+            "phase_state": save_state_snapshot(run_id, state, supabase),
+        }).eq("id", run_id).execute()
+        return
+
+    if mode != "delta":
+        supabase.table("validation_runs").update({
+            **run_fields,
+            "phase_state": state,
+        }).eq("id", run_id).execute()
+        return
+
+    if previous_state is None:
+        previous_state = load_phase_state(run_id, supabase=supabase)
+
+    set_values, unset_keys = diff_state(previous_state, state)
+
+    if set_values and len(set_values) == len(state) and not unset_keys:
+        # Every section changed - a patch saves nothing, replace the base
+        supabase.rpc("replace_phase_state", {
+            "p_run_id": run_id,
+            "p_state": state,
+            "p_run_fields": run_fields,
+        }).execute()
+    elif set_values or unset_keys:
+        result = supabase.rpc("append_state_patch", {
+            "p_run_id": run_id,
+            "p_set_values": set_values,
+            "p_unset_keys": unset_keys,
+            "p_run_fields": run_fields,
+        }).execute()
+
+        pending = (result.data or {}).get("pending_patches", 0)
+        compact_every = int(os.environ.get("STATE_COMPACT_EVERY", DEFAULT_COMPACT_EVERY))
+        if pending >= compact_every:
+            compact_state(run_id, supabase)
+    elif run_fields:
+        # State unchanged: the run columns are the only write
+        supabase.table("validation_runs").update(run_fields).eq(
+            "id", run_id
+        ).execute()
+
+    logger.info(json.dumps({
+        "event": "state_patch_saved",
+        "run_id": run_id,
+        "set_keys": sorted(set_values),
+        "unset_keys": unset_keys,
+    }))
+
+
+# -----------------------------------------------------------------------------
+# Compressed State Snapshots
+# -----------------------------------------------------------------------------
+
+SNAPSHOT_STUB_KEY = "_snapshot"
+DEFAULT_SNAPSHOT_BUCKET = "state-snapshots"
+
+
+def _snapshot_bucket() -> str:
+    return os.environ.get("STATE_SNAPSHOT_BUCKET", DEFAULT_SNAPSHOT_BUCKET)
+
+
+def save_state_snapshot(run_id: str, state: Any, supabase=None) -> dict:
+    """
+    Upload a compressed snapshot of the state to Supabase Storage.
+
+    Args:
+        run_id: Validation run ID
+        state: phase_state dict or ValidationRunState
+        supabase: Supabase client (default: get_supabase())
+
+    Returns:
+        Pointer to store in validation_runs.phase_state
+    """
+    supabase = supabase or get_supabase()
+
+    blob = encode_snapshot(state)
+    bucket = _snapshot_bucket()
+    path = f"{run_id}/state.snap"
+
+    supabase.storage.from_(bucket).upload(
+        path=path,
+        file=blob,
+        file_options={"content-type": "application/octet-stream", "upsert": "true"},
+    )
+
+    logger.info(json.dumps({
+        "event": "state_snapshot_saved",
+        "run_id": run_id,
+        "bytes": len(blob),
+    }))
+
+    return {
+        SNAPSHOT_STUB_KEY: {
+            "bucket": bucket,
+            "path": path,
+            "bytes": len(blob),
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+        }
+    }
+
+
+def load_state_snapshot(
+    run_id: str,
+    run: Optional[dict] = None,
+    supabase=None,
+) -> Optional[LazyStateSnapshot]:
+    """
+    Download the snapshot a run's phase_state points to.
+
+    Sections are decoded lazily on access.
+
+    Args:
+        run_id: Validation run ID
+        run: validation_runs row if already fetched
+        supabase: Supabase client (default: get_supabase())
+
+    Returns:
+        LazyStateSnapshot, or None if the run has no snapshot pointer
+    """
+    supabase = supabase or get_supabase()
+
+    if run is None:
+        result = supabase.table("validation_runs").select(
+            "phase_state"
+        ).eq("id", run_id).single().execute()
+        run = result.data or {}
+
+    pointer = (run.get("phase_state") or {}).get(SNAPSHOT_STUB_KEY)
+    if not pointer:
+        return None
+
+    blob = supabase.storage.from_(pointer["bucket"]).download(pointer["path"])
+    return LazyStateSnapshot(blob)
+
+
+def _merge_snapshot(snapshot: Optional[LazyStateSnapshot], base: dict) -> dict:
+    """Decode a snapshot and overlay keys stored next to the pointer."""
+    state = snapshot.to_dict() if snapshot is not None else {}
+    state.update({k: v for k, v in base.items() if k != SNAPSHOT_STUB_KEY})
+    return state
+
+
 # -----------------------------------------------------------------------------
 # State Checkpoint/Resume
 # -----------------------------------------------------------------------------
@@ -42,6 +338,7 @@ def checkpoint_state(
     run_id: str,
     state: ValidationRunState,
     hitl_checkpoint: Optional[str] = None,
+    previous_state: Optional[dict] = None,
 ) -> bool:
     """
     Checkpoint validation state to Supabase.
@@ -53,18 +350,21 @@ def checkpoint_state(
         run_id: Validation run ID
         state: Current validation state
         hitl_checkpoint: Optional HITL checkpoint name (pauses execution)
+        previous_state: phase_state as last loaded/saved (the JSON dict, not
+            a live ValidationRunState that has since been mutated). In delta
+            mode, passing it avoids re-reading the base row and patches
 
     Returns:
         True if checkpoint successful
     """
     supabase = get_supabase()
+    flush_progress()
 
     try:
         # Serialize state to JSON
         state_json = state.model_dump(mode="json")
 
         update_data = {
-            "phase_state": state_json,
             "current_phase": state.current_phase,
             "updated_at": datetime.now(timezone.utc).isoformat(),
         }
@@ -76,9 +376,13 @@ def checkpoint_state(
         else:
             update_data["status"] = "running"
 
-        supabase.table("validation_runs").update(update_data).eq(
-            "id", run_id
-        ).execute()
+        save_phase_state(
+            run_id,
+            state_json,
+            previous_state=previous_state,
+            supabase=supabase,
+            **update_data,
+        )
 
         logger.info(json.dumps({
             "event": "state_checkpointed",
@@ -122,7 +426,7 @@ def resume_state(run_id: str) -> Optional[ValidationRunState]:
             return None
 
         run_data = result.data
-        phase_state = run_data.get("phase_state", {})
+        phase_state = load_phase_state(run_id, run_data, supabase)
 
         # Handle case where phase_state is the full ValidationRunState
         if "run_id" in phase_state:
@@ -175,7 +479,9 @@ def update_progress(
     """
     Update progress for real-time UI updates via Supabase Realtime.
 
-    Progress records are append-only for instant UI subscription.
+    Progress records are append-only for instant UI subscription. Events are
+    queued on the process-wide ProgressSink and bulk-inserted in the
+    background, so a slow Supabase response does not stall the crew.
 
     Args:
         run_id: Validation run ID
@@ -190,12 +496,10 @@ def update_progress(
         duration_ms: Execution duration in milliseconds
 
     Returns:
-        True if update successful
+        True if the event was queued (or written, when unbuffered)
     """
-    supabase = get_supabase()
-
     try:
-        supabase.table("validation_progress").insert({
+        return get_progress_sink().enqueue({
             "run_id": run_id,
             "validation_phase": phase,
             "crew": crew,
@@ -206,9 +510,7 @@ def update_progress(
             "output": output,
             "error_message": error_message,
             "duration_ms": duration_ms,
-        }).execute()
-
-        return True
+        })
 
     except Exception as e:
         logger.error(json.dumps({
@@ -240,6 +542,7 @@ def create_hitl_request(
         HITL request ID if created, None on error
     """
     supabase = get_supabase()
+    flush_progress()
 
     try:
         # Bug #9 fix: Cancel any existing pending HITL for this checkpoint
@@ -337,51 +640,23 @@ def send_webhook(
     """
     Send webhook to product app.
 
+    The event is queued in the webhook outbox and delivered in the
+    background with retries (see webhook_outbox.py), so callers never wait
+    on the product app.
+
     Args:
         run_id: Validation run ID
         event_type: Event type (e.g., "phase_complete", "hitl_required", "validation_complete")
         payload: Event payload
 
     Returns:
-        True if webhook sent successfully
+        True if the webhook was queued
     """
-    import httpx
-
-    product_app_url = os.environ.get("PRODUCT_APP_URL", "https://app.startupai.site")
-    webhook_url = f"{product_app_url}/api/crewai/webhook"
-    bearer_token = os.environ.get("WEBHOOK_BEARER_TOKEN", "startupai-modal-secret-2026")
-
-    try:
-        response = httpx.post(
-            webhook_url,
-            json={
-                "flow_type": "founder_validation",
-                "run_id": run_id,
-                "event_type": event_type,
-                **payload,
-            },
-            headers={
-                "Authorization": f"Bearer {bearer_token}",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
-        )
-        response.raise_for_status()
-
-        logger.info(json.dumps({
-            "event": "webhook_sent",
-            "run_id": run_id,
-            "event_type": event_type,
-            "status_code": response.status_code,
-        }))
-
-        return True
-
-    except Exception as e:
-        logger.error(json.dumps({
-            "event": "webhook_failed",
-            "run_id": run_id,
-            "event_type": event_type,
-            "error": str(e),
-        }))
-        return False
+    from .webhook_outbox import enqueue_webhook
+
+    return enqueue_webhook(run_id, event_type, {
+        "flow_type": "founder_validation",
+        "run_id": run_id,
+        "event_type": event_type,
+        **payload,
+    })
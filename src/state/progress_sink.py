@@ -0,0 +1,202 @@
+"""
+Buffered progress writer for validation_progress.
+
+Phase modules report progress several times per crew. Writing each event as
+its own Supabase insert puts a network round-trip on the crew's critical
+path, so a slow Supabase response stalls execution. ProgressSink buffers
+events in memory and writes them as one bulk insert:
+
+- every PROGRESS_FLUSH_INTERVAL_MS from a background thread
+- as soon as PROGRESS_MAX_BATCH events are pending
+- on flush_progress() (phase boundaries, HITL checkpoints) and at exit
+
+Ordering: events get their created_at on enqueue and are inserted in enqueue
+order by a single writer, so Realtime consumers see them in the order they
+happened. A failed flush puts the batch back at the front of the buffer.
+
+Configuration:
+    PROGRESS_FLUSH_INTERVAL_MS: Background flush interval (default: 250,
+        0 writes every event synchronously)
+    PROGRESS_MAX_BATCH: Pending events that trigger an immediate flush (default: 50)
+    PROGRESS_MAX_BUFFER: Events kept while Supabase is failing; oldest are
+        dropped beyond this (default: 1000)
+
+Usage:
+    from src.state.progress_sink import get_progress_sink, flush_progress
+
+    get_progress_sink().enqueue({...})
+    flush_progress()  # before checkpointing
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_MS = 250
+DEFAULT_MAX_BATCH = 50
+DEFAULT_MAX_BUFFER = 1000
+
+
+class ProgressSink:
+    """
+    In-memory buffer of validation_progress rows with background bulk inserts.
+
+    Args:
+        insert: Callable taking a list of rows and writing them in one request
+        flush_interval_ms: Background flush interval (0 = write synchronously)
+        max_batch: Pending events that trigger an immediate flush
+        max_buffer: Upper bound on retained events while writes fail
+    """
+
+    def __init__(
+        self,
+        insert: Callable[[list[dict]], None],
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_buffer: int = DEFAULT_MAX_BUFFER,
+    ):
+        self._insert = insert
+        self.flush_interval_ms = flush_interval_ms
+        self.max_batch = max_batch
+        self.max_buffer = max_buffer
+
+        self._buffer: list[dict] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def buffered(self) -> bool:
+        return self.flush_interval_ms > 0
+
+    def pending(self) -> int:
+        """Number of events waiting to be written."""
+        with self._lock:
+            return len(self._buffer)
+
+    def enqueue(self, row: dict) -> bool:
+        """
+        Queue a progress row (stamped with created_at if missing).
+
+        Returns:
+            True if queued (or written, in synchronous mode)
+        """
+        row = dict(row)
+        row.setdefault("created_at", datetime.now(timezone.utc).isoformat())
+
+        with self._lock:
+            self._buffer.append(row)
+            overflow = len(self._buffer) - self.max_buffer
+            if overflow > 0:
+                del self._buffer[:overflow]
+            full = len(self._buffer) >= self.max_batch
+
+        if overflow > 0:
+            logger.warning(json.dumps({
+                "event": "progress_events_dropped",
+                "count": overflow,
+            }))
+
+        if not self.buffered or self._closed:
+            return self.flush()
+
+        self._ensure_thread()
+        if full:
+            self._wakeup.set()
+        return True
+
+    def flush(self) -> bool:
+        """
+        Write all pending events as one bulk insert.
+
+        Returns:
+            True if the buffer was written (or empty)
+        """
+        with self._write_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+            if not batch:
+                return True
+
+            try:
+                self._insert(batch)
+                return True
+            except Exception as e:
+                with self._lock:
+                    self._buffer[:0] = batch
+                    overflow = len(self._buffer) - self.max_buffer
+                    if overflow > 0:
+                        del self._buffer[:overflow]
+                logger.error(json.dumps({
+                    "event": "progress_flush_failed",
+                    "events": len(batch),
+                    "error": str(e),
+                }))
+                return False
+
+    def close(self) -> None:
+        """Stop the background thread and write anything still pending."""
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self.flush()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._flush_loop, name="progress-sink", daemon=True,
+                )
+                self._thread.start()
+
+    def _flush_loop(self) -> None:
+        interval = self.flush_interval_ms / 1000
+        while not self._closed:
+            self._wakeup.wait(interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+_progress_sink: Optional[ProgressSink] = None
+_progress_sink_lock = threading.Lock()
+
+
+def _insert_progress(rows: list[dict]) -> None:
+    from .persistence import get_supabase
+    get_supabase().table("validation_progress").insert(rows).execute()
+
+
+def get_progress_sink() -> ProgressSink:
+    """Get the process-wide progress sink (configured from the environment)."""
+    global _progress_sink
+    if _progress_sink is None:
+        with _progress_sink_lock:
+            if _progress_sink is None:
+                _progress_sink = ProgressSink(
+                    _insert_progress,
+                    flush_interval_ms=int(os.environ.get(
+                        "PROGRESS_FLUSH_INTERVAL_MS", DEFAULT_FLUSH_INTERVAL_MS
+                    )),
+                    max_batch=int(os.environ.get("PROGRESS_MAX_BATCH", DEFAULT_MAX_BATCH)),
+                    max_buffer=int(os.environ.get("PROGRESS_MAX_BUFFER", DEFAULT_MAX_BUFFER)),
+                )
+                atexit.register(_progress_sink.close)
+    return _progress_sink
+
+
+def flush_progress() -> bool:
+    """Write pending progress events now (phase boundaries, HITL, shutdown)."""
+    if _progress_sink is None:
+        return True
+    return _progress_sink.flush()
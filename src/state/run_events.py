@@ -0,0 +1,188 @@
+"""
+Per-run event log and Server-Sent Events stream.
+
+Clients that follow a run otherwise poll /status. GET /status/{run_id}/stream
+instead pushes events from the run_events table (db/migrations/013_run_events.sql)
+as they are written:
+
+- progress             - mirrored from validation_progress by a trigger
+- hitl_required        - recorded alongside the HITL webhook
+- validation_complete  - recorded alongside the completion webhook
+- validation_failed    - recorded alongside the failure webhook
+
+Event ids are the table's bigserial id, so a reconnecting client sends
+Last-Event-ID and receives only what it missed. The stream closes after a
+terminal event or STREAM_MAX_SECONDS; clients reconnect with Last-Event-ID.
+
+Ids are assigned at insert, not commit, so a poll can see id 8 while id 7
+is still uncommitted. Each poll therefore re-reads from the cursor it had
+STREAM_RESCAN_SECONDS ago and skips ids this stream already sent; an event
+that commits later than that after a higher id became visible, or across a
+reconnect (which resumes strictly after Last-Event-ID), is not delivered.
+Late events arrive out of id order.
+
+Configuration:
+    STREAM_POLL_INTERVAL_MS: How often the stream checks for new events (default: 500)
+    STREAM_MAX_SECONDS: Stream lifetime before the client must reconnect (default: 900)
+    STREAM_RESCAN_SECONDS: How far behind the cursor each poll re-reads (default: 5)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Optional
+
+from .persistence import get_supabase
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_EVENTS = ("validation_complete", "validation_failed")
+
+DEFAULT_POLL_INTERVAL_MS = 500
+DEFAULT_MAX_SECONDS = 900
+DEFAULT_RESCAN_SECONDS = 5
+HEARTBEAT_SECONDS = 15
+PAGE_SIZE = 100
+
+
+def record_run_event(
+    run_id: str,
+    event_type: str,
+    payload: Optional[dict[str, Any]] = None,
+    supabase=None,
+) -> bool:
+    """
+    Append an event to a run's stream.
+
+    Args:
+        run_id: Validation run ID
+        event_type: Event type (hitl_required, validation_complete, ...)
+        payload: JSON-serializable event data
+        supabase: Supabase client (default: get_supabase())
+
+    Returns:
+        True if recorded
+    """
+    try:
+        (supabase or get_supabase()).table("run_events").insert({
+            "run_id": run_id,
+            "event_type": event_type,
+            "payload": payload or {},
+        }).execute()
+        return True
+
+    except Exception as e:
+        logger.error(json.dumps({
+            "event": "run_event_failed",
+            "run_id": run_id,
+            "event_type": event_type,
+            "error": str(e),
+        }))
+        return False
+
+
+def fetch_run_events(
+    run_id: str,
+    after_id: int = 0,
+    limit: int = PAGE_SIZE,
+    supabase=None,
+) -> list[dict]:
+    """Read up to limit events with id > after_id, oldest first."""
+    result = (supabase or get_supabase()).table("run_events").select(
+        "id", "event_type", "payload", "created_at"
+    ).eq("run_id", run_id).gt("id", after_id).order("id").limit(limit).execute()
+    return result.data or []
+
+
+def format_sse(event: dict) -> str:
+    """Format a run_events row as an SSE message."""
+    data = json.dumps({
+        **(event.get("payload") or {}),
+        "created_at": event.get("created_at"),
+    }, default=str)
+    return f"id: {event['id']}\nevent: {event['event_type']}\ndata: {data}\n\n"
+
+
+def parse_last_event_id(value: Optional[str]) -> int:
+    """Parse a Last-Event-ID header (0 when missing or malformed)."""
+    try:
+        return max(int(value), 0) if value else 0
+    except ValueError:
+        return 0
+
+
+async def stream_run_events(
+    run_id: str,
+    last_event_id: int = 0,
+    supabase=None,
+    poll_interval_ms: Optional[int] = None,
+    max_seconds: Optional[float] = None,
+    rescan_seconds: Optional[float] = None,
+) -> AsyncIterator[str]:
+    """
+    Yield SSE messages for a run, starting after last_event_id.
+
+    Emits a heartbeat comment when idle so proxies keep the connection
+    open, and stops after a terminal event or max_seconds. Events that
+    commit after a higher id was sent are still delivered if they appear
+    within rescan_seconds.
+    """
+    supabase = supabase or get_supabase()
+    if poll_interval_ms is None:
+        poll_interval_ms = int(os.environ.get("STREAM_POLL_INTERVAL_MS", DEFAULT_POLL_INTERVAL_MS))
+    if max_seconds is None:
+        max_seconds = float(os.environ.get("STREAM_MAX_SECONDS", DEFAULT_MAX_SECONDS))
+    if rescan_seconds is None:
+        rescan_seconds = float(os.environ.get("STREAM_RESCAN_SECONDS", DEFAULT_RESCAN_SECONDS))
+
+    started = time.monotonic()
+    last_sent = started
+    cursor = last_event_id
+    # Re-read floor: the cursor as it was rescan_seconds ago
+    floor = last_event_id
+    history: deque[tuple[float, int]] = deque()
+    sent: set[int] = set()
+
+    # Tell EventSource how long to wait before reconnecting
+    yield f"retry: {max(poll_interval_ms, 1000)}\n\n"
+
+    while time.monotonic() - started < max_seconds:
+        now = time.monotonic()
+        history.append((now, cursor))
+        while history and now - history[0][0] >= rescan_seconds:
+            floor = history.popleft()[1]
+        sent = {event_id for event_id in sent if event_id > floor}
+
+        try:
+            # Over-fetch by the already-sent ids so a page holds PAGE_SIZE new events
+            events = await asyncio.to_thread(
+                fetch_run_events, run_id, floor, PAGE_SIZE + len(sent), supabase
+            )
+        except Exception as e:
+            logger.warning(json.dumps({
+                "event": "run_event_poll_failed",
+                "run_id": run_id,
+                "error": str(e),
+            }))
+            events = []
+
+        new_events = [event for event in events if event["id"] not in sent]
+        for event in new_events:
+            sent.add(event["id"])
+            cursor = max(cursor, event["id"])
+            last_sent = time.monotonic()
+            yield format_sse(event)
+            if event["event_type"] in TERMINAL_EVENTS:
+                return
+
+        if len(new_events) == PAGE_SIZE:
+            continue
+
+        if time.monotonic() - last_sent >= HEARTBEAT_SECONDS:
+            last_sent = time.monotonic()
+            yield ": keep-alive\n\n"
+
+        await asyncio.sleep(poll_interval_ms / 1000)
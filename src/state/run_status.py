@@ -0,0 +1,178 @@
+"""
+Run status reads for GET /status/{run_id}.
+
+The product app polls /status constantly. get_run_status() serves it from
+the materialized validation_run_status summary in a single RPC (see
+db/migrations/012_run_status_summary.sql), returning only progress rows after
+a cursor, and an ETag derived from the summary version so unchanged polls
+short-circuit to 304 without reading progress at all.
+
+If the RPC is unavailable (migration not applied) it falls back to reading
+validation_runs, validation_progress and hitl_requests directly.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Optional
+from uuid import UUID
+
+from .persistence import get_supabase
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROGRESS_LIMIT = 500
+MAX_PROGRESS_LIMIT = 1000
+
+_SUMMARY_FIELDS = (
+    "status",
+    "current_phase",
+    "hitl_state",
+    "error_message",
+    "started_at",
+    "progress_count",
+    "latest_progress",
+    "hitl_pending",
+    "llm_usage",
+)
+
+
+def status_etag(run_id: str, version: int, since: Optional[str], limit: int) -> str:
+    """
+    Build the ETag for a status response.
+
+    The summary version changes on every write to the run, its progress or
+    its HITL requests; since/limit select the page, so they are part of it.
+    """
+    page = hashlib.sha256(f"{since or ''}|{limit}".encode()).hexdigest()[:8]
+    return f'W/"{run_id}.{version}.{page}"'
+
+
+def parse_etag_version(if_none_match: Optional[str], run_id: str) -> Optional[int]:
+    """Extract the summary version from an If-None-Match header we issued."""
+    if not if_none_match:
+        return None
+    tag = if_none_match.split(",")[0].strip().removeprefix("W/").strip('"')
+    parts = tag.split(".")
+    if len(parts) != 3 or parts[0] != run_id or not parts[1].isdigit():
+        return None
+    return int(parts[1])
+
+
+def clamp_progress_limit(limit: Optional[int]) -> int:
+    if not limit or limit < 1:
+        return DEFAULT_PROGRESS_LIMIT
+    return min(limit, MAX_PROGRESS_LIMIT)
+
+
+def _is_uuid(value: str) -> bool:
+    try:
+        UUID(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _page(progress: list[dict], limit: int) -> dict:
+    has_more = len(progress) > limit
+    progress = progress[:limit]
+    return {
+        "progress": progress,
+        "has_more": has_more,
+        "next_cursor": progress[-1]["id"] if progress else None,
+    }
+
+
+def get_run_status(
+    run_id: str,
+    since: Optional[str] = None,
+    limit: Optional[int] = None,
+    known_version: Optional[int] = None,
+    supabase=None,
+) -> Optional[dict]:
+    """
+    Read a run's status summary and one page of progress.
+
+    Args:
+        run_id: Validation run ID
+        since: Progress id or ISO timestamp; only later rows are returned
+        limit: Maximum progress rows (default 500, max 1000)
+        known_version: Summary version the caller already has (from ETag)
+        supabase: Supabase client (default: get_supabase())
+
+    Returns:
+        Status dict with version, summary fields, progress, has_more and
+        next_cursor; {"version", "not_modified": True} if known_version is
+        current; None if the run does not exist
+    """
+    supabase = supabase or get_supabase()
+    limit = clamp_progress_limit(limit)
+
+    try:
+        result = supabase.rpc("get_run_status", {
+            "p_run_id": run_id,
+            "p_since": since,
+            "p_limit": limit,
+            "p_known_version": known_version,
+        }).execute()
+    except Exception as e:
+        logger.warning(json.dumps({
+            "event": "run_status_rpc_failed",
+            "run_id": run_id,
+            "error": str(e),
+        }))
+        return _read_run_status(run_id, since, limit, supabase)
+
+    data = result.data
+    if not data:
+        return None
+    if data.get("not_modified"):
+        return {"version": data["version"], "not_modified": True}
+
+    status = {field: data.get(field) for field in _SUMMARY_FIELDS}
+    status["version"] = data["version"]
+    status["updated_at"] = data.get("run_updated_at")
+    status["not_modified"] = False
+    status.update(_page(data.get("progress") or [], limit))
+    return status
+
+
+def _read_run_status(run_id: str, since: Optional[str], limit: int, supabase) -> Optional[dict]:
+    """Fallback for databases without migration 012 (three queries, no version)."""
+    result = supabase.table("validation_runs").select("*").eq(
+        "id", run_id
+    ).single().execute()
+    if not result.data:
+        return None
+    run = result.data
+
+    # Same (created_at, id) keyset as the RPC: rows sharing the cursor's
+    # timestamp are ordered by id, so none are dropped between pages
+    query = supabase.table("validation_progress").select("*").eq("run_id", run_id)
+    if since and _is_uuid(since):
+        cursor = supabase.table("validation_progress").select("created_at").eq(
+            "id", since
+        ).eq("run_id", run_id).execute()
+        if cursor.data:
+            at = cursor.data[0]["created_at"]
+            query = query.or_(
+                f'created_at.gt."{at}",and(created_at.eq."{at}",id.gt.{since})'
+            )
+    elif since:
+        query = query.gt("created_at", since)
+    progress_result = query.order("created_at", desc=False).order(
+        "id", desc=False
+    ).limit(limit + 1).execute()
+
+    hitl_result = supabase.table("hitl_requests").select("*").eq(
+        "run_id", run_id
+    ).eq("status", "pending").execute()
+
+    status = {field: run.get(field) for field in _SUMMARY_FIELDS}
+    status["hitl_pending"] = hitl_result.data[0] if hitl_result.data else None
+    status["version"] = None
+    status["updated_at"] = run.get("updated_at")
+    status["not_modified"] = False
+    status.update(_page(progress_result.data or [], limit))
+    status["latest_progress"] = status["progress"][-1] if status["progress"] else None
+    return status
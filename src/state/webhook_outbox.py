@@ -0,0 +1,338 @@
+"""
+Durable outbound webhook queue (outbox) for the product app.
+
+Webhooks used to be one-shot inline POSTs with a 30s timeout: a slow product
+app stalled the orchestrator, and a failed POST dropped the event. Events are
+now written to webhook_outbox (db/migrations/014_webhook_outbox.sql) and
+delivered separately:
+
+- enqueue_webhook() inserts the event and kicks a background drain in this
+  process; the orchestrator never waits on the product app
+- deliver_pending() claims due events (SKIP LOCKED + lease), optionally
+  coalesces events for the same endpoint into one POST, and marks them delivered or
+  reschedules them with exponential backoff (dead after max attempts)
+- each claim is sized so its POSTs finish inside the lease, and carries a
+  claim token: a worker whose lease expired cannot mark rows that another
+  worker has since re-claimed
+- events are only POSTed to allow-listed endpoints (the product app webhook
+  plus WEBHOOK_ALLOWED_ENDPOINTS), since the request carries the bearer token
+- the deliver_webhooks Modal function sweeps the table every minute, so
+  events survive container exit and product app outages
+- all POSTs share one keep-alive httpx.Client
+
+By default every event is sent with its original body, one per POST. With
+WEBHOOK_MAX_BATCH > 1, batches of more than one event are sent as
+{"flow_type": "batch", "events": [<body>, ...]} in enqueue order; only turn
+this on once the product app handler unpacks that envelope (see
+docs/features/integration-contracts.md), since it routes on flow_type.
+
+Configuration:
+    WEBHOOK_MAX_BATCH: Events coalesced per POST (default: 1, no batching)
+    WEBHOOK_MAX_ATTEMPTS: Attempts before an event is marked dead (default: 10)
+    WEBHOOK_ALLOWED_ENDPOINTS: Comma-separated extra endpoints that may receive
+        webhooks (default: none; the product app webhook is always allowed)
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Optional
+
+import httpx
+
+from .persistence import get_supabase
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH = 1
+DEFAULT_MAX_ATTEMPTS = 10
+POST_TIMEOUT_SECONDS = 30.0
+LEASE_SECONDS = 300
+# POSTs per claim, leaving one timeout of headroom inside the lease
+POSTS_PER_CLAIM = max(int(LEASE_SECONDS // POST_TIMEOUT_SECONDS) - 1, 1)
+
+_http_client: Optional[httpx.Client] = None
+_http_lock = threading.Lock()
+_drain_thread: Optional[threading.Thread] = None
+_drain_lock = threading.Lock()
+
+
+def product_app_webhook_url() -> str:
+    """Webhook endpoint on the product app."""
+    product_app_url = os.environ.get("PRODUCT_APP_URL", "https://app.startupai.site")
+    return f"{product_app_url}/api/crewai/webhook"
+
+
+def allowed_webhook_endpoints() -> set[str]:
+    """Endpoints that may receive webhooks (and with them the bearer token)."""
+    extra = os.environ.get("WEBHOOK_ALLOWED_ENDPOINTS", "")
+    return {product_app_webhook_url()} | {url.strip() for url in extra.split(",") if url.strip()}
+
+
+def _bearer_token() -> str:
+    return os.environ.get("WEBHOOK_BEARER_TOKEN", "startupai-modal-secret-2026")
+
+
+def get_webhook_http_client() -> httpx.Client:
+    """Process-wide keep-alive client for webhook delivery."""
+    global _http_client
+    if _http_client is None:
+        with _http_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    timeout=httpx.Timeout(POST_TIMEOUT_SECONDS, connect=10.0),
+                    limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                )
+    return _http_client
+
+
+def post_webhook(
+    endpoint: str,
+    body: dict[str, Any],
+    timeout: float = POST_TIMEOUT_SECONDS,
+) -> httpx.Response:
+    """POST a webhook body with the product app bearer token (raises on HTTP errors)."""
+    response = get_webhook_http_client().post(
+        endpoint,
+        json=body,
+        headers={
+            "Authorization": f"Bearer {_bearer_token()}",
+            "Content-Type": "application/json",
+        },
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    return response
+
+
+# -----------------------------------------------------------------------------
+# Enqueue
+# -----------------------------------------------------------------------------
+
+def enqueue_webhook(
+    run_id: Optional[str],
+    event_type: str,
+    body: dict[str, Any],
+    endpoint: Optional[str] = None,
+    supabase=None,
+) -> bool:
+    """
+    Persist a webhook event for delivery and start draining in the background.
+
+    Falls back to a direct POST if the outbox insert fails, so the event is
+    not lost when the table is unavailable.
+
+    Args:
+        run_id: Validation run ID (None for events not tied to a run)
+        event_type: Event type for logs and dead-letter triage
+        body: JSON body exactly as the product app receives it
+        endpoint: Target URL (default: product app webhook)
+        supabase: Supabase client (default: get_supabase())
+
+    Returns:
+        True if the event was queued (or delivered by the fallback)
+
+    Raises:
+        ValueError: If endpoint is not in allowed_webhook_endpoints()
+    """
+    endpoint = endpoint or product_app_webhook_url()
+    if endpoint not in allowed_webhook_endpoints():
+        raise ValueError(f"Webhook endpoint not allowed: {endpoint}")
+
+    try:
+        (supabase or get_supabase()).table("webhook_outbox").insert({
+            "run_id": run_id,
+            "endpoint": endpoint,
+            "event_type": event_type,
+            "body": body,
+        }).execute()
+    except Exception as e:
+        logger.error(json.dumps({
+            "event": "webhook_enqueue_failed",
+            "run_id": run_id,
+            "event_type": event_type,
+            "error": str(e),
+        }))
+        try:
+            post_webhook(endpoint, body)
+            return True
+        except Exception as post_error:
+            logger.error(json.dumps({
+                "event": "webhook_failed",
+                "run_id": run_id,
+                "event_type": event_type,
+                "error": str(post_error),
+            }))
+            return False
+
+    logger.info(json.dumps({
+        "event": "webhook_enqueued",
+        "run_id": run_id,
+        "event_type": event_type,
+    }))
+
+    _start_drain(supabase)
+    return True
+
+
+def _start_drain(supabase=None) -> None:
+    """Drain the outbox on a background thread (one at a time per process)."""
+    global _drain_thread
+    with _drain_lock:
+        if _drain_thread is not None and _drain_thread.is_alive():
+            return
+        _drain_thread = threading.Thread(
+            target=_drain, args=(supabase,), name="webhook-outbox", daemon=True,
+        )
+        _drain_thread.start()
+
+
+def _drain(supabase=None) -> None:
+    try:
+        while deliver_pending(supabase=supabase)["claimed"]:
+            pass
+    except Exception as e:
+        logger.error(json.dumps({
+            "event": "webhook_drain_failed",
+            "error": str(e),
+        }))
+
+
+def wait_for_delivery(timeout: float = 10.0) -> None:
+    """Give an in-progress background drain time to finish (used at exit)."""
+    thread = _drain_thread
+    if thread is not None and thread.is_alive():
+        thread.join(timeout)
+
+
+atexit.register(wait_for_delivery)
+
+
+# -----------------------------------------------------------------------------
+# Delivery
+# -----------------------------------------------------------------------------
+
+def _batch_body(events: list[dict]) -> dict[str, Any]:
+    if len(events) == 1:
+        return events[0]["body"]
+    return {"flow_type": "batch", "events": [event["body"] for event in events]}
+
+
+def deliver_pending(supabase=None, limit: Optional[int] = None) -> dict[str, int]:
+    """
+    Claim due outbox events and deliver them (coalesced per endpoint when
+    WEBHOOK_MAX_BATCH > 1).
+
+    A claim holds at most POSTS_PER_CLAIM POSTs' worth of events, and no POST
+    is started once it could outlast the lease; unsent events are re-claimed
+    when the lease expires. Events whose claim was taken over by another
+    worker in the meantime are not counted as delivered or failed.
+
+    Args:
+        supabase: Supabase client (default: get_supabase())
+        limit: Maximum events to claim (default: POSTS_PER_CLAIM * WEBHOOK_MAX_BATCH)
+
+    Returns:
+        Counts: claimed, delivered, failed
+    """
+    supabase = supabase or get_supabase()
+    max_batch = max(int(os.environ.get("WEBHOOK_MAX_BATCH", DEFAULT_MAX_BATCH)), 1)
+    max_attempts = int(os.environ.get("WEBHOOK_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS))
+    allowed = allowed_webhook_endpoints()
+
+    lease_deadline = time.monotonic() + LEASE_SECONDS
+    result = supabase.rpc("claim_webhook_events", {
+        "p_limit": limit or POSTS_PER_CLAIM * max_batch,
+        "p_lease_seconds": LEASE_SECONDS,
+    }).execute()
+    events = sorted(result.data or [], key=lambda event: event["id"])
+
+    by_endpoint: dict[str, list[dict]] = defaultdict(list)
+    for event in events:
+        by_endpoint[event["endpoint"]].append(event)
+
+    stats = {"claimed": len(events), "delivered": 0, "failed": 0}
+
+    for endpoint, endpoint_events in by_endpoint.items():
+        if endpoint not in allowed:
+            # Never send the bearer token to an unknown host; dead on first attempt
+            stats["failed"] += _fail(
+                supabase, endpoint_events, f"Webhook endpoint not allowed: {endpoint}", max_attempts=1,
+            )
+            logger.error(json.dumps({
+                "event": "webhook_endpoint_rejected",
+                "endpoint": endpoint,
+                "events": len(endpoint_events),
+            }))
+            continue
+
+        for start in range(0, len(endpoint_events), max_batch):
+            if time.monotonic() + POST_TIMEOUT_SECONDS > lease_deadline:
+                logger.warning(json.dumps({
+                    "event": "webhook_lease_exhausted",
+                    "endpoint": endpoint,
+                    "events": len(endpoint_events) - start,
+                }))
+                break
+
+            batch = endpoint_events[start:start + max_batch]
+
+            try:
+                response = post_webhook(endpoint, _batch_body(batch))
+            except Exception as e:
+                stats["failed"] += _fail(supabase, batch, str(e), max_attempts)
+                logger.warning(json.dumps({
+                    "event": "webhook_delivery_failed",
+                    "endpoint": endpoint,
+                    "events": len(batch),
+                    "error": str(e),
+                }))
+                continue
+
+            stats["delivered"] += _settle(supabase, "complete_webhook_events", batch, {})
+            logger.info(json.dumps({
+                "event": "webhook_sent",
+                "endpoint": endpoint,
+                "events": len(batch),
+                "event_types": sorted({event["event_type"] for event in batch}),
+                "status_code": response.status_code,
+            }))
+
+    return stats
+
+
+def _fail(supabase, events: list[dict], error: str, max_attempts: int) -> int:
+    return _settle(supabase, "fail_webhook_events", events, {
+        "p_error": error,
+        "p_max_attempts": max_attempts,
+    })
+
+
+def _settle(supabase, rpc: str, events: list[dict], params: dict[str, Any]) -> int:
+    """
+    Mark claimed events delivered or failed, per claim token.
+
+    Returns the number of rows updated; rows re-claimed by another worker
+    after this worker's lease expired keep their new owner's state.
+    """
+    updated = 0
+    by_token: dict[str, list[int]] = defaultdict(list)
+    for event in events:
+        by_token[event["claim_token"]].append(event["id"])
+
+    for token, ids in by_token.items():
+        result = supabase.rpc(rpc, {"p_ids": ids, "p_claim_token": token, **params}).execute()
+        count = result.data or 0
+        updated += count
+        if count < len(ids):
+            logger.warning(json.dumps({
+                "event": "webhook_claim_lost",
+                "rpc": rpc,
+                "events": len(ids) - count,
+            }))
+
+    return updated
@@ -350,6 +350,7 @@ def mock_discovery_crews():
     with patch.multiple(
         "src.crews.discovery",
         run_discovery_crew=Mock(return_value={}),
+        run_customer_research_crew=Mock(return_value={}),
         run_customer_profile_crew=Mock(return_value=CustomerProfile(
             segment_name="Test", segment_description="Test"
         )),
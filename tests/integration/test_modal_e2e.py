@@ -290,7 +290,8 @@ class TestPhase1Execution:
         from src.modal_app.phases import phase_1
 
         with patch("src.crews.discovery.run_discovery_crew") as mock_discovery:
-            with patch("src.crews.discovery.run_customer_profile_crew") as mock_profile:
+            with patch("src.crews.discovery.run_customer_research_crew", return_value={}), \
+                    patch("src.crews.discovery.run_customer_profile_crew") as mock_profile:
                 with patch("src.crews.discovery.run_value_design_crew") as mock_value:
                     with patch("src.crews.discovery.run_wtp_crew") as mock_wtp:
                         with patch("src.crews.discovery.run_fit_assessment_crew") as mock_fit:
@@ -331,7 +332,8 @@ class TestPhase1Execution:
         }
 
         with patch("src.crews.discovery.run_discovery_crew") as mock_discovery:
-            with patch("src.crews.discovery.run_customer_profile_crew") as mock_profile:
+            with patch("src.crews.discovery.run_customer_research_crew", return_value={}), \
+                    patch("src.crews.discovery.run_customer_profile_crew") as mock_profile:
                 with patch("src.crews.discovery.run_value_design_crew") as mock_value:
                     with patch("src.crews.discovery.run_wtp_crew") as mock_wtp:
                         with patch("src.crews.discovery.run_fit_assessment_crew") as mock_fit:
@@ -610,7 +612,8 @@ class TestFullValidationFlow:
 
         # Phase 1: VPC Discovery (Stage B — brief already approved)
         with patch("src.crews.discovery.run_discovery_crew") as mock_discovery:
-            with patch("src.crews.discovery.run_customer_profile_crew") as mock_profile:
+            with patch("src.crews.discovery.run_customer_research_crew", return_value={}), \
+                    patch("src.crews.discovery.run_customer_profile_crew") as mock_profile:
                 with patch("src.crews.discovery.run_value_design_crew") as mock_value:
                     with patch("src.crews.discovery.run_wtp_crew") as mock_wtp:
                         with patch("src.crews.discovery.run_fit_assessment_crew") as mock_fit:
@@ -694,7 +697,8 @@ class TestFullValidationFlow:
 
         # Phase 1: VPC Discovery (Stage B)
         with patch("src.crews.discovery.run_discovery_crew") as mock_discovery:
-            with patch("src.crews.discovery.run_customer_profile_crew") as mock_profile:
+            with patch("src.crews.discovery.run_customer_research_crew", return_value={}), \
+                    patch("src.crews.discovery.run_customer_profile_crew") as mock_profile:
                 with patch("src.crews.discovery.run_value_design_crew") as mock_value:
                     with patch("src.crews.discovery.run_wtp_crew") as mock_wtp:
                         with patch("src.crews.discovery.run_fit_assessment_crew") as mock_fit:
@@ -732,7 +736,8 @@ class TestHITLCheckpointStructure:
         from src.modal_app.phases import phase_1
 
         with patch("src.crews.discovery.run_discovery_crew") as mock_discovery:
-            with patch("src.crews.discovery.run_customer_profile_crew") as mock_profile:
+            with patch("src.crews.discovery.run_customer_research_crew", return_value={}), \
+                    patch("src.crews.discovery.run_customer_profile_crew") as mock_profile:
                 with patch("src.crews.discovery.run_value_design_crew") as mock_value:
                     with patch("src.crews.discovery.run_wtp_crew") as mock_wtp:
                         with patch("src.crews.discovery.run_fit_assessment_crew") as mock_fit:
@@ -763,7 +768,8 @@ class TestHITLCheckpointStructure:
         from src.modal_app.phases import phase_1
 
         with patch("src.crews.discovery.run_discovery_crew") as mock_discovery:
-            with patch("src.crews.discovery.run_customer_profile_crew") as mock_profile:
+            with patch("src.crews.discovery.run_customer_research_crew", return_value={}), \
+                    patch("src.crews.discovery.run_customer_profile_crew") as mock_profile:
                 with patch("src.crews.discovery.run_value_design_crew") as mock_value:
                     with patch("src.crews.discovery.run_wtp_crew") as mock_wtp:
                         with patch("src.crews.discovery.run_fit_assessment_crew") as mock_fit:
@@ -790,7 +796,8 @@ class TestHITLCheckpointStructure:
         from src.modal_app.phases import phase_1
 
         with patch("src.crews.discovery.run_discovery_crew") as mock_discovery:
-            with patch("src.crews.discovery.run_customer_profile_crew") as mock_profile:
+            with patch("src.crews.discovery.run_customer_research_crew", return_value={}), \
+                    patch("src.crews.discovery.run_customer_profile_crew") as mock_profile:
                 with patch("src.crews.discovery.run_value_design_crew") as mock_value:
                     with patch("src.crews.discovery.run_wtp_crew") as mock_wtp:
                         with patch("src.crews.discovery.run_fit_assessment_crew") as mock_fit:
@@ -0,0 +1,69 @@
+"""
+Tests for the slim API image.
+
+fastapi_app runs on api_image, which ships without crewai, litellm or the ad
+SDKs. These checks import everything app.py imports at top level in a fresh
+interpreter and fail if any of those packages is pulled in, and keep the
+crews package lazy so one phase does not load every other phase's crews.
+"""
+
+import ast
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = REPO_ROOT / "src" / "modal_app" / "app.py"
+
+# Packages that are only installed on the full (phase) image
+HEAVY_PACKAGES = [
+    "crewai",
+    "crewai_tools",
+    "litellm",
+    "openai",
+    "tavily",
+    "mcp",
+    "google.ads",
+    "facebook_business",
+    "pinterest",
+    "scipy",
+]
+
+
+def _top_level_imports() -> list[str]:
+    """Modules imported at module level in app.py (excluding modal)."""
+    modules = []
+    for node in ast.parse(APP_PATH.read_text()).body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+    return [m for m in modules if m.split(".")[0] != "modal"]
+
+
+def _loaded_after_import(modules: list[str]) -> list[str]:
+    code = (
+        "import importlib, json, sys\n"
+        f"for name in {modules!r}:\n"
+        "    importlib.import_module(name)\n"
+        f"print(json.dumps([m for m in {HEAVY_PACKAGES!r} if m in sys.modules]))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": f"{REPO_ROOT}{os.pathsep}{REPO_ROOT / 'src'}"}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, cwd=REPO_ROOT, env=env, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_api_imports_skip_heavy_packages():
+    modules = _top_level_imports()
+    assert "src.state.persistence" in modules
+    assert _loaded_after_import(modules) == []
+
+
+def test_crews_package_is_lazy():
+    assert _loaded_after_import(["src.crews"]) == []
@@ -0,0 +1,254 @@
+"""
+Crew Graph Executor Tests
+
+Tests dependency ordering, concurrency, progress streaming and failure
+handling of the phase crew graph executor.
+
+All tests use mocks (no API keys required).
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.modal_app.phases.crew_graph import (
+    CrewNode,
+    execute_crew_graph,
+    validate_crew_graph,
+)
+from src.state.crew_results import CrewResultMemo
+
+
+# =============================================================================
+# Graph Validation Tests
+# =============================================================================
+
+class TestValidateCrewGraph:
+    """Tests for crew graph validation."""
+
+    def test_rejects_unknown_dependency(self):
+        nodes = [CrewNode(name="A", run=lambda r: 1, depends_on=("Missing",))]
+        with pytest.raises(ValueError, match="unknown crews"):
+            validate_crew_graph(nodes)
+
+    def test_rejects_cycle(self):
+        nodes = [
+            CrewNode(name="A", run=lambda r: 1, depends_on=("B",)),
+            CrewNode(name="B", run=lambda r: 2, depends_on=("A",)),
+        ]
+        with pytest.raises(ValueError, match="cycle"):
+            validate_crew_graph(nodes)
+
+    def test_rejects_duplicate_names(self):
+        nodes = [CrewNode(name="A", run=lambda r: 1), CrewNode(name="A", run=lambda r: 2)]
+        with pytest.raises(ValueError, match="Duplicate"):
+            validate_crew_graph(nodes)
+
+
+# =============================================================================
+# Execution Tests
+# =============================================================================
+
+class TestExecuteCrewGraph:
+    """Tests for crew graph execution."""
+
+    def test_dependents_receive_upstream_results(self):
+        nodes = [
+            CrewNode(name="A", run=lambda r: 1),
+            CrewNode(name="B", run=lambda r: r["A"] + 1, depends_on=("A",)),
+            CrewNode(name="C", run=lambda r: r["A"] + r["B"], depends_on=("A", "B")),
+        ]
+
+        results = execute_crew_graph("run-1", phase=1, nodes=nodes, progress=MagicMock())
+
+        assert results == {"A": 1, "B": 2, "C": 3}
+
+    def test_independent_crews_run_concurrently(self):
+        # Both crews must be running at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def crew(results):
+            barrier.wait()
+            return True
+
+        nodes = [CrewNode(name="A", run=crew), CrewNode(name="B", run=crew)]
+
+        results = execute_crew_graph(
+            "run-1", phase=4, nodes=nodes, progress=MagicMock(), max_workers=2
+        )
+
+        assert results == {"A": True, "B": True}
+
+    def test_streams_progress_rows(self):
+        progress = MagicMock()
+        nodes = [
+            CrewNode(
+                name="A",
+                run=lambda r: 1,
+                start_pct=0,
+                end_pct=50,
+                agent="E1",
+                task="map_assumptions",
+                in_progress_pct=5,
+            ),
+        ]
+
+        execute_crew_graph("run-1", phase=1, nodes=nodes, progress=progress)
+
+        statuses = [c.kwargs["status"] for c in progress.call_args_list]
+        assert statuses == ["started", "in_progress", "completed"]
+        assert progress.call_args_list[1].kwargs["agent"] == "E1"
+        assert progress.call_args_list[2].kwargs["progress_pct"] == 50
+
+    def test_required_failure_raises_and_skips_dependents(self):
+        progress = MagicMock()
+        downstream = MagicMock()
+
+        def failing(results):
+            raise RuntimeError("crew exploded")
+
+        nodes = [
+            CrewNode(name="A", run=failing),
+            CrewNode(name="B", run=downstream, depends_on=("A",)),
+        ]
+
+        with pytest.raises(RuntimeError, match="crew exploded"):
+            execute_crew_graph("run-1", phase=2, nodes=nodes, progress=progress)
+
+        downstream.assert_not_called()
+        failed = [c for c in progress.call_args_list if c.kwargs["status"] == "failed"]
+        assert failed[0].kwargs["crew"] == "A"
+        assert failed[0].kwargs["error_message"] == "crew exploded"
+
+    def test_required_failure_waits_for_running_crews(self):
+        sibling_started = threading.Event()
+        sibling_finished = threading.Event()
+        downstream = MagicMock()
+
+        def slow_sibling(results):
+            sibling_started.set()
+            time.sleep(0.1)
+            sibling_finished.set()
+            return "done"
+
+        def failing(results):
+            assert sibling_started.wait(1)
+            raise RuntimeError("crew exploded")
+
+        nodes = [
+            CrewNode(name="A", run=slow_sibling),
+            CrewNode(name="B", run=failing),
+            CrewNode(name="C", run=downstream, depends_on=("A",)),
+        ]
+
+        with pytest.raises(RuntimeError, match="crew exploded"):
+            execute_crew_graph("run-1", phase=4, nodes=nodes, progress=MagicMock(), max_workers=2)
+
+        assert sibling_finished.is_set()
+        downstream.assert_not_called()
+
+    def test_parallel_progress_never_goes_backwards(self):
+        synthesis_may_finish = threading.Event()
+        progress = MagicMock()
+
+        def synthesis(results):
+            assert synthesis_may_finish.wait(1)
+            return "synthesis"
+
+        def narrative(results):
+            synthesis_may_finish.set()
+            return "pitch"
+
+        nodes = [
+            CrewNode(name="FinanceCrew", run=lambda r: "finance", start_pct=0, end_pct=40),
+            CrewNode(name="SynthesisCrew", run=synthesis, depends_on=("FinanceCrew",), start_pct=40, end_pct=70),
+            CrewNode(name="GovernanceCrew", run=lambda r: "gov", depends_on=("SynthesisCrew",),
+                     start_pct=70, end_pct=80),
+            CrewNode(name="NarrativeCrew", run=narrative, depends_on=("FinanceCrew",), start_pct=80, end_pct=95),
+        ]
+
+        execute_crew_graph("run-1", phase=4, nodes=nodes, progress=progress, max_workers=2)
+
+        pcts = [c.kwargs["progress_pct"] for c in progress.call_args_list]
+        assert pcts == sorted(pcts)
+        assert pcts[-1] == 95
+
+    def test_optional_failure_yields_none(self):
+        def failing(results):
+            raise RuntimeError("narrative unavailable")
+
+        nodes = [
+            CrewNode(name="A", run=lambda r: 1),
+            CrewNode(name="B", run=failing, depends_on=("A",), optional=True),
+        ]
+
+        results = execute_crew_graph("run-1", phase=4, nodes=nodes, progress=MagicMock())
+
+        assert results == {"A": 1, "B": None}
+
+
+# =============================================================================
+# Crew Result Memoization Tests
+# =============================================================================
+
+class TestCrewResultMemo:
+    """Tests for reusing completed crews when a phase is retried."""
+
+    def _supabase(self):
+        """Supabase mock whose crew_results table keeps upserted rows."""
+        client = MagicMock()
+        rows = []
+        table = client.table.return_value
+        table.upsert.side_effect = lambda row, on_conflict=None: rows.append(row) or MagicMock()
+        table.select.return_value.eq.return_value.eq.return_value.execute.side_effect = (
+            lambda: MagicMock(data=[dict(r) for r in rows])
+        )
+        return client
+
+    def _load(self, supabase):
+        load = CrewResultMemo.load
+        return lambda run_id, phase, inputs: load(run_id, phase, inputs, supabase)
+
+    def test_retry_skips_completed_crews(self):
+        supabase = self._supabase()
+        discovery = MagicMock(return_value={"segments": ["freelancers"]})
+        attempts = {"profile": 0}
+
+        def profile(results):
+            attempts["profile"] += 1
+            if attempts["profile"] == 1:
+                raise RuntimeError("rate limited")
+            return {"jobs": results["Discovery"]["segments"]}
+
+        nodes = [
+            CrewNode(name="Discovery", run=discovery),
+            CrewNode(name="Profile", run=profile, depends_on=("Discovery",)),
+        ]
+        state = {"founders_brief": {"idea": "x"}, "iteration_count": 0}
+
+        with patch("src.modal_app.phases.crew_graph.CrewResultMemo.load", side_effect=self._load(supabase)):
+            with pytest.raises(RuntimeError):
+                execute_crew_graph("run-1", 1, nodes, MagicMock(), idempotency_inputs=state)
+            results = execute_crew_graph("run-1", 1, nodes, MagicMock(), idempotency_inputs=state)
+
+        discovery.assert_called_once()
+        assert results["Profile"] == {"jobs": ["freelancers"]}
+
+    def test_changed_inputs_rerun_crew(self):
+        supabase = self._supabase()
+        discovery = MagicMock(return_value={"segments": []})
+        nodes = [CrewNode(name="Discovery", run=discovery)]
+
+        with patch("src.modal_app.phases.crew_graph.CrewResultMemo.load", side_effect=self._load(supabase)):
+            execute_crew_graph("run-1", 1, nodes, MagicMock(), idempotency_inputs={"iteration_count": 0})
+            execute_crew_graph("run-1", 1, nodes, MagicMock(), idempotency_inputs={"iteration_count": 1})
+
+        assert discovery.call_count == 2
+
+    def test_non_json_results_are_not_stored(self):
+        memo = CrewResultMemo("run-1", 2, {"a": 1}, supabase=MagicMock())
+
+        assert memo.save("GovernanceCrew", "k", object()) is False
+        assert memo.get("GovernanceCrew", "k") == (False, None)
@@ -76,6 +76,7 @@ class TestPhase1Context:
         }
 
     @patch("src.crews.discovery.run_discovery_crew")
+    @patch("src.crews.discovery.run_customer_research_crew", new=Mock(return_value={}))
     @patch("src.crews.discovery.run_customer_profile_crew")
     @patch("src.crews.discovery.run_value_design_crew")
     @patch("src.crews.discovery.run_wtp_crew")
@@ -114,6 +115,7 @@ class TestPhase1Context:
         assert "problem_hypothesis" in call_args
 
     @patch("src.crews.discovery.run_discovery_crew")
+    @patch("src.crews.discovery.run_customer_research_crew", new=Mock(return_value={}))
     @patch("src.crews.discovery.run_customer_profile_crew")
     @patch("src.crews.discovery.run_value_design_crew")
     @patch("src.crews.discovery.run_wtp_crew")
@@ -147,6 +149,10 @@ class TestPhase1Context:
 
         # CustomerProfileCrew should be called
         mock_profile.assert_called_once()
+        # ...with the brief-only research pass and DiscoveryCrew's evidence
+        assert mock_profile.call_args.kwargs["founders_brief"]["the_idea"]
+        assert mock_profile.call_args.kwargs["discovery_results"] == {}
+        assert mock_profile.call_args.kwargs["customer_research"] == {}
 
     def test_founders_brief_has_required_fields(self):
         """Founders brief should have all required fields."""
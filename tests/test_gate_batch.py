@@ -0,0 +1,81 @@
+"""
+Tests for vectorized bulk gate evaluation (src/shared/gate_batch.py).
+
+Checks the batch evaluator against evaluate_gate() on randomized evidence
+and covers what-if policy variants and per-check blocker rates.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.shared.gate_batch import evaluate_gates_batch, policy_variant
+from src.shared.gate_policies import DEFAULT_POLICIES, evaluate_gate
+
+SIGNALS = [None, "green", "strong_commitment", "weak_interest", "green_feasible", "PROFITABLE", "proceed"]
+
+
+def _random_summary(rng: random.Random) -> dict:
+    summary = {
+        "experiments_run": rng.randint(0, 5),
+        "weak_evidence_count": rng.randint(0, 3),
+        "medium_evidence_count": rng.randint(0, 3),
+        "strong_evidence_count": rng.randint(0, 3),
+        "fit_score": rng.uniform(40, 100),
+        "ctr": rng.uniform(0, 0.05),
+        "monthly_cost": rng.uniform(0, 20000),
+        "ltv_cac_ratio": rng.uniform(0, 6),
+    }
+    # Some summaries lack fields (treated as 0, as in evaluate_gate)
+    for key in rng.sample(sorted(summary), rng.randint(0, 2)):
+        del summary[key]
+    return summary
+
+
+class TestEvaluateGatesBatch:
+    def test_matches_evaluate_gate(self):
+        rng = random.Random(7)
+        summaries = [_random_summary(rng) for _ in range(300)]
+        signals = [rng.choice(SIGNALS) for _ in summaries]
+        policies = list(DEFAULT_POLICIES.values()) + [
+            policy_variant(DEFAULT_POLICIES["DESIRABILITY"], thresholds={"fit_score": 75.0}, min_experiments=2),
+        ]
+
+        result = evaluate_gates_batch(summaries, policies, signals)
+
+        assert result.shape == (300, 4)
+        for i, (summary, signal) in enumerate(zip(summaries, signals)):
+            for j, policy in enumerate(policies):
+                expected = evaluate_gate(policy, summary, signal)
+                assert result.passed[i, j] == expected.gate_ready
+                assert result.blocker_count[i, j] == len(expected.blockers)
+
+    def test_what_if_stricter_threshold(self):
+        current = DEFAULT_POLICIES["DESIRABILITY"]
+        stricter = policy_variant(current, thresholds={"fit_score": 75.0})
+        assert stricter.thresholds == {"fit_score": 75.0, "ctr": 0.02}
+        assert current.thresholds["fit_score"] == 70.0
+
+        base = {"experiments_run": 3, "medium_evidence_count": 1, "strong_evidence_count": 1, "ctr": 0.03}
+        summaries = [{**base, "fit_score": score} for score in (65, 72, 80, 90)]
+        result = evaluate_gates_batch(summaries, [current, stricter])
+
+        np.testing.assert_array_equal(result.pass_rate(), [0.75, 0.5])
+        assert result.failed_checks(1, 1) == ["threshold:fit_score"]
+        np.testing.assert_array_equal(result.blocker_rates()["threshold:fit_score"], [0.25, 0.5])
+
+    def test_thresholds_only_apply_to_their_policies(self):
+        summaries = [{"experiments_run": 3, "medium_evidence_count": 1, "strong_evidence_count": 1, "monthly_cost": 50000}]
+        result = evaluate_gates_batch(summaries, [DEFAULT_POLICIES["DESIRABILITY"], DEFAULT_POLICIES["FEASIBILITY"]])
+        assert result.checks["threshold:monthly_cost_max"].tolist() == [[False, True]]
+        assert result.checks["threshold:fit_score"].tolist() == [[True, False]]
+
+    def test_empty_batch(self):
+        result = evaluate_gates_batch([], list(DEFAULT_POLICIES.values()), signals=[])
+        assert result.shape == (0, 3)
+        assert np.isnan(result.pass_rate()).all()
+
+    def test_signal_length_mismatch(self):
+        with pytest.raises(ValueError, match="signals"):
+            evaluate_gates_batch([{}], [DEFAULT_POLICIES["VIABILITY"]], signals=[])
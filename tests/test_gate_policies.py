@@ -0,0 +1,163 @@
+"""
+Tests for gate policy loading (src/shared/gate_policies.py).
+
+Covers one query per user for all gates, zero queries on repeat lookups,
+TTL expiry, explicit invalidation, the default fallback on errors and
+policies carried in phase_state. Uses a fake Supabase client (no network).
+"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.shared import gate_policies
+from src.shared.gate_policies import (
+    DEFAULT_POLICIES,
+    GatePolicyCache,
+    evaluate_gate_for_user,
+    get_gate_policy,
+    invalidate_gate_policies,
+    with_gate_policies,
+)
+
+USER_ID = "0b6c2f1e-7d3a-4e58-9a21-5c4d3e2f1a0b"
+
+
+def _supabase(rows):
+    client = MagicMock()
+    query = client.table.return_value.select.return_value.eq.return_value.in_.return_value
+    query.execute.return_value = Mock(data=rows)
+    return client
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    clock = {"now": 1000.0}
+    cache = GatePolicyCache(ttl_seconds=300, clock=lambda: clock["now"])
+    cache.clock = clock
+    monkeypatch.setattr(gate_policies, "_policy_cache", cache)
+    return cache
+
+
+class TestGatePolicyCache:
+    def test_one_query_for_all_gates(self, cache):
+        client = _supabase([{"gate": "FEASIBILITY", "min_experiments": 5, "requires_approval": False}])
+
+        feasibility = get_gate_policy(USER_ID, "feasibility", client)
+        desirability = get_gate_policy(USER_ID, "DESIRABILITY", client)
+        viability = get_gate_policy(USER_ID, "VIABILITY", client)
+
+        assert client.table.call_count == 1
+        client.table.return_value.select.return_value.eq.return_value.in_.assert_called_once_with(
+            "gate", ["DESIRABILITY", "FEASIBILITY", "VIABILITY"]
+        )
+        assert (feasibility.min_experiments, feasibility.requires_approval) == (5, False)
+        assert feasibility.thresholds == DEFAULT_POLICIES["FEASIBILITY"].thresholds
+        assert desirability == DEFAULT_POLICIES["DESIRABILITY"]
+        assert viability == DEFAULT_POLICIES["VIABILITY"]
+
+    def test_ttl_expiry_reloads(self, cache):
+        client = _supabase([])
+        get_gate_policy(USER_ID, "DESIRABILITY", client)
+        cache.clock["now"] += 299
+        get_gate_policy(USER_ID, "DESIRABILITY", client)
+        assert client.table.call_count == 1
+
+        cache.clock["now"] += 2
+        get_gate_policy(USER_ID, "DESIRABILITY", client)
+        assert client.table.call_count == 2
+
+    def test_invalidation(self, cache):
+        client = _supabase([])
+        get_gate_policy(USER_ID, "VIABILITY", client)
+        invalidate_gate_policies(USER_ID)
+        get_gate_policy(USER_ID, "VIABILITY", client)
+        invalidate_gate_policies()
+        get_gate_policy(USER_ID, "VIABILITY", client)
+        assert client.table.call_count == 3
+
+    def test_errors_fall_back_to_defaults_uncached(self, cache):
+        client = MagicMock()
+        client.table.side_effect = Exception("connection refused")
+        assert get_gate_policy(USER_ID, "VIABILITY", client) == DEFAULT_POLICIES["VIABILITY"]
+
+        client.table.side_effect = None
+        client.table.return_value.select.return_value.eq.return_value.in_.return_value.execute.return_value = Mock(
+            data=[{"gate": "VIABILITY", "min_experiments": 7}]
+        )
+        assert get_gate_policy(USER_ID, "VIABILITY", client).min_experiments == 7
+
+    def test_invalid_gate_raises(self, cache):
+        with pytest.raises(ValueError, match="Invalid gate"):
+            get_gate_policy(USER_ID, "LAUNCH", _supabase([]))
+
+    def test_uses_shared_client(self, cache, monkeypatch):
+        client = _supabase([])
+        monkeypatch.setattr("src.state.persistence.get_supabase", lambda: client)
+        get_gate_policy(USER_ID, "DESIRABILITY")
+        get_gate_policy(USER_ID, "FEASIBILITY")
+        assert client.table.call_count == 1
+
+
+class TestPoliciesInState:
+    def test_orchestrator_loads_fresh_policies(self, cache):
+        client = _supabase([{"gate": "DESIRABILITY", "thresholds": {"fit_score": 80.0}}])
+        get_gate_policy(USER_ID, "DESIRABILITY", _supabase([]))  # stale cache entry
+
+        state = {"entrepreneur_input": "idea"}
+        updated = with_gate_policies(state, USER_ID, client)
+
+        assert "gate_policies" not in state
+        assert updated["user_id"] == USER_ID
+        assert updated["gate_policies"]["DESIRABILITY"]["thresholds"] == {"fit_score": 80.0}
+        assert set(updated["gate_policies"]) == set(DEFAULT_POLICIES)
+        assert client.table.call_count == 1
+
+    def test_phases_evaluate_without_queries(self, cache):
+        client = _supabase([{"gate": "DESIRABILITY", "thresholds": {"fit_score": 80.0}}])
+        state = with_gate_policies({}, USER_ID, client)
+        lookups = _supabase([])
+
+        result = evaluate_gate_for_user(
+            USER_ID, "desirability", {"fit_score": 75.0}, supabase=lookups, policies=state["gate_policies"],
+        )
+
+        assert "fit_score below threshold: 75.0 < 80.0" in result.blockers
+        lookups.table.assert_not_called()
+
+    def test_load_failure_keeps_user_without_policies(self):
+        client = MagicMock()
+        client.table.side_effect = Exception("connection refused")
+        assert with_gate_policies({}, USER_ID, client) == {"user_id": USER_ID}
+        state = {}
+        assert with_gate_policies(state, None, client) is state
+
+    def test_kickoff_state_reaches_phase_gate(self, cache):
+        # phase_state as written by /kickoff: no user_id key
+        kickoff_state = {
+            "entrepreneur_input": "A B2B SaaS for supply chain optimization",
+            "session_id": None,
+            "conversation_transcript": None,
+            "user_type": "founder",
+            "hints": None,
+            "additional_context": None,
+        }
+        client = _supabase([{"gate": "DESIRABILITY", "thresholds": {"fit_score": 80.0}}])
+        state = with_gate_policies(kickoff_state, USER_ID, client)
+        state["founders_brief"] = {"the_idea": {"one_liner": "Supply chain SaaS"}}
+
+        with patch("src.modal_app.phases.phase_1.update_progress"), \
+             patch("src.crews.discovery.run_discovery_crew", return_value={}), \
+             patch("src.crews.discovery.run_customer_research_crew", return_value={}), \
+             patch("src.crews.discovery.run_customer_profile_crew", return_value={}), \
+             patch("src.crews.discovery.run_value_design_crew", return_value={}), \
+             patch("src.crews.discovery.run_wtp_crew", return_value={}), \
+             patch("src.crews.discovery.run_fit_assessment_crew", return_value={"fit_score": 75}):
+            from src.modal_app.phases import phase_1
+
+            result = phase_1.execute("test-run-id", state)
+
+        # The user's 80 threshold applies, from state, without another query
+        assert result["hitl_recommended"] == "iterate"
+        assert "fit_score below threshold: 75 < 80.0" in result["hitl_context"]["gate_blockers"]
+        assert client.table.call_count == 1
@@ -0,0 +1,189 @@
+"""
+Tests for transactional HITL decisions and expiry (src/state/hitl.py).
+
+The transition itself runs in the hitl_apply_decision RPC; these tests
+cover the single round trip, error mapping (409 on a second approval),
+the SEGMENT_PIVOT| envelope, snapshot-mode iteration, response messages
+and the batched expiry sweep. Uses a fake Supabase client (no network).
+"""
+
+import json
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from src.state.codec import LazyStateSnapshot, encode_snapshot
+from src.state.hitl import (
+    HITLDecisionError,
+    apply_hitl_decision,
+    decision_message,
+    expire_hitl_requests,
+    parse_segment_pivot_envelope,
+)
+
+RUN_ID = "3c9e1f2a-8b7d-4e6f-a5c4-1d2e3f4a5b6c"
+
+
+def _supabase(data):
+    client = MagicMock()
+    client.rpc.return_value.execute.return_value = Mock(data=data)
+    return client
+
+
+class TestApplyHitlDecision:
+    def test_single_rpc_round_trip(self):
+        client = _supabase({"outcome": "resumed", "next_phase": 3, "resume": True, "previous_phase": 2})
+
+        outcome = apply_hitl_decision(RUN_ID, "approve_desirability_gate", "approved", supabase=client)
+
+        assert outcome["next_phase"] == 3
+        client.rpc.assert_called_once_with("hitl_apply_decision", {
+            "p_run_id": RUN_ID,
+            "p_checkpoint": "approve_desirability_gate",
+            "p_decision": "approved",
+            "p_feedback": None,
+            "p_custom_segment": None,
+            "p_state_updates": {},
+        })
+        client.table.assert_not_called()
+
+    @pytest.mark.parametrize("error, status", [("conflict", 409), ("not_found", 404), ("invalid", 400)])
+    def test_refused_decisions(self, error, status):
+        client = _supabase({"error": error, "detail": "Checkpoint 'approve_brief' is not awaiting a decision"})
+        with pytest.raises(HITLDecisionError) as excinfo:
+            apply_hitl_decision(RUN_ID, "approve_brief", "approved", supabase=client)
+        assert excinfo.value.status_code == status
+
+    def test_iterate_passes_envelope(self, monkeypatch):
+        monkeypatch.delenv("STATE_CHECKPOINT_MODE", raising=False)
+        client = _supabase({"outcome": "iterate", "next_phase": 2, "resume": True})
+        feedback = "SEGMENT_PIVOT|" + json.dumps({"target_segment": " Clinics ", "rationale": "Higher urgency"})
+
+        apply_hitl_decision(RUN_ID, "approve_desirability_gate", "iterate", feedback=feedback, supabase=client)
+
+        updates = client.rpc.call_args.args[1]["p_state_updates"]
+        assert updates["pivot_type"] == "segment_pivot"
+        assert updates["target_segment_hypothesis"]["segment_name"] == "Clinics"
+        assert "pivot_from_phase" not in updates  # set by the RPC from current_phase
+
+    def test_snapshot_mode_iterate_reads_state(self, monkeypatch):
+        monkeypatch.setenv("STATE_CHECKPOINT_MODE", "snapshot")
+        blob = encode_snapshot({
+            "iteration_count": 2,
+            "customer_profile": {"segment_name": "SMBs"},
+            "discovery_results": {"raw": "x" * 1000},
+        })
+        client = _supabase({"outcome": "iterate", "next_phase": 2, "resume": True})
+        client.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = Mock(
+            data={"phase_state": {"_snapshot": {"bucket": "state-snapshots", "path": f"{RUN_ID}/state.snap"}}}
+        )
+        client.storage.from_.return_value.download.return_value = blob
+        decoded = []
+        original = LazyStateSnapshot.__getitem__
+
+        def spy(self, name):
+            decoded.append(name)
+            return original(self, name)
+
+        monkeypatch.setattr(LazyStateSnapshot, "__getitem__", spy)
+        feedback = "SEGMENT_PIVOT|" + json.dumps({"target_segment": "Clinics"})
+
+        apply_hitl_decision(RUN_ID, "approve_desirability_gate", "iterate", feedback=feedback, supabase=client)
+
+        updates = client.rpc.call_args.args[1]["p_state_updates"]
+        assert (updates["iteration_count"], updates["failed_segment"]) == (3, "SMBs")
+        assert sorted(decoded) == ["customer_profile", "iteration_count"]
+
+    def test_snapshot_mode_iterate_prefers_keys_next_to_pointer(self, monkeypatch):
+        monkeypatch.setenv("STATE_CHECKPOINT_MODE", "snapshot")
+        client = _supabase({"outcome": "iterate", "next_phase": 2, "resume": True})
+        client.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = Mock(
+            data={"phase_state": {
+                "_snapshot": {"bucket": "state-snapshots", "path": f"{RUN_ID}/state.snap"},
+                "iteration_count": 4,  # written by an earlier iterate decision
+            }}
+        )
+        client.storage.from_.return_value.download.return_value = encode_snapshot({"iteration_count": 2})
+
+        apply_hitl_decision(RUN_ID, "approve_desirability_gate", "iterate", supabase=client)
+
+        assert client.rpc.call_args.args[1]["p_state_updates"] == {"iteration_count": 5}
+
+
+class TestSegmentPivotEnvelope:
+    @pytest.mark.parametrize("feedback", [
+        None, "", "more interviews", "SEGMENT_PIVOT|{not json", "SEGMENT_PIVOT|" + json.dumps({"target_segment": "  "}),
+        "SEGMENT_PIVOT|" + json.dumps({"target_segment": 5}),
+    ])
+    def test_no_envelope(self, feedback):
+        assert parse_segment_pivot_envelope(RUN_ID, feedback) == {}
+
+    def test_defaults_without_rationale(self):
+        updates = parse_segment_pivot_envelope(RUN_ID, "SEGMENT_PIVOT|" + json.dumps({"target_segment": "Clinics"}))
+        assert updates["pivot_reason"] == "Segment pivot requested by user"
+        assert updates["target_segment_hypothesis"]["segment_description"] == "Clinics"
+
+
+class TestDecisionMessage:
+    @pytest.mark.parametrize("outcome, checkpoint, decision, expected", [
+        ({"outcome": "pivot", "segment_name": "Clinics"}, "approve_segment_pivot", "segment_2",
+         "Segment pivot approved. Targeting 'Clinics' in Phase 1."),
+        ({"outcome": "pivot", "pivot_type": "value_pivot"}, "approve_value_pivot", "approved",
+         "Pivot approved. Returning to Phase 1 for value pivot."),
+        ({"outcome": "resumed", "next_phase": 1}, "approve_brief", "approved",
+         "Brief approved. Proceeding to VPC Discovery (Stage B)."),
+        ({"outcome": "resumed", "next_phase": 3}, "approve_desirability_gate", "override_proceed",
+         "Override applied. Proceeding to Phase 3 despite pivot recommendation."),
+        ({"outcome": "rejected", "next_phase": None}, "approve_brief", "rejected",
+         "Checkpoint 'approve_brief' rejected. Review required."),
+    ])
+    def test_messages(self, outcome, checkpoint, decision, expected):
+        assert decision_message(outcome, checkpoint, decision) == expected
+
+
+class TestExpireHitlRequests:
+    def _batches(self, *batches):
+        client = MagicMock()
+        client.rpc.return_value.execute.side_effect = [Mock(data=batch) for batch in batches]
+        return client
+
+    def test_idle_sweep_is_one_call(self, monkeypatch):
+        monkeypatch.setenv("PRODUCT_APP_URL", "https://app.example.com")
+        client = self._batches({"expired": 0, "runs_failed": 0, "request_ids": [], "notifications": 0})
+
+        result = expire_hitl_requests(supabase=client, limit=50)
+
+        assert result == {"expired": 0, "runs_failed": 0, "notifications": 0, "request_ids": []}
+        client.rpc.assert_called_once_with("expire_hitl_requests", {
+            "p_limit": 50,
+            "p_endpoint": "https://app.example.com/api/crewai/webhook",
+            "p_batch_notification": False,
+        })
+        client.table.assert_not_called()
+
+    def test_backlog_drained_in_full_batches(self):
+        client = self._batches(
+            {"expired": 2, "runs_failed": 1, "request_ids": ["a", "b"], "notifications": 1},
+            {"expired": 1, "runs_failed": 1, "request_ids": ["c"], "notifications": 1},
+        )
+
+        result = expire_hitl_requests(supabase=client, limit=2)
+
+        assert client.rpc.call_count == 2
+        assert result == {"expired": 3, "runs_failed": 2, "notifications": 2, "request_ids": ["a", "b", "c"]}
+
+    def test_batch_size_from_env(self, monkeypatch):
+        monkeypatch.setenv("HITL_EXPIRY_BATCH", "25")
+        client = self._batches({"expired": 0})
+
+        expire_hitl_requests(supabase=client)
+
+        assert client.rpc.call_args.args[1]["p_limit"] == 25
+
+    def test_batched_hitl_expired_webhook_is_opt_in(self, monkeypatch):
+        monkeypatch.setenv("HITL_EXPIRED_WEBHOOK", "1")
+        client = self._batches({"expired": 0})
+
+        expire_hitl_requests(supabase=client)
+
+        assert client.rpc.call_args.args[1]["p_batch_notification"] is True
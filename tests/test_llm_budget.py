@@ -0,0 +1,188 @@
+"""
+Tests for per-run LLM budgets (src/shared/llm_budget.py).
+
+Covers level thresholds, the orchestrator check (state recording and the
+exhausted stop), in-phase degradation of crew agents, skipping optional
+crews and stopping a phase whose spend exhausts the budget. Uses fakes (no API keys required).
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from src.modal_app.phases.crew_graph import CrewNode, execute_crew_graph
+from src.shared import metering
+from src.shared.llm_budget import (
+    BudgetExceededError,
+    RunBudget,
+    apply_degradation,
+    budget_scope,
+    check_run_budget,
+    current_degradation,
+    run_phase_within_budget,
+)
+from src.shared.metering import UsageLedger, metering_scope
+
+RUN_ID = "6f1c0b9e-2f4a-4c7e-9d55-0a7c1e2b3d4f"
+
+
+@pytest.fixture(autouse=True)
+def ledger(monkeypatch):
+    ledger = UsageLedger(Mock())
+    monkeypatch.setattr(metering, "_ledger", ledger)
+    monkeypatch.delenv("RUN_LLM_BUDGET_USD", raising=False)
+    monkeypatch.delenv("RUN_LLM_BUDGET_TOKENS", raising=False)
+    return ledger
+
+
+def _supabase(cost_usd, total_tokens=0):
+    client = MagicMock()
+    client.rpc.return_value.execute.return_value = Mock(
+        data={"cost_usd": cost_usd, "total_tokens": total_tokens}
+    )
+    return client
+
+
+class TestRunBudget:
+    @pytest.mark.parametrize("spent, level", [
+        (1.0, "normal"), (7.0, "economy"), (9.5, "minimal"), (10.0, "exhausted"),
+    ])
+    def test_levels(self, spent, level):
+        assert RunBudget(limit_usd=10.0, spent_usd=spent).level_for() == level
+
+    def test_token_limit_and_level_never_drops(self):
+        budget = RunBudget(limit_usd=10.0, limit_tokens=1000, spent_tokens=950, level="economy")
+        assert budget.level_for() == "minimal"
+        assert RunBudget(limit_usd=10.0, level="minimal").level_for() == "minimal"
+
+
+class TestCheckRunBudget:
+    def test_unlimited_by_default(self):
+        state = {"idea": "x"}
+        assert check_run_budget(RUN_ID, 1, state, _supabase(100.0)) is state
+
+    def test_degradation_recorded_in_state(self, monkeypatch):
+        monkeypatch.setenv("RUN_LLM_BUDGET_USD", "10")
+        state = check_run_budget(RUN_ID, 3, {"idea": "x"}, _supabase(7.5))
+
+        budget = state["llm_budget"]
+        assert budget["level"] == "economy"
+        assert budget["degradations"][0]["phase"] == 3
+        assert budget["limit_usd"] == 10.0
+
+        # Same level on the next phase: no new history entry
+        state = check_run_budget(RUN_ID, 4, state, _supabase(7.9))
+        assert len(state["llm_budget"]["degradations"]) == 1
+
+    def test_exhausted_stops_run(self):
+        state = {"llm_budget": {"limit_usd": 5.0}}
+        with pytest.raises(BudgetExceededError) as excinfo:
+            check_run_budget(RUN_ID, 2, state, _supabase(5.2))
+        assert excinfo.value.phase_state["llm_budget"]["level"] == "exhausted"
+
+    def test_unreadable_spend_keeps_last_known(self):
+        client = MagicMock()
+        client.rpc.side_effect = Exception("function summarize_llm_usage does not exist")
+        state = {"llm_budget": {"limit_usd": 10.0, "spent_usd": 8.0, "level": "economy"}}
+        assert check_run_budget(RUN_ID, 2, state, client)["llm_budget"]["spent_usd"] == 8.0
+
+
+class TestPhaseDegradation:
+    def test_spend_inside_phase_raises_level(self, ledger):
+        state = {"llm_budget": {"limit_usd": 1.0, "spent_usd": 0.5}}
+        with metering_scope(run_id=RUN_ID, phase=4), budget_scope(RUN_ID, state):
+            assert current_degradation().level == "normal"
+            ledger.record(RUN_ID, 4, "FinanceCrew", "gpt-4o", 200_000, 0)  # $0.50
+            assert current_degradation().level == "exhausted"
+
+    def test_apply_degradation_to_agents(self, monkeypatch):
+        monkeypatch.setattr("src.shared.llm_cache.cached_llm",
+                            lambda model, temperature=None: SimpleNamespace(model=model, temperature=temperature))
+        agent = SimpleNamespace(llm=SimpleNamespace(model="gpt-4o", temperature=0.3), max_iter=25, reasoning=True)
+        crew = SimpleNamespace(agents=[agent])
+
+        state = {"llm_budget": {"limit_usd": 10.0, "level": "economy"}}
+        with budget_scope(RUN_ID, state):
+            assert apply_degradation(crew) is crew
+
+        assert agent.llm.model == "openai/gpt-4o-mini"
+        assert agent.llm.temperature == 0.3
+        assert (agent.max_iter, agent.reasoning) == (10, False)
+
+    def test_protected_crew_untouched(self, monkeypatch):
+        monkeypatch.setenv("LLM_BUDGET_PROTECTED_CREWS", "ViabilityGovernanceCrew")
+        agent = SimpleNamespace(llm=SimpleNamespace(model="gpt-4o"), max_iter=25, reasoning=True)
+
+        state = {"llm_budget": {"limit_usd": 10.0, "level": "minimal"}}
+        with budget_scope(RUN_ID, state), metering_scope(crew="ViabilityGovernanceCrew"):
+            apply_degradation(SimpleNamespace(agents=[agent]))
+        assert agent.max_iter == 25
+
+    def test_optional_crew_skipped_at_minimal(self):
+        narrative = Mock(return_value="pitch")
+        nodes = [
+            CrewNode(name="FinanceCrew", run=lambda r: "finance"),
+            CrewNode(name="NarrativeSynthesisCrew", run=narrative, depends_on=("FinanceCrew",), optional=True),
+        ]
+        progress = MagicMock()
+
+        state = {"llm_budget": {"limit_usd": 10.0, "level": "minimal"}}
+        with budget_scope(RUN_ID, state):
+            results = execute_crew_graph(RUN_ID, phase=4, nodes=nodes, progress=progress)
+
+        narrative.assert_not_called()
+        assert results == {"FinanceCrew": "finance", "NarrativeSynthesisCrew": None}
+        skipped = [c.kwargs["crew"] for c in progress.call_args_list if c.kwargs["status"] == "skipped"]
+        assert skipped == ["NarrativeSynthesisCrew"]
+
+
+class TestInPhaseBudget:
+    STATE = {"llm_budget": {"limit_usd": 1.0, "spent_usd": 0.5}}
+
+    def test_phase_result_carries_in_phase_degradation(self, ledger):
+        def execute():
+            ledger.record(RUN_ID, 4, "FinanceCrew", "gpt-4o", 130_000, 0)  # $0.325
+            assert current_degradation().level == "economy"
+            return {"state": {"phase_4_output": "done"}}
+
+        with metering_scope(run_id=RUN_ID, phase=4), budget_scope(RUN_ID, self.STATE) as budget:
+            result = run_phase_within_budget(budget, self.STATE, execute)
+
+        stored = result["state"]["llm_budget"]
+        assert result["state"]["phase_4_output"] == "done"
+        assert stored["level"] == "economy"
+        assert [(d["level"], d["phase"]) for d in stored["degradations"]] == [("economy", 4)]
+        assert "degradations" not in self.STATE["llm_budget"]
+
+    def test_exhausted_stops_remaining_crews(self, ledger):
+        def finance(results):
+            ledger.record(RUN_ID, 4, "FinanceCrew", "gpt-4o", 200_000, 0)  # $0.50
+            return "finance"
+
+        synthesis = Mock(return_value="synthesis")
+        narrative = Mock(return_value="pitch")
+        nodes = [
+            CrewNode(name="FinanceCrew", run=finance),
+            CrewNode(name="SynthesisCrew", run=synthesis, depends_on=("FinanceCrew",)),
+            CrewNode(name="NarrativeCrew", run=narrative, depends_on=("FinanceCrew",), optional=True),
+        ]
+
+        def execute():
+            execute_crew_graph(RUN_ID, phase=4, nodes=nodes, progress=MagicMock())
+            return {"state": {"phase_4_output": "done"}}
+
+        with metering_scope(run_id=RUN_ID, phase=4), budget_scope(RUN_ID, self.STATE) as budget:
+            result = run_phase_within_budget(budget, self.STATE, execute)
+
+        synthesis.assert_not_called()
+        narrative.assert_not_called()
+        assert "exhausted during phase 4" in result["budget_exhausted"]
+        assert "phase_4_output" not in result["state"]
+        assert result["state"]["llm_budget"]["level"] == "exhausted"
+        assert result["state"]["llm_budget"]["degradations"][-1]["level"] == "exhausted"
+
+    def test_apply_degradation_refuses_when_exhausted(self):
+        state = {"llm_budget": {"limit_usd": 1.0, "spent_usd": 1.0, "level": "exhausted"}}
+        with budget_scope(RUN_ID, state), pytest.raises(BudgetExceededError):
+            apply_degradation(SimpleNamespace(agents=[]))
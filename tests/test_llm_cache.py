@@ -0,0 +1,198 @@
+"""
+Tests for the content-addressed LLM completion cache.
+
+Covers key stability, SQLite TTL/LRU eviction, hit/miss counters, the
+direct OpenAI SDK helper and single-module loading of the cache singleton.
+Uses a temporary SQLite file and mocked clients.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.shared.llm_cache import (
+    LLMCacheBackend,
+    SQLiteLLMCache,
+    cached_chat_completion,
+    make_cache_key,
+    set_llm_cache,
+    wrap_llm,
+)
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    """SQLite cache installed as the process-wide backend."""
+    cache = SQLiteLLMCache(path=tmp_path / "llm_cache.sqlite3", ttl_seconds=60, max_entries=2)
+    set_llm_cache(cache)
+    yield cache
+    set_llm_cache(None)
+
+
+def _mock_openai_client(content: str) -> MagicMock:
+    client = MagicMock()
+    client.chat.completions.create.return_value.choices = [
+        MagicMock(message=MagicMock(content=content))
+    ]
+    return client
+
+
+# ===========================================================================
+# CACHE KEY
+# ===========================================================================
+
+
+class TestMakeCacheKey:
+    """Tests for the content address."""
+
+    def test_string_and_single_user_message_are_equivalent(self):
+        assert make_cache_key("gpt-4o", 0.3, "hello") == make_cache_key(
+            "gpt-4o", 0.3, [{"role": "user", "content": "hello"}]
+        )
+
+    def test_key_changes_with_each_component(self):
+        base = make_cache_key("gpt-4o", 0.3, "hello")
+        assert make_cache_key("gpt-4o-mini", 0.3, "hello") != base
+        assert make_cache_key("gpt-4o", 0.7, "hello") != base
+        assert make_cache_key("gpt-4o", 0.3, "hello!") != base
+        assert make_cache_key("gpt-4o", 0.3, "hello", tools=[{"name": "search"}]) != base
+        assert make_cache_key("gpt-4o", 0.3, "hello", response_format={"type": "json_object"}) != base
+
+
+# ===========================================================================
+# SQLITE BACKEND
+# ===========================================================================
+
+
+class TestLLMCacheBackend:
+    """Tests for the backend base class."""
+
+    def test_incomplete_backend_fails_at_construction(self):
+        class GetOnlyCache(LLMCacheBackend):
+            def _get(self, key):
+                return None
+
+        with pytest.raises(TypeError):
+            GetOnlyCache()
+
+
+class TestSQLiteLLMCache:
+    """Tests for the SQLite backend."""
+
+    def test_hit_and_miss_counters(self, sqlite_cache):
+        assert sqlite_cache.get("k1") is None
+        sqlite_cache.set("k1", "gpt-4o", "value")
+        assert sqlite_cache.get("k1") == "value"
+
+        stats = sqlite_cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["writes"] == 1
+
+    def test_expired_entries_are_misses(self, sqlite_cache):
+        sqlite_cache.set("k1", "gpt-4o", "value")
+        sqlite_cache.ttl_seconds = 0
+        time.sleep(0.01)
+        assert sqlite_cache.get("k1") is None
+
+    def test_lru_eviction(self, sqlite_cache):
+        sqlite_cache.set("k1", "gpt-4o", "one")
+        time.sleep(0.01)
+        sqlite_cache.set("k2", "gpt-4o", "two")
+        time.sleep(0.01)
+        sqlite_cache.get("k1")  # k2 is now least recently used
+        time.sleep(0.01)
+        sqlite_cache.set("k3", "gpt-4o", "three")
+
+        assert sqlite_cache.get("k1") == "one"
+        assert sqlite_cache.get("k2") is None
+        assert sqlite_cache.get("k3") == "three"
+
+
+# ===========================================================================
+# INTEGRATIONS
+# ===========================================================================
+
+
+class TestCachedChatCompletion:
+    """Tests for the direct OpenAI SDK helper."""
+
+    def test_second_identical_call_is_served_from_cache(self, sqlite_cache):
+        client = _mock_openai_client('{"ok": true}')
+        kwargs = dict(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": "analyze"}],
+            temperature=0.3,
+            response_format={"type": "json_object"},
+        )
+
+        assert cached_chat_completion(client, **kwargs) == '{"ok": true}'
+        assert cached_chat_completion(client, **kwargs) == '{"ok": true}'
+        client.chat.completions.create.assert_called_once()
+
+    def test_disabled_cache_always_calls_client(self):
+        set_llm_cache(None)
+        client = _mock_openai_client("fresh")
+
+        cached_chat_completion(client, model="gpt-4o", messages=[])
+        cached_chat_completion(client, model="gpt-4o", messages=[])
+
+        assert client.chat.completions.create.call_count == 2
+
+
+class TestWrapLLM:
+    """Tests for CrewAI LLM instance wrapping."""
+
+    def test_repeated_call_skips_provider(self, sqlite_cache):
+        llm = MagicMock(model="gpt-4o", temperature=0.5, response_format=None)
+        llm.call.return_value = "answer"
+        original = llm.call
+
+        wrapped = wrap_llm(llm)
+        assert wrapped.call("question") == "answer"
+        assert wrapped.call("question") == "answer"
+        assert original.call_count == 1
+
+    def test_tool_executing_calls_are_not_cached(self, sqlite_cache):
+        llm = MagicMock(model="gpt-4o", temperature=0.5, response_format=None)
+        llm.call.return_value = "tool result"
+        original = llm.call
+
+        wrapped = wrap_llm(llm)
+        wrapped.call("question", available_functions={"search": lambda q: q})
+        wrapped.call("question", available_functions={"search": lambda q: q})
+        assert original.call_count == 2
+
+
+# ===========================================================================
+# MODULE IDENTITY
+# ===========================================================================
+
+def test_cache_and_registry_load_once():
+    """Crews, phases and tools share one llm_cache/model_registry module each."""
+    repo_root = Path(__file__).resolve().parent.parent
+    code = (
+        "import importlib, json, sys\n"
+        "for name in ['src.modal_app.phases.phase_1', 'src.crews.viability.governance_crew',\n"
+        "             'src.shared.tools.advanced_analysis', 'src.shared.replay']:\n"
+        "    importlib.import_module(name)\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.split('.')[0] in ('shared', 'state', 'crews'))))\n"
+    )
+    env = {
+        **os.environ,
+        "PYTHONPATH": f"{repo_root}{os.pathsep}{repo_root / 'src'}",
+        "LITELLM_LOCAL_MODEL_COST_MAP": "True",
+        "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "sk-test"),
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, cwd=repo_root, env=env, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
@@ -0,0 +1,137 @@
+"""
+Tests for LLM token and cost metering (src/shared/metering.py).
+
+Covers pricing, scope attribution through the crew graph, cache hits,
+direct OpenAI SDK calls, batched flushes and the /status rollup.
+Uses fakes (no API keys required).
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from src.modal_app.phases.crew_graph import CrewNode, execute_crew_graph
+from src.shared import metering
+from src.shared.llm_cache import cached_chat_completion
+from src.shared.metering import (
+    UsageLedger,
+    llm_cost,
+    metering_scope,
+    summarize_usage,
+    wrap_llm_for_metering,
+)
+
+RUN_ID = "6f1c0b9e-2f4a-4c7e-9d55-0a7c1e2b3d4f"
+
+
+@pytest.fixture
+def ledger(monkeypatch):
+    ledger = UsageLedger(Mock())
+    monkeypatch.setattr(metering, "_ledger", ledger)
+    return ledger
+
+
+def _fake_llm(model="openai/gpt-4o", prompt_tokens=1000, completion_tokens=100):
+    llm = SimpleNamespace(model=model, _token_usage={"prompt_tokens": 0, "completion_tokens": 0})
+
+    def call(messages, **kwargs):
+        llm._token_usage["prompt_tokens"] += prompt_tokens
+        llm._token_usage["completion_tokens"] += completion_tokens
+        return "answer"
+
+    llm.call = call
+    return wrap_llm_for_metering(llm)
+
+
+class TestPricing:
+    def test_longest_prefix_wins(self):
+        assert llm_cost("openai/gpt-4o", 1_000_000, 0) == pytest.approx(2.50)
+        assert llm_cost("gpt-4o-mini-2024-07-18", 1_000_000, 1_000_000) == pytest.approx(0.75)
+
+    def test_unknown_model_costs_nothing(self):
+        assert llm_cost("acme/unknown-model", 1000, 1000) == 0.0
+
+
+class TestAttribution:
+    def test_crew_graph_calls_are_attributed_per_crew(self, ledger):
+        llm = _fake_llm()
+        nodes = [
+            CrewNode(name="FinanceCrew", run=lambda r: llm.call("q")),
+            CrewNode(name="SynthesisCrew", run=lambda r: [llm.call("q"), llm.call("q")]),
+        ]
+        with metering_scope(run_id=RUN_ID, phase=4):
+            execute_crew_graph(RUN_ID, phase=4, nodes=nodes, progress=MagicMock())
+
+        rows = {row["crew"]: row for row in ledger.rows(RUN_ID)}
+        assert rows["FinanceCrew"]["calls"] == 1
+        assert rows["SynthesisCrew"]["prompt_tokens"] == 2000
+        assert rows["SynthesisCrew"]["phase"] == 4
+        assert rows["SynthesisCrew"]["cost_usd"] == pytest.approx(2 * (0.0025 + 0.001))
+
+    def test_cache_hit_has_no_cost(self, ledger):
+        llm = _fake_llm(prompt_tokens=0, completion_tokens=0)
+        with metering_scope(run_id=RUN_ID, phase=1, crew="DiscoveryCrew"):
+            llm.call("q")
+
+        (row,) = ledger.rows()
+        assert row["cache_hits"] == 1 and row["cost_usd"] == 0
+
+    def test_calls_outside_a_run_are_not_metered(self, ledger):
+        _fake_llm().call("q")
+        assert ledger.rows() == []
+
+    def test_direct_chat_completion(self, ledger, monkeypatch):
+        monkeypatch.setattr("src.shared.llm_cache.get_llm_cache", lambda: None)
+        client = Mock()
+        client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content="segments"))],
+            usage=Mock(prompt_tokens=500, completion_tokens=50),
+        )
+        with metering_scope(run_id=RUN_ID, phase=2):
+            cached_chat_completion(client, model="gpt-4o-mini", messages=[])
+
+        (row,) = ledger.rows()
+        assert row["crew"] == metering.PHASE_LEVEL
+        assert (row["prompt_tokens"], row["completion_tokens"]) == (500, 50)
+
+
+class TestFlush:
+    def test_flush_writes_deltas_once(self):
+        write = Mock()
+        ledger = UsageLedger(write)
+        ledger.record(RUN_ID, 1, "DiscoveryCrew", "gpt-4o", 100, 10)
+        ledger.record(RUN_ID, 1, "DiscoveryCrew", "gpt-4o", 100, 10)
+
+        assert ledger.flush() is True
+        (rows,) = write.call_args[0]
+        assert rows[0]["calls"] == 2 and rows[0]["prompt_tokens"] == 200
+
+        ledger.record(RUN_ID, 1, "DiscoveryCrew", "gpt-4o", 1, 1)
+        ledger.flush()
+        assert write.call_args[0][0][0]["calls"] == 1
+        assert ledger.totals(RUN_ID)["calls"] == 3
+
+    def test_failed_flush_keeps_deltas(self):
+        write = Mock(side_effect=[Exception("supabase down"), None])
+        ledger = UsageLedger(write)
+        ledger.record(RUN_ID, 3, "BuildCrew", "gpt-4o", 100, 10)
+
+        assert ledger.flush() is False
+        ledger.record(RUN_ID, 3, "BuildCrew", "gpt-4o", 100, 10)
+        assert ledger.flush() is True
+        assert write.call_args[0][0][0]["calls"] == 2
+
+
+class TestSummary:
+    def test_rollup_by_phase_and_crew(self):
+        summary = summarize_usage([
+            {"phase": 1, "crew": "DiscoveryCrew", "calls": 3, "prompt_tokens": 300, "completion_tokens": 30, "cost_usd": 0.01},
+            {"phase": 1, "crew": "WTPCrew", "calls": 1, "prompt_tokens": 100, "completion_tokens": 10, "cost_usd": 0.05},
+            {"phase": 2, "crew": "GrowthCrew", "calls": 2, "prompt_tokens": 200, "completion_tokens": 20, "cost_usd": 0.02},
+        ])
+
+        assert summary["calls"] == 6
+        assert summary["total_tokens"] == 660
+        assert summary["by_phase"]["1"]["cost_usd"] == pytest.approx(0.06)
+        assert summary["by_crew"][0]["crew"] == "WTPCrew"
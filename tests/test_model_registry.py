@@ -0,0 +1,110 @@
+"""
+Tests for the agent model registry (src/shared/model_registry.py).
+
+Covers tier resolution, environment overlays and env var overrides, and
+checks that every crew agent gets its model from the registry.
+"""
+
+import ast
+import re
+from pathlib import Path
+
+import pytest
+
+from src.shared import model_registry
+from src.shared.model_registry import load_registry, model_for, tier_for
+
+CREWS_DIR = Path(__file__).resolve().parent.parent / "src" / "crews"
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch):
+    for name in ("MODEL_REGISTRY_ENV", "MODEL_REGISTRY_PATH", "LLM_MODEL_FAST", "LLM_MODEL_STANDARD"):
+        monkeypatch.delenv(name, raising=False)
+    load_registry.cache_clear()
+    yield
+    load_registry.cache_clear()
+
+
+def _agent_roles() -> set[str]:
+    roles = set()
+    for path in CREWS_DIR.glob("*/*_crew.py"):
+        roles.update(re.findall(r'get_llm\("(\w+)"', path.read_text()))
+    return roles
+
+
+def _agent_definitions() -> list[tuple[str, str, ast.Call]]:
+    """(crew file, role, Agent(...) call) for every agent built with get_llm(role)."""
+    agents = []
+    for path in CREWS_DIR.glob("*/*_crew.py"):
+        for node in ast.walk(ast.parse(path.read_text())):
+            if not (isinstance(node, ast.Call) and getattr(node.func, "id", None) == "Agent"):
+                continue
+            llm = next((k.value for k in node.keywords if k.arg == "llm"), None)
+            if isinstance(llm, ast.Call) and getattr(llm.func, "id", None) == "get_llm":
+                agents.append((f"{path.parent.name}/{path.name}", llm.args[0].value, node))
+    return agents
+
+
+class TestResolution:
+    def test_cheap_roles_use_fast_tier(self):
+        assert model_for("l2_legal_compliance") == "openai/gpt-4o-mini"
+        assert model_for("j2_job_ranking") == "openai/gpt-4o-mini"
+
+    def test_unlisted_roles_use_default_tier(self):
+        assert tier_for("n3_claim_guardian") == "standard"
+        assert model_for("n3_claim_guardian") == "openai/gpt-4o"
+
+    def test_environment_overlay(self, monkeypatch):
+        monkeypatch.setenv("MODEL_REGISTRY_ENV", "development")
+        assert model_for("n3_claim_guardian") == "openai/gpt-4o-mini"
+
+    def test_env_overrides(self, monkeypatch):
+        monkeypatch.setenv("LLM_MODEL_FAST", "openai/gpt-4.1-nano")
+        monkeypatch.setenv("LLM_ROLE_N3_CLAIM_GUARDIAN", "fast")
+        assert model_for("n3_claim_guardian") == "openai/gpt-4.1-nano"
+
+    def test_unknown_tier_raises(self, monkeypatch):
+        monkeypatch.setenv("LLM_ROLE_G1_QA_AGENT", "premium")
+        with pytest.raises(KeyError, match="premium"):
+            model_for("g1_qa_agent")
+
+
+class TestCrewAgents:
+    def test_no_hardcoded_models_in_crews(self):
+        for path in CREWS_DIR.glob("*/*_crew.py"):
+            assert "cached_llm(" not in path.read_text(), path.name
+
+    def test_registry_roles_exist_in_crews(self):
+        registry_roles = set(load_registry()["roles"])
+        assert registry_roles <= _agent_roles()
+
+    def test_every_agent_role_has_a_model(self):
+        assert len(_agent_roles()) > 30
+        for role in _agent_roles():
+            assert model_for(role).startswith("openai/")
+
+    def test_roles_are_unique_per_agent(self):
+        seen = {}
+        for crew_file, role, _ in _agent_definitions():
+            if tier_for(role) == "fast":
+                assert role not in seen, f"{role} is shared by {seen[role]} and {crew_file}"
+                seen[role] = crew_file
+
+    def test_fast_roles_have_no_tools_or_reasoning(self):
+        fast_agents = [(f, role, call) for f, role, call in _agent_definitions() if tier_for(role) == "fast"]
+        assert {role for _, role, _ in fast_agents} == set(load_registry()["roles"])
+
+        for crew_file, role, call in fast_agents:
+            keywords = {k.arg: k.value for k in call.keywords}
+            tools = keywords.get("tools")
+            assert tools is None or (isinstance(tools, ast.List) and not tools.elts), f"{crew_file}:{role} has tools"
+            reasoning = keywords.get("reasoning")
+            assert reasoning is None or (isinstance(reasoning, ast.Constant) and reasoning.value is False), \
+                f"{crew_file}:{role} uses reasoning"
+
+    def test_get_llm_uses_role_model(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr("src.shared.llm_cache.cached_llm", lambda **kwargs: calls.append(kwargs))
+        model_registry.get_llm("fit_route_agent", temperature=0.3)
+        assert calls == [{"model": "openai/gpt-4o-mini", "temperature": 0.3}]
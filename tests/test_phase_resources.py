@@ -0,0 +1,27 @@
+"""
+Tests for per-phase Modal resource profiles.
+
+Each phase runs as its own Modal function sized from PHASE_RESOURCES; these
+checks keep the profiles consistent with PHASE_CONFIG.
+"""
+
+from src.modal_app.config import ORCHESTRATOR_RESOURCES, PHASE_CONFIG, PHASE_RESOURCES
+
+
+def test_every_phase_has_a_resource_profile():
+    assert set(PHASE_RESOURCES) == set(PHASE_CONFIG)
+
+
+def test_timeouts_leave_headroom_over_expected_duration():
+    for phase, resources in PHASE_RESOURCES.items():
+        assert resources["timeout_seconds"] >= PHASE_CONFIG[phase]["timeout_seconds"]
+
+
+def test_orchestrator_outlives_all_phases():
+    # Every attempt of every phase, including retries
+    total = sum((r["retries"] + 1) * r["timeout_seconds"] for r in PHASE_RESOURCES.values())
+    assert ORCHESTRATOR_RESOURCES["timeout_seconds"] > total
+
+
+def test_orchestrator_timeout_within_modal_limit():
+    assert ORCHESTRATOR_RESOURCES["timeout_seconds"] <= 24 * 60 * 60
@@ -274,6 +274,7 @@ class TestPhase1PivotContext:
     """Test that Phase 1 receives and uses pivot context correctly."""
 
     @patch("src.crews.discovery.run_discovery_crew")
+    @patch("src.crews.discovery.run_customer_research_crew", new=Mock(return_value={}))
     @patch("src.crews.discovery.run_customer_profile_crew")
     @patch("src.crews.discovery.run_value_design_crew")
     @patch("src.crews.discovery.run_wtp_crew")
@@ -326,6 +327,7 @@ class TestPhase1PivotContext:
         assert founders_brief_arg["pivot_context"]["target_segment_hypothesis"]["segment_name"] == "Enterprise SaaS"
 
     @patch("src.crews.discovery.run_discovery_crew")
+    @patch("src.crews.discovery.run_customer_research_crew", new=Mock(return_value={}))
     @patch("src.crews.discovery.run_customer_profile_crew")
     @patch("src.crews.discovery.run_value_design_crew")
     @patch("src.crews.discovery.run_wtp_crew")
@@ -378,6 +380,7 @@ class TestPhase1PivotContext:
         assert "DIFFERENT segment" in pivot_instructions or "new target" in pivot_instructions.lower()
 
     @patch("src.crews.discovery.run_discovery_crew")
+    @patch("src.crews.discovery.run_customer_research_crew", new=Mock(return_value={}))
     @patch("src.crews.discovery.run_customer_profile_crew")
     @patch("src.crews.discovery.run_value_design_crew")
     @patch("src.crews.discovery.run_wtp_crew")
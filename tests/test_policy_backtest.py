@@ -0,0 +1,158 @@
+"""
+Tests for gate policy backtesting (src/shared/policy_backtest.py).
+
+Covers outcome labeling, replay metrics on a hand-checked example,
+bootstrap intervals, keyset-paginated streaming and Parquet loading.
+Uses a fake Supabase client (no network).
+"""
+
+from unittest.mock import MagicMock, Mock
+
+import numpy as np
+import pytest
+
+from src.shared.policy_backtest import (
+    BAD,
+    GOOD,
+    UNLABELED,
+    backtest_policies,
+    configs_from_spec,
+    decisions_from_rows,
+    iter_table_pages,
+    label_decisions,
+    load_parquet_decisions,
+    load_parquet_outcomes,
+    outcomes_from_rows,
+)
+
+READY = {"experiments_run": 3, "medium_evidence_count": 1, "strong_evidence_count": 1, "ctr": 0.03}
+
+
+def _decision(project, fit_score, decision, at="2026-03-01T00:00:00+00:00", **extra):
+    return {
+        "id": f"{project}-{at}",
+        "project_id": project,
+        "decision_type": "router_decision",
+        "decision_point": "desirability_gate",
+        "decision": decision,
+        "context_snapshot": {**READY, "fit_score": fit_score, **extra},
+        "created_at": at,
+    }
+
+
+def _outcome(project, ctr, at="2026-04-01T00:00:00+00:00"):
+    return {
+        "id": f"o-{project}-{at}",
+        "project_id": project,
+        "primary_metric": "ctr",
+        "primary_value": ctr,
+        "status": "completed",
+        "completed_at": at,
+    }
+
+
+DECISIONS = [
+    _decision("p1", 80, "passed"),   # good project, passes at 70 and 75
+    _decision("p2", 72, "passed"),   # bad project, passes at 70 only
+    _decision("p3", 73, "passed"),   # good project, passes at 70 only
+    _decision("p4", 60, "failed"),   # good project, blocked by both
+    _decision("p5", 90, "passed"),   # no later outcomes
+]
+OUTCOMES = [
+    _outcome("p1", 0.04), _outcome("p1", 0.01), _outcome("p1", 0.05),
+    _outcome("p2", 0.005),
+    _outcome("p3", 0.03),
+    _outcome("p4", 0.03),
+    _outcome("p5", 0.03, at="2026-02-01T00:00:00+00:00"),  # before the decision
+    {**_outcome("p1", 0.9), "primary_metric": "nps"},       # no target: ignored
+]
+
+
+class TestLabeling:
+    def test_labels_from_later_outcomes(self):
+        labels = label_decisions(decisions_from_rows(DECISIONS), outcomes_from_rows(OUTCOMES))
+        assert labels.tolist() == [GOOD, BAD, GOOD, GOOD, UNLABELED]
+
+    def test_non_gate_rows_skipped(self):
+        rows = DECISIONS + [{**DECISIONS[0], "decision_point": "budget_gate"}, {**DECISIONS[0], "decision": "escalated"}]
+        assert len(decisions_from_rows(rows)) == 5
+
+
+class TestBacktest:
+    def test_metrics(self):
+        configs = configs_from_spec({
+            "current": {},
+            "fit75": {"DESIRABILITY": {"thresholds": {"fit_score": 75.0}}},
+        })
+        report = backtest_policies(
+            decisions_from_rows(DECISIONS), outcomes_from_rows(OUTCOMES), configs, n_bootstrap=200,
+        )
+        assert (report["decisions"], report["labeled_decisions"]) == (5, 4)
+
+        fit75 = report["policies"]["fit75"]["overall"]
+        assert fit75["pass_rate"]["value"] == 0.4
+        assert fit75["divergence_rate"]["value"] == 0.4
+        assert fit75["false_pass_rate"]["value"] == 0.0
+        assert fit75["false_block_rate"]["value"] == pytest.approx(2 / 3, abs=1e-4)
+
+        recorded = report["policies"]["recorded"]["overall"]
+        assert recorded["divergence_rate"]["value"] == 0.0
+        assert recorded["false_pass_rate"]["value"] == 1.0
+
+        low, high = fit75["pass_rate"]["ci"]
+        assert low <= 0.4 <= high
+        assert report["policies"]["current"]["by_gate"]["DESIRABILITY"]["decisions"] == 5
+
+    def test_bootstrap_is_seeded(self):
+        configs = configs_from_spec({"current": {}})
+        args = (decisions_from_rows(DECISIONS), outcomes_from_rows(OUTCOMES), configs)
+        assert backtest_policies(*args, seed=3) == backtest_policies(*args, seed=3)
+
+    def test_large_history(self):
+        rng = np.random.default_rng(1)
+        n = 20_000
+        fit = rng.uniform(50, 100, n)
+        decisions = decisions_from_rows(
+            _decision(f"p{i}", fit[i], "passed" if fit[i] >= 70 else "failed") for i in range(n)
+        )
+        outcomes = outcomes_from_rows(_outcome(f"p{i}", 0.03 if fit[i] > 65 else 0.01) for i in range(n))
+        configs = configs_from_spec({"current": {}, "fit65": {"DESIRABILITY": {"thresholds": {"fit_score": 65.0}}}})
+
+        report = backtest_policies(decisions, outcomes, configs, n_bootstrap=500)
+
+        current = report["policies"]["current"]["overall"]
+        assert current["divergence_rate"]["value"] == 0.0
+        assert current["false_pass_rate"]["value"] == 0.0
+        assert report["policies"]["fit65"]["overall"]["false_block_rate"]["value"] == 0.0
+
+    def test_unknown_gate(self):
+        with pytest.raises(ValueError, match="LAUNCH"):
+            configs_from_spec({"x": {"LAUNCH": {}}})
+
+
+class TestLoading:
+    def test_keyset_pagination(self):
+        pages = [[{"id": "a"}, {"id": "b"}], [{"id": "c"}]]
+        client = MagicMock()
+        query = client.table.return_value.select.return_value
+        query.eq.return_value = query
+        query.gt.return_value = query
+        query.order.return_value.limit.return_value.execute.side_effect = [Mock(data=p) for p in pages]
+
+        result = list(iter_table_pages(client, "decision_log", ["id"], [("eq", "decision_type", "router_decision")], page_size=2))
+
+        assert result == pages
+        query.gt.assert_called_once_with("id", "b")
+
+    def test_parquet_export(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        import json
+
+        decision_rows = [{**row, "context_snapshot": json.dumps(row["context_snapshot"])} for row in DECISIONS]
+        pq.write_table(pa.Table.from_pylist(decision_rows), tmp_path / "decisions.parquet")
+        pq.write_table(pa.Table.from_pylist(OUTCOMES), tmp_path / "outcomes.parquet")
+
+        decisions = load_parquet_decisions(tmp_path / "decisions.parquet")
+        outcomes = load_parquet_outcomes(tmp_path / "outcomes.parquet")
+        assert label_decisions(decisions, outcomes).tolist() == [GOOD, BAD, GOOD, GOOD, UNLABELED]
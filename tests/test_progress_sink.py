@@ -0,0 +1,132 @@
+"""
+Tests for the buffered progress writer.
+
+Covers batching, ordering, flush triggers, failure retention and the
+update_progress integration. Uses an in-memory insert callable.
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+from src.state.persistence import update_progress
+from src.state.progress_sink import ProgressSink
+
+
+class RecordingInsert:
+    """Insert callable that records each bulk write."""
+
+    def __init__(self, failures: int = 0):
+        self.batches = []
+        self.failures = failures
+
+    def __call__(self, rows):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("supabase timeout")
+        self.batches.append([row["task"] for row in rows])
+
+
+# ===========================================================================
+# SINK BEHAVIOUR
+# ===========================================================================
+
+
+class TestProgressSink:
+    """Tests for buffering and flushing."""
+
+    def test_events_are_written_as_one_batch_in_order(self):
+        insert = RecordingInsert()
+        sink = ProgressSink(insert, flush_interval_ms=60_000)
+
+        for task in ["a", "b", "c"]:
+            sink.enqueue({"task": task})
+
+        assert insert.batches == []
+        assert sink.flush()
+        assert insert.batches == [["a", "b", "c"]]
+
+    def test_created_at_is_stamped_on_enqueue(self):
+        rows = []
+        sink = ProgressSink(rows.extend, flush_interval_ms=60_000)
+
+        sink.enqueue({"task": "a"})
+        sink.flush()
+
+        assert rows[0]["created_at"]
+
+    def test_background_thread_flushes_on_interval(self):
+        insert = RecordingInsert()
+        sink = ProgressSink(insert, flush_interval_ms=10)
+
+        sink.enqueue({"task": "a"})
+        deadline = time.monotonic() + 2
+        while not insert.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        sink.close()
+
+        assert insert.batches == [["a"]]
+
+    def test_full_batch_wakes_flusher(self):
+        insert = RecordingInsert()
+        sink = ProgressSink(insert, flush_interval_ms=60_000, max_batch=2)
+
+        sink.enqueue({"task": "a"})
+        sink.enqueue({"task": "b"})
+        deadline = time.monotonic() + 2
+        while not insert.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        sink.close()
+
+        assert insert.batches == [["a", "b"]]
+
+    def test_failed_flush_keeps_events_in_order(self):
+        insert = RecordingInsert(failures=1)
+        sink = ProgressSink(insert, flush_interval_ms=60_000)
+
+        sink.enqueue({"task": "a"})
+        assert not sink.flush()
+        sink.enqueue({"task": "b"})
+        assert sink.flush()
+
+        assert insert.batches == [["a", "b"]]
+
+    def test_unbuffered_mode_writes_inline(self):
+        insert = RecordingInsert()
+        sink = ProgressSink(insert, flush_interval_ms=0)
+
+        sink.enqueue({"task": "a"})
+
+        assert insert.batches == [["a"]]
+
+
+# ===========================================================================
+# UPDATE_PROGRESS INTEGRATION
+# ===========================================================================
+
+
+class TestUpdateProgress:
+    """Tests that update_progress queues instead of inserting."""
+
+    def test_update_progress_does_not_block_on_supabase(self):
+        insert = RecordingInsert()
+        sink = ProgressSink(insert, flush_interval_ms=60_000)
+
+        with patch("src.state.persistence.get_progress_sink", return_value=sink):
+            assert update_progress("run-1", phase=1, crew="DiscoveryCrew", task="t1")
+            assert update_progress("run-1", phase=1, crew="DiscoveryCrew", task="t2")
+
+        assert insert.batches == []
+        sink.flush()
+        assert insert.batches == [["t1", "t2"]]
+
+    def test_sink_writes_to_validation_progress(self):
+        supabase = MagicMock()
+
+        with patch("src.state.persistence.get_supabase", return_value=supabase), \
+                patch.dict("os.environ", {"PROGRESS_FLUSH_INTERVAL_MS": "0"}), \
+                patch("src.state.progress_sink._progress_sink", None):
+            update_progress("run-1", phase=0, crew="OnboardingCrew", status="completed")
+
+        supabase.table.assert_called_with("validation_progress")
+        rows = supabase.table.return_value.insert.call_args[0][0]
+        assert rows[0]["validation_phase"] == 0
@@ -0,0 +1,165 @@
+"""
+Tests for record/replay cassettes (src/shared/replay.py).
+
+A phase recorded against fake Supabase / OpenAI clients must replay with the
+same result without touching either client, with sleeps compressed and the
+network blocked.
+"""
+
+import socket
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from src.shared.llm_cache import cached_chat_completion
+from src.shared.replay import (
+    Cassette,
+    CassetteMissError,
+    record_phase,
+    replay_phase,
+    use_cassette,
+    wrap_llm_for_cassette,
+)
+from src.state import persistence
+from src.state.persistence import get_supabase
+
+
+@pytest.fixture
+def fake_supabase(monkeypatch):
+    client = MagicMock()
+    query = client.table.return_value.select.return_value.eq.return_value
+    query.execute.return_value = Mock(data=[{"id": "run-1", "current_phase": 2}], count=None)
+    monkeypatch.setattr(persistence, "_supabase_client", client)
+    return client
+
+
+def _openai_client(content: str = "recorded answer"):
+    client = Mock()
+    client.chat.completions.create.return_value = Mock(
+        choices=[Mock(message=Mock(content=content))]
+    )
+    return client
+
+
+def _failing_client():
+    client = Mock()
+    client.chat.completions.create.side_effect = AssertionError("provider called during replay")
+    return client
+
+
+def _phase(client):
+    def execute(run_id: str, state: dict) -> dict:
+        run = get_supabase().table("validation_runs").select("*").eq("id", run_id).execute()
+        answer = cached_chat_completion(
+            client, model="gpt-4o-mini", messages=[{"role": "user", "content": state["idea"]}],
+        )
+        time.sleep(0.3)
+        return {"phase": run.data[0]["current_phase"], "answer": answer}
+    return execute
+
+
+class TestCassette:
+    def test_save_and_load_round_trip(self, tmp_path):
+        cassette = Cassette("record", metadata={"run_id": "run-1"})
+        cassette.record("llm", "gpt-4o", "k1", {"type": "text", "value": "hi"}, 12.5)
+        loaded = Cassette.load(cassette.save(tmp_path / "c.json"))
+
+        assert loaded.metadata == {"run_id": "run-1"}
+        assert loaded.play("llm", "gpt-4o", "k1")["response"]["value"] == "hi"
+        assert loaded.stats()["recorded_ms"] == {"llm": 12.5}
+
+    def test_key_miss_falls_back_in_order_unless_strict(self):
+        interactions = [
+            {"kind": "llm", "name": "gpt-4o", "key": k, "response": k, "duration_ms": 1}
+            for k in ("a", "b")
+        ]
+        lenient = Cassette("replay", interactions)
+        assert lenient.play("llm", "gpt-4o", "b")["response"] == "b"
+        assert lenient.play("llm", "gpt-4o", "changed")["response"] == "a"
+        assert lenient.stats()["fallbacks"] == 1
+
+        strict = Cassette("replay", interactions, strict=True)
+        with pytest.raises(CassetteMissError):
+            strict.play("llm", "gpt-4o", "changed")
+        assert strict.stats()["misses"] == 1
+
+
+class TestLLMHook:
+    def test_llm_call_replays_without_provider(self):
+        llm = SimpleNamespace(model="openai/gpt-4o", temperature=0.2, call=Mock(return_value="live"))
+        wrap_llm_for_cassette(llm)
+        recorder = Cassette("record")
+
+        with use_cassette(recorder):
+            assert llm.call([{"role": "user", "content": "hi"}]) == "live"
+
+        provider = Mock()
+        replayed = wrap_llm_for_cassette(SimpleNamespace(model="openai/gpt-4o", temperature=0.2, call=provider))
+        with use_cassette(Cassette("replay", recorder.interactions())):
+            assert replayed.call([{"role": "user", "content": "hi"}]) == "live"
+        provider.assert_not_called()
+
+    def test_passthrough_without_cassette(self):
+        underlying = Mock(return_value="live")
+        llm = wrap_llm_for_cassette(SimpleNamespace(model="m", temperature=None, call=underlying))
+        assert llm.call("hello") == "live"
+        underlying.assert_called_once()
+
+
+class TestToolHook:
+    def test_tool_output_replays_without_running_tool(self):
+        from crewai.tools import BaseTool
+
+        calls = []
+
+        class EchoTool(BaseTool):
+            name: str = "echo"
+            description: str = "Upper-cases text"
+
+            def _run(self, text: str) -> str:
+                calls.append(text)
+                return text.upper()
+
+        recorder = Cassette("record")
+        with use_cassette(recorder):
+            assert EchoTool().run(text="hi") == "HI"
+
+        with use_cassette(Cassette("replay", recorder.interactions())):
+            assert EchoTool().run(text="hi") == "HI"
+        assert calls == ["hi"]
+
+
+class TestPhaseReplay:
+    def test_recorded_phase_replays_offline(self, tmp_path, fake_supabase, monkeypatch):
+        result = record_phase("run-1", 2, {"idea": "AI bookkeeping"}, _phase(_openai_client()), tmp_path)
+        assert result == {"phase": 2, "answer": "recorded answer"}
+
+        # Replay never reaches Supabase or OpenAI
+        monkeypatch.setattr(persistence, "_supabase_client", None)
+        (path,) = (tmp_path / "run-1").glob("*_phase_2.json")
+
+        started = time.perf_counter()
+        report = replay_phase(Cassette.load(path), execute=_phase(_failing_client()))
+
+        assert report["error"] is None
+        assert report["matched"] is True
+        assert report["misses"] == 0
+        assert report["counts"] == {"supabase": 1, "chat": 1, "phase": 1}
+        assert time.perf_counter() - started < 0.2  # sleep(0.3) compressed
+        assert persistence._supabase_client is None
+
+    def test_changed_result_is_reported(self, tmp_path, fake_supabase):
+        record_phase("run-1", 2, {"idea": "AI bookkeeping"}, _phase(_openai_client()), tmp_path)
+        (path,) = (tmp_path / "run-1").glob("*_phase_2.json")
+
+        def diverging(run_id, state):
+            return {**_phase(_failing_client())(run_id, state), "extra": True}
+
+        assert replay_phase(Cassette.load(path), execute=diverging)["matched"] is False
+
+    def test_network_is_blocked_during_replay(self):
+        with use_cassette(Cassette("replay", [])):
+            with pytest.raises(CassetteMissError):
+                socket.create_connection(("127.0.0.1", 9), timeout=1)
@@ -0,0 +1,117 @@
+"""
+Tests for the run event log and SSE stream.
+
+Covers SSE formatting, Last-Event-ID resume, late-committing events and
+termination after terminal events. Uses a mocked Supabase client.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from src.state.run_events import (
+    format_sse,
+    parse_last_event_id,
+    record_run_event,
+    stream_run_events,
+)
+
+
+def _event(event_id, event_type="progress", **payload):
+    return {"id": event_id, "event_type": event_type, "payload": payload, "created_at": "2026-10-16T00:00:00Z"}
+
+
+async def _collect(stream):
+    return [message async for message in stream]
+
+
+class TestFormatting:
+    """Tests for SSE wire format."""
+
+    def test_format_sse(self):
+        message = format_sse(_event(42, crew="DiscoveryCrew"))
+
+        lines = message.splitlines()
+        assert lines[0] == "id: 42"
+        assert lines[1] == "event: progress"
+        assert json.loads(lines[2].removeprefix("data: "))["crew"] == "DiscoveryCrew"
+        assert message.endswith("\n\n")
+
+    def test_parse_last_event_id(self):
+        assert parse_last_event_id("17") == 17
+        assert parse_last_event_id(None) == 0
+        assert parse_last_event_id("garbage") == 0
+
+
+class TestStreamRunEvents:
+    """Tests for the polling stream."""
+
+    async def test_resumes_after_last_event_id_and_stops_on_completion(self):
+        pages = [
+            [_event(6, crew="DiscoveryCrew")],
+            [],
+            [_event(7, "validation_complete", status="completed")],
+        ]
+        cursors = []
+
+        def fetch(run_id, after_id, limit, supabase):
+            cursors.append(after_id)
+            return pages.pop(0)
+
+        with patch("src.state.run_events.fetch_run_events", side_effect=fetch):
+            messages = await _collect(stream_run_events(
+                "run-1", last_event_id=5, supabase=MagicMock(), poll_interval_ms=1, max_seconds=5,
+                rescan_seconds=0,
+            ))
+
+        assert cursors == [5, 6, 6]
+        assert messages[0].startswith("retry:")
+        assert [m.splitlines()[0] for m in messages[1:]] == ["id: 6", "id: 7"]
+
+    async def test_late_commit_behind_cursor_is_delivered_once(self):
+        # Event 7 commits after 8 was already sent
+        pages = [
+            [_event(6), _event(8)],
+            [_event(6), _event(7), _event(8)],
+            [_event(6), _event(7), _event(8), _event(9, "validation_complete")],
+        ]
+        calls = []
+
+        def fetch(run_id, after_id, limit, supabase):
+            calls.append((after_id, limit))
+            return pages.pop(0)
+
+        with patch("src.state.run_events.fetch_run_events", side_effect=fetch):
+            messages = await _collect(stream_run_events(
+                "run-1", last_event_id=5, supabase=MagicMock(), poll_interval_ms=1, max_seconds=5,
+                rescan_seconds=60,
+            ))
+
+        assert [after_id for after_id, _ in calls] == [5, 5, 5]
+        assert [limit for _, limit in calls] == [100, 102, 103]
+        assert [m.splitlines()[0] for m in messages[1:]] == ["id: 6", "id: 8", "id: 7", "id: 9"]
+
+    async def test_stops_after_max_seconds(self):
+        with patch("src.state.run_events.fetch_run_events", return_value=[]):
+            messages = await _collect(stream_run_events(
+                "run-1", supabase=MagicMock(), poll_interval_ms=1, max_seconds=0.01,
+            ))
+
+        assert messages == [messages[0]]
+
+
+class TestRecordRunEvent:
+    """Tests for event writes."""
+
+    def test_record_inserts_row(self):
+        supabase = MagicMock()
+
+        assert record_run_event("run-1", "hitl_required", {"checkpoint": "approve_vpc"}, supabase)
+
+        supabase.table.assert_called_with("run_events")
+        assert supabase.table.return_value.insert.call_args[0][0]["event_type"] == "hitl_required"
+
+    def test_record_failure_is_swallowed(self):
+        supabase = MagicMock()
+        supabase.table.side_effect = Exception("connection reset")
+
+        assert record_run_event("run-1", "validation_complete", supabase=supabase) is False
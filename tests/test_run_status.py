@@ -0,0 +1,130 @@
+"""
+Tests for /status run summary reads.
+
+Covers the get_run_status RPC path, cursor paging, the ETag round trip and
+the fallback for databases without the summary table. Uses a mocked
+Supabase client.
+"""
+
+from unittest.mock import MagicMock
+
+from src.state.run_status import (
+    get_run_status,
+    parse_etag_version,
+    status_etag,
+)
+
+RUN_ID = "6f1c0b9e-2f4a-4c7e-9d55-0a7c1e2b3d4f"
+
+
+def _progress(n):
+    return [{"id": f"p{i}", "crew": "DiscoveryCrew", "created_at": f"2026-10-16T00:00:0{i}Z"} for i in range(n)]
+
+
+def _supabase(rpc_data):
+    client = MagicMock()
+    client.rpc.return_value.execute.return_value = MagicMock(data=rpc_data)
+    return client
+
+
+class TestGetRunStatus:
+    """Tests for the single-RPC status read."""
+
+    def test_single_round_trip(self):
+        supabase = _supabase({
+            "version": 7,
+            "status": "running",
+            "current_phase": 1,
+            "progress_count": 3,
+            "progress": _progress(3),
+            "hitl_pending": None,
+        })
+
+        status = get_run_status(RUN_ID, since="p0", supabase=supabase)
+
+        supabase.rpc.assert_called_once()
+        supabase.table.assert_not_called()
+        assert supabase.rpc.call_args[0][1]["p_since"] == "p0"
+        assert status["version"] == 7
+        assert status["next_cursor"] == "p2"
+        assert status["has_more"] is False
+
+    def test_limit_reports_has_more(self):
+        supabase = _supabase({"version": 1, "status": "running", "current_phase": 0, "progress": _progress(3)})
+
+        status = get_run_status(RUN_ID, limit=2, supabase=supabase)
+
+        assert [p["id"] for p in status["progress"]] == ["p0", "p1"]
+        assert status["has_more"] is True
+        assert status["next_cursor"] == "p1"
+
+    def test_known_version_short_circuits(self):
+        supabase = _supabase({"version": 7, "not_modified": True})
+
+        status = get_run_status(RUN_ID, known_version=7, supabase=supabase)
+
+        assert status == {"version": 7, "not_modified": True}
+
+    def test_unknown_run_returns_none(self):
+        assert get_run_status(RUN_ID, supabase=_supabase(None)) is None
+
+    def test_falls_back_without_rpc(self):
+        supabase = MagicMock()
+        supabase.rpc.side_effect = Exception("function get_run_status does not exist")
+        supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = (
+            MagicMock(data={"status": "paused", "current_phase": 2})
+        )
+        progress_query = supabase.table.return_value.select.return_value.eq.return_value
+        progress_query.order.return_value.order.return_value.limit.return_value.execute.return_value = (
+            MagicMock(data=_progress(2))
+        )
+        progress_query.eq.return_value.execute.return_value = MagicMock(data=[{"checkpoint_name": "approve_vpc"}])
+
+        status = get_run_status(RUN_ID, supabase=supabase)
+
+        assert status["version"] is None
+        assert status["status"] == "paused"
+        assert len(status["progress"]) == 2
+        assert status["hitl_pending"] == {"checkpoint_name": "approve_vpc"}
+
+    def test_fallback_pages_by_created_at_and_id(self):
+        cursor_id = "0b8c4f3e-5a1d-4e2b-9c7f-6d3a2e1f0b9c"
+        supabase = MagicMock()
+        supabase.rpc.side_effect = Exception("function get_run_status does not exist")
+        supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = (
+            MagicMock(data={"status": "running", "current_phase": 1})
+        )
+        filtered = supabase.table.return_value.select.return_value.eq.return_value
+        filtered.eq.return_value.execute.return_value = MagicMock(
+            data=[{"created_at": "2026-10-16T00:00:01+00:00"}]
+        )
+        page = filtered.or_.return_value.order.return_value.order.return_value.limit.return_value
+        page.execute.return_value = MagicMock(data=_progress(2))
+
+        status = get_run_status(RUN_ID, since=cursor_id, supabase=supabase)
+
+        filtered.gt.assert_not_called()
+        filtered.or_.assert_called_once_with(
+            'created_at.gt."2026-10-16T00:00:01+00:00",'
+            f'and(created_at.eq."2026-10-16T00:00:01+00:00",id.gt.{cursor_id})'
+        )
+        orders = filtered.or_.return_value.order
+        assert orders.call_args.args == ("created_at",)
+        assert orders.return_value.order.call_args.args == ("id",)
+        assert len(status["progress"]) == 2
+
+
+class TestStatusEtag:
+    """Tests for ETag generation and parsing."""
+
+    def test_round_trip(self):
+        etag = status_etag(RUN_ID, 12, "p3", 500)
+
+        assert parse_etag_version(etag, RUN_ID) == 12
+
+    def test_page_is_part_of_etag(self):
+        assert status_etag(RUN_ID, 12, None, 500) != status_etag(RUN_ID, 12, "p3", 500)
+
+    def test_foreign_etag_is_ignored(self):
+        assert parse_etag_version('"abc"', RUN_ID) is None
+        assert parse_etag_version(status_etag("other-run", 3, None, 500), RUN_ID) is None
@@ -0,0 +1,196 @@
+"""
+Tests for delta state checkpointing.
+
+Covers per-key diffs, patch replay, and how save_phase_state/load_phase_state
+and checkpoint_state talk to Supabase in full and delta mode. Uses a mocked Supabase client.
+"""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.state.models import ValidationRunState
+from src.state.persistence import (
+    apply_state_patches,
+    checkpoint_state,
+    diff_state,
+    load_phase_state,
+    save_phase_state,
+)
+
+
+@pytest.fixture
+def supabase():
+    client = MagicMock()
+    client.rpc.return_value.execute.return_value = MagicMock(
+        data={"version": 1, "pending_patches": 1}
+    )
+    return client
+
+
+@pytest.fixture
+def delta_mode():
+    with patch.dict("os.environ", {"STATE_CHECKPOINT_MODE": "delta", "STATE_COMPACT_EVERY": "3"}):
+        yield
+
+
+# ===========================================================================
+# DIFF / REPLAY
+# ===========================================================================
+
+
+class TestDiffAndApply:
+    """Tests for per-key patches."""
+
+    def test_diff_only_contains_changed_sections(self):
+        previous = {"founders_brief": {"idea": "x"}, "customer_profile": {"jobs": []}, "stale": 1}
+        current = {"founders_brief": {"idea": "x"}, "customer_profile": {"jobs": ["a"]}, "iteration_count": 1}
+
+        set_values, unset_keys = diff_state(previous, current)
+
+        assert set_values == {"customer_profile": {"jobs": ["a"]}, "iteration_count": 1}
+        assert unset_keys == ["stale"]
+
+    def test_replaying_patches_reconstructs_state(self):
+        states = [
+            {"entrepreneur_input": "idea"},
+            {"entrepreneur_input": "idea", "founders_brief": {"v": 1}},
+            {"founders_brief": {"v": 2}, "pivot_type": "segment_pivot"},
+        ]
+        patches = []
+        for previous, current in zip(states, states[1:]):
+            set_values, unset_keys = diff_state(previous, current)
+            patches.append({"set_values": set_values, "unset_keys": unset_keys})
+
+        assert apply_state_patches(states[0], patches) == states[-1]
+
+
+# ===========================================================================
+# SUPABASE INTEGRATION
+# ===========================================================================
+
+
+class TestSavePhaseState:
+    """Tests for save_phase_state write paths."""
+
+    def test_full_mode_rewrites_phase_state(self, supabase):
+        with patch.dict("os.environ", {}, clear=True):
+            save_phase_state("run-1", {"a": 1}, previous_state={"a": 0}, supabase=supabase, status="paused")
+
+        supabase.table.return_value.update.assert_called_once_with({"status": "paused", "phase_state": {"a": 1}})
+        supabase.rpc.assert_not_called()
+
+    def test_delta_mode_appends_changed_keys_only(self, supabase, delta_mode):
+        previous = {"founders_brief": {"big": "blob"}, "iteration_count": 0}
+        current = {"founders_brief": {"big": "blob"}, "iteration_count": 1}
+
+        save_phase_state("run-1", current, previous_state=previous, supabase=supabase, status="running")
+
+        # Run columns ride in the same RPC, so state and status cannot diverge
+        supabase.rpc.assert_called_once_with("append_state_patch", {
+            "p_run_id": "run-1",
+            "p_set_values": {"iteration_count": 1},
+            "p_unset_keys": [],
+            "p_run_fields": {"status": "running"},
+        })
+        supabase.table.return_value.update.assert_not_called()
+
+    def test_delta_mode_replace_carries_run_fields(self, supabase, delta_mode):
+        save_phase_state(
+            "run-1", {"a": 2}, previous_state={"a": 1}, supabase=supabase, hitl_state="approve_brief", status="paused",
+        )
+
+        supabase.rpc.assert_called_once_with("replace_phase_state", {
+            "p_run_id": "run-1",
+            "p_state": {"a": 2},
+            "p_run_fields": {"hitl_state": "approve_brief", "status": "paused"},
+        })
+        supabase.table.return_value.update.assert_not_called()
+
+    def test_delta_mode_compacts_after_threshold(self, supabase, delta_mode):
+        supabase.rpc.return_value.execute.return_value = MagicMock(
+            data={"version": 3, "pending_patches": 3}
+        )
+
+        save_phase_state("run-1", {"a": 1, "b": 2}, previous_state={"a": 1, "b": 1}, supabase=supabase)
+
+        assert [c.args[0] for c in supabase.rpc.call_args_list] == [
+            "append_state_patch",
+            "compact_state_patches",
+        ]
+
+    def test_delta_mode_skips_write_when_unchanged(self, supabase, delta_mode):
+        save_phase_state("run-1", {"a": 1}, previous_state={"a": 1}, supabase=supabase)
+
+        supabase.rpc.assert_not_called()
+        supabase.table.return_value.update.assert_not_called()
+
+    def test_delta_mode_unchanged_state_updates_run_fields_only(self, supabase, delta_mode):
+        save_phase_state("run-1", {"a": 1}, previous_state={"a": 1}, supabase=supabase, current_phase=2)
+
+        supabase.rpc.assert_not_called()
+        supabase.table.return_value.update.assert_called_once_with({"current_phase": 2})
+
+
+class TestCheckpointState:
+    """Tests for checkpoint_state in delta mode."""
+
+    @pytest.fixture
+    def state(self):
+        return ValidationRunState(
+            run_id=uuid4(),
+            project_id=uuid4(),
+            user_id=uuid4(),
+            entrepreneur_input="AI-powered bookkeeping for freelancers",
+        )
+
+    @pytest.fixture(autouse=True)
+    def client(self, supabase):
+        with patch("src.state.persistence.get_supabase", return_value=supabase), \
+                patch("src.state.persistence.flush_progress"):
+            yield supabase
+
+    def test_previous_state_skips_reload(self, client, delta_mode, state):
+        previous = state.model_dump(mode="json")
+        state.current_phase = 1
+
+        with patch("src.state.persistence.load_phase_state") as load:
+            assert checkpoint_state(str(state.run_id), state, previous_state=previous)
+
+        load.assert_not_called()
+        client.rpc.assert_called_once()
+        name, params = client.rpc.call_args.args
+        assert name == "append_state_patch"
+        assert (params["p_set_values"], params["p_unset_keys"]) == ({"current_phase": 1}, [])
+        assert {k: params["p_run_fields"][k] for k in ("current_phase", "status")} == {
+            "current_phase": 1, "status": "running",
+        }
+        client.table.return_value.update.assert_not_called()
+
+    def test_without_previous_state_reloads(self, client, delta_mode, state):
+        with patch("src.state.persistence.load_phase_state", return_value={}) as load:
+            assert checkpoint_state(str(state.run_id), state)
+
+        load.assert_called_once()
+
+
+class TestLoadPhaseState:
+    """Tests for reconstructing state on resume."""
+
+    def test_compacted_run_needs_no_patch_read(self, supabase):
+        run = {"phase_state": {"a": 1}, "state_version": 4, "state_base_version": 4}
+
+        assert load_phase_state("run-1", run, supabase) == {"a": 1}
+        supabase.table.assert_not_called()
+
+    def test_pending_patches_are_applied_in_order(self, supabase):
+        run = {"phase_state": {"a": 1, "b": 1}, "state_version": 2, "state_base_version": 0}
+        query = supabase.table.return_value.select.return_value.eq.return_value.gt.return_value.lte.return_value
+        query.order.return_value.execute.return_value = MagicMock(data=[
+            {"version": 1, "set_values": {"a": 2}, "unset_keys": []},
+            {"version": 2, "set_values": {"c": 3}, "unset_keys": ["b"]},
+        ])
+
+        assert load_phase_state("run-1", run, supabase) == {"a": 2, "c": 3}
+        supabase.table.assert_called_with("validation_state_patches")
@@ -0,0 +1,140 @@
+"""
+Tests for compressed state snapshots.
+
+Covers the snapshot codec (round trip, lazy section decoding, format checks)
+and snapshot checkpoint mode in save_phase_state/load_phase_state/resume_state.
+Uses a mocked Supabase client.
+"""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.state.codec import (
+    COMPRESSION_ZLIB,
+    LazyStateSnapshot,
+    SnapshotFormatError,
+    decode_snapshot,
+    encode_snapshot,
+)
+from src.state.models import ValidationRunState
+from src.state.persistence import (
+    load_phase_state,
+    resume_state,
+    save_phase_state,
+)
+
+
+@pytest.fixture
+def phase_state():
+    return {
+        "entrepreneur_input": "AI bookkeeping for freelancers",
+        "founders_brief": {"the_idea": {"one_liner": "Bookkeeping on autopilot"}},
+        "discovery_results": {"raw": "x" * 5000},
+        "iteration_count": 2,
+    }
+
+
+# ===========================================================================
+# CODEC
+# ===========================================================================
+
+
+class TestSnapshotCodec:
+    """Tests for encode/decode and lazy access."""
+
+    def test_round_trip(self, phase_state):
+        assert decode_snapshot(encode_snapshot(phase_state)) == phase_state
+
+    def test_zlib_round_trip(self, phase_state):
+        blob = encode_snapshot(phase_state, compression=COMPRESSION_ZLIB)
+
+        assert LazyStateSnapshot(blob).compression == COMPRESSION_ZLIB
+        assert decode_snapshot(blob) == phase_state
+
+    def test_sections_decode_on_access_only(self, phase_state):
+        snapshot = LazyStateSnapshot(encode_snapshot(phase_state))
+
+        assert set(snapshot) == set(phase_state)
+        assert snapshot.decoded_sections == []
+
+        assert snapshot["iteration_count"] == 2
+        assert snapshot.decoded_sections == ["iteration_count"]
+
+    def test_accepts_pydantic_model(self):
+        state = ValidationRunState(
+            run_id=uuid4(), project_id=uuid4(), user_id=uuid4(), entrepreneur_input="idea",
+        )
+
+        decoded = decode_snapshot(encode_snapshot(state))
+
+        assert ValidationRunState(**decoded) == state
+
+    def test_rejects_foreign_bytes(self):
+        with pytest.raises(SnapshotFormatError):
+            LazyStateSnapshot(b'{"not": "a snapshot"}')
+
+
+# ===========================================================================
+# SNAPSHOT CHECKPOINT MODE
+# ===========================================================================
+
+
+@pytest.fixture
+def snapshot_mode():
+    with patch.dict("os.environ", {"STATE_CHECKPOINT_MODE": "snapshot"}):
+        yield
+
+
+@pytest.fixture
+def supabase():
+    """Supabase mock whose Storage keeps uploaded files in memory."""
+    client = MagicMock()
+    files = {}
+
+    def upload(path, file, file_options=None):
+        files[path] = file
+
+    bucket = client.storage.from_.return_value
+    bucket.upload.side_effect = upload
+    bucket.download.side_effect = lambda path: files[path]
+    client.files = files
+    return client
+
+
+class TestSnapshotMode:
+    """Tests for snapshot checkpoints against Supabase."""
+
+    def test_save_stores_pointer_not_state(self, supabase, snapshot_mode, phase_state):
+        save_phase_state("run-1", phase_state, supabase=supabase, status="paused")
+
+        payload = supabase.table.return_value.update.call_args[0][0]
+        assert payload["status"] == "paused"
+        assert set(payload["phase_state"]) == {"_snapshot"}
+        assert payload["phase_state"]["_snapshot"]["path"] == "run-1/state.snap"
+        assert decode_snapshot(supabase.files["run-1/state.snap"]) == phase_state
+
+    def test_load_resolves_pointer(self, supabase, snapshot_mode, phase_state):
+        save_phase_state("run-1", phase_state, supabase=supabase)
+        pointer = supabase.table.return_value.update.call_args[0][0]["phase_state"]
+
+        assert load_phase_state("run-1", {"phase_state": pointer}, supabase) == phase_state
+
+    def test_resume_restores_snapshot_state(self, supabase, snapshot_mode, phase_state):
+        run_id = str(uuid4())
+        state = ValidationRunState(
+            run_id=run_id, project_id=uuid4(), user_id=uuid4(), entrepreneur_input="idea", current_phase=2,
+        ).model_dump(mode="json")
+        state["discovery_results"] = phase_state["discovery_results"]
+        save_phase_state(run_id, state, supabase=supabase)
+        pointer = supabase.table.return_value.update.call_args[0][0]["phase_state"]
+
+        supabase.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = (
+            MagicMock(data={"phase_state": pointer})
+        )
+        with patch("src.state.persistence.get_supabase", return_value=supabase):
+            resumed = resume_state(run_id)
+
+        assert resumed.current_phase == 2
+        assert resumed.entrepreneur_input == "idea"
@@ -0,0 +1,214 @@
+"""
+Tests for phase latency tracing (src/shared/tracing.py).
+
+A traced phase must produce phase -> crew -> task -> agent -> LLM/tool spans
+with token counts rolled up to every ancestor, and export them as Chrome
+trace JSON or OpenTelemetry spans. Tracing is off unless TRACE_EXPORT is set.
+
+All tests use fakes (no API keys or CrewAI runs required).
+"""
+
+import ast
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.modal_app.phases.crew_graph import CrewNode, execute_crew_graph
+from src.shared import tracing
+from src.shared.tracing import (
+    Tracer,
+    merge_chrome_traces,
+    trace_id_for_run,
+    trace_phase,
+    wrap_llm_for_tracing,
+)
+
+
+def _fake_llm(prompt_tokens: int = 100, completion_tokens: int = 20):
+    """LLM stand-in whose call() bumps _token_usage like crewai.LLM does."""
+    llm = SimpleNamespace(model="openai/gpt-4o", _token_usage={"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0})
+
+    def call(messages, **kwargs):
+        llm._token_usage["prompt_tokens"] += prompt_tokens
+        llm._token_usage["completion_tokens"] += completion_tokens
+        llm._token_usage["total_tokens"] += prompt_tokens + completion_tokens
+        return "answer"
+
+    llm.call = call
+    return wrap_llm_for_tracing(llm)
+
+
+def _event(seconds: float, **fields):
+    start = datetime(2026, 10, 16, tzinfo=timezone.utc)
+    return SimpleNamespace(timestamp=start + timedelta(seconds=seconds), **fields)
+
+
+@pytest.fixture
+def chrome(monkeypatch, tmp_path):
+    monkeypatch.setenv("TRACE_EXPORT", "chrome")
+    return tmp_path
+
+
+class TestTracePhase:
+    def test_disabled_by_default(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("TRACE_EXPORT", raising=False)
+        llm = _fake_llm()
+        with trace_phase("run-1", 1, tmp_path) as tracer:
+            assert llm.call([{"role": "user", "content": "hi"}]) == "answer"
+        assert tracer is None
+        assert not list(tmp_path.rglob("*.json"))
+
+    def test_crew_graph_spans_and_token_rollup(self, chrome):
+        llm = _fake_llm()
+        task = SimpleNamespace(id="task-1", agent=SimpleNamespace(id="agent-1", role="Analyst"))
+        nodes = [
+            CrewNode(name="FinanceCrew", run=lambda r: llm.call("q", from_task=task)),
+            CrewNode(name="SynthesisCrew", run=lambda r: llm.call("q"), depends_on=("FinanceCrew",)),
+        ]
+        progress = MagicMock()
+
+        with trace_phase("run-1", 4, chrome) as tracer:
+            execute_crew_graph("run-1", phase=4, nodes=nodes, progress=progress)
+
+        by_name = {span.name: span for span in tracer.spans if span.kind != tracing.LLM}
+        llm_spans = [span for span in tracer.spans if span.kind == tracing.LLM]
+        phase = by_name["phase_4"]
+
+        assert by_name["FinanceCrew"].parent_id == phase.span_id
+        assert {span.parent_id for span in llm_spans} == {
+            by_name["FinanceCrew"].span_id, by_name["SynthesisCrew"].span_id,
+        }
+        assert llm_spans[0].attributes["agent"] == "Analyst"
+        assert phase.attributes["sum_total_tokens"] == 240
+        assert phase.attributes["sum_llm_calls"] == 2
+        assert by_name["FinanceCrew"].attributes["sum_prompt_tokens"] == 100
+
+        completed = [c.kwargs for c in progress.call_args_list if c.kwargs["status"] == "completed"]
+        assert all(isinstance(c["duration_ms"], int) for c in completed)
+
+        trace = json.loads((chrome / "run-1" / "phase_4.trace.json").read_text())
+        complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        assert {e["cat"] for e in complete} == {"phase", "crew", "llm"}
+        assert trace["otherData"]["trace_id"] == trace_id_for_run("run-1")
+
+    def test_failed_crew_marks_span(self, chrome):
+        def boom(results):
+            raise RuntimeError("provider down")
+
+        nodes = [CrewNode(name="GrowthCrew", run=boom)]
+        with pytest.raises(RuntimeError):
+            with trace_phase("run-1", 2, chrome) as tracer:
+                execute_crew_graph("run-1", phase=2, nodes=nodes, progress=MagicMock())
+
+        crew = next(span for span in tracer.spans if span.kind == tracing.CREW)
+        assert crew.status == "error"
+        assert (chrome / "run-1" / "phase_2.trace.json").exists()
+
+
+class TestEventStitching:
+    def test_task_agent_tool_hierarchy(self):
+        tracer = Tracer("run-1", "phase_1")
+        with tracer.span("DiscoveryCrew", tracing.CREW) as crew:
+            pass
+        tracer.link_task("task-1", crew)
+
+        # Two LLM iterations by the agent, opened under the crew span
+        for _ in range(2):
+            tracer.add_span("gpt-4o", tracing.LLM, 1, 2, crew.span_id,
+                            task_id="task-1", agent_id="agent-1", llm_calls=1, total_tokens=50)
+
+        tracer.record_event("task_started", _event(0, task_id="task-1"))
+        tracer.record_event("agent_started", _event(0.1, task_id="task-1", agent_id="agent-1"))
+        tracer.record_event("tool_finished", _event(
+            0.5, task_id="task-1", agent_id="agent-1", tool_name="web_search", run_attempts=3,
+            started_at=_event(0.2).timestamp, finished_at=_event(0.5).timestamp,
+        ))
+        tracer.record_event("agent_completed", _event(0.9, task_id="task-1", agent_id="agent-1", agent_role="Researcher"))
+        tracer.record_event("task_completed", _event(1.0, task_id="task-1", task_name="Research market"))
+        tracer.finish()
+
+        kinds = {span.kind: span for span in tracer.spans}
+        task, agent, tool = kinds[tracing.TASK], kinds[tracing.AGENT], kinds[tracing.TOOL]
+
+        assert task.parent_id == crew.span_id and task.name == "Research market"
+        assert agent.parent_id == task.span_id and agent.name == "Researcher"
+        assert tool.parent_id == agent.span_id
+        assert tool.attributes["retries"] == 2
+        assert tool.duration_ms == pytest.approx(300)
+
+        llm_spans = [span for span in tracer.spans if span.kind == tracing.LLM]
+        assert all(span.parent_id == agent.span_id for span in llm_spans)
+        assert sorted(span.attributes["iteration"] for span in llm_spans) == [1, 2]
+        assert crew.attributes["sum_total_tokens"] == 100
+        assert crew.attributes["sum_tool_calls"] == 1
+
+
+class TestExport:
+    def test_otel_spans_share_run_trace_id(self):
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+        tracer = Tracer("run-1", "phase_3")
+        with tracer.span("phase_3", tracing.PHASE):
+            with tracer.span("BuildCrew", tracing.CREW):
+                pass
+
+        from opentelemetry import trace
+        original = trace.get_tracer
+        trace.get_tracer = provider.get_tracer
+        try:
+            assert tracer.export_otel() == 2
+        finally:
+            trace.get_tracer = original
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        assert {span.context.trace_id for span in spans.values()} == {int(trace_id_for_run("run-1"), 16)}
+        assert spans["BuildCrew"].parent.span_id == spans["phase_3"].context.span_id
+
+    def test_merge_chrome_traces(self, tmp_path):
+        paths = []
+        for name in ("run_1", "phase_1"):
+            tracer = Tracer("run-1", name)
+            with tracer.span(name, tracing.PHASE):
+                pass
+            paths.append(tracer.write_chrome_trace(tmp_path))
+
+        merged = merge_chrome_traces(paths)
+        processes = [e["args"]["name"] for e in merged["traceEvents"] if e["name"] == "process_name"]
+        assert sorted(processes) == ["phase_1", "run_1"]
+        assert {e["pid"] for e in merged["traceEvents"]} == {1, 2}
+
+
+
+class TestTraceVolumeMounts:
+    """Modal functions that write traces must mount the trace volume."""
+
+    APP_PATH = Path(__file__).resolve().parent.parent / "src" / "modal_app" / "app.py"
+
+    @staticmethod
+    def _mounts_traces(node) -> bool:
+        return any(
+            keyword.arg == "volumes" and "TRACE_DIR" in ast.unparse(keyword.value)
+            for decorator in node.decorator_list if isinstance(decorator, ast.Call)
+            for keyword in decorator.keywords
+        )
+
+    def test_orchestrator_entry_points_mount_volume(self):
+        functions = [node for node in ast.parse(self.APP_PATH.read_text()).body if isinstance(node, ast.FunctionDef)]
+        tracing_functions = [
+            node for node in functions
+            if node.name == "run_validation" or "run_validation.local(" in ast.unparse(node)
+        ]
+
+        assert {node.name for node in tracing_functions} >= {"run_validation", "resume_from_checkpoint"}
+        for node in tracing_functions:
+            assert self._mounts_traces(node), f"{node.name} writes traces without the trace volume"
@@ -9,6 +9,8 @@ Tests crew structure, agents, tasks, and flow orchestration for:
 - FitAssessmentCrew (2 agents)
 """
 
+import threading
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
@@ -282,6 +284,7 @@ class TestPhase1Flow:
         with patch("src.modal_app.phases.phase_1.update_progress") as mock_progress, \
              patch("src.crews.discovery.run_discovery_crew") as mock_disc, \
              patch("src.crews.discovery.run_customer_profile_crew") as mock_cp, \
+             patch("src.crews.discovery.run_customer_research_crew", return_value={}), \
              patch("src.crews.discovery.run_value_design_crew") as mock_vd, \
              patch("src.crews.discovery.run_wtp_crew") as mock_wtp, \
              patch("src.crews.discovery.run_fit_assessment_crew") as mock_fit_crew:
@@ -319,6 +322,7 @@ class TestPhase1Flow:
         with patch("src.modal_app.phases.phase_1.update_progress") as mock_progress, \
              patch("src.crews.discovery.run_discovery_crew") as mock_disc, \
              patch("src.crews.discovery.run_customer_profile_crew") as mock_cp, \
+             patch("src.crews.discovery.run_customer_research_crew", return_value={}), \
              patch("src.crews.discovery.run_value_design_crew") as mock_vd, \
              patch("src.crews.discovery.run_wtp_crew") as mock_wtp, \
              patch("src.crews.discovery.run_fit_assessment_crew") as mock_fit_crew:
@@ -355,6 +359,7 @@ class TestPhase1Flow:
         with patch("src.modal_app.phases.phase_1.update_progress") as mock_progress, \
              patch("src.crews.discovery.run_discovery_crew") as mock_disc, \
              patch("src.crews.discovery.run_customer_profile_crew") as mock_cp, \
+             patch("src.crews.discovery.run_customer_research_crew", return_value={}), \
              patch("src.crews.discovery.run_value_design_crew") as mock_vd, \
              patch("src.crews.discovery.run_wtp_crew") as mock_wtp, \
              patch("src.crews.discovery.run_fit_assessment_crew") as mock_fit_crew:
@@ -377,6 +382,58 @@ class TestPhase1Flow:
 
             assert result["hitl_recommended"] == "iterate"
 
+    def test_phase_1_research_runs_alongside_discovery(self, minimal_founders_brief):
+        """Test that DiscoveryCrew and the brief-only research pass overlap."""
+        # Each crew waits for the other to start, so both must be running at once
+        barrier = threading.Barrier(2, timeout=5)
+        events = []
+
+        def crew(name, result):
+            def run(*args, **kwargs):
+                events.append(f"{name} started")
+                barrier.wait()
+                events.append(f"{name} finished")
+                return result
+            return run
+
+        with patch("src.modal_app.phases.phase_1.update_progress"), \
+             patch("src.crews.discovery.run_discovery_crew") as mock_disc, \
+             patch("src.crews.discovery.run_customer_research_crew") as mock_research, \
+             patch("src.crews.discovery.run_customer_profile_crew") as mock_cp, \
+             patch("src.crews.discovery.run_value_design_crew") as mock_vd, \
+             patch("src.crews.discovery.run_wtp_crew") as mock_wtp, \
+             patch("src.crews.discovery.run_fit_assessment_crew") as mock_fit_crew:
+
+            mock_disc.side_effect = crew("discovery", {"evidence": "collected"})
+            mock_research.side_effect = crew("research", {"jobs": "ranked"})
+            mock_cp.return_value = CustomerProfile(
+                segment_name="Test", segment_description="Test"
+            )
+            mock_vd.return_value = ValueMap()
+            mock_wtp.return_value = {}
+            mock_fit_crew.return_value = FitAssessment(
+                fit_score=75,
+                fit_status="strong",
+                profile_completeness=0.8,
+                value_map_coverage=0.8,
+                evidence_strength="strong",
+                gate_ready=True,
+            )
+
+            from src.modal_app.phases.phase_1 import execute
+
+            execute(
+                run_id="test-run-123",
+                state={"founders_brief": minimal_founders_brief.model_dump()},
+            )
+
+        assert sorted(events[:2]) == ["discovery started", "research started"]
+        assert sorted(events[2:]) == ["discovery finished", "research finished"]
+        # The refinement pass gets both outputs
+        mock_cp.assert_called_once()
+        assert mock_cp.call_args.kwargs["discovery_results"] == {"evidence": "collected"}
+        assert mock_cp.call_args.kwargs["customer_research"] == {"jobs": "ranked"}
+
 
 # =============================================================================
 # Agent Count Verification
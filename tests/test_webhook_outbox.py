@@ -0,0 +1,197 @@
+"""
+Tests for the webhook outbox.
+
+Covers enqueueing, per-endpoint coalescing, backoff on failure, claim
+tokens and leases, the endpoint allow-list and the direct-POST fallback. Uses a mocked Supabase client and HTTP client.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.state.persistence import send_webhook
+from src.state.webhook_outbox import (
+    LEASE_SECONDS,
+    POSTS_PER_CLAIM,
+    deliver_pending,
+    enqueue_webhook,
+)
+
+WEBHOOK_URL = "https://app.example/api/crewai/webhook"
+
+
+@pytest.fixture(autouse=True)
+def product_app_url():
+    with patch.dict("os.environ", {"PRODUCT_APP_URL": "https://app.example"}):
+        yield
+
+
+def _outbox_event(event_id, endpoint=WEBHOOK_URL, claim_token="claim-1", **body):
+    return {
+        "id": event_id,
+        "endpoint": endpoint,
+        "event_type": "progress",
+        "claim_token": claim_token,
+        "body": body,
+    }
+
+
+@pytest.fixture
+def http():
+    client = MagicMock()
+    client.post.return_value.status_code = 200
+    with patch("src.state.webhook_outbox.get_webhook_http_client", return_value=client):
+        yield client
+
+
+def _supabase(claimed, held=None):
+    """Mock client; complete/fail only update ids in held (default: all claimed)."""
+    client = MagicMock()
+    held = {event["id"] for event in claimed} if held is None else set(held)
+
+    def rpc(name, params):
+        call = MagicMock()
+        if name == "claim_webhook_events":
+            data = claimed
+        else:
+            data = len(held & set(params["p_ids"]))
+        call.execute.return_value = MagicMock(data=data)
+        return call
+
+    client.rpc.side_effect = rpc
+    return client
+
+
+class TestEnqueue:
+    """Tests for queuing events."""
+
+    def test_enqueue_does_not_post_inline(self, http):
+        supabase = MagicMock()
+
+        with patch("src.state.webhook_outbox._start_drain") as drain:
+            assert enqueue_webhook("run-1", "hitl_checkpoint", {"flow_type": "hitl_checkpoint"}, supabase=supabase)
+
+        row = supabase.table.return_value.insert.call_args[0][0]
+        assert row["body"] == {"flow_type": "hitl_checkpoint"}
+        assert row["endpoint"].endswith("/api/crewai/webhook")
+        http.post.assert_not_called()
+        drain.assert_called_once()
+
+    def test_rejects_endpoint_outside_allow_list(self, http):
+        supabase = MagicMock()
+
+        with pytest.raises(ValueError):
+            enqueue_webhook("run-1", "progress", {}, endpoint="https://attacker.example/", supabase=supabase)
+
+        supabase.table.assert_not_called()
+        http.post.assert_not_called()
+
+    def test_falls_back_to_direct_post_when_outbox_unavailable(self, http):
+        supabase = MagicMock()
+        supabase.table.side_effect = Exception("relation webhook_outbox does not exist")
+
+        assert enqueue_webhook("run-1", "validation_complete", {"status": "completed"}, supabase=supabase)
+        http.post.assert_called_once()
+
+    def test_send_webhook_keeps_body_shape(self):
+        with patch("src.state.webhook_outbox.enqueue_webhook", return_value=True) as enqueue:
+            send_webhook("run-1", "narrative_generated", {"flow_type": "narrative_synthesis"})
+
+        body = enqueue.call_args[0][2]
+        assert body == {"flow_type": "narrative_synthesis", "run_id": "run-1", "event_type": "narrative_generated"}
+
+
+class TestDeliverPending:
+    """Tests for draining the outbox."""
+
+    def test_one_event_per_post_by_default(self, http):
+        supabase = _supabase([_outbox_event(2, n=2), _outbox_event(1, n=1)])
+
+        stats = deliver_pending(supabase=supabase)
+
+        assert stats == {"claimed": 2, "delivered": 2, "failed": 0}
+        assert [c.kwargs["json"] for c in http.post.call_args_list] == [{"n": 1}, {"n": 2}]
+
+    def test_coalesces_events_per_endpoint(self, http):
+        supabase = _supabase([
+            _outbox_event(2, n=2),
+            _outbox_event(1, n=1),
+            _outbox_event(3, endpoint="https://other.example/hook", n=3),
+        ])
+
+        with patch.dict("os.environ", {
+            "WEBHOOK_MAX_BATCH": "20",
+            "WEBHOOK_ALLOWED_ENDPOINTS": "https://other.example/hook",
+        }):
+            stats = deliver_pending(supabase=supabase)
+
+        assert stats == {"claimed": 3, "delivered": 3, "failed": 0}
+        assert http.post.call_count == 2
+        batch = http.post.call_args_list[0].kwargs["json"]
+        assert batch == {"flow_type": "batch", "events": [{"n": 1}, {"n": 2}]}
+        assert http.post.call_args_list[1].kwargs["json"] == {"n": 3}
+
+    def test_max_batch_splits_posts(self, http):
+        supabase = _supabase([_outbox_event(i, n=i) for i in range(3)])
+
+        with patch.dict("os.environ", {"WEBHOOK_MAX_BATCH": "2"}):
+            deliver_pending(supabase=supabase)
+
+        assert http.post.call_count == 2
+
+    def test_failed_batch_is_rescheduled(self, http):
+        http.post.side_effect = Exception("503 Service Unavailable")
+        supabase = _supabase([_outbox_event(1), _outbox_event(2)])
+
+        with patch.dict("os.environ", {"WEBHOOK_MAX_BATCH": "20"}):
+            stats = deliver_pending(supabase=supabase)
+
+        assert stats["failed"] == 2
+        names = [c.args[0] for c in supabase.rpc.call_args_list]
+        assert names == ["claim_webhook_events", "fail_webhook_events"]
+        assert supabase.rpc.call_args_list[1].args[1]["p_ids"] == [1, 2]
+        assert supabase.rpc.call_args_list[1].args[1]["p_claim_token"] == "claim-1"
+
+    def test_claim_fits_in_lease(self, http):
+        supabase = _supabase([])
+
+        with patch.dict("os.environ", {"WEBHOOK_MAX_BATCH": "5"}):
+            deliver_pending(supabase=supabase)
+
+        params = supabase.rpc.call_args_list[0].args[1]
+        assert params == {"p_limit": POSTS_PER_CLAIM * 5, "p_lease_seconds": LEASE_SECONDS}
+
+    def test_stops_posting_before_lease_expires(self, http):
+        supabase = _supabase([_outbox_event(i, n=i) for i in range(3)])
+        clock = iter([0.0, 0.0, LEASE_SECONDS - 1.0])
+
+        with patch("src.state.webhook_outbox.time.monotonic", side_effect=lambda: next(clock)):
+            stats = deliver_pending(supabase=supabase)
+
+        # Third event is left for re-claim after the lease expires
+        assert http.post.call_count == 1
+        assert stats == {"claimed": 3, "delivered": 1, "failed": 0}
+
+    def test_reclaimed_row_is_not_marked_by_stale_worker(self, http):
+        # Event 1's lease expired mid-drain and another worker re-claimed it
+        supabase = _supabase([_outbox_event(1, n=1), _outbox_event(2, n=2)], held=[2])
+
+        stats = deliver_pending(supabase=supabase)
+
+        assert stats == {"claimed": 2, "delivered": 1, "failed": 0}
+        completes = [c.args[1] for c in supabase.rpc.call_args_list if c.args[0] == "complete_webhook_events"]
+        assert completes == [
+            {"p_ids": [1], "p_claim_token": "claim-1"},
+            {"p_ids": [2], "p_claim_token": "claim-1"},
+        ]
+
+    def test_endpoint_outside_allow_list_is_dead_without_post(self, http):
+        supabase = _supabase([_outbox_event(1, endpoint="https://attacker.example/")])
+
+        stats = deliver_pending(supabase=supabase)
+
+        assert stats == {"claimed": 1, "delivered": 0, "failed": 1}
+        http.post.assert_not_called()
+        name, params = supabase.rpc.call_args_list[1].args
+        assert name == "fail_webhook_events"
+        assert params["p_max_attempts"] == 1
@@ -35,7 +35,7 @@ CREW_INPUT_VARIABLES = {
     "onboarding": {"entrepreneur_input"},
     # Phase 1: VPC Discovery
     "discovery": {"founders_brief", "entrepreneur_input", "raw_idea", "hints"},
-    "customer_profile": {"founders_brief", "entrepreneur_input", "discovery_results"},
+    "customer_profile": {"founders_brief", "entrepreneur_input", "discovery_results", "customer_research"},
     "value_design": {"founders_brief", "customer_profile"},
     "wtp": {"founders_brief", "customer_profile", "value_map"},
     "fit_assessment": {"founders_brief", "customer_profile", "value_map", "wtp_insights", "wtp_results"},
@@ -7,10 +7,10 @@ Uses mocking to avoid actual API calls.
 
 import json
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, AsyncMock, MagicMock, mock_open
 from datetime import datetime
 
-from shared.tools.advanced_analysis import (
+from src.shared.tools.advanced_analysis import (
     TranscriptionTool,
     InsightExtractorTool,
     BehaviorPatternTool,
@@ -132,7 +132,7 @@ class TestTranscriptionTool:
         assert "# Interview Transcript" in result
         assert "Short interview notes" in result
 
-    @patch("shared.tools.advanced_analysis.TranscriptionTool._get_openai_client")
+    @patch("src.shared.tools.advanced_analysis.TranscriptionTool._get_openai_client")
     def test_file_transcription(
         self, mock_get_client, transcription_tool, mock_openai_transcription_response
     ):
@@ -177,7 +177,7 @@ class TestInsightExtractorTool:
         assert len(insight_tool.description) > 50
         assert "insight" in insight_tool.description.lower()
 
-    @patch("shared.tools.advanced_analysis.InsightExtractorTool._get_openai_client")
+    @patch("src.shared.tools.advanced_analysis.InsightExtractorTool._get_openai_client")
     def test_extracts_themes_and_pain_points(
         self, mock_get_client, insight_tool, mock_openai_insight_response
     ):
@@ -197,7 +197,7 @@ class TestInsightExtractorTool:
         assert "Pain Points" in result
         assert "Opportunities" in result
 
-    @patch("shared.tools.advanced_analysis.InsightExtractorTool._get_openai_client")
+    @patch("src.shared.tools.advanced_analysis.InsightExtractorTool._get_openai_client")
     def test_handles_api_error(self, mock_get_client, insight_tool):
         """Tool should handle API errors gracefully."""
         mock_get_client.side_effect = Exception("API error")
@@ -206,7 +206,7 @@ class TestInsightExtractorTool:
 
         assert "error" in result.lower() or "failed" in result.lower()
 
-    @patch("shared.tools.advanced_analysis.InsightExtractorTool._get_openai_client")
+    @patch("src.shared.tools.advanced_analysis.InsightExtractorTool._get_openai_client")
     def test_handles_invalid_json_response(self, mock_get_client, insight_tool):
         """Tool should handle invalid JSON from API."""
         mock_client = MagicMock()
@@ -221,6 +221,23 @@ class TestInsightExtractorTool:
 
         assert "failed" in result.lower() or "error" in result.lower()
 
+    @patch("src.shared.tools.advanced_analysis.InsightExtractorTool._get_async_openai_client")
+    async def test_arun_uses_async_client(
+        self, mock_get_client, insight_tool, mock_openai_insight_response
+    ):
+        """Async path should await the shared AsyncOpenAI client."""
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content=mock_openai_insight_response))]
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_get_client.return_value = mock_client
+
+        result = await insight_tool._arun("Customer interview transcript")
+
+        mock_client.chat.completions.create.assert_awaited_once()
+        assert "# Extracted Insights" in result
+        assert "workflow inefficiency" in result
+
 
 # ===========================================================================
 # BEHAVIOR PATTERN TOOL TESTS
@@ -239,7 +256,7 @@ class TestBehaviorPatternTool:
         assert len(pattern_tool.description) > 50
         assert "pattern" in pattern_tool.description.lower()
 
-    @patch("shared.tools.advanced_analysis.BehaviorPatternTool._get_openai_client")
+    @patch("src.shared.tools.advanced_analysis.BehaviorPatternTool._get_openai_client")
     def test_identifies_patterns(
         self, mock_get_client, pattern_tool, mock_openai_pattern_response
     ):
@@ -258,7 +275,7 @@ class TestBehaviorPatternTool:
         assert "Identified Patterns" in result
         assert "SAY vs DO Discrepancies" in result
 
-    @patch("shared.tools.advanced_analysis.BehaviorPatternTool._get_openai_client")
+    @patch("src.shared.tools.advanced_analysis.BehaviorPatternTool._get_openai_client")
     def test_handles_topic_in_input(
         self, mock_get_client, pattern_tool, mock_openai_pattern_response
     ):
@@ -275,7 +292,7 @@ class TestBehaviorPatternTool:
 
         assert "tool usage" in result
 
-    @patch("shared.tools.advanced_analysis.BehaviorPatternTool._get_openai_client")
+    @patch("src.shared.tools.advanced_analysis.BehaviorPatternTool._get_openai_client")
     def test_handles_api_error(self, mock_get_client, pattern_tool):
         """Tool should handle API errors gracefully."""
         mock_get_client.side_effect = Exception("API error")
@@ -389,7 +406,7 @@ class TestConvenienceFunctions:
         result = transcribe_audio("Test interview transcript content goes here")
         assert "# Interview Transcript" in result
 
-    @patch("shared.tools.advanced_analysis.InsightExtractorTool._get_openai_client")
+    @patch("src.shared.tools.advanced_analysis.InsightExtractorTool._get_openai_client")
     def test_extract_insights_function(
         self, mock_get_client, mock_openai_insight_response
     ):
@@ -405,7 +422,7 @@ class TestConvenienceFunctions:
         result = extract_insights("Customer feedback text")
         assert "# Extracted Insights" in result
 
-    @patch("shared.tools.advanced_analysis.BehaviorPatternTool._get_openai_client")
+    @patch("src.shared.tools.advanced_analysis.BehaviorPatternTool._get_openai_client")
     def test_identify_patterns_function(
         self, mock_get_client, mock_openai_pattern_response
     ):
@@ -512,8 +529,8 @@ class TestImports:
     """Tests to verify imports work correctly."""
 
     def test_can_import_from_shared_tools(self):
-        """Should be able to import from shared.tools."""
-        from shared.tools import (
+        """Should be able to import from src.shared.tools."""
+        from src.shared.tools import (
             TranscriptionTool,
             InsightExtractorTool,
             BehaviorPatternTool,
@@ -527,7 +544,7 @@ class TestImports:
 
     def test_can_import_convenience_functions(self):
         """Should be able to import convenience functions."""
-        from shared.tools import (
+        from src.shared.tools import (
             transcribe_audio,
             extract_insights,
             identify_patterns,
@@ -541,7 +558,7 @@ class TestImports:
 
     def test_can_import_output_models(self):
         """Should be able to import output models."""
-        from shared.tools import (
+        from src.shared.tools import (
             TranscriptionOutput,
             InsightExtractionOutput,
             BehaviorPatternOutput,
@@ -7,10 +7,10 @@ Uses mocking to avoid actual API calls.
 
 import json
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from datetime import datetime, timedelta
 
-from shared.tools.analytics_privacy import (
+from src.shared.tools.analytics_privacy import (
     AnalyticsTool,
     AnonymizerTool,
     AdPlatformTool,
@@ -163,6 +163,24 @@ class TestAnalyticsTool:
                 assert "Pageviews" in result
                 assert "Visitors" in result
 
+    async def test_arun_uses_pooled_async_client(self, analytics_tool, mock_netlify_analytics_response):
+        """Async path should fetch site info and analytics over the pooled client."""
+        site_response = MagicMock(status_code=200)
+        site_response.json.return_value = {"name": "My Test Site"}
+        analytics_response = MagicMock(status_code=200)
+        analytics_response.json.return_value = mock_netlify_analytics_response
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=[site_response, analytics_response])
+
+        with patch.dict("os.environ", {"NETLIFY_ACCESS_TOKEN": "test-token"}):
+            with patch("src.shared.tools.analytics_privacy.get_async_http_client", return_value=client):
+                result = await analytics_tool._arun("test-site")
+
+        assert client.get.await_count == 2
+        assert "My Test Site" in result
+        assert "1,500" in result
+
 
 # ===========================================================================
 # ANONYMIZER TOOL TESTS
@@ -400,7 +418,7 @@ class TestPydanticModels:
 
     def test_analytics_output_model(self):
         """AnalyticsOutput model should be valid."""
-        from shared.tools.analytics_privacy import AnalyticsMetrics
+        from src.shared.tools.analytics_privacy import AnalyticsMetrics
 
         output = AnalyticsOutput(
             site_id="test-site",
@@ -432,7 +450,7 @@ class TestPydanticModels:
 
     def test_ad_platform_output_model(self):
         """AdPlatformOutput model should be valid."""
-        from shared.tools.analytics_privacy import AdCampaignData
+        from src.shared.tools.analytics_privacy import AdCampaignData
 
         output = AdPlatformOutput(
             platform="meta",
@@ -458,7 +476,7 @@ class TestPydanticModels:
 
     def test_calendar_output_model(self):
         """CalendarOutput model should be valid."""
-        from shared.tools.analytics_privacy import CalendarSlot
+        from src.shared.tools.analytics_privacy import CalendarSlot
 
         output = CalendarOutput(
             available_slots=[
@@ -484,8 +502,8 @@ class TestImports:
     """Tests to verify imports work correctly."""
 
     def test_can_import_from_shared_tools(self):
-        """Should be able to import from shared.tools."""
-        from shared.tools import (
+        """Should be able to import from src.shared.tools."""
+        from src.shared.tools import (
             AnalyticsTool,
             AnonymizerTool,
             AdPlatformTool,
@@ -499,7 +517,7 @@ class TestImports:
 
     def test_can_import_convenience_functions(self):
         """Should be able to import convenience functions."""
-        from shared.tools import (
+        from src.shared.tools import (
             get_analytics,
             anonymize_data,
             get_ad_metrics,
@@ -513,7 +531,7 @@ class TestImports:
 
     def test_can_import_output_models(self):
         """Should be able to import output models."""
-        from shared.tools import (
+        from src.shared.tools import (
             AnalyticsOutput,
             AnonymizationResult,
             AdPlatformOutput,
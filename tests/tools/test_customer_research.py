@@ -5,11 +5,12 @@ Tests ForumSearchTool, ReviewAnalysisTool, SocialListeningTool, and TrendAnalysi
 Uses mocking to avoid actual Tavily API calls.
 """
 
+import asyncio
 import pytest
 from unittest.mock import patch, MagicMock
 from datetime import datetime
 
-from shared.tools.customer_research import (
+from src.shared.tools.customer_research import (
     ForumSearchTool,
     ReviewAnalysisTool,
     SocialListeningTool,
@@ -92,7 +93,7 @@ class TestForumSearchTool:
         assert "reddit" in forum_tool.default_platforms
         assert "stackoverflow" in forum_tool.default_platforms
 
-    @patch("shared.tools.customer_research.TavilySearchTool")
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
     def test_run_constructs_query_with_platforms(self, mock_tavily_class, mock_tavily_response):
         """Tool should construct query with platform filters."""
         mock_instance = MagicMock()
@@ -111,7 +112,7 @@ class TestForumSearchTool:
         assert "site:news.ycombinator.com" in call_args
         assert "startup challenges" in call_args
 
-    @patch("shared.tools.customer_research.TavilySearchTool")
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
     def test_run_returns_formatted_output(self, mock_tavily_class, mock_tavily_response):
         """Tool should return formatted output with header."""
         mock_instance = MagicMock()
@@ -125,7 +126,7 @@ class TestForumSearchTool:
         assert "## Discussion Threads Found" in result
         assert "## Key Observations" in result
 
-    @patch("shared.tools.customer_research.TavilySearchTool")
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
     def test_run_handles_exception(self, mock_tavily_class):
         """Tool should handle exceptions gracefully."""
         mock_instance = MagicMock()
@@ -156,7 +157,7 @@ class TestReviewAnalysisTool:
         assert len(review_tool.description) > 50
         assert "review" in review_tool.description.lower()
 
-    @patch("shared.tools.customer_research.TavilySearchTool")
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
     def test_run_searches_multiple_categories(self, mock_tavily_class, mock_tavily_response):
         """Tool should search for negative, feature, and positive reviews."""
         mock_instance = MagicMock()
@@ -169,7 +170,7 @@ class TestReviewAnalysisTool:
         # Should make 3 search calls (negative, feature, positive)
         assert mock_instance._run.call_count == 3
 
-    @patch("shared.tools.customer_research.TavilySearchTool")
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
     def test_run_includes_review_sites(self, mock_tavily_class, mock_tavily_response):
         """Tool should search review sites like G2, Capterra."""
         mock_instance = MagicMock()
@@ -185,7 +186,7 @@ class TestReviewAnalysisTool:
         assert "g2.com" in combined
         assert "capterra.com" in combined
 
-    @patch("shared.tools.customer_research.TavilySearchTool")
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
     def test_run_returns_structured_sections(self, mock_tavily_class, mock_tavily_response):
         """Tool should return sections for complaints, features, and positives."""
         mock_instance = MagicMock()
@@ -200,6 +201,28 @@ class TestReviewAnalysisTool:
         assert "## Feature Requests & Wishes" in result
         assert "## What Customers Love" in result
 
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
+    async def test_arun_runs_searches_concurrently(self, mock_tavily_class, mock_tavily_response):
+        """Async path should issue all review searches at once."""
+        in_flight = {"now": 0, "max": 0}
+
+        async def fake_arun(query):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return mock_tavily_response
+
+        mock_instance = MagicMock()
+        mock_instance._arun.side_effect = fake_arun
+        mock_tavily_class.return_value = mock_instance
+
+        result = await ReviewAnalysisTool()._arun("test product")
+
+        assert in_flight["max"] == 3
+        mock_instance._run.assert_not_called()
+        assert "## Feature Requests & Wishes" in result
+
 
 # ===========================================================================
 # SOCIAL LISTENING TOOL TESTS
@@ -218,7 +241,7 @@ class TestSocialListeningTool:
         assert len(social_tool.description) > 50
         assert "social" in social_tool.description.lower()
 
-    @patch("shared.tools.customer_research.TavilySearchTool")
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
     def test_run_searches_multiple_platforms(self, mock_tavily_class, mock_tavily_response):
         """Tool should search Twitter, LinkedIn, and blogs."""
         mock_instance = MagicMock()
@@ -231,7 +254,7 @@ class TestSocialListeningTool:
         # Should make 3 search calls (twitter, linkedin, mentions)
         assert mock_instance._run.call_count == 3
 
-    @patch("shared.tools.customer_research.TavilySearchTool")
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
     def test_run_returns_platform_sections(self, mock_tavily_class, mock_tavily_response):
         """Tool should return sections per platform."""
         mock_instance = MagicMock()
@@ -264,7 +287,7 @@ class TestTrendAnalysisTool:
         assert len(trend_tool.description) > 50
         assert "trend" in trend_tool.description.lower()
 
-    @patch("shared.tools.customer_research.TavilySearchTool")
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
     def test_run_searches_multiple_aspects(self, mock_tavily_class, mock_tavily_response):
         """Tool should search trends, market size, innovation, and challenges."""
         mock_instance = MagicMock()
@@ -277,7 +300,7 @@ class TestTrendAnalysisTool:
         # Should make 4 search calls
         assert mock_instance._run.call_count == 4
 
-    @patch("shared.tools.customer_research.TavilySearchTool")
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
     def test_run_includes_current_year(self, mock_tavily_class, mock_tavily_response):
         """Tool should include current year in trend searches."""
         mock_instance = MagicMock()
@@ -293,7 +316,7 @@ class TestTrendAnalysisTool:
         combined = " ".join(calls)
         assert current_year in combined
 
-    @patch("shared.tools.customer_research.TavilySearchTool")
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
     def test_run_returns_trend_sections(self, mock_tavily_class, mock_tavily_response):
         """Tool should return sections for different trend aspects."""
         mock_instance = MagicMock()
@@ -318,7 +341,7 @@ class TestTrendAnalysisTool:
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
 
-    @patch("shared.tools.customer_research.TavilySearchTool")
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
     def test_search_forums(self, mock_tavily_class, mock_tavily_response):
         """search_forums() convenience function should work."""
         mock_instance = MagicMock()
@@ -328,7 +351,7 @@ class TestConvenienceFunctions:
         result = search_forums("startup advice", "reddit")
         assert "# Forum Search:" in result
 
-    @patch("shared.tools.customer_research.TavilySearchTool")
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
     def test_analyze_reviews(self, mock_tavily_class, mock_tavily_response):
         """analyze_reviews() convenience function should work."""
         mock_instance = MagicMock()
@@ -338,7 +361,7 @@ class TestConvenienceFunctions:
         result = analyze_reviews("project management")
         assert "# Review Analysis:" in result
 
-    @patch("shared.tools.customer_research.TavilySearchTool")
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
     def test_listen_social(self, mock_tavily_class, mock_tavily_response):
         """listen_social() convenience function should work."""
         mock_instance = MagicMock()
@@ -348,7 +371,7 @@ class TestConvenienceFunctions:
         result = listen_social("AI automation")
         assert "# Social Listening:" in result
 
-    @patch("shared.tools.customer_research.TavilySearchTool")
+    @patch("src.shared.tools.customer_research.TavilySearchTool")
     def test_analyze_trends(self, mock_tavily_class, mock_tavily_response):
         """analyze_trends() convenience function should work."""
         mock_instance = MagicMock()
@@ -425,8 +448,8 @@ class TestImports:
     """Tests to verify imports work correctly."""
 
     def test_can_import_from_shared_tools(self):
-        """Should be able to import from shared.tools."""
-        from shared.tools import (
+        """Should be able to import from src.shared.tools."""
+        from src.shared.tools import (
             ForumSearchTool,
             ReviewAnalysisTool,
             SocialListeningTool,
@@ -440,7 +463,7 @@ class TestImports:
 
     def test_can_import_convenience_functions(self):
         """Should be able to import convenience functions."""
-        from shared.tools import (
+        from src.shared.tools import (
             search_forums,
             analyze_reviews,
             listen_social,
@@ -454,7 +477,7 @@ class TestImports:
 
     def test_can_import_output_models(self):
         """Should be able to import output models."""
-        from shared.tools import (
+        from src.shared.tools import (
             ForumSearchOutput,
             ReviewAnalysisOutput,
             SocialListeningOutput,
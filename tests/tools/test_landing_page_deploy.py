@@ -12,7 +12,7 @@ import pytest
 from unittest.mock import patch, MagicMock, Mock
 from datetime import datetime
 
-from shared.tools.landing_page_deploy import (
+from src.shared.tools.landing_page_deploy import (
     LandingPageDeploymentTool,
     deploy_landing_page,
     DeploymentResult,
@@ -351,7 +351,7 @@ class TestLandingPageDeploymentToolWithMocks:
         'SUPABASE_KEY': 'test-service-key',
         'SUPABASE_ANON_KEY': 'test-anon-key',
     })
-    @patch('state.persistence.get_supabase')
+    @patch('src.state.persistence.get_supabase')
     def test_run_successful_deployment(
         self, mock_get_supabase, deploy_tool, sample_html, mock_supabase_client
     ):
@@ -376,7 +376,7 @@ class TestLandingPageDeploymentToolWithMocks:
         'SUPABASE_KEY': 'test-service-key',
         'SUPABASE_ANON_KEY': 'test-anon-key',
     })
-    @patch('state.persistence.get_supabase')
+    @patch('src.state.persistence.get_supabase')
     def test_run_storage_path_sanitized(
         self, mock_get_supabase, deploy_tool, sample_html, mock_supabase_client
     ):
@@ -401,7 +401,7 @@ class TestLandingPageDeploymentToolWithMocks:
         'SUPABASE_URL': 'https://test.supabase.co',
         'SUPABASE_KEY': 'test-service-key',
     }, clear=True)  # No SUPABASE_ANON_KEY
-    @patch('state.persistence.get_supabase')
+    @patch('src.state.persistence.get_supabase')
     def test_run_no_anon_key_warning(
         self, mock_get_supabase, deploy_tool, sample_html, mock_supabase_client
     ):
@@ -422,7 +422,7 @@ class TestLandingPageDeploymentToolWithMocks:
         'SUPABASE_KEY': 'test-service-key',
         'SUPABASE_ANON_KEY': 'test-anon-key',
     })
-    @patch('state.persistence.get_supabase')
+    @patch('src.state.persistence.get_supabase')
     def test_run_bucket_not_found(self, mock_get_supabase, deploy_tool, sample_html):
         """Test error when storage bucket doesn't exist."""
         mock_client = MagicMock()
@@ -445,7 +445,7 @@ class TestLandingPageDeploymentToolWithMocks:
         'SUPABASE_KEY': 'test-service-key',
         'SUPABASE_ANON_KEY': 'test-anon-key',
     })
-    @patch('state.persistence.get_supabase')
+    @patch('src.state.persistence.get_supabase')
     def test_run_upload_error(self, mock_get_supabase, deploy_tool, sample_html):
         """Test handling of upload failure."""
         mock_client = MagicMock()
@@ -469,7 +469,7 @@ class TestLandingPageDeploymentToolWithMocks:
         'SUPABASE_KEY': 'test-service-key',
         'SUPABASE_ANON_KEY': 'test-anon-key',
     })
-    @patch('state.persistence.get_supabase')
+    @patch('src.state.persistence.get_supabase')
     def test_run_metadata_failure_continues(
         self, mock_get_supabase, deploy_tool, sample_html
     ):
@@ -507,7 +507,7 @@ class TestDeployLandingPageFunction:
         'SUPABASE_KEY': 'test-service-key',
         'SUPABASE_ANON_KEY': 'test-anon-key',
     })
-    @patch('state.persistence.get_supabase')
+    @patch('src.state.persistence.get_supabase')
     def test_deploy_landing_page_success(
         self, mock_get_supabase, sample_html, mock_supabase_client
     ):
@@ -527,7 +527,7 @@ class TestDeployLandingPageFunction:
         'SUPABASE_KEY': 'test-service-key',
         'SUPABASE_ANON_KEY': 'test-anon-key',
     })
-    @patch('state.persistence.get_supabase')
+    @patch('src.state.persistence.get_supabase')
     def test_deploy_landing_page_with_site_name_ignored(
         self, mock_get_supabase, sample_html, mock_supabase_client
     ):
@@ -558,8 +558,8 @@ class TestBuildCrewIntegration:
     """Tests to verify tool is correctly wired to BuildCrew."""
 
     def test_tool_can_be_imported_from_shared_tools(self):
-        """Test that tool can be imported from shared.tools."""
-        from shared.tools import LandingPageDeploymentTool, deploy_landing_page, DeploymentResult
+        """Test that tool can be imported from src.shared.tools."""
+        from src.shared.tools import LandingPageDeploymentTool, deploy_landing_page, DeploymentResult
 
         assert LandingPageDeploymentTool is not None
         assert deploy_landing_page is not None
@@ -568,14 +568,14 @@ class TestBuildCrewIntegration:
     def test_build_crew_f3_has_deployment_tool(self):
         """Test that F3 agent in BuildCrew has the deployment tool."""
         # Import the crew to verify it compiles with the new tool
-        from crews.desirability.build_crew import BuildCrew
+        from src.crews.desirability.build_crew import BuildCrew
 
         # Verify the import doesn't fail
         assert BuildCrew is not None
 
     def test_tool_instantiation_in_agent_context(self):
         """Test that tool can be instantiated as agents do."""
-        from shared.tools import LandingPageDeploymentTool
+        from src.shared.tools import LandingPageDeploymentTool
 
         tool = LandingPageDeploymentTool()
 
@@ -596,7 +596,7 @@ class TestAsyncSupport:
         'SUPABASE_KEY': 'test-service-key',
         'SUPABASE_ANON_KEY': 'test-anon-key',
     })
-    @patch('state.persistence.get_supabase')
+    @patch('src.state.persistence.get_supabase')
     @pytest.mark.asyncio
     async def test_arun_delegates_to_run(
         self, mock_get_supabase, deploy_tool, sample_html, mock_supabase_client
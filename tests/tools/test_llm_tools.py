@@ -8,7 +8,7 @@ These tools generate structured outputs using LLM prompts.
 import json
 import pytest
 
-from shared.tools.llm_tools import (
+from src.shared.tools.llm_tools import (
     CanvasBuilderTool,
     TestCardTool,
     LearningCardTool,
@@ -564,8 +564,8 @@ class TestImports:
     """Tests to verify imports work correctly."""
 
     def test_can_import_from_shared_tools(self):
-        """Should be able to import from shared.tools."""
-        from shared.tools import (
+        """Should be able to import from src.shared.tools."""
+        from src.shared.tools import (
             CanvasBuilderTool,
             TestCardTool,
             LearningCardTool,
@@ -577,7 +577,7 @@ class TestImports:
 
     def test_can_import_convenience_functions(self):
         """Should be able to import convenience functions."""
-        from shared.tools import (
+        from src.shared.tools import (
             build_canvas_element,
             design_test_card,
             capture_learning,
@@ -589,7 +589,7 @@ class TestImports:
 
     def test_can_import_output_models(self):
         """Should be able to import output models."""
-        from shared.tools import (
+        from src.shared.tools import (
             CanvasBuilderOutput,
             TestCardOutput,
             LearningCardOutput,
@@ -601,7 +601,7 @@ class TestImports:
 
     def test_can_import_enums(self):
         """Should be able to import enums."""
-        from shared.tools import (
+        from src.shared.tools import (
             CanvasElementType,
             ExperimentType,
             EvidenceType,
@@ -0,0 +1,271 @@
+"""
+Tests for the Tavily search result cache and batch search.
+
+Tests query normalization, TTL/LRU behaviour, in-flight dedup, the
+TavilySearchTool integration and concurrent batch search. Uses mocking to
+avoid actual API calls.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch, AsyncMock, MagicMock
+
+import pytest
+
+from src.shared.tools.search_cache import (
+    SearchCache,
+    normalize_query,
+    search_cache_key,
+)
+from src.shared.tools.http_clients import run_sync
+from src.shared.tools.web_search import (
+    BatchSearchTool,
+    TavilySearchTool,
+    batch_search_async,
+)
+
+
+# ===========================================================================
+# TEST FIXTURES
+# ===========================================================================
+
+
+@pytest.fixture
+def fresh_cache():
+    """Install an empty process-wide search cache."""
+    cache = SearchCache(ttl_seconds=60, max_entries=10)
+    with patch("src.shared.tools.web_search.get_search_cache", return_value=cache):
+        yield cache
+
+
+@pytest.fixture
+def tavily_response():
+    return {
+        "answer": "Founders struggle with validation.",
+        "results": [
+            {"title": "Thread", "url": "https://reddit.com/r/startups/1", "content": "...", "score": 0.9},
+        ],
+    }
+
+
+# ===========================================================================
+# QUERY NORMALIZATION TESTS
+# ===========================================================================
+
+
+class TestNormalizeQuery:
+    """Tests for query canonicalization."""
+
+    def test_case_and_whitespace(self):
+        assert normalize_query("  Startup   Founders PAIN ") == "startup founders pain"
+
+    def test_standalone_site_filter_order(self):
+        assert normalize_query("crm site:reddit.com site:quora.com") == normalize_query(
+            "site:quora.com crm site:reddit.com"
+        )
+
+    def test_site_group_order(self):
+        assert normalize_query(
+            "crm reviews (site:g2.com OR site:capterra.com)"
+        ) == normalize_query("CRM reviews (site:capterra.com or site:g2.com)")
+
+    def test_different_terms_stay_different(self):
+        assert normalize_query("crm pricing") != normalize_query("crm reviews")
+
+    def test_cache_key_includes_params(self):
+        assert search_cache_key("crm", max_results=5) != search_cache_key("crm", max_results=8)
+
+
+# ===========================================================================
+# CACHE BEHAVIOUR TESTS
+# ===========================================================================
+
+
+class TestSearchCache:
+    """Tests for TTL, LRU and in-flight dedup."""
+
+    def test_hit_after_first_fetch(self):
+        cache = SearchCache(ttl_seconds=60)
+        fetch = MagicMock(return_value={"results": []})
+
+        cache.get_or_fetch("k", fetch)
+        cache.get_or_fetch("k", fetch)
+
+        fetch.assert_called_once()
+        assert cache.stats()["hits"] == 1
+
+    def test_expired_entry_refetches(self):
+        cache = SearchCache(ttl_seconds=0.01)
+        fetch = MagicMock(return_value={"results": []})
+
+        cache.get_or_fetch("k", fetch)
+        time.sleep(0.02)
+        cache.get_or_fetch("k", fetch)
+
+        assert fetch.call_count == 2
+
+    def test_lru_bound(self):
+        cache = SearchCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_failures_are_not_cached(self):
+        cache = SearchCache(ttl_seconds=60)
+        fetch = MagicMock(side_effect=[RuntimeError("rate limited"), {"results": []}])
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_fetch("k", fetch)
+        assert cache.get_or_fetch("k", fetch) == {"results": []}
+
+    def test_concurrent_identical_requests_share_one_fetch(self):
+        cache = SearchCache(ttl_seconds=60)
+        release = threading.Event()
+        calls = []
+
+        def slow_fetch():
+            calls.append(1)
+            release.wait(timeout=5)
+            return {"results": []}
+
+        threads = [
+            threading.Thread(target=cache.get_or_fetch, args=("k", slow_fetch))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert len(calls) == 1
+        assert cache.stats()["deduped"] == 3
+
+
+# ===========================================================================
+# TAVILY SEARCH TOOL INTEGRATION
+# ===========================================================================
+
+
+class TestTavilySearchToolCaching:
+    """Tests that TavilySearchTool goes through the cache."""
+
+    def test_equivalent_queries_hit_network_once(self, fresh_cache, tavily_response):
+        client = MagicMock()
+        client.search.return_value = tavily_response
+
+        with patch("src.shared.tools.web_search.get_tavily_client", return_value=client):
+            tool = TavilySearchTool(max_results=5)
+            first = tool._run("Founder pain site:reddit.com site:quora.com")
+            second = tool._run("founder  pain site:quora.com site:reddit.com")
+
+        client.search.assert_called_once()
+        assert "Founders struggle with validation." in first
+        assert "Founders struggle with validation." in second
+
+    async def test_arun_shares_cache_with_run(self, fresh_cache, tavily_response):
+        fake_search = AsyncMock(return_value=tavily_response)
+        client = MagicMock()
+
+        with patch("src.shared.tools.web_search._tavily_search_async", fake_search), \
+                patch("src.shared.tools.web_search.get_tavily_client", return_value=client):
+            tool = TavilySearchTool(max_results=5)
+            first = await tool._arun("Founder pain")
+            second = tool._run("founder   PAIN")
+
+        fake_search.assert_awaited_once()
+        client.search.assert_not_called()
+        assert "Founders struggle with validation." in first
+        assert "Founders struggle with validation." in second
+
+    def test_missing_api_key_reports_configuration_error(self, fresh_cache):
+        with patch.dict("os.environ", {}, clear=True):
+            result = TavilySearchTool()._run("anything")
+
+        assert "Configuration error" in result
+
+
+# ===========================================================================
+# BATCH SEARCH TESTS
+# ===========================================================================
+
+
+class TestBatchSearch:
+    """Tests for concurrent multi-query search with URL dedup."""
+
+    def _fake_search(self, responses, in_flight=None):
+        async def fake(query, search_depth, max_results, include_answer):
+            if in_flight is not None:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+                await asyncio.sleep(0.01)
+                in_flight["now"] -= 1
+            result = responses[query]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return fake
+
+    def test_merges_and_dedups_by_url(self, fresh_cache):
+        responses = {
+            "crm pain": {
+                "answer": "Manual data entry.",
+                "results": [
+                    {"title": "A", "url": "https://a.com/post/", "content": "a", "score": 0.5},
+                    {"title": "B", "url": "https://b.com", "content": "b", "score": 0.7},
+                ],
+            },
+            "crm pricing": {
+                "results": [
+                    {"title": "A", "url": "https://a.com/post", "content": "a", "score": 0.9},
+                ],
+            },
+        }
+
+        with patch("src.shared.tools.web_search._tavily_search_async", self._fake_search(responses)):
+            output = run_sync(batch_search_async(["crm pain", "crm pricing"]))
+
+        assert output.result_count == 2
+        assert [r.score for r in output.results] == [0.9, 0.7]
+        assert output.answers == {"crm pain": "Manual data entry."}
+
+    def test_respects_concurrency_limit(self, fresh_cache):
+        queries = [f"query {i}" for i in range(6)]
+        responses = {q: {"results": []} for q in queries}
+        in_flight = {"now": 0, "max": 0}
+
+        with patch("src.shared.tools.web_search._tavily_search_async", self._fake_search(responses, in_flight)):
+            run_sync(batch_search_async(queries, max_concurrency=2))
+
+        assert in_flight["max"] == 2
+
+    def test_failed_query_does_not_fail_batch(self, fresh_cache):
+        responses = {
+            "ok": {"results": [{"title": "A", "url": "https://a.com", "content": "a", "score": 0.5}]},
+            "broken": RuntimeError("HTTP 429"),
+        }
+
+        with patch("src.shared.tools.web_search._tavily_search_async", self._fake_search(responses)):
+            output = run_sync(batch_search_async(["ok", "broken"]))
+
+        assert output.result_count == 1
+        assert "HTTP 429" in output.errors["broken"]
+
+    def test_tool_accepts_list_input(self, fresh_cache):
+        responses = {
+            "a": {"results": [{"title": "A", "url": "https://a.com", "content": "a", "score": 0.5}]},
+            "b": {"results": []},
+        }
+
+        with patch("src.shared.tools.web_search._tavily_search_async", self._fake_search(responses)):
+            result = BatchSearchTool()._run(queries=["a", "b"])
+
+        assert "Batch Web Search Results (2 queries)" in result
+        assert "https://a.com" in result